@@ -1514,12 +1514,20 @@ export async function createClanInvite(
 }
 
 export async function listClanMembers(clanId: number): Promise<any> {
-  return httpJson(
-    `/clans/${encodeURIComponent(String(clanId))}/members`,
-    "GET",
-    undefined,
-    { header_clan_id: clanId }
-  );
+  // The endpoint pages by membership id; follow next_after_id so callers
+  // still receive the whole roster in one result.
+  const path = `/clans/${encodeURIComponent(String(clanId))}/members`;
+  const first = await httpJson(path, "GET", undefined, { header_clan_id: clanId });
+  const items: any[] = Array.isArray(first?.items) ? [...first.items] : [];
+  let page = first;
+  while (page?.has_more && page?.next_after_id) {
+    const query = new URLSearchParams({ after_id: String(page.next_after_id) });
+    page = await httpJson(`${path}?${query.toString()}`, "GET", undefined, {
+      header_clan_id: clanId,
+    });
+    if (Array.isArray(page?.items)) items.push(...page.items);
+  }
+  return { ...first, items, has_more: false, next_after_id: null };
 }
 
 export async function submitJoinRequest(
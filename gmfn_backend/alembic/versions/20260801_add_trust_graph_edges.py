@@ -0,0 +1,106 @@
+"""add materialized trust graph edges
+
+Revision ID: 20260801_trust_graph_edges
+Revises: 20260726_trustslip_dp_consent_share
+Create Date: 2026-08-01
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260801_trust_graph_edges"
+down_revision = "20260726_trustslip_dp_consent_share"
+branch_labels = None
+depends_on = None
+
+
+def _has_table(bind, table_name: str) -> bool:
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _has_index(bind, table_name: str, index_name: str) -> bool:
+    if not _has_table(bind, table_name):
+        return False
+    inspector = sa.inspect(bind)
+    return any(idx["name"] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if not _has_table(bind, "trust_graph_edges"):
+        op.create_table(
+            "trust_graph_edges",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("edge_type", sa.String(length=40), nullable=False),
+            sa.Column("source_node_id", sa.String(length=40), nullable=False),
+            sa.Column("target_node_id", sa.String(length=40), nullable=False),
+            sa.Column("source_user_id", sa.Integer(), nullable=True),
+            sa.Column("target_user_id", sa.Integer(), nullable=True),
+            sa.Column("clan_id", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("loan_id", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("directional", sa.Boolean(), nullable=False, server_default=sa.true()),
+            sa.Column("event_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("supporting_event_ids_json", sa.Text(), nullable=True),
+            sa.Column("reasons_json", sa.Text(), nullable=True),
+            sa.Column("first_seen_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("last_seen_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.text("CURRENT_TIMESTAMP"),
+            ),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.text("CURRENT_TIMESTAMP"),
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint(
+                "edge_type",
+                "source_node_id",
+                "target_node_id",
+                "clan_id",
+                "loan_id",
+                name="uq_trust_graph_edges_key",
+            ),
+        )
+
+    indexes = (
+        ("ix_trust_graph_edges_id", ["id"]),
+        ("ix_trust_graph_edges_edge_type", ["edge_type"]),
+        ("ix_trust_graph_edges_source_user_id", ["source_user_id"]),
+        ("ix_trust_graph_edges_target_user_id", ["target_user_id"]),
+        ("ix_trust_graph_edges_loan_id", ["loan_id"]),
+        ("ix_trust_graph_edges_source_seen", ["source_user_id", "last_seen_at"]),
+        ("ix_trust_graph_edges_target_seen", ["target_user_id", "last_seen_at"]),
+    )
+    for name, columns in indexes:
+        if not _has_index(bind, "trust_graph_edges", name):
+            op.create_index(name, "trust_graph_edges", columns)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if not _has_table(bind, "trust_graph_edges"):
+        return
+
+    for name in (
+        "ix_trust_graph_edges_target_seen",
+        "ix_trust_graph_edges_source_seen",
+        "ix_trust_graph_edges_loan_id",
+        "ix_trust_graph_edges_target_user_id",
+        "ix_trust_graph_edges_source_user_id",
+        "ix_trust_graph_edges_edge_type",
+        "ix_trust_graph_edges_id",
+    ):
+        if _has_index(bind, "trust_graph_edges", name):
+            op.drop_index(name, table_name="trust_graph_edges")
+
+    op.drop_table("trust_graph_edges")
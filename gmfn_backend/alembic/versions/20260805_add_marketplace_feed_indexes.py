@@ -0,0 +1,57 @@
+"""add marketplace feed keyset indexes
+
+Revision ID: 20260805_marketplace_feed_idx
+Revises: 20260801_trust_graph_edges
+Create Date: 2026-08-05
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260805_marketplace_feed_idx"
+down_revision = "20260801_trust_graph_edges"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    (
+        "marketplace_products",
+        "ix_marketplace_products_feed",
+        ["visibility_mode", "is_active", "created_at", "id"],
+    ),
+    (
+        "marketplace_shops",
+        "ix_marketplace_shops_active_created",
+        ["is_active", "created_at", "id"],
+    ),
+)
+
+
+def _has_table(bind, table_name: str) -> bool:
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _has_index(bind, table_name: str, index_name: str) -> bool:
+    if not _has_table(bind, table_name):
+        return False
+    inspector = sa.inspect(bind)
+    return any(idx["name"] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for table_name, name, columns in INDEXES:
+        if _has_table(bind, table_name) and not _has_index(bind, table_name, name):
+            op.create_index(name, table_name, columns)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table_name, name, _columns in reversed(INDEXES):
+        if _has_index(bind, table_name, name):
+            op.drop_index(name, table_name=table_name)
@@ -0,0 +1,54 @@
+"""add community domain change version
+
+Revision ID: 20260818_domain_change_version
+Revises: 20260805_marketplace_feed_idx
+Create Date: 2026-08-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260818_domain_change_version"
+down_revision = "20260805_marketplace_feed_idx"
+branch_labels = None
+depends_on = None
+
+
+TABLE_NAME = "community_domains"
+COLUMN_NAME = "change_version"
+
+
+def _has_table(bind, table_name: str) -> bool:
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _has_column(bind, table_name: str, column_name: str) -> bool:
+    if not _has_table(bind, table_name):
+        return False
+    inspector = sa.inspect(bind)
+    return any(col["name"] == column_name for col in inspector.get_columns(table_name))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if _has_table(bind, TABLE_NAME) and not _has_column(bind, TABLE_NAME, COLUMN_NAME):
+        op.add_column(
+            TABLE_NAME,
+            sa.Column(
+                COLUMN_NAME,
+                sa.Integer(),
+                nullable=False,
+                server_default="0",
+            ),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if _has_column(bind, TABLE_NAME, COLUMN_NAME):
+        with op.batch_alter_table(TABLE_NAME) as batch_op:
+            batch_op.drop_column(COLUMN_NAME)
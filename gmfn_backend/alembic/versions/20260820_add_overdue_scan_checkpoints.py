@@ -0,0 +1,84 @@
+"""add maintenance checkpoints and loan due_at index
+
+Revision ID: 20260820_overdue_scan_checkpoints
+Revises: 20260818_domain_change_version
+Create Date: 2026-08-20
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260820_overdue_scan_checkpoints"
+down_revision = "20260818_domain_change_version"
+branch_labels = None
+depends_on = None
+
+
+def _has_table(bind, table_name: str) -> bool:
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _has_index(bind, table_name: str, index_name: str) -> bool:
+    if not _has_table(bind, table_name):
+        return False
+    inspector = sa.inspect(bind)
+    return any(idx["name"] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if not _has_table(bind, "maintenance_checkpoints"):
+        op.create_table(
+            "maintenance_checkpoints",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("job_key", sa.String(length=96), nullable=False),
+            sa.Column("cursor_json", sa.Text(), nullable=True),
+            sa.Column("pass_started_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.text("CURRENT_TIMESTAMP"),
+            ),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.text("CURRENT_TIMESTAMP"),
+            ),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    for name, columns, unique in (
+        ("ix_maintenance_checkpoints_id", ["id"], False),
+        ("ix_maintenance_checkpoints_job_key", ["job_key"], True),
+    ):
+        if not _has_index(bind, "maintenance_checkpoints", name):
+            op.create_index(name, "maintenance_checkpoints", columns, unique=unique)
+
+    if _has_table(bind, "loans") and not _has_index(bind, "loans", "ix_loans_due_at_id"):
+        op.create_index("ix_loans_due_at_id", "loans", ["due_at", "id"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    if _has_index(bind, "loans", "ix_loans_due_at_id"):
+        op.drop_index("ix_loans_due_at_id", table_name="loans")
+
+    if not _has_table(bind, "maintenance_checkpoints"):
+        return
+
+    for name in (
+        "ix_maintenance_checkpoints_job_key",
+        "ix_maintenance_checkpoints_id",
+    ):
+        if _has_index(bind, "maintenance_checkpoints", name):
+            op.drop_index(name, table_name="maintenance_checkpoints")
+
+    op.drop_table("maintenance_checkpoints")
@@ -0,0 +1,78 @@
+"""add daily invite analytics rollups
+
+Revision ID: 20260822_invite_analytics_rollups
+Revises: 20260820_overdue_scan_checkpoints
+Create Date: 2026-08-22
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260822_invite_analytics_rollups"
+down_revision = "20260820_overdue_scan_checkpoints"
+branch_labels = None
+depends_on = None
+
+
+def _has_table(bind, table_name: str) -> bool:
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _has_index(bind, table_name: str, index_name: str) -> bool:
+    if not _has_table(bind, table_name):
+        return False
+    inspector = sa.inspect(bind)
+    return any(idx["name"] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if not _has_table(bind, "invite_analytics_rollups"):
+        op.create_table(
+            "invite_analytics_rollups",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("clan_id", sa.Integer(), nullable=False),
+            sa.Column("day", sa.Date(), nullable=False),
+            sa.Column("bucket", sa.String(length=16), nullable=False),
+            sa.Column("bucket_key", sa.String(length=128), nullable=False, server_default=""),
+            sa.Column("invites_created", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("invites_revoked", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("joins", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("last_event_at", sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint(
+                "clan_id",
+                "bucket",
+                "bucket_key",
+                "day",
+                name="uq_invite_analytics_rollups_key",
+            ),
+        )
+
+    indexes = (
+        ("ix_invite_analytics_rollups_id", ["id"]),
+        ("ix_invite_analytics_rollups_clan_bucket_day", ["clan_id", "bucket", "day"]),
+    )
+    for name, columns in indexes:
+        if not _has_index(bind, "invite_analytics_rollups", name):
+            op.create_index(name, "invite_analytics_rollups", columns)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if not _has_table(bind, "invite_analytics_rollups"):
+        return
+
+    for name in (
+        "ix_invite_analytics_rollups_clan_bucket_day",
+        "ix_invite_analytics_rollups_id",
+    ):
+        if _has_index(bind, "invite_analytics_rollups", name):
+            op.drop_index(name, table_name="invite_analytics_rollups")
+
+    op.drop_table("invite_analytics_rollups")
@@ -0,0 +1,43 @@
+"""add bank_events (status, clan_id) index for the reconciliation worker
+
+Revision ID: 20260824_bank_events_status_index
+Revises: 20260822_invite_analytics_rollups
+Create Date: 2026-08-24
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260824_bank_events_status_index"
+down_revision = "20260822_invite_analytics_rollups"
+branch_labels = None
+depends_on = None
+
+
+def _has_table(bind, table_name: str) -> bool:
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _has_index(bind, table_name: str, index_name: str) -> bool:
+    if not _has_table(bind, table_name):
+        return False
+    inspector = sa.inspect(bind)
+    return any(idx["name"] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if not _has_table(bind, "bank_events"):
+        return
+    if not _has_index(bind, "bank_events", "ix_bank_events_status_clan_v1"):
+        op.create_index("ix_bank_events_status_clan_v1", "bank_events", ["status", "clan_id"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if _has_index(bind, "bank_events", "ix_bank_events_status_clan_v1"):
+        op.drop_index("ix_bank_events_status_clan_v1", table_name="bank_events")
@@ -0,0 +1,47 @@
+"""add trust_events (subject_user_id, created_at, id) index for timeline paging
+
+Revision ID: 20260826_trust_events_subject_created_index
+Revises: 20260824_bank_events_status_index
+Create Date: 2026-08-26
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260826_trust_events_subject_created_index"
+down_revision = "20260824_bank_events_status_index"
+branch_labels = None
+depends_on = None
+
+
+def _has_table(bind, table_name: str) -> bool:
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _has_index(bind, table_name: str, index_name: str) -> bool:
+    if not _has_table(bind, table_name):
+        return False
+    inspector = sa.inspect(bind)
+    return any(idx["name"] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if not _has_table(bind, "trust_events"):
+        return
+    if not _has_index(bind, "trust_events", "ix_trust_events_subject_created_id"):
+        op.create_index(
+            "ix_trust_events_subject_created_id",
+            "trust_events",
+            ["subject_user_id", "created_at", "id"],
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if _has_index(bind, "trust_events", "ix_trust_events_subject_created_id"):
+        op.drop_index("ix_trust_events_subject_created_id", table_name="trust_events")
@@ -0,0 +1,60 @@
+"""add identity_risk_signals.dedupe_key for idempotent overlap signals
+
+Revision ID: 20260828_identity_risk_signal_dedupe_key
+Revises: 20260826_trust_events_subject_created_index
+Create Date: 2026-08-28
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260828_identity_risk_signal_dedupe_key"
+down_revision = "20260826_trust_events_subject_created_index"
+branch_labels = None
+depends_on = None
+
+
+def _has_table(bind, table_name: str) -> bool:
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _has_column(bind, table_name: str, column_name: str) -> bool:
+    inspector = sa.inspect(bind)
+    return any(col["name"] == column_name for col in inspector.get_columns(table_name))
+
+
+def _has_index(bind, table_name: str, index_name: str) -> bool:
+    if not _has_table(bind, table_name):
+        return False
+    inspector = sa.inspect(bind)
+    return any(idx["name"] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if not _has_table(bind, "identity_risk_signals"):
+        return
+    if not _has_column(bind, "identity_risk_signals", "dedupe_key"):
+        op.add_column(
+            "identity_risk_signals",
+            sa.Column("dedupe_key", sa.String(length=200), nullable=True),
+        )
+    if not _has_index(bind, "identity_risk_signals", op.f("ix_identity_risk_signals_dedupe_key")):
+        op.create_index(
+            op.f("ix_identity_risk_signals_dedupe_key"),
+            "identity_risk_signals",
+            ["dedupe_key"],
+            unique=True,
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if _has_index(bind, "identity_risk_signals", op.f("ix_identity_risk_signals_dedupe_key")):
+        op.drop_index(op.f("ix_identity_risk_signals_dedupe_key"), table_name="identity_risk_signals")
+    if _has_table(bind, "identity_risk_signals") and _has_column(bind, "identity_risk_signals", "dedupe_key"):
+        op.drop_column("identity_risk_signals", "dedupe_key")
@@ -0,0 +1,44 @@
+"""add image_variants_json to marketplace products and broadcasts
+
+Revision ID: 20260830_marketplace_image_variants
+Revises: 20260828_identity_risk_signal_dedupe_key
+Create Date: 2026-08-30
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260830_marketplace_image_variants"
+down_revision = "20260828_identity_risk_signal_dedupe_key"
+branch_labels = None
+depends_on = None
+
+
+TABLES = ("marketplace_products", "marketplace_broadcasts")
+
+
+def _has_table(bind, table_name: str) -> bool:
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _has_column(bind, table_name: str, column_name: str) -> bool:
+    inspector = sa.inspect(bind)
+    return any(col["name"] == column_name for col in inspector.get_columns(table_name))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for table_name in TABLES:
+        if _has_table(bind, table_name) and not _has_column(bind, table_name, "image_variants_json"):
+            op.add_column(table_name, sa.Column("image_variants_json", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table_name in TABLES:
+        if _has_table(bind, table_name) and _has_column(bind, table_name, "image_variants_json"):
+            op.drop_column(table_name, "image_variants_json")
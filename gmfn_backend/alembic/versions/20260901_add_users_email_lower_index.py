@@ -0,0 +1,35 @@
+"""add a lower(email) index on users for case-insensitive lookups
+
+Revision ID: 20260901_users_email_lower_index
+Revises: 20260830_marketplace_image_variants
+Create Date: 2026-09-01
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260901_users_email_lower_index"
+down_revision = "20260830_marketplace_image_variants"
+branch_labels = None
+depends_on = None
+
+
+def _has_table(bind, table_name: str) -> bool:
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if not _has_table(bind, "users"):
+        return
+    # Expression indexes are not reflected on every dialect, so the
+    # existence check is left to the database.
+    op.execute(sa.text("CREATE INDEX IF NOT EXISTS ix_users_email_lower ON users (lower(email))"))
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DROP INDEX IF EXISTS ix_users_email_lower"))
@@ -14,7 +14,7 @@ from typing import Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field, field_validator
-from sqlalchemy import or_, func
+from sqlalchemy import and_, case, exists, func, or_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -32,6 +32,7 @@ from app.db.models import (
     UserPayoutDestination,
 )
 from app.db.verification_models import IdentityVerificationCheck
+from app.services.community_confirmation_service import provision_confirmation_contacts_for_membership
 from app.services.global_identity_service import generate_gmfn_id
 from app.services.trust_events_services import build_trust_meta, log_trust_event
 from app.services.trust_score_service import apply_trust_score
@@ -1027,6 +1028,7 @@ def _ensure_ownership_admin_membership_no_commit(
         archived.left_at = None
         archived.role = "admin"
         db.add(archived)
+        provision_confirmation_contacts_for_membership(db, archived)
         db.flush()
         return archived
 
@@ -1037,6 +1039,7 @@ def _ensure_ownership_admin_membership_no_commit(
         personal_pool_balance=Decimal("0"),
     )
     db.add(membership)
+    provision_confirmation_contacts_for_membership(db, membership)
     db.flush()
     return membership
 
@@ -2011,6 +2014,150 @@ def admin_exposure(
     return {"items": items, "total": len(items), "clan_id": int(clan_id)}
 
 
+def _entry_user_match():
+    """SQL twin of the intake's user lookup: a user with the entry's phone or email."""
+    entry_email = func.lower(func.trim(func.coalesce(EntryPhoneVerification.email, "")))
+    return or_(
+        and_(
+            func.coalesce(EntryPhoneVerification.phone_e164, "") != "",
+            exists().where(User.phone_e164 == EntryPhoneVerification.phone_e164),
+        ),
+        and_(
+            entry_email != "",
+            exists().where(func.lower(User.email) == entry_email),
+        ),
+    )
+
+
+def _stage_counts(db: Session, stage: Any, *, source: Any) -> dict[str, int]:
+    staged = db.query(stage.label("stage")).select_from(source).subquery()
+    rows = db.query(staged.c.stage, func.count()).group_by(staged.c.stage).all()
+    return {str(name): int(count) for name, count in rows}
+
+
+def _entry_stage_counts(db: Session, now: datetime) -> dict[str, int]:
+    """Every intake entry by stage, with the same rules as _entry_stage."""
+    matched = _entry_user_match()
+    stage = case(
+        (and_(matched, EntryPhoneVerification.consumed_at.isnot(None)), "completed"),
+        (matched, "account_exists"),
+        (EntryPhoneVerification.expires_at < now, "expired"),
+        (EntryPhoneVerification.bank_details_recorded_at.isnot(None), "ready_for_community"),
+        (EntryPhoneVerification.verified_at.isnot(None), "awaiting_bank"),
+        else_="awaiting_phone",
+    )
+    return _stage_counts(db, stage, source=EntryPhoneVerification)
+
+
+def _join_stage_counts(db: Session) -> dict[str, int]:
+    """Every join request by stage, with the same rules as _join_stage."""
+    status = func.lower(func.coalesce(func.nullif(func.trim(ClanJoinRequest.status), ""), "pending"))
+    has_link = and_(
+        ClanJoinRequest.activation_link.isnot(None),
+        ClanJoinRequest.activation_link != "",
+    )
+    stage = case(
+        (and_(status == "approved", has_link), "approved_activation_ready"),
+        (status == "approved", "approved_missing_activation"),
+        else_=status,
+    )
+    return _stage_counts(db, stage, source=ClanJoinRequest)
+
+
+def _intake_users_by_entry(
+    db: Session,
+    entry_rows: list[EntryPhoneVerification],
+) -> dict[int, User]:
+    """Matched user per entry id: by phone first, then by case-insensitive email."""
+    phones = {_safe_str(row.phone_e164) for row in entry_rows} - {""}
+    emails = {_safe_str(row.email).lower() for row in entry_rows} - {""}
+
+    by_phone: dict[str, User] = {}
+    if phones:
+        for user in (
+            db.query(User)
+            .filter(User.phone_e164.in_(sorted(phones)))
+            .order_by(User.id.asc())
+        ):
+            by_phone.setdefault(_safe_str(user.phone_e164), user)
+
+    by_email: dict[str, User] = {}
+    if emails:
+        for user in (
+            db.query(User)
+            .filter(func.lower(User.email).in_(sorted(emails)))
+            .order_by(User.id.asc())
+        ):
+            by_email.setdefault(_safe_str(user.email).lower(), user)
+
+    matched: dict[int, User] = {}
+    for row in entry_rows:
+        user = by_phone.get(_safe_str(row.phone_e164)) or by_email.get(_safe_str(row.email).lower())
+        if user is not None:
+            matched[int(row.id)] = user
+    return matched
+
+
+def _latest_payouts_by_user(db: Session, user_ids: set[int]) -> dict[int, UserPayoutDestination]:
+    if not user_ids:
+        return {}
+    latest_ids = (
+        db.query(func.max(UserPayoutDestination.id))
+        .filter(UserPayoutDestination.user_id.in_(sorted(user_ids)))
+        .group_by(UserPayoutDestination.user_id)
+    )
+    return {
+        int(payout.user_id): payout
+        for payout in db.query(UserPayoutDestination).filter(UserPayoutDestination.id.in_(latest_ids))
+    }
+
+
+def _recent_communities_by_user(
+    db: Session,
+    user_ids: set[int],
+    *,
+    per_user: int = 5,
+) -> dict[int, list[dict[str, Any]]]:
+    communities: dict[int, list[dict[str, Any]]] = {}
+    if not user_ids:
+        return communities
+    rows = (
+        db.query(ClanMembership, Clan)
+        .join(Clan, Clan.id == ClanMembership.clan_id)
+        .filter(
+            ClanMembership.user_id.in_(sorted(user_ids)),
+            ClanMembership.left_at.is_(None),
+        )
+        .order_by(ClanMembership.id.desc())
+        .all()
+    )
+    for membership, clan in rows:
+        items = communities.setdefault(int(membership.user_id), [])
+        if len(items) < per_user:
+            items.append(
+                {
+                    "clan_id": int(clan.id),
+                    "name": clan.name,
+                    "marketplace_name": getattr(clan, "marketplace_name", None),
+                    "role": membership.role,
+                }
+            )
+    return communities
+
+
+def _checks_by_entry(db: Session, entry_ids: list[int]) -> dict[int, list[IdentityVerificationCheck]]:
+    checks: dict[int, list[IdentityVerificationCheck]] = {}
+    if not entry_ids:
+        return checks
+    for check in (
+        db.query(IdentityVerificationCheck)
+        .filter(IdentityVerificationCheck.entry_phone_verification_id.in_(entry_ids))
+        .order_by(IdentityVerificationCheck.id.asc())
+    ):
+        checks.setdefault(int(check.entry_phone_verification_id), []).append(check)
+    return checks
+
+
 @router.get("/pilot-intake")
 def admin_pilot_intake(
     limit: int = Query(50, ge=1, le=200),
@@ -2034,60 +2181,21 @@ def admin_pilot_intake(
         .all()
     )
 
+    users_by_entry = _intake_users_by_entry(db, entry_rows)
+    user_ids = {int(user.id) for user in users_by_entry.values()}
+    payouts_by_user = _latest_payouts_by_user(db, user_ids)
+    communities_by_user = _recent_communities_by_user(db, user_ids)
+    checks_by_entry = _checks_by_entry(db, [int(row.id) for row in entry_rows])
+
     create_items: list[dict[str, Any]] = []
-    stage_counts: dict[str, int] = {}
 
     for row in entry_rows:
-        email = _safe_str(getattr(row, "email", "")).lower()
-        phone = _safe_str(getattr(row, "phone_e164", ""))
-        user = None
-
-        if phone:
-            user = db.query(User).filter(User.phone_e164 == phone).first()
-        if user is None and email:
-            user = db.query(User).filter(func.lower(User.email) == email).first()
-
-        payout = None
-        communities: list[dict[str, Any]] = []
-        if user is not None:
-            payout = (
-                db.query(UserPayoutDestination)
-                .filter(UserPayoutDestination.user_id == int(user.id))
-                .order_by(UserPayoutDestination.id.desc())
-                .first()
-            )
-
-            membership_rows = (
-                db.query(ClanMembership, Clan)
-                .join(Clan, Clan.id == ClanMembership.clan_id)
-                .filter(
-                    ClanMembership.user_id == int(user.id),
-                    ClanMembership.left_at.is_(None),
-                )
-                .order_by(ClanMembership.id.desc())
-                .limit(5)
-                .all()
-            )
-
-            communities = [
-                {
-                    "clan_id": int(clan.id),
-                    "name": clan.name,
-                    "marketplace_name": getattr(clan, "marketplace_name", None),
-                    "role": membership.role,
-                }
-                for membership, clan in membership_rows
-            ]
-
-        checks = (
-            db.query(IdentityVerificationCheck)
-            .filter(IdentityVerificationCheck.entry_phone_verification_id == int(row.id))
-            .order_by(IdentityVerificationCheck.id.asc())
-            .all()
-        )
+        user = users_by_entry.get(int(row.id))
+        payout = payouts_by_user.get(int(user.id)) if user is not None else None
+        communities = communities_by_user.get(int(user.id), []) if user is not None else []
+        checks = checks_by_entry.get(int(row.id), [])
 
         stage = _entry_stage(row, user, now)
-        stage_counts[stage] = stage_counts.get(stage, 0) + 1
 
         create_items.append(
             {
@@ -2172,15 +2280,28 @@ def admin_pilot_intake(
         .all()
     )
 
+    join_clan_ids = {int(row.clan_id) for row in join_rows}
+    join_user_ids = {int(row.applicant_user_id) for row in join_rows if row.applicant_user_id} | {
+        int(row.invited_by_user_id) for row in join_rows if row.invited_by_user_id
+    }
+    clans_by_id = (
+        {int(clan.id): clan for clan in db.query(Clan).filter(Clan.id.in_(sorted(join_clan_ids)))}
+        if join_clan_ids
+        else {}
+    )
+    users_by_id = (
+        {int(user.id): user for user in db.query(User).filter(User.id.in_(sorted(join_user_ids)))}
+        if join_user_ids
+        else {}
+    )
+
     join_items: list[dict[str, Any]] = []
-    join_stage_counts: dict[str, int] = {}
 
     for row in join_rows:
         stage = _join_stage(row)
-        join_stage_counts[stage] = join_stage_counts.get(stage, 0) + 1
-        clan = db.get(Clan, int(row.clan_id))
-        applicant = db.get(User, int(row.applicant_user_id))
-        inviter = db.get(User, int(row.invited_by_user_id)) if row.invited_by_user_id else None
+        clan = clans_by_id.get(int(row.clan_id))
+        applicant = users_by_id.get(int(row.applicant_user_id)) if row.applicant_user_id else None
+        inviter = users_by_id.get(int(row.invited_by_user_id)) if row.invited_by_user_id else None
 
         join_items.append(
             {
@@ -2220,12 +2341,18 @@ def admin_pilot_intake(
             }
         )
 
+    # Stage counts cover the whole funnel, not just the rows listed above.
+    stage_counts = _entry_stage_counts(db, now)
+    join_stage_counts = _join_stage_counts(db)
+
     return {
         "generated_at": _dt_iso(now),
         "summary": {
             "create_total": len(create_items),
+            "create_funnel_total": sum(stage_counts.values()),
             "create_by_stage": stage_counts,
             "join_total": len(join_items),
+            "join_funnel_total": sum(join_stage_counts.values()),
             "join_by_stage": join_stage_counts,
             "needs_attention": (
                 stage_counts.get("expired", 0)
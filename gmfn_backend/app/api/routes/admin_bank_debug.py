@@ -14,6 +14,7 @@ from app.core.auth import get_current_user
 from app.db.database import get_db
 from app.db.models import CommunityDomain, User
 from app.db.bank_models import BankEvent, ExpectedPayment
+from app.services.community_domain_payload_cache import bump_community_domain_change_version
 from app.services.feature_entitlements_service import grant_or_extend_entitlement
 
 router = APIRouter(prefix="/admin/bank", tags=["admin"])
@@ -322,6 +323,7 @@ def admin_expected_payment_finance_review(
     if previous_status.lower() not in {"closed", "suspended"}:
         domain.status = "active"
         db.add(domain)
+        bump_community_domain_change_version(db, int(domain.id))
 
     row.paid_amount = amount
     row.remaining_amount = Decimal("0.00")
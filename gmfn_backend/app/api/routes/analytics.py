@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Response
@@ -15,8 +15,10 @@ from app.schemas.analytics import (
 )
 from app.services.invite_analytics_service import (
     get_invite_analytics,
+    get_invite_analytics_daily,
     get_recent_invite_joins,
     get_trust_events_timeline,
+    csv_for_invite_analytics_daily,
     csv_for_recent_invite_joins,
     csv_for_trust_events,
 )
@@ -127,6 +129,26 @@ def export_recent_invite_joins_csv(
     )
 
 
+@router.get("/clans/{clan_id}/invites/daily.csv")
+def export_invite_analytics_daily_csv(
+    clan_id: int,
+    from_day: Optional[date] = None,
+    to_day: Optional[date] = None,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    _ensure_clan_admin_or_platform_admin(db, current_user=user, clan_id=int(clan_id))
+    rows = get_invite_analytics_daily(db, clan_id=clan_id, from_day=from_day, to_day=to_day)
+    csv_text = csv_for_invite_analytics_daily(rows)
+    return Response(
+        content=csv_text,
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f'attachment; filename="gsn-community-{clan_id}-invites-daily.csv"'
+        },
+    )
+
+
 @router.get("/clans/{clan_id}/trust-events.csv")
 def export_trust_events_csv(
     clan_id: int,
@@ -9,13 +9,14 @@ from decimal import Decimal
 from typing import Any, List, Optional
 from urllib.parse import quote, urlencode, urlparse
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import HTMLResponse
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator
-from sqlalchemy import or_
+from sqlalchemy import func, or_
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 from app.services.notification_service import create_notification
+from app.services.notification_stream_service import publish_notifications
 from app.core.auth import get_current_user, is_user_activation_pending, oauth2_scheme
 from app.core.clan_auth import (
     _is_default_clan_name,
@@ -55,6 +56,7 @@ from app.services.invites_service import (
 )
 from app.services.global_identity_service import ensure_user_gmfn_id
 from app.services.feature_entitlements_service import get_active_feature_quantity_for_scope
+from app.services.community_confirmation_service import provision_confirmation_contacts_for_membership
 from app.services.community_integrity_service import _user_settings_table_exists
 from app.services.trust_events_services import log_trust_event
 from app.schemas.invites import ClanInviteRelationshipEvidence
@@ -64,6 +66,8 @@ router = APIRouter(prefix="/clans", tags=["clans"])
 JOIN_APPROVAL_RATIO = Decimal("0.40")
 DEFAULT_SHAREABLE_JOIN_INVITE_MAX_USES = 100
 FREE_COMMUNITY_MEMBER_CAPACITY = 15
+MEMBER_LIST_DEFAULT_LIMIT = 200
+MEMBER_LIST_MAX_LIMIT = 500
 FEATURE_COMMUNITY_MEMBER_CAPACITY = "community_member_capacity"
 COMMUNITY_DOMAIN_FEATURE_POLICY_KEY = "domain.feature_policy"
 COMMUNITY_DOMAIN_FEATURE_MEMBER_INVITES = "member_invites"
@@ -713,16 +717,23 @@ def _member_display(user: Optional[User]) -> str:
 
 
 def _member_row(db: Session, m: ClanMembership) -> dict[str, Any]:
-    u = db.get(User, m.user_id)
-    clan = db.get(Clan, m.clan_id)
+    return _member_row_payload(m, user=db.get(User, m.user_id), clan=db.get(Clan, m.clan_id))
+
+
+def _member_row_payload(
+    m: ClanMembership,
+    *,
+    user: Optional[User],
+    clan: Optional[Clan],
+) -> dict[str, Any]:
     return {
         "id": int(m.id),
         "clan_id": int(m.clan_id),
         "community_code": _community_code(m.clan_id),
         "clan_name": (clan.name if clan else None),
         "user_id": int(m.user_id),
-        "email": (u.email if u else None),
-        "gmfn_id": (getattr(u, "gmfn_id", None) if u else None),
+        "email": (user.email if user else None),
+        "gmfn_id": (getattr(user, "gmfn_id", None) if user else None),
         "role": m.role,
         "personal_pool_balance": str(m.personal_pool_balance or Decimal("0")),
         "created_at": m.created_at,
@@ -915,10 +926,10 @@ def _member_witness_request_action_url(row: CommunityMemberVerificationRequest)
 def _notify_member_witness_request_created(
     db: Session,
     row: CommunityMemberVerificationRequest,
-) -> None:
+) -> Notification:
     subject = db.get(User, int(row.subject_user_id))
     community = db.get(Clan, int(row.clan_id))
-    create_notification(
+    return create_notification(
         db,
         user_id=int(row.verifier_user_id),
         kind="community_member_witness.request_to_respond",
@@ -938,7 +949,7 @@ def _notify_member_witness_request_created(
 def _mark_member_witness_request_notification_read(
     db: Session,
     row: CommunityMemberVerificationRequest,
-) -> None:
+) -> Optional[Notification]:
     notification = (
         db.query(Notification)
         .filter(Notification.user_id == int(row.verifier_user_id))
@@ -947,10 +958,11 @@ def _mark_member_witness_request_notification_read(
         .first()
     )
     if notification is None or notification.is_read:
-        return
+        return None
     notification.is_read = True
     notification.read_at = datetime.now(timezone.utc)
     db.add(notification)
+    return notification
 
 
 def _notify_member_witness_requester_result(
@@ -958,14 +970,14 @@ def _notify_member_witness_requester_result(
     row: CommunityMemberVerificationRequest,
     *,
     status: str,
-) -> None:
+) -> Optional[Notification]:
     recipient_id = int(row.requested_by_user_id or row.subject_user_id)
     if recipient_id <= 0 or recipient_id == int(row.verifier_user_id):
-        return
+        return None
     verifier = db.get(User, int(row.verifier_user_id))
     community = db.get(Clan, int(row.clan_id))
     normalized_status = _safe_str(status, _safe_str(row.status, "updated")).lower()
-    create_notification(
+    return create_notification(
         db,
         user_id=recipient_id,
         kind="community_member_witness.outcome_updated",
@@ -3097,6 +3109,7 @@ def join_clan(
         personal_pool_balance=Decimal("0"),
     )
     db.add(m)
+    provision_confirmation_contacts_for_membership(db, m)
     db.commit()
     db.refresh(m)
 
@@ -4578,7 +4591,7 @@ def create_member_verification_request(
         commit=False,
         refresh=False,
     )
-    _notify_member_witness_request_created(db, row)
+    notification = _notify_member_witness_request_created(db, row)
     try:
         db.commit()
         db.refresh(row)
@@ -4610,6 +4623,7 @@ def create_member_verification_request(
             status_code=409,
             detail="GSN could not reserve this witness request. Try again.",
         ) from exc
+    publish_notifications(db, created=[notification])
     return {
         "ok": True,
         "message": "Member witness request created. Share the approval link or one-time code with the verifier.",
@@ -4754,10 +4768,11 @@ def decide_member_verification_request(
             commit=False,
             refresh=False,
         )
-        _mark_member_witness_request_notification_read(db, row)
-        _notify_member_witness_requester_result(db, row, status="declined")
+        request_notification = _mark_member_witness_request_notification_read(db, row)
+        result_notification = _notify_member_witness_requester_result(db, row, status="declined")
         db.commit()
         db.refresh(row)
+        publish_notifications(db, created=[result_notification], read=[request_notification])
         return {
             "ok": True,
             "message": "Member witness request declined.",
@@ -4800,11 +4815,12 @@ def decide_member_verification_request(
         commit=False,
         refresh=False,
     )
-    _mark_member_witness_request_notification_read(db, row)
-    _notify_member_witness_requester_result(db, row, status="approved")
+    request_notification = _mark_member_witness_request_notification_read(db, row)
+    result_notification = _notify_member_witness_requester_result(db, row, status="approved")
     db.commit()
     db.refresh(row)
     db.refresh(verification)
+    publish_notifications(db, created=[result_notification], read=[request_notification])
     return {
         "ok": True,
         "message": message,
@@ -5294,9 +5310,66 @@ def update_invite_settings(
     }
 
 
+def _list_member_page(
+    db: Session,
+    *,
+    clan: Clan,
+    limit: int = MEMBER_LIST_DEFAULT_LIMIT,
+    after_id: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    One page of a community's active members, in join order, read with a
+    single membership + user query. Memberships whose user row is gone are
+    left out, here and in _listed_member_count.
+    """
+    page_size = max(1, min(int(limit), MEMBER_LIST_MAX_LIMIT))
+    q = (
+        db.query(ClanMembership, User)
+        .join(User, User.id == ClanMembership.user_id)
+        .filter(
+            ClanMembership.clan_id == int(clan.id),
+            ClanMembership.left_at.is_(None),
+        )
+    )
+    if after_id is not None:
+        q = q.filter(ClanMembership.id > int(after_id))
+    rows = q.order_by(ClanMembership.id.asc()).limit(page_size + 1).all()
+
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    return {
+        "items": [_member_row_payload(m, user=user, clan=clan) for m, user in rows],
+        "has_more": has_more,
+        "next_after_id": int(rows[-1][0].id) if has_more and rows else None,
+    }
+
+
+def _listed_member_count(db: Session, *, clan_id: int) -> int:
+    return (
+        db.query(func.count(ClanMembership.id))
+        .join(User, User.id == ClanMembership.user_id)
+        .filter(
+            ClanMembership.clan_id == int(clan_id),
+            ClanMembership.left_at.is_(None),
+        )
+        .scalar()
+        or 0
+    )
+
+
+def _member_reviewer_items(db: Session, *, clan: Clan) -> list[dict[str, Any]]:
+    """Every eligible reviewer in the community, independent of the page."""
+    return [
+        _member_row_payload(m, user=user, clan=clan)
+        for m, user in _active_reviewer_memberships(db, clan_id=int(clan.id))
+    ]
+
+
 @router.get("/{clan_id}/members", response_model=dict[str, Any])
 def list_members(
     clan_id: int,
+    limit: int = Query(default=MEMBER_LIST_DEFAULT_LIMIT, ge=1, le=MEMBER_LIST_MAX_LIMIT),
+    after_id: Optional[int] = Query(default=None, ge=1),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -5306,29 +5379,18 @@ def list_members(
         current_user=current_user,
     )
 
-    member_rows = (
-        db.query(ClanMembership)
-        .filter(
-            ClanMembership.clan_id == int(clan_id),
-            ClanMembership.left_at.is_(None),
-        )
-        .order_by(ClanMembership.created_at.asc(), ClanMembership.id.asc())
-        .all()
-    )
-    reviewer_members = [
-        membership
-        for membership, _user in _active_reviewer_memberships(db, clan_id=int(clan_id))
-    ]
-
-    items = [_member_row(db, m) for m in member_rows]
-    reviewer_items = [_member_row(db, m) for m in reviewer_members]
+    page = _list_member_page(db, clan=clan, limit=limit, after_id=after_id)
+    total = _listed_member_count(db, clan_id=int(clan_id))
+    reviewer_items = _member_reviewer_items(db, clan=clan)
     capacity = _community_member_capacity_snapshot(db, clan_id=int(clan_id))
     return {
-        "items": items,
-        "total": len(items),
-        "active_membership_total": len(items),
+        "items": page["items"],
+        "total": total,
+        "active_membership_total": total,
         "reviewer_items": reviewer_items,
         "reviewer_total": len(reviewer_items),
+        "has_more": page["has_more"],
+        "next_after_id": page["next_after_id"],
         "community_code": _community_code(clan_id),
         "member_capacity_included": capacity["included"],
         "member_capacity_extra": capacity["extra"],
@@ -5379,6 +5441,7 @@ def add_member(
         personal_pool_balance=Decimal("0"),
     )
     db.add(m)
+    provision_confirmation_contacts_for_membership(db, m)
     db.commit()
     db.refresh(m)
     return _member_row(db, m)
@@ -735,12 +735,16 @@ def get_public_community_confirmation(
 
 @router.get("/community-confirmations/inbox")
 def get_community_confirmation_inbox(
+    limit: int = Query(default=50, ge=1, le=200),
+    before_id: Optional[int] = Query(default=None, ge=1),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> Dict[str, Any]:
     return list_confirmation_inbox(
         db,
         responder_user_id=int(getattr(current_user, "id")),
+        limit=limit,
+        before_id=before_id,
     )
 
 
@@ -8,12 +8,12 @@ import secrets
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Literal, Optional, Sequence
+from typing import Any, Callable, Literal, Optional, Sequence
 from urllib.parse import quote
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
 from pydantic import BaseModel, ConfigDict, Field, field_validator
-from sqlalchemy import func
+from sqlalchemy import and_, case, func, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -44,7 +44,8 @@ from app.services.payment_instruction_service import (
     create_community_domain_subscription_instruction,
 )
 from app.services.notification_service import create_notification
-from app.services.web_push_service import dispatch_web_push_for_notifications
+from app.services.notification_stream_service import publish_notifications
+from app.services.web_push_service import schedule_web_push_for_notifications
 from app.db.bank_models import ExpectedPayment
 from app.services.community_pay_in_account_service import get_community_pay_in_settlement
 from app.services.settlement_config_service import (
@@ -52,6 +53,10 @@ from app.services.settlement_config_service import (
     normalize_settlement_country,
 )
 from app.services.trust_events_services import log_trust_event
+from app.services.community_domain_payload_cache import (
+    bump_community_domain_change_version,
+    cached_community_domain_payload,
+)
 
 
 router = APIRouter(prefix="/community-domains", tags=["community-domains"])
@@ -1641,18 +1646,6 @@ def _period_bounds(
     return start, end
 
 
-def _within_period(
-    value: Optional[datetime],
-    *,
-    period_start: datetime,
-    period_end: datetime,
-) -> bool:
-    if value is None:
-        return False
-    checked = _as_aware_utc(value)
-    return period_start <= checked <= period_end
-
-
 def _increment_count(bucket: dict[str, int], key: Optional[str], default: str = "unknown") -> None:
     clean_key = _clean_role(key, default)
     bucket[clean_key] = bucket.get(clean_key, 0) + 1
@@ -1668,6 +1661,55 @@ def _not_recorded_period_section(label: str, missing_reason: str) -> dict[str, A
     }
 
 
+def _add_count(
+    bucket: dict[str, int],
+    key: Optional[str],
+    amount: Any,
+    default: str = "unknown",
+) -> None:
+    if not amount:
+        return
+    clean_key = _clean_role(key, default)
+    bucket[clean_key] = bucket.get(clean_key, 0) + int(amount)
+
+
+def _period_clause(column: Any, *, period_start: datetime, period_end: datetime) -> Any:
+    return and_(column.isnot(None), column >= period_start, column <= period_end)
+
+
+def _count_where(condition: Any) -> Any:
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _text_mentions_any(columns: Sequence[Any], words: Sequence[str]) -> Any:
+    return or_(
+        *(
+            func.lower(func.coalesce(column, "")).like(f"%{word}%")
+            for column in columns
+            for word in words
+        )
+    )
+
+
+def _source_record_summary_for_query(
+    query: Any,
+    *,
+    id_column: Any,
+    total: int,
+    order_by: Sequence[Any],
+    limit: int = 10,
+) -> dict[str, Any]:
+    ids = [
+        int(row[0])
+        for row in query.with_entities(id_column).order_by(*order_by).limit(int(limit)).all()
+    ]
+    return {
+        "total": int(total),
+        "ids": ids,
+        "truncated": int(total) > int(limit),
+    }
+
+
 def _source_record_summary(rows: list[Any], *, limit: int = 10) -> dict[str, Any]:
     ids = [int(getattr(row, "id", 0) or 0) for row in rows if getattr(row, "id", None)]
     return {
@@ -4071,8 +4113,9 @@ def _create_community_domain_notice_notifications(
             )
         )
     db.commit()
+    publish_notifications(db, created=notification_rows)
     try:
-        dispatch_web_push_for_notifications(db, notification_rows)
+        schedule_web_push_for_notifications(db, notification_rows)
     except Exception:
         pass
     return len(recipient_ids)
@@ -4147,8 +4190,9 @@ def _create_community_domain_admin_notifications(
             )
         )
     db.commit()
+    publish_notifications(db, created=notification_rows)
     try:
-        dispatch_web_push_for_notifications(db, notification_rows)
+        schedule_web_push_for_notifications(db, notification_rows)
     except Exception:
         pass
     return len(recipient_ids)
@@ -4442,12 +4486,8 @@ def _community_domain_module_scope_readiness_payload(
     active_non_root_nodes = [
         node for node in active_nodes if node.parent_node_id is not None
     ]
-    active_node_member_count = (
-        db.query(CommunityNodeMembership)
-        .filter(CommunityNodeMembership.community_domain_id == domain_id)
-        .filter(CommunityNodeMembership.status == "active")
-        .count()
-    )
+    counters = _community_domain_counters(db, community_domain_id=domain_id)
+    active_node_member_count = counters["active_node_member_count"]
     active_policy_rows = (
         db.query(CommunityDomainPolicy)
         .filter(CommunityDomainPolicy.community_domain_id == domain_id)
@@ -4711,23 +4751,10 @@ def _community_domain_economic_participation_payload(
     )
     enabled_modules = set(template["default_modules"])
     marketplace_role = _clean_role(template["marketplace_role"], "optional")
-    active_member_count = (
-        db.query(CommunityDomainMembership)
-        .filter(CommunityDomainMembership.community_domain_id == int(domain.id))
-        .filter(CommunityDomainMembership.status == "active")
-        .count()
-    )
-    active_node_member_count = (
-        db.query(CommunityNodeMembership)
-        .filter(CommunityNodeMembership.community_domain_id == int(domain.id))
-        .filter(CommunityNodeMembership.status == "active")
-        .count()
-    )
-    node_count = (
-        db.query(CommunityNode)
-        .filter(CommunityNode.community_domain_id == int(domain.id))
-        .count()
-    )
+    counters = _community_domain_counters(db, community_domain_id=int(domain.id))
+    active_member_count = counters["active_member_count"]
+    active_node_member_count = counters["active_node_member_count"]
+    node_count = counters["node_count"]
 
     marketplace_ready = marketplace_role in {"core", "supported"}
     marketplace_status_by_role = {
@@ -5230,37 +5257,12 @@ def _community_domain_readiness_payload(
     template = _community_domain_template_for_key(
         domain.template_key or domain.domain_type
     )
-    node_count = (
-        db.query(CommunityNode)
-        .filter(CommunityNode.community_domain_id == int(domain.id))
-        .count()
-    )
-    active_member_count = (
-        db.query(CommunityDomainMembership)
-        .filter(CommunityDomainMembership.community_domain_id == int(domain.id))
-        .filter(CommunityDomainMembership.status == "active")
-        .count()
-    )
-    active_node_member_count = (
-        db.query(CommunityNodeMembership)
-        .filter(CommunityNodeMembership.community_domain_id == int(domain.id))
-        .filter(CommunityNodeMembership.status == "active")
-        .count()
-    )
-    active_policy_count = (
-        db.query(CommunityDomainPolicy)
-        .filter(CommunityDomainPolicy.community_domain_id == int(domain.id))
-        .filter(CommunityDomainPolicy.status == "active")
-        .count()
-    )
-    open_review_count = (
-        db.query(CommunityDomainActionReview)
-        .filter(CommunityDomainActionReview.community_domain_id == int(domain.id))
-        .filter(
-            CommunityDomainActionReview.status.in_(REVIEWER_QUEUE_PENDING_STATUSES)
-        )
-        .count()
-    )
+    counters = _community_domain_counters(db, community_domain_id=int(domain.id))
+    node_count = counters["node_count"]
+    active_member_count = counters["active_member_count"]
+    active_node_member_count = counters["active_node_member_count"]
+    active_policy_count = counters["active_policy_count"]
+    open_review_count = counters["open_review_count"]
 
     status = _clean_role(domain.status, "draft")
     verification_status = _clean_role(domain.verification_status, "unverified")
@@ -5570,23 +5572,10 @@ def _community_domain_activation_requirements_payload(
     )
     domain_status = _clean_role(domain.status, "draft")
     verification_status = _clean_role(domain.verification_status, "unverified")
-    node_count = (
-        db.query(CommunityNode)
-        .filter(CommunityNode.community_domain_id == int(domain.id))
-        .count()
-    )
-    active_member_count = (
-        db.query(CommunityDomainMembership)
-        .filter(CommunityDomainMembership.community_domain_id == int(domain.id))
-        .filter(CommunityDomainMembership.status == "active")
-        .count()
-    )
-    active_policy_count = (
-        db.query(CommunityDomainPolicy)
-        .filter(CommunityDomainPolicy.community_domain_id == int(domain.id))
-        .filter(CommunityDomainPolicy.status == "active")
-        .count()
-    )
+    counters = _community_domain_counters(db, community_domain_id=int(domain.id))
+    node_count = counters["node_count"]
+    active_member_count = counters["active_member_count"]
+    active_policy_count = counters["active_policy_count"]
 
     ready_by_key = {
         "package_quote": domain_status == "active",
@@ -6240,37 +6229,12 @@ def _community_domain_dashboard_payload(
     template = _community_domain_template_for_key(
         domain.template_key or domain.domain_type
     )
-    node_count = (
-        db.query(CommunityNode)
-        .filter(CommunityNode.community_domain_id == int(domain.id))
-        .count()
-    )
-    active_member_count = (
-        db.query(CommunityDomainMembership)
-        .filter(CommunityDomainMembership.community_domain_id == int(domain.id))
-        .filter(CommunityDomainMembership.status == "active")
-        .count()
-    )
-    node_member_count = (
-        db.query(CommunityNodeMembership)
-        .filter(CommunityNodeMembership.community_domain_id == int(domain.id))
-        .filter(CommunityNodeMembership.status == "active")
-        .count()
-    )
-    active_policy_count = (
-        db.query(CommunityDomainPolicy)
-        .filter(CommunityDomainPolicy.community_domain_id == int(domain.id))
-        .filter(CommunityDomainPolicy.status == "active")
-        .count()
-    )
-    open_review_count = (
-        db.query(CommunityDomainActionReview)
-        .filter(CommunityDomainActionReview.community_domain_id == int(domain.id))
-        .filter(
-            CommunityDomainActionReview.status.in_(REVIEWER_QUEUE_PENDING_STATUSES)
-        )
-        .count()
-    )
+    counters = _community_domain_counters(db, community_domain_id=int(domain.id))
+    node_count = counters["node_count"]
+    active_member_count = counters["active_member_count"]
+    node_member_count = counters["active_node_member_count"]
+    active_policy_count = counters["active_policy_count"]
+    open_review_count = counters["open_review_count"]
 
     status = _clean_role(domain.status, "draft")
     billing_status = "active" if status == "active" else "quote_required"
@@ -6402,37 +6366,12 @@ def _community_domain_operating_map_payload(
     public_profile_present = bool(_clean_str(domain.public_profile))
     has_social_bridge = domain.clan_id is not None
 
-    node_count = (
-        db.query(CommunityNode)
-        .filter(CommunityNode.community_domain_id == domain_id)
-        .count()
-    )
-    active_member_count = (
-        db.query(CommunityDomainMembership)
-        .filter(CommunityDomainMembership.community_domain_id == domain_id)
-        .filter(CommunityDomainMembership.status == "active")
-        .count()
-    )
-    active_node_member_count = (
-        db.query(CommunityNodeMembership)
-        .filter(CommunityNodeMembership.community_domain_id == domain_id)
-        .filter(CommunityNodeMembership.status == "active")
-        .count()
-    )
-    active_policy_count = (
-        db.query(CommunityDomainPolicy)
-        .filter(CommunityDomainPolicy.community_domain_id == domain_id)
-        .filter(CommunityDomainPolicy.status == "active")
-        .count()
-    )
-    open_review_count = (
-        db.query(CommunityDomainActionReview)
-        .filter(CommunityDomainActionReview.community_domain_id == domain_id)
-        .filter(
-            CommunityDomainActionReview.status.in_(REVIEWER_QUEUE_PENDING_STATUSES)
-        )
-        .count()
-    )
+    counters = _community_domain_counters(db, community_domain_id=domain_id)
+    node_count = counters["node_count"]
+    active_member_count = counters["active_member_count"]
+    active_node_member_count = counters["active_node_member_count"]
+    active_policy_count = counters["active_policy_count"]
+    open_review_count = counters["open_review_count"]
 
     def route_hint(suffix: str, *, requires_admin: bool = False) -> Optional[str]:
         if requires_admin and not can_admin:
@@ -7475,18 +7414,9 @@ def _community_domain_rollout_plan_payload(
         .filter(CommunityNodeMembership.status == "active")
         .all()
     )
-    active_member_count = (
-        db.query(CommunityDomainMembership)
-        .filter(CommunityDomainMembership.community_domain_id == domain_id)
-        .filter(CommunityDomainMembership.status == "active")
-        .count()
-    )
-    active_policy_count = (
-        db.query(CommunityDomainPolicy)
-        .filter(CommunityDomainPolicy.community_domain_id == domain_id)
-        .filter(CommunityDomainPolicy.status == "active")
-        .count()
-    )
+    counters = _community_domain_counters(db, community_domain_id=domain_id)
+    active_member_count = counters["active_member_count"]
+    active_policy_count = counters["active_policy_count"]
     capacity_plan = _community_domain_capacity_plan_payload(
         db,
         domain=domain,
@@ -14240,12 +14170,8 @@ def _community_domain_trust_relay_readiness_payload(
         .filter(CommunityDomainMembership.status == "active")
         .all()
     )
-    active_node_member_count = (
-        db.query(CommunityNodeMembership)
-        .filter(CommunityNodeMembership.community_domain_id == domain_id)
-        .filter(CommunityNodeMembership.status == "active")
-        .count()
-    )
+    counters = _community_domain_counters(db, community_domain_id=domain_id)
+    active_node_member_count = counters["active_node_member_count"]
     active_policy_rows = (
         db.query(CommunityDomainPolicy)
         .filter(CommunityDomainPolicy.community_domain_id == domain_id)
@@ -14963,12 +14889,8 @@ def _community_domain_trust_mobility_payload(
         .filter(CommunityDomainMembership.status == "active")
         .count()
     )
-    active_node_member_count = (
-        db.query(CommunityNodeMembership)
-        .filter(CommunityNodeMembership.community_domain_id == domain_id)
-        .filter(CommunityNodeMembership.status == "active")
-        .count()
-    )
+    counters = _community_domain_counters(db, community_domain_id=domain_id)
+    active_node_member_count = counters["active_node_member_count"]
     active_policy_count = (
         db.query(CommunityDomainPolicy)
         .filter(CommunityDomainPolicy.community_domain_id == domain_id)
@@ -16290,18 +16212,9 @@ def _community_domain_record_privacy_map_payload(
             visibility_policy_counts.get(policy_key, 0) + 1
         )
 
-    active_member_count = (
-        db.query(CommunityDomainMembership)
-        .filter(CommunityDomainMembership.community_domain_id == domain_id)
-        .filter(CommunityDomainMembership.status == "active")
-        .count()
-    )
-    active_policy_count = (
-        db.query(CommunityDomainPolicy)
-        .filter(CommunityDomainPolicy.community_domain_id == domain_id)
-        .filter(CommunityDomainPolicy.status == "active")
-        .count()
-    )
+    counters = _community_domain_counters(db, community_domain_id=domain_id)
+    active_member_count = counters["active_member_count"]
+    active_policy_count = counters["active_policy_count"]
     review_count = (
         db.query(CommunityDomainActionReview)
         .filter(CommunityDomainActionReview.community_domain_id == domain_id)
@@ -16595,12 +16508,8 @@ def _community_domain_configuration_map_payload(
         .filter(CommunityDomainMembership.status == "active")
         .count()
     )
-    active_node_member_count = (
-        db.query(CommunityNodeMembership)
-        .filter(CommunityNodeMembership.community_domain_id == domain_id)
-        .filter(CommunityNodeMembership.status == "active")
-        .count()
-    )
+    counters = _community_domain_counters(db, community_domain_id=domain_id)
+    active_node_member_count = counters["active_node_member_count"]
     active_policy_count = (
         db.query(CommunityDomainPolicy)
         .filter(CommunityDomainPolicy.community_domain_id == domain_id)
@@ -17157,18 +17066,9 @@ def _community_domain_appeal_readiness_payload(
 ) -> dict[str, Any]:
     domain_id = int(domain.id)
     root_node = _find_root_node(db, community_domain_id=domain_id)
-    active_member_count = (
-        db.query(CommunityDomainMembership)
-        .filter(CommunityDomainMembership.community_domain_id == domain_id)
-        .filter(CommunityDomainMembership.status == "active")
-        .count()
-    )
-    active_policy_count = (
-        db.query(CommunityDomainPolicy)
-        .filter(CommunityDomainPolicy.community_domain_id == domain_id)
-        .filter(CommunityDomainPolicy.status == "active")
-        .count()
-    )
+    counters = _community_domain_counters(db, community_domain_id=domain_id)
+    active_member_count = counters["active_member_count"]
+    active_policy_count = counters["active_policy_count"]
     reviews = (
         db.query(CommunityDomainActionReview)
         .filter(CommunityDomainActionReview.community_domain_id == domain_id)
@@ -17441,18 +17341,9 @@ def _community_domain_institutional_profile_payload(
         .filter(CommunityNode.parent_node_id.isnot(None))
         .count()
     )
-    active_member_count = (
-        db.query(CommunityDomainMembership)
-        .filter(CommunityDomainMembership.community_domain_id == domain_id)
-        .filter(CommunityDomainMembership.status == "active")
-        .count()
-    )
-    active_policy_count = (
-        db.query(CommunityDomainPolicy)
-        .filter(CommunityDomainPolicy.community_domain_id == domain_id)
-        .filter(CommunityDomainPolicy.status == "active")
-        .count()
-    )
+    counters = _community_domain_counters(db, community_domain_id=domain_id)
+    active_member_count = counters["active_member_count"]
+    active_policy_count = counters["active_policy_count"]
     pending_review_count = (
         db.query(CommunityDomainActionReview)
         .filter(CommunityDomainActionReview.community_domain_id == domain_id)
@@ -18323,18 +18214,9 @@ def _community_domain_activity_map_payload(
         if node.parent_node_id is not None
         and _clean_role(node.status, "active") == "active"
     ]
-    active_member_count = (
-        db.query(CommunityDomainMembership)
-        .filter(CommunityDomainMembership.community_domain_id == domain_id)
-        .filter(CommunityDomainMembership.status == "active")
-        .count()
-    )
-    active_policy_count = (
-        db.query(CommunityDomainPolicy)
-        .filter(CommunityDomainPolicy.community_domain_id == domain_id)
-        .filter(CommunityDomainPolicy.status == "active")
-        .count()
-    )
+    counters = _community_domain_counters(db, community_domain_id=domain_id)
+    active_member_count = counters["active_member_count"]
+    active_policy_count = counters["active_policy_count"]
     review_count = (
         db.query(CommunityDomainActionReview)
         .filter(CommunityDomainActionReview.community_domain_id == domain_id)
@@ -21170,6 +21052,27 @@ def _descendant_node_ids(
     return [int(item.id) for item in rows]
 
 
+def _node_scope_id_select(
+    *,
+    domain: CommunityDomain,
+    node: CommunityNode,
+    include_descendants: bool,
+):
+    """
+    The node ids _descendant_node_ids returns, as a subquery matched on the
+    materialized path prefix, so scoped filters need no id list.
+    """
+    scope = CommunityNode.id == int(node.id)
+    path = _clean_str(node.path)
+    if include_descendants and path:
+        scope = or_(scope, CommunityNode.path.like(f"{path}/%"))
+    return (
+        select(CommunityNode.id)
+        .where(CommunityNode.community_domain_id == int(domain.id))
+        .where(scope)
+    )
+
+
 def _node_lifecycle_impact_summary(
     db: Session,
     *,
@@ -21583,6 +21486,76 @@ def _find_root_node(db: Session, community_domain_id: int) -> Optional[Community
     )
 
 
+def _cached_domain_payload(
+    db: Session,
+    *,
+    domain: CommunityDomain,
+    current_user: User,
+    endpoint: str,
+    build: Callable[[], dict[str, Any]],
+) -> dict[str, Any]:
+    # Payloads depend on the viewer's memberships (tracked by the domain's
+    # change_version) and on their platform role, so both key the entry.
+    return cached_community_domain_payload(
+        db,
+        community_domain_id=int(domain.id),
+        endpoint=endpoint,
+        viewer=(int(current_user.id), str(getattr(current_user, "role", "") or "")),
+        build=build,
+    )
+
+
+def _community_domain_counters(
+    db: Session, *, community_domain_id: int
+) -> dict[str, int]:
+    """
+    Domain-level counters shared by the dashboard, readiness, capacity and
+    node map payloads, read with one SELECT of scalar subqueries. Reads
+    committed and flushed rows only; a write path that needs its pending
+    rows counted flushes them first.
+    """
+    domain_id = int(community_domain_id)
+
+    def count_of(column: Any, *conditions: Any) -> Any:
+        return select(func.count(column)).where(*conditions).scalar_subquery()
+
+    row = db.execute(
+        select(
+            count_of(
+                CommunityNode.id,
+                CommunityNode.community_domain_id == domain_id,
+            ),
+            count_of(
+                CommunityDomainMembership.id,
+                CommunityDomainMembership.community_domain_id == domain_id,
+                CommunityDomainMembership.status == "active",
+            ),
+            count_of(
+                CommunityNodeMembership.id,
+                CommunityNodeMembership.community_domain_id == domain_id,
+                CommunityNodeMembership.status == "active",
+            ),
+            count_of(
+                CommunityDomainPolicy.id,
+                CommunityDomainPolicy.community_domain_id == domain_id,
+                CommunityDomainPolicy.status == "active",
+            ),
+            count_of(
+                CommunityDomainActionReview.id,
+                CommunityDomainActionReview.community_domain_id == domain_id,
+                CommunityDomainActionReview.status.in_(REVIEWER_QUEUE_PENDING_STATUSES),
+            ),
+        )
+    ).one()
+    return {
+        "node_count": int(row[0] or 0),
+        "active_member_count": int(row[1] or 0),
+        "active_node_member_count": int(row[2] or 0),
+        "active_policy_count": int(row[3] or 0),
+        "open_review_count": int(row[4] or 0),
+    }
+
+
 def _get_or_create_setup_authority_review(
     db: Session,
     *,
@@ -21909,6 +21882,7 @@ def update_community_domain_profile(
         root_node.name = domain.display_name
 
     try:
+        bump_community_domain_change_version(db, int(domain.id))
         db.commit()
     except IntegrityError as exc:
         db.rollback()
@@ -22105,7 +22079,7 @@ def delegate_community_domain_setup_editor(
             ),
         )
         db.add(review)
-        create_notification(
+        notification = create_notification(
             db,
             user_id=int(domain.owner_user_id),
             kind="community_domain_setup_editor",
@@ -22119,8 +22093,10 @@ def delegate_community_domain_setup_editor(
             commit=False,
             refresh=False,
         )
+        bump_community_domain_change_version(db, int(domain.id))
         db.commit()
         db.refresh(review)
+        publish_notifications(db, created=[notification])
         return {
             "ok": True,
             "created": True,
@@ -22236,40 +22212,46 @@ def delegate_community_domain_setup_editor(
     )
     db.add(review)
 
-    create_notification(
-        db,
-        user_id=int(subject_user.id),
-        kind="community_domain_setup_editor",
-        title="Community Domain setup authority changed",
-        message=(
-            f"{domain.display_name} setup authority was "
-            f"{'granted to' if payload.action == 'appoint' else 'removed from'} "
-            "your GSN account."
-        ),
-        action_url=f"/app/community-domain/{int(domain.id)}",
-        action_label="Open Community Domain",
-        commit=False,
-        refresh=False,
-    )
-    if int(domain.owner_user_id) != int(current_user.id):
+    notifications = [
         create_notification(
             db,
-            user_id=int(domain.owner_user_id),
+            user_id=int(subject_user.id),
             kind="community_domain_setup_editor",
             title="Community Domain setup authority changed",
             message=(
-                f"{getattr(current_user, 'email', 'A GSN admin')} changed setup "
-                f"authority for {getattr(subject_user, 'email', 'a user')}."
+                f"{domain.display_name} setup authority was "
+                f"{'granted to' if payload.action == 'appoint' else 'removed from'} "
+                "your GSN account."
             ),
             action_url=f"/app/community-domain/{int(domain.id)}",
             action_label="Open Community Domain",
             commit=False,
             refresh=False,
         )
+    ]
+    if int(domain.owner_user_id) != int(current_user.id):
+        notifications.append(
+            create_notification(
+                db,
+                user_id=int(domain.owner_user_id),
+                kind="community_domain_setup_editor",
+                title="Community Domain setup authority changed",
+                message=(
+                    f"{getattr(current_user, 'email', 'A GSN admin')} changed setup "
+                    f"authority for {getattr(subject_user, 'email', 'a user')}."
+                ),
+                action_url=f"/app/community-domain/{int(domain.id)}",
+                action_label="Open Community Domain",
+                commit=False,
+                refresh=False,
+            )
+        )
 
+    bump_community_domain_change_version(db, int(domain.id))
     db.commit()
     db.refresh(membership)
     db.refresh(review)
+    publish_notifications(db, created=notifications)
 
     return {
         "ok": True,
@@ -22391,6 +22373,7 @@ async def submit_community_domain_setup_evidence(
         status="active",
     )
     db.add(evidence)
+    bump_community_domain_change_version(db, int(domain.id))
     db.commit()
     db.refresh(review)
     db.refresh(evidence)
@@ -22528,6 +22511,7 @@ def create_community_domain_payment_instruction(
     if domain.clan_id is None:
         domain.clan_id = int(payload.clan_id)
         db.add(domain)
+        bump_community_domain_change_version(db, int(domain.id))
         db.commit()
         db.refresh(domain)
 
@@ -22763,6 +22747,7 @@ def get_community_domain_period_summary(
 
     node: Optional[CommunityNode] = None
     node_scope_ids: list[int] = []
+    node_scope = None
     if community_node_id is not None:
         node = _get_node_or_404(
             db,
@@ -22775,29 +22760,51 @@ def get_community_domain_period_summary(
             node=node,
             include_descendants=bool(include_descendants),
         )
+        # SQL filters match the path prefix; the id list is only reported
+        # and used for the meta-json event sections filtered in Python.
+        node_scope = _node_scope_id_select(
+            domain=domain,
+            node=node,
+            include_descendants=bool(include_descendants),
+        )
 
     include_source_ids = visibility_mode in {"admin_only", "director_safe"}
 
-    members = (
-        db.query(CommunityDomainMembership)
+    membership_added = _period_clause(
+        CommunityDomainMembership.created_at,
+        period_start=start,
+        period_end=end,
+    )
+    membership_updated = and_(
+        _period_clause(CommunityDomainMembership.updated_at, period_start=start, period_end=end),
+        or_(
+            CommunityDomainMembership.created_at.is_(None),
+            CommunityDomainMembership.updated_at != CommunityDomainMembership.created_at,
+        ),
+    )
+    membership_groups = (
+        db.query(
+            CommunityDomainMembership.status,
+            CommunityDomainMembership.role,
+            func.count(CommunityDomainMembership.id),
+            _count_where(membership_added),
+            _count_where(membership_updated),
+        )
         .filter(CommunityDomainMembership.community_domain_id == int(domain.id))
+        .group_by(CommunityDomainMembership.status, CommunityDomainMembership.role)
         .all()
     )
     membership_by_status: dict[str, int] = {}
     membership_by_role: dict[str, int] = {}
-    added_members: list[CommunityDomainMembership] = []
-    updated_members: list[CommunityDomainMembership] = []
-    for row in members:
-        _increment_count(membership_by_status, row.status, "unknown")
-        _increment_count(membership_by_role, row.role, "member")
-        if _within_period(row.created_at, period_start=start, period_end=end):
-            added_members.append(row)
-        if (
-            row.updated_at is not None
-            and row.updated_at != row.created_at
-            and _within_period(row.updated_at, period_start=start, period_end=end)
-        ):
-            updated_members.append(row)
+    members_total = 0
+    added_members_total = 0
+    updated_members_total = 0
+    for member_status, member_role, count, added, updated in membership_groups:
+        _add_count(membership_by_status, member_status, count, "unknown")
+        _add_count(membership_by_role, member_role, count, "member")
+        members_total += int(count or 0)
+        added_members_total += int(added or 0)
+        updated_members_total += int(updated or 0)
 
     status_change_events = (
         db.query(TrustEvent)
@@ -22813,8 +22820,8 @@ def get_community_domain_period_summary(
         if int((row.meta or {}).get("community_domain_id") or 0) == int(domain.id)
     ]
     status_movements = {
-        "added": len(added_members),
-        "updated": len(updated_members),
+        "added": added_members_total,
+        "updated": updated_members_total,
         "reactivated": 0,
         "removed_or_deactivated": 0,
         "suspended": 0,
@@ -22838,68 +22845,107 @@ def get_community_domain_period_summary(
         if new_status == "archived":
             status_movements["archived"] += 1
 
-    review_rows = (
+    review_created_clause = _period_clause(
+        CommunityDomainActionReview.created_at,
+        period_start=start,
+        period_end=end,
+    )
+    review_decided_clause = _period_clause(
+        CommunityDomainActionReview.decided_at,
+        period_start=start,
+        period_end=end,
+    )
+    review_applied_clause = _period_clause(
+        CommunityDomainActionReview.applied_at,
+        period_start=start,
+        period_end=end,
+    )
+    period_review_query = (
         db.query(CommunityDomainActionReview)
         .filter(CommunityDomainActionReview.community_domain_id == int(domain.id))
-        .all()
+        .filter(
+            or_(
+                review_created_clause,
+                _period_clause(
+                    CommunityDomainActionReview.updated_at,
+                    period_start=start,
+                    period_end=end,
+                ),
+                review_decided_clause,
+                review_applied_clause,
+            )
+        )
     )
-    if node_scope_ids:
-        review_rows = [
-            row for row in review_rows if row.community_node_id in set(node_scope_ids)
-        ]
-    period_reviews = [
-        row
-        for row in review_rows
-        if any(
-            _within_period(value, period_start=start, period_end=end)
-            for value in (row.created_at, row.updated_at, row.decided_at, row.applied_at)
+    if node_scope is not None:
+        period_review_query = period_review_query.filter(
+            CommunityDomainActionReview.community_node_id.in_(node_scope)
         )
-    ]
+    review_groups = (
+        period_review_query.with_entities(
+            CommunityDomainActionReview.status,
+            CommunityDomainActionReview.action_key,
+            func.count(CommunityDomainActionReview.id),
+            _count_where(review_created_clause),
+            _count_where(review_decided_clause),
+            _count_where(review_applied_clause),
+        )
+        .group_by(CommunityDomainActionReview.status, CommunityDomainActionReview.action_key)
+        .all()
+    )
     review_by_status: dict[str, int] = {}
     review_by_action: dict[str, int] = {}
+    period_reviews_total = 0
     review_created = 0
     review_decided = 0
     review_applied = 0
-    for row in period_reviews:
-        _increment_count(review_by_status, row.status, "unknown")
-        _increment_count(review_by_action, row.action_key, "unknown")
-        if _within_period(row.created_at, period_start=start, period_end=end):
-            review_created += 1
-        if _within_period(row.decided_at, period_start=start, period_end=end):
-            review_decided += 1
-        if _within_period(row.applied_at, period_start=start, period_end=end):
-            review_applied += 1
-
-    evidence_rows = (
+    for review_status, action_key, count, created, decided, applied in review_groups:
+        _add_count(review_by_status, review_status, count, "unknown")
+        _add_count(review_by_action, action_key, count, "unknown")
+        period_reviews_total += int(count or 0)
+        review_created += int(created or 0)
+        review_decided += int(decided or 0)
+        review_applied += int(applied or 0)
+
+    evidence_query = (
         db.query(CommunityDomainActionReviewEvidence)
         .filter(CommunityDomainActionReviewEvidence.community_domain_id == int(domain.id))
         .filter(CommunityDomainActionReviewEvidence.created_at >= start)
         .filter(CommunityDomainActionReviewEvidence.created_at <= end)
-        .order_by(
-            CommunityDomainActionReviewEvidence.created_at.desc(),
-            CommunityDomainActionReviewEvidence.id.desc(),
+    )
+    if node_scope is not None:
+        evidence_query = evidence_query.filter(
+            CommunityDomainActionReviewEvidence.community_node_id.in_(node_scope)
+        )
+    evidence_text_columns = (
+        CommunityDomainActionReviewEvidence.evidence_type,
+        CommunityDomainActionReviewEvidence.title,
+        CommunityDomainActionReviewEvidence.description,
+    )
+    evidence_groups = (
+        evidence_query.with_entities(
+            CommunityDomainActionReviewEvidence.status,
+            CommunityDomainActionReviewEvidence.evidence_type,
+            func.count(CommunityDomainActionReviewEvidence.id),
+            _count_where(_text_mentions_any(evidence_text_columns, ("meeting", "event"))),
+            _count_where(_text_mentions_any(evidence_text_columns, ("attendance", "attendee"))),
+        )
+        .group_by(
+            CommunityDomainActionReviewEvidence.status,
+            CommunityDomainActionReviewEvidence.evidence_type,
         )
         .all()
     )
-    if node_scope_ids:
-        evidence_rows = [
-            row for row in evidence_rows if row.community_node_id in set(node_scope_ids)
-        ]
     evidence_by_status: dict[str, int] = {}
     evidence_by_type: dict[str, int] = {}
+    evidence_total = 0
     meeting_signal_count = 0
     attendance_signal_count = 0
-    for row in evidence_rows:
-        _increment_count(evidence_by_status, row.status, "unknown")
-        _increment_count(evidence_by_type, row.evidence_type, "evidence")
-        text = " ".join(
-            str(part or "").lower()
-            for part in (row.evidence_type, row.title, row.description)
-        )
-        if "meeting" in text or "event" in text:
-            meeting_signal_count += 1
-        if "attendance" in text or "attendee" in text:
-            attendance_signal_count += 1
+    for evidence_status, evidence_type, count, meeting_signals, attendance_signals in evidence_groups:
+        _add_count(evidence_by_status, evidence_status, count, "unknown")
+        _add_count(evidence_by_type, evidence_type, count, "evidence")
+        evidence_total += int(count or 0)
+        meeting_signal_count += int(meeting_signals or 0)
+        attendance_signal_count += int(attendance_signals or 0)
 
     linked_clan_id = int(domain.clan_id) if domain.clan_id is not None else None
     confirmation_summary: dict[str, Any]
@@ -22914,57 +22960,83 @@ def get_community_domain_period_summary(
             ),
         }
     else:
-        confirmation_requests = (
+        request_query = (
             db.query(CommunityConfirmationRequest)
             .filter(CommunityConfirmationRequest.community_id == linked_clan_id)
             .filter(CommunityConfirmationRequest.created_at >= start)
             .filter(CommunityConfirmationRequest.created_at <= end)
-            .all()
         )
-        request_ids = [int(row.id) for row in confirmation_requests]
-        confirmation_responses = (
-            db.query(CommunityConfirmationResponse)
-            .filter(CommunityConfirmationResponse.request_id.in_(request_ids))
-            .all()
-            if request_ids
-            else []
+        requests_total = int(
+            request_query.with_entities(func.count(CommunityConfirmationRequest.id)).scalar() or 0
         )
-        confirmation_outcomes = (
-            db.query(CommunityConfirmationOutcome)
-            .filter(CommunityConfirmationOutcome.request_id.in_(request_ids))
+        period_request_ids = (
+            select(CommunityConfirmationRequest.id)
+            .where(CommunityConfirmationRequest.community_id == linked_clan_id)
+            .where(CommunityConfirmationRequest.created_at >= start)
+            .where(CommunityConfirmationRequest.created_at <= end)
+        )
+        responses_by_type: dict[str, int] = {}
+        responses_total = 0
+        for response_type, count in (
+            db.query(
+                CommunityConfirmationResponse.response_type,
+                func.count(CommunityConfirmationResponse.id),
+            )
+            .filter(CommunityConfirmationResponse.request_id.in_(period_request_ids))
+            .group_by(CommunityConfirmationResponse.response_type)
             .all()
-            if request_ids
-            else []
+        ):
+            _add_count(responses_by_type, response_type, count, "unknown")
+            responses_total += int(count or 0)
+        outcome_totals = (
+            db.query(
+                func.count(CommunityConfirmationOutcome.id),
+                func.coalesce(func.sum(CommunityConfirmationOutcome.positive_count), 0),
+                func.coalesce(func.sum(CommunityConfirmationOutcome.caution_count), 0),
+                func.coalesce(func.sum(CommunityConfirmationOutcome.objection_count), 0),
+                func.coalesce(func.sum(CommunityConfirmationOutcome.no_response_count), 0),
+            )
+            .filter(CommunityConfirmationOutcome.request_id.in_(period_request_ids))
+            .one()
         )
-        member_verifications = (
+        verification_query = (
             db.query(CommunityMemberVerification)
             .filter(CommunityMemberVerification.clan_id == linked_clan_id)
             .filter(CommunityMemberVerification.created_at >= start)
             .filter(CommunityMemberVerification.created_at <= end)
-            .all()
         )
-        responses_by_type: dict[str, int] = {}
-        for row in confirmation_responses:
-            _increment_count(responses_by_type, row.response_type, "unknown")
+        verifications_total = int(
+            verification_query.with_entities(func.count(CommunityMemberVerification.id)).scalar() or 0
+        )
         confirmation_summary = {
-            "status": "recorded" if request_ids or member_verifications else "recorded_empty",
+            "status": "recorded" if requests_total or verifications_total else "recorded_empty",
             "linked_clan_id": linked_clan_id,
-            "requests_total": len(confirmation_requests),
-            "responses_total": len(confirmation_responses),
-            "outcomes_total": len(confirmation_outcomes),
-            "member_witness_verifications_total": len(member_verifications),
+            "requests_total": requests_total,
+            "responses_total": responses_total,
+            "outcomes_total": int(outcome_totals[0] or 0),
+            "member_witness_verifications_total": verifications_total,
             "responses_by_type": responses_by_type,
-            "positive_count": sum(int(row.positive_count or 0) for row in confirmation_outcomes),
-            "caution_count": sum(int(row.caution_count or 0) for row in confirmation_outcomes),
-            "objection_count": sum(int(row.objection_count or 0) for row in confirmation_outcomes),
-            "no_response_count": sum(int(row.no_response_count or 0) for row in confirmation_outcomes),
+            "positive_count": int(outcome_totals[1] or 0),
+            "caution_count": int(outcome_totals[2] or 0),
+            "objection_count": int(outcome_totals[3] or 0),
+            "no_response_count": int(outcome_totals[4] or 0),
             "source_records": {
-                "requests": _source_record_summary(confirmation_requests)
+                "requests": _source_record_summary_for_query(
+                    request_query,
+                    id_column=CommunityConfirmationRequest.id,
+                    total=requests_total,
+                    order_by=(CommunityConfirmationRequest.id.asc(),),
+                )
                 if include_source_ids
-                else {"total": len(confirmation_requests)},
-                "member_verifications": _source_record_summary(member_verifications)
+                else {"total": requests_total},
+                "member_verifications": _source_record_summary_for_query(
+                    verification_query,
+                    id_column=CommunityMemberVerification.id,
+                    total=verifications_total,
+                    order_by=(CommunityMemberVerification.id.asc(),),
+                )
                 if include_source_ids
-                else {"total": len(member_verifications)},
+                else {"total": verifications_total},
             },
         }
 
@@ -23247,16 +23319,29 @@ def get_community_domain_period_summary(
     )
 
     source_sections = {
-        "membership_rows": {"total": len(members)},
+        "membership_rows": {"total": members_total},
         "member_status_change_events": _source_record_summary(domain_status_change_events)
         if include_source_ids
         else {"total": len(domain_status_change_events)},
-        "action_reviews": _source_record_summary(period_reviews)
+        "action_reviews": _source_record_summary_for_query(
+            period_review_query,
+            id_column=CommunityDomainActionReview.id,
+            total=period_reviews_total,
+            order_by=(CommunityDomainActionReview.id.asc(),),
+        )
         if include_source_ids
-        else {"total": len(period_reviews)},
-        "action_review_evidence": _source_record_summary(evidence_rows)
+        else {"total": period_reviews_total},
+        "action_review_evidence": _source_record_summary_for_query(
+            evidence_query,
+            id_column=CommunityDomainActionReviewEvidence.id,
+            total=evidence_total,
+            order_by=(
+                CommunityDomainActionReviewEvidence.created_at.desc(),
+                CommunityDomainActionReviewEvidence.id.desc(),
+            ),
+        )
         if include_source_ids
-        else {"total": len(evidence_rows)},
+        else {"total": evidence_total},
         "trust_events": {
             "total": len(seen_trust_event_ids),
             "ids": sorted(seen_trust_event_ids)[:10] if include_source_ids else [],
@@ -23338,7 +23423,7 @@ def get_community_domain_period_summary(
             ),
         },
         "membership_snapshot": {
-            "total": len(members),
+            "total": members_total,
             "by_status": membership_by_status,
             "by_role": membership_by_role,
             "active_total": membership_by_status.get("active", 0),
@@ -23349,7 +23434,7 @@ def get_community_domain_period_summary(
         },
         "member_movement": status_movements,
         "governance_summary": {
-            "total": len(period_reviews),
+            "total": period_reviews_total,
             "requested_total": review_created,
             "decided_total": review_decided,
             "applied_total": review_applied,
@@ -23358,7 +23443,7 @@ def get_community_domain_period_summary(
             "source": "community_domain_action_reviews",
         },
         "evidence_summary": {
-            "total": len(evidence_rows),
+            "total": evidence_total,
             "by_status": evidence_by_status,
             "by_type": evidence_by_type,
             "meeting_signal_count": meeting_signal_count,
@@ -26031,10 +26116,16 @@ def get_community_domain_operating_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "operating_map": _community_domain_operating_map_payload(
+        "operating_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="operating_map",
+            build=lambda: _community_domain_operating_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26050,10 +26141,16 @@ def get_community_domain_template_fit(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "template_fit": _community_domain_template_fit_payload(
+        "template_fit": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="template_fit",
+            build=lambda: _community_domain_template_fit_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26069,10 +26166,16 @@ def get_community_domain_setup_plan(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "setup_plan": _community_domain_setup_plan_payload(
+        "setup_plan": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="setup_plan",
+            build=lambda: _community_domain_setup_plan_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26088,10 +26191,16 @@ def get_community_domain_capacity_plan(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "capacity_plan": _community_domain_capacity_plan_payload(
+        "capacity_plan": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="capacity_plan",
+            build=lambda: _community_domain_capacity_plan_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26107,10 +26216,16 @@ def get_community_domain_rollout_plan(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "rollout_plan": _community_domain_rollout_plan_payload(
+        "rollout_plan": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="rollout_plan",
+            build=lambda: _community_domain_rollout_plan_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26126,10 +26241,16 @@ def get_community_domain_rollout_tree(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "rollout_tree": _community_domain_rollout_tree_payload(
+        "rollout_tree": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="rollout_tree",
+            build=lambda: _community_domain_rollout_tree_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26145,10 +26266,16 @@ def get_community_domain_node_autonomy_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "node_autonomy_map": _community_domain_node_autonomy_map_payload(
+        "node_autonomy_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="node_autonomy_map",
+            build=lambda: _community_domain_node_autonomy_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26164,10 +26291,16 @@ def get_community_domain_node_economic_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "node_economic_map": _community_domain_node_economic_map_payload(
+        "node_economic_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="node_economic_map",
+            build=lambda: _community_domain_node_economic_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26183,10 +26316,16 @@ def get_community_domain_node_activity_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "node_activity_map": _community_domain_node_activity_map_payload(
+        "node_activity_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="node_activity_map",
+            build=lambda: _community_domain_node_activity_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26202,10 +26341,16 @@ def get_community_domain_node_trust_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "node_trust_map": _community_domain_node_trust_map_payload(
+        "node_trust_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="node_trust_map",
+            build=lambda: _community_domain_node_trust_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26221,10 +26366,16 @@ def get_community_domain_node_participation_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "node_participation_map": _community_domain_node_participation_map_payload(
+        "node_participation_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="node_participation_map",
+            build=lambda: _community_domain_node_participation_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26240,10 +26391,16 @@ def get_community_domain_node_service_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "node_service_map": _community_domain_node_service_map_payload(
+        "node_service_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="node_service_map",
+            build=lambda: _community_domain_node_service_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26259,10 +26416,16 @@ def get_community_domain_node_privacy_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "node_privacy_map": _community_domain_node_privacy_map_payload(
+        "node_privacy_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="node_privacy_map",
+            build=lambda: _community_domain_node_privacy_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26278,10 +26441,16 @@ def get_community_domain_node_analytics_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "node_analytics_map": _community_domain_node_analytics_map_payload(
+        "node_analytics_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="node_analytics_map",
+            build=lambda: _community_domain_node_analytics_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26297,10 +26466,16 @@ def get_community_domain_node_domain_boundary_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "node_domain_boundary_map": _community_domain_node_domain_boundary_map_payload(
+        "node_domain_boundary_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="node_domain_boundary_map",
+            build=lambda: _community_domain_node_domain_boundary_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26316,10 +26491,16 @@ def get_community_domain_node_evidence_authority_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "node_evidence_authority_map": _community_domain_node_evidence_authority_map_payload(
+        "node_evidence_authority_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="node_evidence_authority_map",
+            build=lambda: _community_domain_node_evidence_authority_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26335,10 +26516,16 @@ def get_community_domain_node_communication_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "node_communication_map": _community_domain_node_communication_map_payload(
+        "node_communication_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="node_communication_map",
+            build=lambda: _community_domain_node_communication_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26354,10 +26541,16 @@ def get_community_domain_node_vault_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "node_vault_map": _community_domain_node_vault_map_payload(
+        "node_vault_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="node_vault_map",
+            build=lambda: _community_domain_node_vault_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26373,10 +26566,16 @@ def get_community_domain_node_scheduled_activity_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "node_scheduled_activity_map": _community_domain_node_scheduled_activity_map_payload(
+        "node_scheduled_activity_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="node_scheduled_activity_map",
+            build=lambda: _community_domain_node_scheduled_activity_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26392,10 +26591,16 @@ def get_community_domain_node_paid_activity_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "node_paid_activity_map": _community_domain_node_paid_activity_map_payload(
+        "node_paid_activity_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="node_paid_activity_map",
+            build=lambda: _community_domain_node_paid_activity_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26411,10 +26616,16 @@ def get_community_domain_governance_coverage(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "governance_coverage": _community_domain_governance_coverage_payload(
+        "governance_coverage": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="governance_coverage",
+            build=lambda: _community_domain_governance_coverage_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26430,10 +26641,16 @@ def get_community_domain_analytics(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "analytics": _community_domain_analytics_payload(
+        "analytics": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="analytics",
+            build=lambda: _community_domain_analytics_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26449,10 +26666,16 @@ def get_community_domain_evidence_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "evidence_map": _community_domain_evidence_map_payload(
+        "evidence_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="evidence_map",
+            build=lambda: _community_domain_evidence_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26469,11 +26692,17 @@ def get_community_domain_evidence_record_readiness(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "evidence_record_readiness": _community_domain_evidence_record_readiness_payload(
+        "evidence_record_readiness": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="evidence_record_readiness",
+            build=lambda: _community_domain_evidence_record_readiness_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26490,11 +26719,17 @@ def get_community_domain_evidence_release_readiness(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "evidence_release_readiness": _community_domain_evidence_release_readiness_payload(
+        "evidence_release_readiness": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="evidence_release_readiness",
+            build=lambda: _community_domain_evidence_release_readiness_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26511,11 +26746,17 @@ def get_community_domain_trust_relay_readiness(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "trust_relay_readiness": _community_domain_trust_relay_readiness_payload(
+        "trust_relay_readiness": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="trust_relay_readiness",
+            build=lambda: _community_domain_trust_relay_readiness_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26532,11 +26773,17 @@ def get_community_domain_notification_scope_readiness(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "notification_scope_readiness": _community_domain_notification_scope_readiness_payload(
+        "notification_scope_readiness": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="notification_scope_readiness",
+            build=lambda: _community_domain_notification_scope_readiness_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26553,11 +26800,17 @@ def get_community_domain_provider_delivery_lift_plan(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "provider_delivery_lift_plan": _community_domain_provider_delivery_lift_plan_payload(
+        "provider_delivery_lift_plan": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="provider_delivery_lift_plan",
+            build=lambda: _community_domain_provider_delivery_lift_plan_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26574,11 +26827,17 @@ def get_community_domain_provider_destination_readiness(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "provider_destination_readiness": _community_domain_provider_destination_readiness_payload(
+        "provider_destination_readiness": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="provider_destination_readiness",
+            build=lambda: _community_domain_provider_destination_readiness_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26594,10 +26853,16 @@ def get_community_domain_trust_mobility(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "trust_mobility": _community_domain_trust_mobility_payload(
+        "trust_mobility": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
+            endpoint="trust_mobility",
+            build=lambda: _community_domain_trust_mobility_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+            ),
         ),
     }
 
@@ -26614,11 +26879,17 @@ def get_community_domain_subscription_lifecycle(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "subscription_lifecycle": _community_domain_subscription_lifecycle_payload(
+        "subscription_lifecycle": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="subscription_lifecycle",
+            build=lambda: _community_domain_subscription_lifecycle_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26635,11 +26906,17 @@ def get_community_domain_social_bridge(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "social_bridge": _community_domain_social_bridge_payload(
+        "social_bridge": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="social_bridge",
+            build=lambda: _community_domain_social_bridge_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26656,11 +26933,17 @@ def get_community_domain_affiliation_readiness(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "affiliation_readiness": _community_domain_affiliation_readiness_payload(
+        "affiliation_readiness": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="affiliation_readiness",
+            build=lambda: _community_domain_affiliation_readiness_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26677,11 +26960,17 @@ def get_community_domain_institutional_profile(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "institutional_profile": _community_domain_institutional_profile_payload(
+        "institutional_profile": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="institutional_profile",
+            build=lambda: _community_domain_institutional_profile_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26698,11 +26987,17 @@ def get_community_domain_delegation_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "delegation_map": _community_domain_delegation_map_payload(
+        "delegation_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="delegation_map",
+            build=lambda: _community_domain_delegation_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26732,11 +27027,17 @@ def get_community_domain_identity_context(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "identity_context": _community_domain_identity_context_payload(
+        "identity_context": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            membership=membership,
+            endpoint="identity_context",
+            build=lambda: _community_domain_identity_context_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                membership=membership,
+            ),
         ),
     }
 
@@ -26753,11 +27054,17 @@ def get_community_domain_activity_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "activity_map": _community_domain_activity_map_payload(
+        "activity_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="activity_map",
+            build=lambda: _community_domain_activity_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26774,11 +27081,17 @@ def get_community_domain_activity_group_readiness(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "activity_group_readiness": _community_domain_activity_group_readiness_payload(
+        "activity_group_readiness": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="activity_group_readiness",
+            build=lambda: _community_domain_activity_group_readiness_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26795,11 +27108,17 @@ def get_community_domain_member_verification_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "member_verification_map": _community_domain_member_verification_map_payload(
+        "member_verification_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="member_verification_map",
+            build=lambda: _community_domain_member_verification_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26816,11 +27135,17 @@ def get_community_domain_network_exchange_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "network_exchange_map": _community_domain_network_exchange_map_payload(
+        "network_exchange_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="network_exchange_map",
+            build=lambda: _community_domain_network_exchange_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26837,11 +27162,17 @@ def get_community_domain_record_privacy_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "record_privacy_map": _community_domain_record_privacy_map_payload(
+        "record_privacy_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="record_privacy_map",
+            build=lambda: _community_domain_record_privacy_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26858,11 +27189,17 @@ def get_community_domain_configuration_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "configuration_map": _community_domain_configuration_map_payload(
+        "configuration_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="configuration_map",
+            build=lambda: _community_domain_configuration_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26879,11 +27216,17 @@ def get_community_domain_compliance_map(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "compliance_map": _community_domain_compliance_map_payload(
+        "compliance_map": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="compliance_map",
+            build=lambda: _community_domain_compliance_map_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26900,11 +27243,17 @@ def get_community_domain_appeal_readiness(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "appeal_readiness": _community_domain_appeal_readiness_payload(
+        "appeal_readiness": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="appeal_readiness",
+            build=lambda: _community_domain_appeal_readiness_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26940,11 +27289,17 @@ def get_community_domain_module_scope_readiness(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "module_scope_readiness": _community_domain_module_scope_readiness_payload(
+        "module_scope_readiness": _cached_domain_payload(
             db,
             domain=domain,
             current_user=current_user,
-            can_admin=can_admin,
+            endpoint="module_scope_readiness",
+            build=lambda: _community_domain_module_scope_readiness_payload(
+                db,
+                domain=domain,
+                current_user=current_user,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -26961,10 +27316,16 @@ def get_community_domain_economic_participation(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "economic_participation": _community_domain_economic_participation_payload(
+        "economic_participation": _cached_domain_payload(
             db,
             domain=domain,
-            can_admin=can_admin,
+            current_user=current_user,
+            endpoint="economic_participation",
+            build=lambda: _community_domain_economic_participation_payload(
+                db,
+                domain=domain,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -27000,10 +27361,16 @@ def list_community_domain_roles(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "roles": _community_domain_role_projection_payload(
+        "roles": _cached_domain_payload(
             db,
             domain=domain,
-            can_admin=can_admin,
+            current_user=current_user,
+            endpoint="roles",
+            build=lambda: _community_domain_role_projection_payload(
+                db,
+                domain=domain,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -27020,10 +27387,16 @@ def get_community_domain_governance_model(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "governance_model": _community_domain_governance_model_payload(
+        "governance_model": _cached_domain_payload(
             db,
             domain=domain,
-            can_admin=can_admin,
+            current_user=current_user,
+            endpoint="governance_model",
+            build=lambda: _community_domain_governance_model_payload(
+                db,
+                domain=domain,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -27040,10 +27413,16 @@ def get_community_domain_readiness(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "readiness": _community_domain_readiness_payload(
+        "readiness": _cached_domain_payload(
             db,
             domain=domain,
-            can_admin=can_admin,
+            current_user=current_user,
+            endpoint="readiness",
+            build=lambda: _community_domain_readiness_payload(
+                db,
+                domain=domain,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -27079,10 +27458,16 @@ def get_community_domain_activation_requirements(
     return {
         "ok": True,
         "community_domain_id": int(domain.id),
-        "activation_requirements": _community_domain_activation_requirements_payload(
+        "activation_requirements": _cached_domain_payload(
             db,
             domain=domain,
-            can_admin=can_admin,
+            current_user=current_user,
+            endpoint="activation_requirements",
+            build=lambda: _community_domain_activation_requirements_payload(
+                db,
+                domain=domain,
+                can_admin=can_admin,
+            ),
         ),
     }
 
@@ -27238,6 +27623,7 @@ def create_community_domain_node(
         db.flush()
         parent_path = _clean_str(parent_node.path, f"/{int(domain.id)}")
         node.path = f"{parent_path}/{int(node.id)}"
+        bump_community_domain_change_version(db, int(domain.id))
         db.commit()
     except IntegrityError as exc:
         db.rollback()
@@ -27368,6 +27754,7 @@ def update_community_domain_node_status(
         )
         db.add(lifecycle_record)
     db.add(node)
+    bump_community_domain_change_version(db, int(domain.id))
     db.commit()
     db.refresh(node)
     if lifecycle_record is not None:
@@ -27589,6 +27976,7 @@ def request_community_domain_membership(
         payload_json=_json_dump(request_payload),
     )
     db.add(row)
+    bump_community_domain_change_version(db, int(domain.id))
     db.commit()
     db.refresh(row)
 
@@ -27697,6 +28085,7 @@ def upsert_community_domain_member(
     membership.title = _clean_str(payload.title) or None
 
     try:
+        bump_community_domain_change_version(db, int(domain.id))
         db.commit()
     except IntegrityError as exc:
         db.rollback()
@@ -27791,6 +28180,7 @@ def _change_community_domain_member_status(
             commit=False,
             refresh=False,
         )
+    bump_community_domain_change_version(db, int(domain.id))
     db.commit()
     db.refresh(membership)
     return {
@@ -27984,6 +28374,7 @@ def upsert_community_node_member(
     membership.title = _clean_str(payload.title) or None
 
     try:
+        bump_community_domain_change_version(db, int(domain.id))
         db.commit()
     except IntegrityError as exc:
         db.rollback()
@@ -28096,6 +28487,7 @@ def upsert_community_domain_policy(
     policy.updated_by_user_id = int(current_user.id)
 
     try:
+        bump_community_domain_change_version(db, int(domain.id))
         db.commit()
     except IntegrityError as exc:
         db.rollback()
@@ -28318,6 +28710,7 @@ def create_community_domain_action_review(
         payload_json=_json_dump(review_payload),
     )
     db.add(row)
+    bump_community_domain_change_version(db, int(domain.id))
     db.commit()
     db.refresh(row)
     return {
@@ -28771,6 +29164,7 @@ def create_community_domain_action_review_comment(
         body=_clean_str(payload.body),
     )
     db.add(comment)
+    bump_community_domain_change_version(db, int(domain.id))
     db.commit()
     db.refresh(comment)
     return {
@@ -28892,6 +29286,7 @@ def create_community_domain_action_review_evidence(
         status="active",
     )
     db.add(evidence)
+    bump_community_domain_change_version(db, int(domain.id))
     db.commit()
     db.refresh(evidence)
     return {
@@ -29362,6 +29757,7 @@ def revise_community_domain_action_review(
         payload_json=_json_dump(revision_payload),
     )
     db.add(revision)
+    bump_community_domain_change_version(db, int(domain.id))
     db.commit()
     db.refresh(revision)
     previous_action_review_payload = (
@@ -29482,6 +29878,7 @@ def cancel_community_domain_action_review(
     row.decided_at = datetime.now(timezone.utc)
 
     db.add(row)
+    bump_community_domain_change_version(db, int(domain.id))
     db.commit()
     db.refresh(row)
     action_review_payload = (
@@ -29652,6 +30049,7 @@ def decide_community_domain_action_review(
         row.status = "pending_review"
 
     db.add(row)
+    bump_community_domain_change_version(db, int(domain.id))
     db.commit()
     db.refresh(decision_row)
     db.refresh(row)
@@ -29793,7 +30191,7 @@ def apply_community_domain_action_review(
             }
         )
         db.add(row)
-        create_notification(
+        notification = create_notification(
             db,
             user_id=int(subject_user.id),
             kind="community_domain_setup_editor",
@@ -29807,9 +30205,11 @@ def apply_community_domain_action_review(
             commit=False,
             refresh=False,
         )
+        bump_community_domain_change_version(db, int(domain.id))
         db.commit()
         db.refresh(membership)
         db.refresh(row)
+        publish_notifications(db, created=[notification])
         applied = {
             "type": "setup_editor",
             "created": created,
@@ -29884,6 +30284,7 @@ def apply_community_domain_action_review(
         row.applied_by_user_id = int(current_user.id)
         row.applied_at = datetime.now(timezone.utc)
         db.add(row)
+        bump_community_domain_change_version(db, int(domain.id))
         db.commit()
         db.refresh(membership)
         db.refresh(row)
@@ -29956,6 +30357,7 @@ def apply_community_domain_action_review(
         row.applied_by_user_id = int(current_user.id)
         row.applied_at = datetime.now(timezone.utc)
         db.add(row)
+        bump_community_domain_change_version(db, int(domain.id))
         db.commit()
         db.refresh(membership)
         db.refresh(row)
@@ -30052,6 +30454,7 @@ def apply_community_domain_action_review(
         )
         db.add(node)
         db.add(row)
+        bump_community_domain_change_version(db, int(domain.id))
         db.commit()
         db.refresh(node)
         db.refresh(row)
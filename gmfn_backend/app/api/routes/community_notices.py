@@ -21,7 +21,8 @@ from app.db.models import (
 )
 from app.services.community_integrity_service import _user_settings_table_exists
 from app.services.notification_service import create_notification
-from app.services.web_push_service import dispatch_web_push_for_notifications
+from app.services.notification_stream_service import publish_notifications
+from app.services.web_push_service import schedule_web_push_for_notifications
 from app.services.community_meeting_service import list_community_meetings
 from app.services.trust_events_services import log_trust_event
 
@@ -378,8 +379,9 @@ def _create_notice_notifications(
             )
         )
     db.commit()
+    publish_notifications(db, created=notification_rows)
     try:
-        dispatch_web_push_for_notifications(db, notification_rows)
+        schedule_web_push_for_notifications(db, notification_rows)
     except Exception:
         pass
     return len(recipient_ids)
@@ -9,7 +9,7 @@ from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy import case, func
+from sqlalchemy import and_, case, func, or_, select
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_user
@@ -38,7 +38,14 @@ from app.services.community_domain_feature_policy import (
     require_domain_spotlight_enabled,
     require_domain_vault_enabled,
 )
+from app.services.marketplace_image_variants import (
+    enqueue_image_variant_job,
+    existing_image_variants,
+    image_variants_payload,
+    record_known_image_variants,
+)
 from app.services.notification_service import create_notification
+from app.services.notification_stream_service import publish_notifications
 from app.services.trust_events_services import log_trust_event
 from app.services.vault_domain_service import (
     archive_vault_offer_for_product,
@@ -479,6 +486,64 @@ def _shop_is_visible_in_clan(
     return membership is not None
 
 
+def _shop_visible_in_clan_clause(clan_id: int):
+    """
+    SQL form of _shop_is_visible_in_clan for feed queries that join or select
+    MarketplaceShop: the owner must be an active member of the community.
+    """
+    return MarketplaceShop.owner_user_id.in_(
+        select(ClanMembership.user_id).where(
+            ClanMembership.clan_id == int(clan_id),
+            ClanMembership.left_at.is_(None),
+        )
+    )
+
+
+def _cursor_datetime(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value
+
+
+def _apply_keyset_before(
+    q: Any,
+    *,
+    created_col: Any,
+    id_col: Any,
+    before_created_at: Optional[datetime],
+    before_id: Optional[int],
+) -> Any:
+    before_created_at = _cursor_datetime(before_created_at)
+    before_id = _safe_int(before_id, 0) or None
+
+    if before_created_at is not None and before_id is not None:
+        return q.filter(
+            or_(
+                created_col < before_created_at,
+                and_(created_col == before_created_at, id_col < int(before_id)),
+            )
+        )
+    if before_created_at is not None:
+        return q.filter(created_col < before_created_at)
+    if before_id is not None:
+        return q.filter(id_col < int(before_id))
+    return q
+
+
+def _next_page_cursor(rows: list[Any], *, limit: int) -> Dict[str, Any]:
+    if not rows or len(rows) < int(limit):
+        return {"next_before_created_at": None, "next_before_id": None}
+
+    last = rows[-1]
+    created_at = getattr(last, "created_at", None)
+    return {
+        "next_before_created_at": created_at.isoformat() if created_at else None,
+        "next_before_id": int(last.id),
+    }
+
+
 def _shop_follower_count(db: Session, *, shop_id: int) -> int:
     return (
         db.query(ShopFollower)
@@ -601,7 +666,7 @@ def _notify_shop_followers(
     message: str,
     action_url: str,
     clan_ids: Optional[list[int]] = None,
-) -> int:
+) -> list[Notification]:
     follower_rows = (
         db.query(ShopFollower)
         .filter(ShopFollower.shop_id == int(shop.id))
@@ -609,7 +674,7 @@ def _notify_shop_followers(
         .all()
     )
 
-    created = 0
+    created: list[Notification] = []
     seen_user_ids: set[int] = set()
     for follower in follower_rows:
         follower_user_id = int(follower.follower_user_id)
@@ -633,18 +698,19 @@ def _notify_shop_followers(
         ):
             continue
 
-        create_notification(
-            db,
-            user_id=follower_user_id,
-            kind=kind,
-            title=title,
-            message=message,
-            action_url=action_url,
-            action_label="Open shop",
-            commit=False,
-            refresh=False,
+        created.append(
+            create_notification(
+                db,
+                user_id=follower_user_id,
+                kind=kind,
+                title=title,
+                message=message,
+                action_url=action_url,
+                action_label="Open shop",
+                commit=False,
+                refresh=False,
+            )
         )
-        created += 1
 
     return created
 
@@ -1038,6 +1104,82 @@ def _product_newest_rank(product: MarketplaceProduct) -> tuple[datetime, int]:
     return (created_at, int(getattr(product, "id", 0) or 0))
 
 
+def _visible_product_feed_page(
+    db: Session,
+    q: Any,
+    *,
+    limit: int,
+    before_created_at: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+) -> tuple[list[MarketplaceProduct], list[MarketplaceProduct]]:
+    """
+    Reads an already visibility-filtered product query one page at a time.
+
+    Block de-duplication only needs the active public products of the shops
+    that appear on the page, so those are loaded per shop instead of the whole
+    marketplace. Returns (page, block assignment context).
+    """
+    page: list[MarketplaceProduct] = []
+    context_by_id: dict[int, MarketplaceProduct] = {}
+    loaded_shop_ids: set[int] = set()
+    seen_ids: set[int] = set()
+    cursor_created_at = before_created_at
+    cursor_id = before_id
+
+    while len(page) < int(limit):
+        chunk = (
+            _apply_keyset_before(
+                q,
+                created_col=MarketplaceProduct.created_at,
+                id_col=MarketplaceProduct.id,
+                before_created_at=cursor_created_at,
+                before_id=cursor_id,
+            )
+            .order_by(MarketplaceProduct.created_at.desc(), MarketplaceProduct.id.desc())
+            .limit(int(limit))
+            .all()
+        )
+        fresh = [product for product in chunk if int(product.id) not in seen_ids]
+        if not fresh:
+            break
+        seen_ids.update(int(product.id) for product in fresh)
+
+        new_shop_ids = {int(product.shop_id) for product in fresh} - loaded_shop_ids
+        if new_shop_ids:
+            for product in (
+                db.query(MarketplaceProduct)
+                .filter(
+                    MarketplaceProduct.shop_id.in_(sorted(new_shop_ids)),
+                    MarketplaceProduct.visibility_mode == VISIBILITY_COMMUNITY,
+                    MarketplaceProduct.is_active.is_(True),
+                )
+                .all()
+            ):
+                context_by_id[int(product.id)] = product
+            loaded_shop_ids.update(new_shop_ids)
+
+        for product in fresh:
+            context_by_id.setdefault(int(product.id), product)
+
+        kept_ids = {
+            int(product.id)
+            for product in _dedupe_active_public_block_products(list(context_by_id.values()))
+        }
+        page.extend(product for product in fresh if int(product.id) in kept_ids)
+
+        if len(chunk) < int(limit):
+            break
+        cursor_created_at = chunk[-1].created_at
+        cursor_id = int(chunk[-1].id)
+
+    context = sorted(
+        _dedupe_active_public_block_products(list(context_by_id.values())),
+        key=_product_newest_rank,
+        reverse=True,
+    )
+    return page[: int(limit)], context
+
+
 def _display_public_block_assignments(
     items: list[MarketplaceProduct],
 ) -> dict[int, MarketplaceProduct]:
@@ -1359,6 +1501,7 @@ def _shop_out(db: Session, shop: MarketplaceShop) -> Dict[str, Any]:
         "banner_url": image_url,
         "logo_url": image_url,
         "shop_logo_url": image_url,
+        **image_variants_payload(image_url, existing_image_variants(image_url)),
         "marketplace_name": clan_name,
         "clan_name": clan_name,
         "community_name": clan_name,
@@ -1418,6 +1561,7 @@ def _product_out(
         "price": product.price,
         "currency": product.currency,
         "image_url": image_url,
+        **image_variants_payload(image_url, getattr(product, "image_variants_json", None)),
         "video_url": video_url,
         "image_url_available": _media_url_available(image_url),
         "video_url_available": _media_url_available(video_url),
@@ -1682,6 +1826,10 @@ def _broadcast_out(db: Session, item: MarketplaceBroadcast) -> Dict[str, Any]:
         "shop_id": int(item.shop_id) if getattr(item, "shop_id", None) is not None else None,
         "message": item.message,
         "image_url": _stored_media_url(getattr(item, "image_url", None)),
+        **image_variants_payload(
+            _stored_media_url(getattr(item, "image_url", None)),
+            getattr(item, "image_variants_json", None),
+        ),
         "video_url": _stored_media_url(getattr(item, "video_url", None)),
         "image_url_available": _media_url_available(getattr(item, "image_url", None)),
         "video_url_available": _media_url_available(getattr(item, "video_url", None)),
@@ -1799,6 +1947,8 @@ def list_marketplace_shops(
     clan_id: Optional[int] = Query(default=None),
     only_active: bool = Query(default=True),
     limit: int = Query(default=50, ge=1, le=200),
+    before_created_at: Optional[datetime] = Query(default=None),
+    before_id: Optional[int] = Query(default=None, ge=1),
     x_clan_id: Optional[str] = Header(default=None, alias="X-Clan-Id"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -1810,23 +1960,28 @@ def list_marketplace_shops(
         header_clan_id=x_clan_id,
     )
 
-    q = db.query(MarketplaceShop)
+    q = db.query(MarketplaceShop).filter(_shop_visible_in_clan_clause(resolved_clan_id))
     if only_active:
         q = q.filter(MarketplaceShop.is_active.is_(True))
 
-    rows = (
+    q = _apply_keyset_before(
+        q,
+        created_col=MarketplaceShop.created_at,
+        id_col=MarketplaceShop.id,
+        before_created_at=before_created_at,
+        before_id=before_id,
+    )
+    visible = (
         q.order_by(MarketplaceShop.created_at.desc(), MarketplaceShop.id.desc())
+        .limit(int(limit))
         .all()
     )
 
-    visible = [
-        row for row in rows if _shop_is_visible_in_clan(db, shop=row, clan_id=resolved_clan_id)
-    ][: int(limit)]
-
     return {
         "items": [_shop_out(db, x) for x in visible],
         "total": len(visible),
         "clan_id": resolved_clan_id,
+        **_next_page_cursor(visible, limit=int(limit)),
     }
 
 
@@ -2659,6 +2814,8 @@ def list_marketplace_products(
     include_reposted: bool = Query(default=True),
     include_private_manage: bool = Query(default=False),
     limit: int = Query(default=100, ge=1, le=300),
+    before_created_at: Optional[datetime] = Query(default=None),
+    before_id: Optional[int] = Query(default=None, ge=1),
     x_clan_id: Optional[str] = Header(default=None, alias="X-Clan-Id"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -2725,8 +2882,13 @@ def list_marketplace_products(
             "include_private_manage": True,
         }
 
-    q = db.query(MarketplaceProduct).filter(
-        MarketplaceProduct.visibility_mode == VISIBILITY_COMMUNITY
+    q = (
+        db.query(MarketplaceProduct)
+        .join(MarketplaceShop, MarketplaceShop.id == MarketplaceProduct.shop_id)
+        .filter(
+            MarketplaceProduct.visibility_mode == VISIBILITY_COMMUNITY,
+            _shop_visible_in_clan_clause(resolved_clan_id),
+        )
     )
 
     if only_active:
@@ -2735,33 +2897,13 @@ def list_marketplace_products(
     if shop_id and int(shop_id) > 0:
         q = q.filter(MarketplaceProduct.shop_id == int(shop_id))
 
-    items = q.all()
-
-    visible_items: list[MarketplaceProduct] = []
-    for item in items:
-        if _safe_str(getattr(item, "visibility_mode", None), VISIBILITY_COMMUNITY) != VISIBILITY_COMMUNITY:
-            continue
-
-        shop = (
-            db.query(MarketplaceShop)
-            .filter(MarketplaceShop.id == int(item.shop_id))
-            .first()
-        )
-        if not shop:
-            continue
-        if not _shop_is_visible_in_clan(db, shop=shop, clan_id=resolved_clan_id):
-            continue
-        visible_items.append(item)
-
-    visible_items.sort(
-        key=lambda x: (
-            x.created_at or _now_utc(),
-            x.id or 0,
-        ),
-        reverse=True,
+    visible_items, visible_context_items = _visible_product_feed_page(
+        db,
+        q,
+        limit=int(limit),
+        before_created_at=before_created_at,
+        before_id=before_id,
     )
-    visible_context_items = _dedupe_active_public_block_products(visible_items)
-    visible_items = visible_context_items[: int(limit)]
 
     return {
         "items": _products_out(
@@ -2771,6 +2913,7 @@ def list_marketplace_products(
         ),
         "total": len(visible_items),
         "clan_id": resolved_clan_id,
+        **_next_page_cursor(visible_items, limit=int(limit)),
     }
 
 
@@ -2898,6 +3041,7 @@ def create_marketplace_product(
 
     if hasattr(product, "video_url"):
         setattr(product, "video_url", _safe_str(payload.video_url) or None)
+    record_known_image_variants(product)
 
     try:
         db.add(product)
@@ -2927,6 +3071,7 @@ def create_marketplace_product(
     except ValueError as exc:
         db.rollback()
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    enqueue_image_variant_job(db, product)
 
     log_trust_event(
         db,
@@ -2959,9 +3104,10 @@ def create_marketplace_product(
         commit=False,
         refresh=False,
     )
+    follower_notifications: list[Notification] = []
     if visibility_mode == VISIBILITY_COMMUNITY:
         shop_name = _public_identity_name(getattr(shop, "name", None), fallback="A shop you follow")
-        _notify_shop_followers(
+        follower_notifications = _notify_shop_followers(
             db,
             shop=shop,
             kind="marketplace.shop.product_created",
@@ -2976,6 +3122,7 @@ def create_marketplace_product(
             clan_ids=[resolved_clan_id],
         )
     db.commit()
+    publish_notifications(db, created=follower_notifications)
 
     return {
         "ok": True,
@@ -3075,15 +3222,19 @@ def update_marketplace_product(
     clear_image_requested = bool(
         payload.clear_image or payload.remove_image or payload.delete_image
     )
+    image_changed = False
     if clear_image_requested:
         if getattr(product, "image_url", None) is not None:
             product.image_url = None
-            changed = True
+            image_changed = True
     elif "image_url" in provided:
         new_image = _safe_str(payload.image_url) or None
         if getattr(product, "image_url", None) != new_image:
             product.image_url = new_image
-            changed = True
+            image_changed = True
+    if image_changed:
+        record_known_image_variants(product)
+        changed = True
 
     if hasattr(product, "video_url") and "video_url" in provided:
         new_video = _safe_str(payload.video_url) or None
@@ -3289,6 +3440,7 @@ def update_marketplace_product(
                     or (not previous_active and bool(getattr(product, "is_active", True)))
                 )
             )
+            follower_notifications: list[Notification] = []
             if major_public_offer_update:
                 notify_shop = (
                     db.query(MarketplaceShop)
@@ -3300,7 +3452,7 @@ def update_marketplace_product(
                         getattr(notify_shop, "name", None),
                         fallback="A shop you follow",
                     )
-                    _notify_shop_followers(
+                    follower_notifications = _notify_shop_followers(
                         db,
                         shop=notify_shop,
                         kind="marketplace.shop.product_updated",
@@ -3316,9 +3468,12 @@ def update_marketplace_product(
                     )
             db.commit()
             db.refresh(product)
+            publish_notifications(db, created=follower_notifications)
         except ValueError as exc:
             db.rollback()
             raise HTTPException(status_code=400, detail=str(exc)) from exc
+        if image_changed:
+            enqueue_image_variant_job(db, product)
 
     return {
         "ok": True,
@@ -3718,6 +3873,7 @@ def repost_marketplace_product(
         expires_at=spotlight_expires_at,
         created_at=current_time,
     )
+    record_known_image_variants(broadcast)
     db.add(repost)
     db.add(broadcast)
     db.flush()
@@ -3775,7 +3931,7 @@ def repost_marketplace_product(
         refresh=False,
     )
     shop_name = _public_identity_name(getattr(shop, "name", None), fallback="A shop you follow")
-    _notify_shop_followers(
+    follower_notifications = _notify_shop_followers(
         db,
         shop=shop,
         kind="marketplace.shop.spotlight_created",
@@ -3793,6 +3949,8 @@ def repost_marketplace_product(
     db.commit()
     db.refresh(repost)
     db.refresh(broadcast)
+    enqueue_image_variant_job(db, broadcast)
+    publish_notifications(db, created=follower_notifications)
 
     return {
         "ok": True,
@@ -4122,6 +4280,7 @@ def create_marketplace_broadcast(
             expires_at=expires_at,
             created_at=created_at,
         )
+        record_known_image_variants(item)
         db.add(item)
         created_items.append(item)
 
@@ -4152,6 +4311,7 @@ def create_marketplace_broadcast(
 
     for item in created_items:
         db.refresh(item)
+        enqueue_image_variant_job(db, item)
 
     canonical_shop = shop
     if canonical_shop is None:
@@ -4193,13 +4353,14 @@ def create_marketplace_broadcast(
         (x for x in created_items if int(x.clan_id) == int(resolved_clan_id)),
         created_items[0],
     )
+    follower_notifications: list[Notification] = []
     if canonical_shop is not None:
         shop_name = _public_identity_name(
             getattr(canonical_shop, "name", None),
             fallback="A shop you follow",
         )
         spotlight_publish = priority_mode == SPOTLIGHT_PAID
-        _notify_shop_followers(
+        follower_notifications = _notify_shop_followers(
             db,
             shop=canonical_shop,
             kind=(
@@ -4222,6 +4383,7 @@ def create_marketplace_broadcast(
             clan_ids=target_clan_ids,
         )
     db.commit()
+    publish_notifications(db, created=follower_notifications)
 
     return {
         "ok": True,
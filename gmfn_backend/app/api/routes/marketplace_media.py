@@ -1,21 +1,72 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
 import secrets
+import tempfile
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
 
 from fastapi import APIRouter, Body, File, Form, HTTPException, UploadFile, Request
 from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from starlette.responses import Response
 from pydantic import BaseModel, Field, field_validator
 
-router = APIRouter(prefix="/marketplace/media", tags=["marketplace-media"])
+from app.services.marketplace_image_variants import image_variant_urls, schedule_image_variants
 
 MAX_IMAGE_BYTES = 10 * 1024 * 1024
 MAX_VIDEO_BYTES = 15 * 1024 * 1024
 MAX_VIDEO_DURATION_SECONDS = 10.0
 
+# Uploads are streamed to disk in pieces of this size; a request never
+# holds more than one piece in memory.
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+# Room for multipart boundaries, part headers and the small form fields on
+# top of the file itself when judging a declared Content-Length.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+_MULTIPART_MEDIA_TYPES = {
+    "upload_marketplace_image": "image",
+    "upload_marketplace_video": "video",
+}
+
+
+class _MultipartSizeCapRoute(APIRoute):
+    """
+    FastAPI parses a multipart body (spooling the file to a temp file)
+    before the endpoint runs, so the size cap inside the endpoint comes too
+    late to save the read. This route rejects an oversized Content-Length
+    before the body is touched. Chunked requests carry no length and are
+    still capped while the endpoint copies the upload.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        media_type = _MULTIPART_MEDIA_TYPES.get(getattr(self.endpoint, "__name__", ""))
+        if media_type is None:
+            return handler
+
+        async def capped_handler(request: Request) -> Response:
+            max_bytes = _max_bytes_for(media_type)
+            declared = str(request.headers.get("content-length") or "").strip()
+            if declared.isdigit() and int(declared) > max_bytes + MULTIPART_OVERHEAD_BYTES:
+                raise _too_large(max_bytes)
+            return await handler(request)
+
+        return capped_handler
+
+
+router = APIRouter(
+    prefix="/marketplace/media",
+    tags=["marketplace-media"],
+    route_class=_MultipartSizeCapRoute,
+)
+
 ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
 ALLOWED_VIDEO_EXTENSIONS = {".mp4", ".webm", ".mov"}
 
@@ -152,14 +203,108 @@ def _max_bytes_for(media_type: str) -> int:
     return MAX_IMAGE_BYTES if media_type == "image" else MAX_VIDEO_BYTES
 
 
-async def _read_limited_bytes(file: UploadFile, max_bytes: int) -> bytes:
-    data = await file.read()
-    if len(data) > max_bytes:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File is too large. Maximum allowed is {max_bytes // (1024 * 1024)}MB.",
-        )
-    return data
+def _too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(
+        status_code=400,
+        detail=f"File is too large. Maximum allowed is {max_bytes // (1024 * 1024)}MB.",
+    )
+
+
+@dataclass
+class _StagedUpload:
+    path: Path
+    size_bytes: int
+    sha256: str
+
+
+def _discard(path: Path) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+async def _upload_file_chunks(file: UploadFile) -> AsyncIterator[bytes]:
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def _stage_upload(
+    chunks: AsyncIterator[bytes],
+    *,
+    directory: Path,
+    max_bytes: int,
+) -> _StagedUpload:
+    """
+    Stream chunks into a temp file beside their final home, enforcing
+    max_bytes as they arrive and hashing on the fly. File I/O runs off the
+    event loop; the temp file is removed if anything goes wrong.
+    """
+    handle = await asyncio.to_thread(
+        tempfile.NamedTemporaryFile,
+        mode="wb",
+        dir=str(directory),
+        prefix=".upload-",
+        suffix=".part",
+        delete=False,
+    )
+    path = Path(handle.name)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            size += len(chunk)
+            if size > max_bytes:
+                raise _too_large(max_bytes)
+            digest.update(chunk)
+            await asyncio.to_thread(handle.write, chunk)
+        await asyncio.to_thread(handle.close)
+    except BaseException:
+        await asyncio.to_thread(handle.close)
+        await asyncio.to_thread(_discard, path)
+        raise
+
+    return _StagedUpload(path=path, size_bytes=size, sha256=digest.hexdigest())
+
+
+def _place_staged(staged: _StagedUpload, target: Path) -> None:
+    os.replace(staged.path, target)
+
+
+def _place_deduplicated(staged: _StagedUpload, directory: Path, ext: str) -> Tuple[str, bool]:
+    """
+    Files are named by content hash, so identical media is stored once.
+    Returns the stored filename and whether it was already there.
+    """
+    filename = f"{staged.sha256[:32]}{ext}"
+    target = directory / filename
+    if target.exists():
+        _discard(staged.path)
+        return filename, True
+    os.replace(staged.path, target)
+    return filename, False
+
+
+async def _store_upload_file(
+    file: UploadFile,
+    *,
+    directory: Path,
+    ext: str,
+    max_bytes: int,
+    empty_detail: str,
+) -> Tuple[str, _StagedUpload, bool]:
+    staged = await _stage_upload(_upload_file_chunks(file), directory=directory, max_bytes=max_bytes)
+    if staged.size_bytes == 0:
+        await asyncio.to_thread(_discard, staged.path)
+        raise HTTPException(status_code=400, detail=empty_detail)
+
+    filename, deduplicated = await asyncio.to_thread(_place_deduplicated, staged, directory, ext)
+    return filename, staged, deduplicated
 
 
 class UploadUrlCreateIn(BaseModel):
@@ -224,26 +369,30 @@ async def upload_marketplace_file_direct(
     content_type = _normalize_content_type(request.headers.get("content-type"))
     _validate_content_type(media_type, content_type, ext)
 
-    raw = await request.body()
-    if not raw:
-        raise HTTPException(status_code=400, detail="Uploaded file is empty.")
-
     max_bytes = _max_bytes_for(media_type)
-    if len(raw) > max_bytes:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File is too large. Maximum allowed is {max_bytes // (1024 * 1024)}MB.",
-        )
+    declared = str(request.headers.get("content-length") or "").strip()
+    if declared.isdigit() and int(declared) > max_bytes:
+        raise _too_large(max_bytes)
 
     filepath = _upload_path_for(kind, filename)
-    filepath.write_bytes(raw)
+    staged = await _stage_upload(request.stream(), directory=filepath.parent, max_bytes=max_bytes)
+    if staged.size_bytes == 0:
+        await asyncio.to_thread(_discard, staged.path)
+        raise HTTPException(status_code=400, detail="Uploaded file is empty.")
+
+    # The name was handed out by upload-url, so it is kept; the rename
+    # makes the file appear complete or not at all.
+    await asyncio.to_thread(_place_staged, staged, filepath)
+    if kind == "images":
+        schedule_image_variants(_public_url_for(kind, filename))
 
     return {
         "ok": True,
         "kind": kind[:-1],
         "filename": filename,
         "content_type": content_type,
-        "size_bytes": len(raw),
+        "size_bytes": staged.size_bytes,
+        "sha256": staged.sha256,
         "url": _public_url_for(kind, filename),
     }
 
@@ -261,21 +410,28 @@ async def upload_marketplace_image(
     _validate_ext("image", ext)
     _validate_content_type("image", content_type, ext)
 
-    data = await _read_limited_bytes(file, MAX_IMAGE_BYTES)
-    if not data:
-        raise HTTPException(status_code=400, detail="Image file is empty.")
-
-    filename = _random_name(ext)
-    filepath = _image_upload_dir() / filename
-    filepath.write_bytes(data)
+    filename, staged, deduplicated = await _store_upload_file(
+        file,
+        directory=_image_upload_dir(),
+        ext=ext,
+        max_bytes=MAX_IMAGE_BYTES,
+        empty_detail="Image file is empty.",
+    )
+    url = _public_url_for("images", filename)
+    # Thumbnail and WebP variants are rendered on the worker pool; products
+    # and broadcasts using this URL record them once they exist.
+    schedule_image_variants(url)
 
     return {
         "ok": True,
         "kind": "image",
         "filename": filename,
         "content_type": content_type,
-        "size_bytes": len(data),
-        "url": _public_url_for("images", filename),
+        "size_bytes": staged.size_bytes,
+        "sha256": staged.sha256,
+        "deduplicated": deduplicated,
+        "url": url,
+        "variant_urls": image_variant_urls(url),
         "clan_id": clan_id,
     }
 
@@ -300,20 +456,22 @@ async def upload_marketplace_video(
             detail=f"Video must not be longer than {int(MAX_VIDEO_DURATION_SECONDS)} seconds.",
         )
 
-    data = await _read_limited_bytes(file, MAX_VIDEO_BYTES)
-    if not data:
-        raise HTTPException(status_code=400, detail="Video file is empty.")
-
-    filename = _random_name(ext)
-    filepath = _video_upload_dir() / filename
-    filepath.write_bytes(data)
+    filename, staged, deduplicated = await _store_upload_file(
+        file,
+        directory=_video_upload_dir(),
+        ext=ext,
+        max_bytes=MAX_VIDEO_BYTES,
+        empty_detail="Video file is empty.",
+    )
 
     return {
         "ok": True,
         "kind": "video",
         "filename": filename,
         "content_type": content_type,
-        "size_bytes": len(data),
+        "size_bytes": staged.size_bytes,
+        "sha256": staged.sha256,
+        "deduplicated": deduplicated,
         "duration_seconds": duration_seconds,
         "max_video_seconds": MAX_VIDEO_DURATION_SECONDS,
         "url": _public_url_for("videos", filename),
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_user
@@ -13,6 +16,10 @@ from app.services.notification_service import (
     mark_notification_read,
     seed_assistance_notifications,
 )
+from app.services.notification_stream_service import (
+    notification_event_stream,
+    parse_last_event_id,
+)
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
@@ -51,6 +58,38 @@ def my_unread_count(
     )
 
 
+@router.get("/me/stream")
+async def stream_my_notifications(
+    request: Request,
+    last_event_id: Optional[int] = Query(None, ge=0),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Server-sent events replacing the /me and /me/unread-count polls: new
+    notifications and unread count changes are pushed as they commit.
+    Browsers resume with the Last-Event-ID header; last_event_id serves
+    clients that cannot set it. The stream reads through short sessions of
+    its own rather than holding a pooled connection open.
+    """
+    user_id = int(current_user.id)
+    resume_from = parse_last_event_id(request.headers.get("last-event-id"))
+    if resume_from is None:
+        resume_from = last_event_id
+
+    return StreamingResponse(
+        notification_event_stream(
+            user_id=user_id,
+            last_event_id=resume_from,
+            is_disconnected=request.is_disconnected,
+        ),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.post("/me/{notification_id}/read")
 def read_notification(
     notification_id: int,
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import lru_cache
 from io import BytesIO
 from html import escape
 from textwrap import wrap
@@ -14,6 +16,11 @@ from sqlalchemy.orm import Session
 
 from app.db.models import MarketplaceProduct, MarketplaceShop, User
 from app.deps import get_db
+from app.services.share_card_cache import (
+    CachedShareCard,
+    get_share_card_cache,
+    share_card_cache_key,
+)
 
 router = APIRouter(prefix="/share", tags=["share-preview"])
 
@@ -22,6 +29,10 @@ PUBLIC_API_ORIGIN = "https://gmfn-api.onrender.com"
 PUBLIC_VISIBILITY_MODES = ("community_visible", "public", "community")
 CARD_WIDTH = 1200
 CARD_HEIGHT = 630
+# Bump whenever _draw_share_card_png changes its output so cached cards and
+# crawler ETags roll over.
+SHARE_CARD_TEMPLATE_VERSION = "2026-08-card-v1"
+SHARE_CARD_CACHE_CONTROL = "public, max-age=300"
 
 
 def _safe_str(value: Any, default: str = "") -> str:
@@ -310,6 +321,7 @@ def _svg_text_lines(text: str, *, max_chars: int, max_lines: int) -> list[str]:
     return [*lines[: max_lines - 1], f"{lines[max_lines - 1].rstrip()}..."]
 
 
+@lru_cache(maxsize=32)
 def _font(size: int, *, bold: bool = False) -> ImageFont.ImageFont:
     names = (
         ("arialbd.ttf", "Arial Bold.ttf", "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf")
@@ -401,18 +413,26 @@ def _draw_lines(
     return current_y
 
 
+@lru_cache(maxsize=4)
+def _gradient_column(height: int) -> Image.Image:
+    column = Image.new("RGBA", (1, height))
+    column.putdata(
+        [
+            (
+                int(6 + (y / max(1, height - 1)) * 5),
+                int(24 + (y / max(1, height - 1)) * 21),
+                int(39 + (y / max(1, height - 1)) * 35),
+                255,
+            )
+            for y in range(height)
+        ]
+    )
+    return column
+
+
 def _gradient_card(size: tuple[int, int]) -> Image.Image:
     width, height = size
-    image = Image.new("RGBA", size, "#061827")
-    pixels = image.load()
-    for y in range(height):
-        ratio = y / max(1, height - 1)
-        r = int(6 + ratio * 5)
-        g = int(24 + ratio * 21)
-        b = int(39 + ratio * 35)
-        for x in range(width):
-            pixels[x, y] = (r, g, b, 255)
-    return image
+    return _gradient_column(height).resize((width, height), Image.NEAREST)
 
 
 def _draw_share_card_png(
@@ -527,6 +547,96 @@ def _draw_share_card_png(
     return out.getvalue()
 
 
+def _share_card_inputs(
+    payload: dict[str, str],
+    *,
+    block: Optional[int],
+    eyebrow: str = "PUBLIC SHOP",
+    block_label_override: str = "",
+) -> dict[str, Any]:
+    return {
+        "template": SHARE_CARD_TEMPLATE_VERSION,
+        "size": [CARD_WIDTH, CARD_HEIGHT],
+        "gmfn_id": payload.get("gmfn_id", ""),
+        "shop_name": payload.get("shop_name", ""),
+        "product_line": payload.get("product_line", ""),
+        "trust_line": payload.get("trust_line", ""),
+        "price": payload.get("price", ""),
+        "block": int(block) if block else None,
+        "eyebrow": eyebrow,
+        "block_label_override": block_label_override,
+    }
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    raw = _safe_str(request.headers.get("if-none-match"))
+    if not raw:
+        return False
+    if raw == "*":
+        return True
+    candidates = {part.strip().removeprefix("W/") for part in raw.split(",")}
+    return etag in candidates
+
+
+def _not_modified_since(request: Request, card: CachedShareCard) -> bool:
+    raw = _safe_str(request.headers.get("if-modified-since"))
+    if not raw or request.headers.get("if-none-match"):
+        return False
+    try:
+        since = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return card.last_modified <= since
+
+
+def _share_card_png_response(
+    request: Request,
+    payload: dict[str, str],
+    *,
+    target_url: str,
+    block: Optional[int],
+    eyebrow: str = "PUBLIC SHOP",
+    block_label_override: str = "",
+) -> Response:
+    """
+    Serves a share card from the render cache. The ETag is the content key, so
+    a crawler revalidating an unchanged card gets a 304 before anything is
+    read from disk or rendered.
+    """
+    key = share_card_cache_key(
+        _share_card_inputs(
+            payload,
+            block=block,
+            eyebrow=eyebrow,
+            block_label_override=block_label_override,
+        )
+    )
+    etag = f'"{key}"'
+    headers = {"Cache-Control": SHARE_CARD_CACHE_CONTROL, "ETag": etag}
+
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    card = get_share_card_cache().get_or_render(
+        key,
+        lambda: _draw_share_card_png(
+            payload,
+            target_url=target_url,
+            block=block,
+            eyebrow=eyebrow,
+            block_label_override=block_label_override,
+        ),
+    )
+    headers["Last-Modified"] = format_datetime(card.last_modified, usegmt=True)
+
+    if _not_modified_since(request, card):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=card.content, media_type="image/png", headers=headers)
+
+
 @router.get("/vault-request/{gmfn_id}", response_class=HTMLResponse)
 def public_vault_request_share_preview(
     gmfn_id: str,
@@ -592,18 +702,14 @@ def public_vault_request_share_card_png(
 ) -> Response:
     payload = _vault_request_payload(db, gmfn_id=gmfn_id)
     target_url = _vault_request_frontend_url(payload["gmfn_id"])
-    png = _draw_share_card_png(
+    return _share_card_png_response(
+        request,
         payload,
         target_url=target_url,
         block=None,
         eyebrow="PRIVATE VAULT",
         block_label_override="Vault request",
     )
-    return Response(
-        content=png,
-        media_type="image/png",
-        headers={"Cache-Control": "public, max-age=300"},
-    )
 
 
 @router.get("/shop/{gmfn_id}", response_class=HTMLResponse)
@@ -675,12 +781,7 @@ def public_shop_share_card_png(
 ) -> Response:
     payload = _preview_payload(db, gmfn_id=gmfn_id, product_id=product_id)
     target_url = _shop_frontend_url(payload["gmfn_id"], product_id=product_id, block=block)
-    png = _draw_share_card_png(payload, target_url=target_url, block=block)
-    return Response(
-        content=png,
-        media_type="image/png",
-        headers={"Cache-Control": "public, max-age=300"},
-    )
+    return _share_card_png_response(request, payload, target_url=target_url, block=block)
 
 
 @router.get("/shop/{gmfn_id}/card.svg")
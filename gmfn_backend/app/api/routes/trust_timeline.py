@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session
 from app.core.auth import get_current_user
 from app.db.database import get_db
 from app.db.models import User
-from app.services.trust_timeline_service import list_trust_timeline
+from app.services.trust_timeline_service import get_trust_timeline_page
 
 router = APIRouter(prefix="/trust", tags=["trust"])
 
@@ -27,26 +27,37 @@ def _require_admin(user: Any) -> None:
         raise HTTPException(status_code=403, detail="Admin access required")
 
 
+def _timeline_page(db: Session, **kwargs: Any) -> Dict[str, Any]:
+    try:
+        return get_trust_timeline_page(db, **kwargs)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
 @router.get("/me/timeline")
 def my_trust_timeline(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     limit: int = 50,
+    before: Optional[str] = None,
 ) -> Dict[str, Any]:
     lim = max(1, min(int(limit or 50), 200))
 
-    items = list_trust_timeline(
+    page = _timeline_page(
         db,
         user_id=int(current_user.id),
         limit=lim,
         audience="user",
         hide_zero_deltas_for_user=True,
+        before=before,
     )
 
     return {
         "user_id": int(current_user.id),
-        "items": items,
-        "total": len(items),
+        "items": page["items"],
+        "total": len(page["items"]),
+        "has_more": page["has_more"],
+        "next_before": page["next_before"],
     }
 
 
@@ -56,6 +67,7 @@ def user_trust_timeline_admin(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     limit: int = 50,
+    before: Optional[str] = None,
 ) -> Dict[str, Any]:
     _require_admin(current_user)
 
@@ -68,16 +80,19 @@ def user_trust_timeline_admin(
     if not target:
         raise HTTPException(status_code=404, detail="User not found")
 
-    items = list_trust_timeline(
+    page = _timeline_page(
         db,
         user_id=int(user_id),
         limit=lim,
         audience="admin",
         hide_zero_deltas_for_user=False,
+        before=before,
     )
 
     return {
         "user_id": int(user_id),
-        "items": items,
-        "total": len(items),
+        "items": page["items"],
+        "total": len(page["items"]),
+        "has_more": page["has_more"],
+        "next_before": page["next_before"],
     }
\ No newline at end of file
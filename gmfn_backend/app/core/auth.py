@@ -1,11 +1,26 @@
+"""
+Request authentication: token subject -> current User.
+
+get_current_user caches subject -> user id per process
+(GMFN_AUTH_USER_CACHE_TTL_SECONDS, default 30; GMFN_AUTH_USER_CACHE_MAX,
+default 2048). A cache hit still costs one primary-key db.get(User, id)
+round trip per request. That is deliberate: it trades the "no DB round trip
+for hot users" goal for never serving a stale password, role or balance,
+and it replaces the email/gmfn_id lookup rather than adding to it.
+"""
+
 from __future__ import annotations
 
 import os
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
+from sqlalchemy import case, or_
 from sqlalchemy.orm import Session
 
 from app.core.security import decode_token, get_password_hash, verify_password
@@ -61,6 +76,104 @@ def is_user_activation_pending(user: Optional[User]) -> bool:
     return False
 
 
+def _env_int(name: str, default: int) -> int:
+    raw = str(os.getenv(name, "") or "").strip()
+    try:
+        return int(raw) if raw else default
+    except ValueError:
+        return default
+
+
+class _AuthSubjectCache:
+    """
+    Per-process token subject -> user id, bounded by size and TTL.
+
+    Only the id is cached. The User row itself is always loaded fresh by
+    primary key, so password, role and balance changes (including bulk
+    update(User) statements and writes from other processes) take effect
+    on the next request; a hit just skips resolving the subject, and a
+    user whose email or gmfn_id no longer matches it is resolved again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple[float, int]]" = OrderedDict()
+
+    @staticmethod
+    def ttl_seconds() -> int:
+        return max(0, _env_int("GMFN_AUTH_USER_CACHE_TTL_SECONDS", 30))
+
+    @staticmethod
+    def max_entries() -> int:
+        return max(1, _env_int("GMFN_AUTH_USER_CACHE_MAX", 2048))
+
+    def get(self, subject: str) -> Optional[int]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry is None:
+                return None
+            expires_at, user_id = entry
+            if expires_at <= now:
+                self._entries.pop(subject, None)
+                return None
+            self._entries.move_to_end(subject)
+            return user_id
+
+    def put(self, subject: str, user_id: int) -> None:
+        ttl = self.ttl_seconds()
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries.pop(subject, None)
+            self._entries[subject] = (time.monotonic() + ttl, int(user_id))
+            limit = self.max_entries()
+            while len(self._entries) > limit:
+                self._entries.popitem(last=False)
+
+    def discard(self, subject: str) -> None:
+        with self._lock:
+            self._entries.pop(subject, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_auth_subject_cache = _AuthSubjectCache()
+
+
+def clear_auth_user_cache() -> None:
+    _auth_subject_cache.clear()
+
+
+def _subject_matches(user: Optional[User], subject: str) -> bool:
+    return user is not None and subject in {
+        str(getattr(user, "email", "") or ""),
+        str(getattr(user, "gmfn_id", "") or ""),
+    }
+
+
+def _user_for_subject(db: Session, subject: str) -> Optional[User]:
+    user_id = _auth_subject_cache.get(subject)
+    if user_id is not None:
+        user = db.get(User, user_id)
+        if _subject_matches(user, subject):
+            return user
+        _auth_subject_cache.discard(subject)
+
+    # One round trip for both subject forms; an email match wins, as before.
+    user = (
+        db.query(User)
+        .filter(or_(User.email == subject, User.gmfn_id == subject))
+        .order_by(case((User.email == subject, 0), else_=1), User.id.asc())
+        .first()
+    )
+    if user is not None:
+        _auth_subject_cache.put(subject, int(user.id))
+    return user
+
+
 def get_current_user(
     db: Session = Depends(get_db),
     token: Optional[str] = Depends(oauth2_scheme),
@@ -75,11 +188,7 @@ def get_current_user(
             subject = str(payload.get("sub") or "").strip()
 
             if subject:
-                user = db.query(User).filter(User.email == subject).first()
-                if user:
-                    return user
-
-                user = db.query(User).filter(User.gmfn_id == subject).first()
+                user = _user_for_subject(db, subject)
                 if user:
                     return user
         except JWTError:
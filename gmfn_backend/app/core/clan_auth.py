@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.db.models import Clan, ClanMembership, User
 from app.core.auth import get_current_user
+from app.services.community_confirmation_service import provision_confirmation_contacts_for_membership
 
 DEFAULT_CLAN_NAME = "Default Clan"
 LEGACY_DEFAULT_CLAN_NAME = "GMFN Default Clan"
@@ -75,6 +76,7 @@ def ensure_membership(*, db: Session, clan: Clan, user: User, role: str = "user"
         archived.left_at = None
         if role == "admin" or (archived.role or "").lower() != "admin":
             archived.role = role
+        provision_confirmation_contacts_for_membership(db, archived)
         db.commit()
         db.refresh(archived)
         return archived
@@ -86,6 +88,7 @@ def ensure_membership(*, db: Session, clan: Clan, user: User, role: str = "user"
         personal_pool_balance=Decimal("0"),
     )
     db.add(m)
+    provision_confirmation_contacts_for_membership(db, m)
     db.commit()
     db.refresh(m)
     return m
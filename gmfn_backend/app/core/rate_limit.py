@@ -1,10 +1,20 @@
 # app/core/rate_limit.py
 from __future__ import annotations
 
+import math
+import os
+import sqlite3
+import threading
 import time
-from collections import deque
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Deque, Dict
+from pathlib import Path
+from typing import Any, Optional, Protocol, Tuple
+
+try:  # pragma: no cover - redis is optional; only needed for the redis backend
+    import redis  # type: ignore
+except Exception:  # pragma: no cover
+    redis = None  # type: ignore[assignment]
 
 
 @dataclass(frozen=True)
@@ -14,39 +24,238 @@ class RateLimitResult:
     reset_in_seconds: int
 
 
-class InMemoryRateLimiter:
+def _now() -> float:
+    return time.time()
+
+
+class CounterStore(Protocol):
+    """
+    Redis-compatible counter subset used by the limiter.
+
+    A redis.Redis client satisfies this as-is, so any Redis (or a local
+    Redis-protocol stand-in) can be plugged in without an adapter.
+    """
+
+    def get(self, name: str) -> Any: ...
+
+    def incr(self, name: str, amount: int = 1) -> int: ...
+
+    def expire(self, name: str, time: int) -> Any: ...
+
+
+class MemoryCounterStore:
+    """
+    Per-process counters with expiry and a hard key cap.
+
+    Expired keys are swept every sweep_interval operations and the least
+    recently touched key is dropped once max_keys is reached, so memory stays
+    bounded no matter how many distinct clients show up.
+    """
+
+    def __init__(self, *, max_keys: int = 100_000, sweep_interval: int = 1024) -> None:
+        self.max_keys = max(1, int(max_keys))
+        self.sweep_interval = max(1, int(sweep_interval))
+        self._data: "OrderedDict[str, Tuple[int, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._ops = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _live(self, name: str, now: float) -> Optional[Tuple[int, Optional[float]]]:
+        item = self._data.get(name)
+        if item is None:
+            return None
+        if item[1] is not None and item[1] <= now:
+            del self._data[name]
+            return None
+        return item
+
+    def _tick(self, now: float) -> None:
+        self._ops += 1
+        if self._ops % self.sweep_interval == 0:
+            expired = [k for k, (_, exp) in self._data.items() if exp is not None and exp <= now]
+            for k in expired:
+                del self._data[k]
+
+    def get(self, name: str) -> Optional[int]:
+        now = _now()
+        with self._lock:
+            item = self._live(name, now)
+            return item[0] if item else None
+
+    def incr(self, name: str, amount: int = 1) -> int:
+        now = _now()
+        with self._lock:
+            self._tick(now)
+            item = self._live(name, now)
+            value = (item[0] if item else 0) + int(amount)
+            self._data[name] = (value, item[1] if item else None)
+            self._data.move_to_end(name)
+            while len(self._data) > self.max_keys:
+                self._data.popitem(last=False)
+            return value
+
+    def expire(self, name: str, time: int) -> bool:
+        now = _now()
+        with self._lock:
+            item = self._live(name, now)
+            if item is None:
+                return False
+            self._data[name] = (item[0], now + float(time))
+            return True
+
+
+class SQLiteCounterStore:
     """
-    Minimal in-memory rate limiter (MVP).
-    Sliding window per key.
+    Counters in a local SQLite file, shared by every worker on the host.
 
-    NOTE: per-process only. Good for MVP/pilot. Redis later for production.
+    Each increment runs in its own IMMEDIATE transaction so concurrent
+    uvicorn workers see one consistent count. Expired rows are deleted every
+    sweep_interval operations.
     """
 
-    def __init__(self) -> None:
-        self._hits: Dict[str, Deque[float]] = {}
+    def __init__(self, path: str, *, sweep_interval: int = 1024) -> None:
+        self.path = str(path)
+        self.sweep_interval = max(1, int(sweep_interval))
+        self._local = threading.local()
+        self._ops = 0
+        Path(self.path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_counters ("
+                "name TEXT PRIMARY KEY, value INTEGER NOT NULL, expires_at REAL)"
+            )
+            self._local.conn = conn
+        return conn
+
+    def get(self, name: str) -> Optional[int]:
+        row = self._conn().execute(
+            "SELECT value FROM rate_limit_counters "
+            "WHERE name = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (name, _now()),
+        ).fetchone()
+        return int(row[0]) if row else None
+
+    def incr(self, name: str, amount: int = 1) -> int:
+        now = _now()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._ops += 1
+            if self._ops % self.sweep_interval == 0:
+                conn.execute(
+                    "DELETE FROM rate_limit_counters WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                    (now,),
+                )
+            conn.execute(
+                "INSERT INTO rate_limit_counters (name, value, expires_at) VALUES (?, ?, NULL) "
+                "ON CONFLICT(name) DO UPDATE SET "
+                "value = CASE WHEN expires_at IS NOT NULL AND expires_at <= ? "
+                "THEN excluded.value ELSE value + excluded.value END, "
+                "expires_at = CASE WHEN expires_at IS NOT NULL AND expires_at <= ? "
+                "THEN NULL ELSE expires_at END",
+                (name, int(amount), now, now),
+            )
+            row = conn.execute(
+                "SELECT value FROM rate_limit_counters WHERE name = ?",
+                (name,),
+            ).fetchone()
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return int(row[0])
+
+    def expire(self, name: str, time: int) -> bool:
+        cur = self._conn().execute(
+            "UPDATE rate_limit_counters SET expires_at = ? WHERE name = ?",
+            (_now() + float(time), name),
+        )
+        return cur.rowcount > 0
+
+
+class RateLimiter:
+    """
+    Sliding-window counter limiter over a pluggable CounterStore.
+
+    Keeps two counters per key (current and previous fixed window) and
+    weights the previous one by how much of it still overlaps the sliding
+    window, so memory per key is constant. Counters expire after two
+    windows, which is what evicts idle keys. The hit is counted before the
+    check so concurrent workers never admit more than max_requests, and
+    handed back when the request is rejected: only admitted requests count,
+    so a client retrying while blocked is not locked out any longer.
+    """
+
+    def __init__(self, store: CounterStore, *, prefix: str = "gmfn:rl") -> None:
+        self.store = store
+        self.prefix = prefix
 
     def check(self, *, key: str, max_requests: int, window_seconds: int) -> RateLimitResult:
-        now = time.time()
-        q = self._hits.get(key)
-        if q is None:
-            q = deque()
-            self._hits[key] = q
-
-        cutoff = now - float(window_seconds)
-        while q and q[0] < cutoff:
-            q.popleft()
-
-        if len(q) >= int(max_requests):
-            reset_in = int(max(0.0, (q[0] + float(window_seconds)) - now)) if q else int(window_seconds)
+        window = max(1, int(window_seconds))
+        limit = int(max_requests)
+        now = _now()
+
+        window_index = int(now // window)
+        elapsed = now - (window_index * window)
+        current_name = f"{self.prefix}:{key}:{window}:{window_index}"
+        previous_name = f"{self.prefix}:{key}:{window}:{window_index - 1}"
+
+        current = int(self.store.incr(current_name))
+        if current == 1:
+            self.store.expire(current_name, window * 2)
+        previous = int(self.store.get(previous_name) or 0)
+
+        estimated = previous * ((window - elapsed) / window) + current
+        reset_in = max(1, int(math.ceil(window - elapsed)))
+
+        if estimated > limit:
+            self.store.incr(current_name, -1)
             return RateLimitResult(ok=False, remaining=0, reset_in_seconds=reset_in)
 
-        q.append(now)
-        remaining = int(max_requests) - len(q)
-        reset_in = int(max(0.0, (q[0] + float(window_seconds)) - now)) if q else int(window_seconds)
+        remaining = max(0, limit - int(math.ceil(estimated)))
         return RateLimitResult(ok=True, remaining=remaining, reset_in_seconds=reset_in)
 
 
-rate_limiter = InMemoryRateLimiter()
+class InMemoryRateLimiter(RateLimiter):
+    """Per-process limiter; kept for callers that construct one directly."""
+
+    def __init__(self, *, max_keys: int = 100_000) -> None:
+        super().__init__(MemoryCounterStore(max_keys=max_keys))
+
+
+def _default_store() -> CounterStore:
+    """
+    GMFN_RATE_LIMIT_BACKEND selects the store:
+    - memory (default): per process
+    - sqlite: GMFN_RATE_LIMIT_SQLITE_PATH, shared by workers on one host
+    - redis: GMFN_RATE_LIMIT_REDIS_URL, shared across hosts
+    """
+    backend = str(os.getenv("GMFN_RATE_LIMIT_BACKEND", "") or "").strip().lower()
+
+    if backend == "sqlite":
+        path = str(os.getenv("GMFN_RATE_LIMIT_SQLITE_PATH", "") or "").strip()
+        return SQLiteCounterStore(path or "gmfn_rate_limit.db")
+
+    if backend == "redis":
+        url = str(os.getenv("GMFN_RATE_LIMIT_REDIS_URL", "") or "").strip()
+        if redis is None or not url:
+            raise RuntimeError(
+                "GMFN_RATE_LIMIT_BACKEND=redis needs the redis package and "
+                "GMFN_RATE_LIMIT_REDIS_URL."
+            )
+        return redis.Redis.from_url(url)
+
+    return MemoryCounterStore()
+
+
+rate_limiter = RateLimiter(_default_store())
 
 
 def client_ip(headers: dict, fallback: str = "unknown") -> str:
@@ -62,4 +271,4 @@ def client_ip(headers: dict, fallback: str = "unknown") -> str:
     if xri:
         return str(xri).strip() or fallback
 
-    return fallback
\ No newline at end of file
+    return fallback
@@ -85,6 +85,7 @@ class BankEvent(Base):
         Index("ix_bank_events_clan_refnorm_v1", "clan_id", "reference_normalized"),
         Index("ix_bank_events_clan_matchkey_v1", "clan_id", "match_key"),
         Index("ix_bank_events_clan_status_v1", "clan_id", "status"),
+        Index("ix_bank_events_status_clan_v1", "status", "clan_id"),
         Index("ix_bank_events_clan_refnorm_ccy_amt_v1", "clan_id", "reference_normalized", "currency", "amount"),
         Index("uq_bank_events_hash_v1", "hash", unique=True),
     )
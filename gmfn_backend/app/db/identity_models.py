@@ -44,6 +44,9 @@ class IdentityRiskSignal(Base):
     description: Mapped[str] = mapped_column(Text, nullable=False)
     meta_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    # Set for signals recorded at most once (one per overlapping pair and device).
+    dedupe_key: Mapped[Optional[str]] = mapped_column(String(200), nullable=True, unique=True, index=True)
+
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_now_utc)
 
 
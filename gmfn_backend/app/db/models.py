@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from decimal import Decimal
 import json
 from typing import Any, Dict, Optional
@@ -8,6 +8,7 @@ from typing import Any, Dict, Optional
 from sqlalchemy import (
     Boolean,
     Column,
+    Date,
     DateTime,
     ForeignKey,
     ForeignKeyConstraint,
@@ -99,6 +100,10 @@ class User(Base):
     )
 
 
+# Case-insensitive email lookups (sign-in, intake matching) use lower(email).
+Index("ix_users_email_lower", func.lower(User.email))
+
+
 class Clan(Base):
     __tablename__ = "clans"
 
@@ -349,6 +354,14 @@ class CommunityDomain(Base):
     country: Mapped[Optional[str]] = mapped_column(String(80), nullable=True)
     state: Mapped[Optional[str]] = mapped_column(String(120), nullable=True)
     public_profile: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Bumped on every flush that writes this domain or one of its
+    # community_domain_id rows; keys the read-only payload cache.
+    change_version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -1163,6 +1176,11 @@ class CommunityMemberVerificationRequest(Base):
 class Loan(Base):
     __tablename__ = "loans"
 
+    __table_args__ = (
+        # Overdue scanner walks (due_at, id) as a keyset.
+        Index("ix_loans_due_at_id", "due_at", "id"),
+    )
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
     borrower_user_id: Mapped[int] = mapped_column(
@@ -2308,6 +2326,11 @@ class PoolEvent(Base):
 class TrustEvent(Base):
     __tablename__ = "trust_events"
 
+    __table_args__ = (
+        # Keyset walk of one member's timeline, newest first.
+        Index("ix_trust_events_subject_created_id", "subject_user_id", "created_at", "id"),
+    )
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
     event_type: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
@@ -2373,6 +2396,137 @@ class TrustEvent(Base):
     meta = synonym("meta_json", descriptor=property(_get_meta, _set_meta))
 
 
+class TrustGraphEdge(Base):
+    """
+    Materialized trust-graph edge, aggregated from TrustEvents.
+
+    One row per (edge_type, source, target, clan, loan). clan_id/loan_id use 0
+    for "none" so the natural key stays unique on every backend.
+    """
+
+    __tablename__ = "trust_graph_edges"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "edge_type",
+            "source_node_id",
+            "target_node_id",
+            "clan_id",
+            "loan_id",
+            name="uq_trust_graph_edges_key",
+        ),
+        Index("ix_trust_graph_edges_source_seen", "source_user_id", "last_seen_at"),
+        Index("ix_trust_graph_edges_target_seen", "target_user_id", "last_seen_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+    edge_type: Mapped[str] = mapped_column(String(40), nullable=False, index=True)
+    source_node_id: Mapped[str] = mapped_column(String(40), nullable=False)
+    target_node_id: Mapped[str] = mapped_column(String(40), nullable=False)
+    source_user_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
+    target_user_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
+
+    clan_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    loan_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        index=True,
+    )
+
+    directional: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=True,
+        server_default="1",
+    )
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    supporting_event_ids_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    reasons_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    first_seen_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_seen_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
+class InviteAnalyticsRollup(Base):
+    """
+    Daily invite counters for one clan, folded from invite TrustEvents.
+
+    bucket "clan" (bucket_key "") holds the clan-wide totals; buckets
+    "inviter" and "code" hold joins per inviter user id and per invite code.
+    day is the UTC date of the event.
+    """
+
+    __tablename__ = "invite_analytics_rollups"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "clan_id",
+            "bucket",
+            "bucket_key",
+            "day",
+            name="uq_invite_analytics_rollups_key",
+        ),
+        Index("ix_invite_analytics_rollups_clan_bucket_day", "clan_id", "bucket", "day"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+    clan_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    bucket: Mapped[str] = mapped_column(String(16), nullable=False)
+    bucket_key: Mapped[str] = mapped_column(String(128), nullable=False, default="", server_default="")
+
+    invites_created: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    invites_revoked: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    joins: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    last_event_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class MaintenanceCheckpoint(Base):
+    """
+    Resume point for a bounded maintenance job, one row per job_key.
+
+    cursor_json is owned by the job; a missing row or empty cursor means the
+    next run starts from the beginning.
+    """
+
+    __tablename__ = "maintenance_checkpoints"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    job_key: Mapped[str] = mapped_column(String(96), nullable=False, unique=True, index=True)
+    cursor_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    pass_started_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
 class ProtectedTradeRecord(Base):
     __tablename__ = "protected_trade_records"
 
@@ -2789,6 +2943,7 @@ class MarketplaceShop(Base):
             "owner_user_id",
             name="uq_marketplace_shop_owner_global",
         ),
+        Index("ix_marketplace_shops_active_created", "is_active", "created_at", "id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -2865,6 +3020,16 @@ class ShopFollower(Base):
 class MarketplaceProduct(Base):
     __tablename__ = "marketplace_products"
 
+    __table_args__ = (
+        Index(
+            "ix_marketplace_products_feed",
+            "visibility_mode",
+            "is_active",
+            "created_at",
+            "id",
+        ),
+    )
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
     clan_id: Mapped[int] = mapped_column(
@@ -2895,6 +3060,8 @@ class MarketplaceProduct(Base):
     )
 
     image_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # {"thumb": url, "medium": url} WebP variants of a local image_url.
+    image_variants_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     video_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     visibility_mode: Mapped[str] = mapped_column(
@@ -2945,6 +3112,8 @@ class MarketplaceBroadcast(Base):
 
     message: Mapped[str] = mapped_column(Text, nullable=False)
     image_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # {"thumb": url, "medium": url} WebP variants of a local image_url.
+    image_variants_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     video_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     priority_mode: Mapped[str] = mapped_column(
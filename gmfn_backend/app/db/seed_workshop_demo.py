@@ -20,6 +20,7 @@ from app.db.models import (
     TrustSlip,
     User,
 )
+from app.services.community_confirmation_service import provision_confirmation_contacts_for_membership
 from app.services.trust_score_service import apply_trust_score
 from app.services.trust_slips_services import get_trust_slip_payload, store_trust_slip_snapshot
 
@@ -161,6 +162,7 @@ def _ensure_membership(
         membership.personal_pool_balance = Decimal("45000.00")
         membership.left_at = None
         db.add(membership)
+    provision_confirmation_contacts_for_membership(db, membership)
     db.commit()
     db.refresh(membership)
     return membership
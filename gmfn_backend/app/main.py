@@ -11,11 +11,9 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy import distinct
-from sqlalchemy.orm import Session
 
 from app.api.router import api_router
-from app.db.database import Base, SessionLocal, engine
+from app.db.database import Base, engine
 
 # IMPORTANT: ensure models are imported so SQLAlchemy sees them
 import app.db.bank_models  # noqa: F401
@@ -24,8 +22,7 @@ import app.db.models  # noqa: F401
 import app.db.notification_models  # noqa: F401
 import app.db.verification_models  # noqa: F401
 
-from app.db.bank_models import BankEvent
-from app.services.reconciliation_service import reconcile_batch
+from app.services.reconciliation_worker_service import run_reconciliation_pass
 
 
 def _truthy(value: str | None) -> bool:
@@ -85,46 +82,14 @@ def _uploads_dir() -> Path:
     return Path(raw or "uploads").expanduser()
 
 
-def _reconcile_all_clans_once() -> None:
-    db: Session = SessionLocal()
-    try:
-        clan_rows = (
-            db.query(distinct(BankEvent.clan_id))
-            .order_by(BankEvent.clan_id.asc())
-            .all()
-        )
-
-        clan_ids = [
-            int(row[0])
-            for row in clan_rows
-            if row and row[0] is not None
-        ]
-
-        for clan_id in clan_ids:
-            try:
-                reconcile_batch(
-                    db,
-                    clan_id=int(clan_id),
-                    limit=300,
-                    confirm_non_canonical=True,
-                    canonical_only_match=False,
-                    dry_run=False,
-                )
-            except Exception:
-                # Pilot-safe: keep other clans reconciling even if one fails
-                db.rollback()
-                if _dev_mode():
-                    print(f"[GMFN reconcile] clan_id={clan_id} failed")
-                    print(traceback.format_exc())
-    finally:
-        db.close()
-
-
 async def _reconciliation_loop() -> None:
+    # Kept for single-process deployments; app.maintenance.run_reconciliation_worker
+    # runs the same pass as a standalone process. The pass runs on a thread
+    # so it never blocks the event loop.
     while True:
         await asyncio.sleep(60)
         try:
-            _reconcile_all_clans_once()
+            await asyncio.to_thread(run_reconciliation_pass)
         except Exception:
             # Pilot-safe background swallow
             if _dev_mode():
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def _positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return parsed
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Create the default community confirmation contact for every "
+            "active membership that has none. Safe to re-run."
+        )
+    )
+    parser.add_argument(
+        "--community-id",
+        type=_positive_int,
+        default=None,
+        help="Backfill one community only. Default: every community.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=500,
+        help="Memberships handled per transaction. Default: 500.",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Pretty-print JSON output.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    from app.db.database import SessionLocal
+    from app.services.community_confirmation_service import (
+        backfill_default_confirmation_contacts,
+    )
+
+    with SessionLocal() as db:
+        result: dict[str, Any] = backfill_default_confirmation_contacts(
+            db,
+            community_id=args.community_id,
+            chunk_size=int(args.chunk_size),
+        )
+
+    print(json.dumps(result, indent=2 if args.pretty else None, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
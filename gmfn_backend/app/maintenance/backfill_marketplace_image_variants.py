@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def _positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return parsed
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Render thumbnail and WebP variants for marketplace products and "
+            "broadcasts whose local image has none recorded. Safe to re-run."
+        )
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=200,
+        help="Rows handled per transaction. Default: 200.",
+    )
+    parser.add_argument(
+        "--max-rows",
+        type=_positive_int,
+        default=5000,
+        help="Stop after this many rows. Default: 5000.",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Pretty-print JSON output.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    from app.db.database import SessionLocal
+    from app.services.marketplace_image_variants import backfill_image_variants
+
+    with SessionLocal() as db:
+        result: dict[str, Any] = backfill_image_variants(
+            db,
+            chunk_size=int(args.chunk_size),
+            max_rows=int(args.max_rows),
+        )
+
+    print(json.dumps(result, indent=2 if args.pretty else None, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def _positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return parsed
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Backfill or rebuild the daily invite analytics rollups from "
+            "invite TrustEvent history. Safe to re-run."
+        )
+    )
+    parser.add_argument(
+        "--clan-id",
+        type=_positive_int,
+        default=None,
+        help="Rebuild one clan only. Default: every clan.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=1000,
+        help="TrustEvents read per chunk. Default: 1000.",
+    )
+    parser.add_argument(
+        "--if-requested",
+        action="store_true",
+        help="Only rebuild the clans a failed incremental fold has flagged.",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Pretty-print JSON output.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    from app.db.database import SessionLocal
+    from app.services.invite_analytics_service import (
+        rebuild_invite_analytics_rollups,
+        requested_invite_rollup_rebuilds,
+    )
+
+    with SessionLocal() as db:
+        if not args.if_requested:
+            result: dict[str, Any] = rebuild_invite_analytics_rollups(
+                db,
+                clan_id=args.clan_id,
+                chunk_size=int(args.chunk_size),
+            )
+        else:
+            requested = requested_invite_rollup_rebuilds(db)
+            if args.clan_id is not None:
+                requested = [clan_id for clan_id in requested if clan_id == args.clan_id]
+            result = {"clans": {}}
+            for clan_id in requested:
+                result["clans"][str(clan_id)] = rebuild_invite_analytics_rollups(
+                    db,
+                    clan_id=clan_id,
+                    chunk_size=int(args.chunk_size),
+                )
+            if not requested:
+                result = {"skipped": True, "reason": "no rebuild requested"}
+
+    print(json.dumps(result, indent=2 if args.pretty else None, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
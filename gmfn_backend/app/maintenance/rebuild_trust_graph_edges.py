@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def _positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return parsed
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Backfill or rebuild the materialized trust graph edges from the "
+            "full TrustEvent history. Safe to re-run. Runs as one transaction "
+            "holding a write lock on trust_graph_edges, so events logged "
+            "meanwhile wait for it to commit instead of being lost; graph "
+            "reads are not blocked."
+        )
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=1000,
+        help="TrustEvents read per chunk. Default: 1000.",
+    )
+    parser.add_argument(
+        "--if-requested",
+        action="store_true",
+        help="Only rebuild when a failed incremental fold has requested it.",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Pretty-print JSON output.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    from app.db.database import SessionLocal
+    from app.services.maintenance_checkpoint_service import load_checkpoint
+    from app.services.trust_graph_service import (
+        TRUST_GRAPH_REBUILD_JOB_KEY,
+        rebuild_trust_graph_edges,
+    )
+
+    with SessionLocal() as db:
+        request = load_checkpoint(db, TRUST_GRAPH_REBUILD_JOB_KEY)
+        if args.if_requested and not request:
+            result: dict[str, Any] = {"skipped": True, "reason": "no rebuild requested"}
+        else:
+            result = rebuild_trust_graph_edges(
+                db,
+                chunk_size=int(args.chunk_size),
+            )
+            result["rebuild_request"] = request or None
+
+    print(json.dumps(result, indent=2 if args.pretty else None, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def _positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return parsed
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Rebuild identity cluster links from every recorded device "
+            "fingerprint and report the resulting account clusters. Safe to re-run."
+        )
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=5000,
+        help="Fingerprint rows read per chunk. Default: 5000.",
+    )
+    parser.add_argument(
+        "--top",
+        type=_positive_int,
+        default=20,
+        help="Largest clusters listed in the report. Default: 20.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report clusters without writing missing links.",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Pretty-print JSON output.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    from app.db.database import SessionLocal
+    from app.services.identity_service import recluster_device_fingerprints
+
+    with SessionLocal() as db:
+        result: dict[str, Any] = recluster_device_fingerprints(
+            db,
+            chunk_size=int(args.chunk_size),
+            dry_run=bool(args.dry_run),
+            top_components=int(args.top),
+        )
+
+    print(json.dumps(result, indent=2 if args.pretty else None, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def _positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return parsed
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Recompute stored trust scores for one community or every member "
+            "in chunked batches. Intended for nightly cron and policy changes."
+        )
+    )
+    parser.add_argument(
+        "--clan-id",
+        type=_positive_int,
+        default=None,
+        help="Optional community id. Omit to recompute every user.",
+    )
+    parser.add_argument(
+        "--user-id",
+        type=_positive_int,
+        action="append",
+        default=None,
+        help="Recompute only this user. May be repeated.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=500,
+        help="Users recomputed and committed per chunk. Default: 500.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Compute scores without writing them back.",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Pretty-print JSON output.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    from app.db.database import SessionLocal
+    from app.services.trust_score_service import recompute_trust_for_users
+
+    with SessionLocal() as db:
+        result: dict[str, Any] = recompute_trust_for_users(
+            db,
+            user_ids=args.user_id,
+            clan_id=args.clan_id,
+            chunk_size=int(args.chunk_size),
+            dry_run=bool(args.dry_run),
+        )
+
+    print(json.dumps(result, indent=2 if args.pretty else None, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
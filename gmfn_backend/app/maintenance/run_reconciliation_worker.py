@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def _positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return parsed
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Reconcile unreconciled BankEvents for every clan on a worker pool. "
+            "Runs forever unless --once is given; prints one JSON metrics line "
+            "per pass."
+        )
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Run a single pass and exit.",
+    )
+    parser.add_argument(
+        "--interval-seconds",
+        type=_positive_int,
+        default=60,
+        help="Pause between passes. Default: 60.",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=_positive_int,
+        default=None,
+        help="Clans reconciled in parallel. Default: GMFN_RECONCILE_MAX_WORKERS or 4.",
+    )
+    parser.add_argument(
+        "--max-events-per-clan",
+        type=_positive_int,
+        default=1000,
+        help="Events handled per clan per pass. Default: 1000.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=200,
+        help="Events committed together. Default: 200.",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Pretty-print JSON output.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    from app.services.reconciliation_worker_service import run_reconciliation_pass
+
+    while True:
+        result: dict[str, Any] = run_reconciliation_pass(
+            max_workers=args.max_workers,
+            max_events_per_clan=int(args.max_events_per_clan),
+            chunk_size=int(args.chunk_size),
+        )
+        print(json.dumps(result, indent=2 if args.pretty else None, sort_keys=True), flush=True)
+        if args.once:
+            return 0
+        time.sleep(int(args.interval_seconds))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -29,7 +29,8 @@ def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description=(
             "Record missing Community Confirmation review SLA TrustEvents and "
-            "notify reviewers. Intended for cron/worker execution."
+            "notify reviewers across every open review case. Resumes from the "
+            "saved checkpoint; intended for cron/worker execution."
         )
     )
     parser.add_argument(
@@ -48,10 +49,18 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Optional community id to scan. Omit for an admin-wide scan.",
     )
     parser.add_argument(
+        "--chunk-size",
         "--limit",
+        dest="chunk_size",
         type=_positive_int,
-        default=200,
-        help="Maximum active review cases to inspect. Default: 200.",
+        default=500,
+        help="Review cases handled and committed per chunk. Default: 500.",
+    )
+    parser.add_argument(
+        "--max-cases",
+        type=_positive_int,
+        default=20000,
+        help="Maximum open review cases handled in this run. Default: 20000.",
     )
     parser.add_argument(
         "--pretty",
@@ -71,16 +80,17 @@ def main(argv: list[str] | None = None) -> int:
 
     from app.db.database import SessionLocal
     from app.services.community_confirmation_service import (
-        scan_confirmation_review_sla_events,
+        scan_all_confirmation_review_sla_events,
     )
 
     with SessionLocal() as db:
-        result: dict[str, Any] = scan_confirmation_review_sla_events(
+        result: dict[str, Any] = scan_all_confirmation_review_sla_events(
             db,
             actor_user_id=int(args.actor_user_id),
             actor_role="admin",
             community_id=args.community_id,
-            limit=int(args.limit),
+            chunk_size=int(args.chunk_size),
+            max_cases=int(args.max_cases),
         )
 
     print(json.dumps(result, indent=2 if args.pretty else None, sort_keys=True))
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def _positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return parsed
+
+
+def _non_negative_int(value: str) -> int:
+    parsed = int(value)
+    if parsed < 0:
+        raise argparse.ArgumentTypeError("must be zero or a positive integer")
+    return parsed
+
+
+def _optional_positive_int(value: str | None) -> int | None:
+    if value is None or str(value).strip() == "":
+        return None
+    return _positive_int(str(value))
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Default loans that are past due beyond the grace window across the "
+            "whole loan book. Resumes from the saved checkpoint; intended for "
+            "nightly cron."
+        )
+    )
+    parser.add_argument(
+        "--actor-user-id",
+        type=_positive_int,
+        default=_optional_positive_int(os.getenv("GSN_MAINTENANCE_ACTOR_USER_ID")),
+        help=(
+            "Admin user id used as the maintenance actor. Can also be set with "
+            "GSN_MAINTENANCE_ACTOR_USER_ID."
+        ),
+    )
+    parser.add_argument(
+        "--grace-days",
+        type=_non_negative_int,
+        default=3,
+        help="Days past due before a loan is defaulted. Default: 3.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=200,
+        help="Loans defaulted and committed per chunk. Default: 200.",
+    )
+    parser.add_argument(
+        "--max-loans",
+        type=_positive_int,
+        default=5000,
+        help="Maximum candidate loans handled in this run. Default: 5000.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report would-default loans without writing anything.",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Pretty-print JSON output.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if not args.actor_user_id:
+        parser.error(
+            "--actor-user-id is required unless GSN_MAINTENANCE_ACTOR_USER_ID is set"
+        )
+
+    from app.db.database import SessionLocal
+    from app.services.loan_overdue_service import scan_overdue_loan_book
+
+    with SessionLocal() as db:
+        result: dict[str, Any] = scan_overdue_loan_book(
+            db,
+            actor_user_id=int(args.actor_user_id),
+            grace_days=int(args.grace_days),
+            chunk_size=int(args.chunk_size),
+            max_loans=int(args.max_loans),
+            dry_run=bool(args.dry_run),
+        )
+
+    print(json.dumps(result, indent=2 if args.pretty else None, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
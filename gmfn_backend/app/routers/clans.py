@@ -7,6 +7,7 @@ from app.db.models import Clan, ClanMembership
 from app.core.clan_auth import require_clan_admin
 from app.core.auth import get_current_user
 from app.schemas.clan_memberships import ClanMemberCreate, ClanMemberOut
+from app.services.community_confirmation_service import provision_confirmation_contacts_for_membership
 
 router = APIRouter()
 
@@ -51,6 +52,7 @@ def add_clan_member(
         role=(payload.role if payload.role in ("user", "admin") else "user"),
     )
     db.add(row)
+    provision_confirmation_contacts_for_membership(db, row)
 
     try:
         db.commit()
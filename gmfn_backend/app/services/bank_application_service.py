@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from app.db.bank_models import BankEvent, ExpectedPayment
 from app.db.models import PoolEvent, User
 from app.services.feature_entitlements_service import grant_or_extend_entitlement
+from app.services.notification_stream_service import publish_notifications
 from app.services.repayments_service import create_repayment
 from app.services.trust_events_services import log_trust_event
 from app.services.vault_domain_service import (
@@ -205,11 +206,12 @@ def _apply_pool_contribution(
 
     from app.services.rosca_service import notify_rosca_contribution_confirmed
 
-    notify_rosca_contribution_confirmed(db, exp=exp)
+    rosca = notify_rosca_contribution_confirmed(db, exp=exp)
 
     db.commit()
     db.refresh(pe)
     db.refresh(exp)
+    publish_notifications(db, created=rosca.get("notifications") or [])
 
     return {
         "ok": True,
@@ -472,6 +474,9 @@ def _apply_feature_subscription(
         community_domain_id = _safe_int(meta.get("community_domain_id"), 0)
         if community_domain_id > 0:
             from app.db.models import CommunityDomain
+            from app.services.community_domain_payload_cache import (
+                bump_community_domain_change_version,
+            )
 
             domain = db.get(CommunityDomain, int(community_domain_id))
             if domain is not None:
@@ -479,6 +484,7 @@ def _apply_feature_subscription(
                 if previous_status.lower() not in {"closed", "suspended"}:
                     domain.status = "active"
                     db.add(domain)
+                    bump_community_domain_change_version(db, int(domain.id))
                 community_domain_activation = {
                     "community_domain_id": int(community_domain_id),
                     "previous_status": previous_status,
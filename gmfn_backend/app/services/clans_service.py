@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session
 
 from app.db.models import Clan, ClanMembership, User
 from app.core.clan_auth import _is_default_clan_name
+from app.services.community_confirmation_service import provision_confirmation_contacts_for_membership
 
 
 def _is_last_admin(db: Session, *, clan_id: int) -> bool:
@@ -60,6 +61,7 @@ def create_clan(
         personal_pool_balance=Decimal("0"),
     )
     db.add(membership)
+    provision_confirmation_contacts_for_membership(db, membership)
     db.commit()
 
     return clan
@@ -107,6 +109,7 @@ def join_clan(db: Session, *, user: User, clan_id: int) -> ClanMembership:
         personal_pool_balance=Decimal("0"),
     )
     db.add(membership)
+    provision_confirmation_contacts_for_membership(db, membership)
     db.commit()
     db.refresh(membership)
     return membership
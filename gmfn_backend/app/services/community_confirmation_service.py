@@ -3,10 +3,10 @@ from __future__ import annotations
 import json
 import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
-from sqlalchemy import case, func, or_
-from sqlalchemy.exc import OperationalError
+from sqlalchemy import case, exists, func, or_
+from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
 from app.core.auth import is_user_activation_pending
@@ -39,7 +39,9 @@ from app.db.notification_models import Notification
 from app.services.community_confirmation_callback_delivery import (
     attempt_confirmation_callback_delivery,
 )
+from app.services.maintenance_checkpoint_service import load_checkpoint, save_checkpoint
 from app.services.notification_service import create_notification
+from app.services.notification_stream_service import publish_notifications
 from app.services.trust_events_services import build_trust_meta, log_trust_event
 
 
@@ -124,6 +126,7 @@ VALID_CONFIRMATION_CONTACT_STANDING_STATUSES = {
 }
 DEFAULT_REVIEW_ATTENTION_AFTER_HOURS = 24
 DEFAULT_REVIEW_OVERDUE_AFTER_HOURS = 72
+REVIEW_SLA_SCAN_JOB_KEY = "community_confirmation_review_sla_scan"
 COMMUNITY_VERIFY_PREFIXES = (
     "GMFN-C-",
     "GSN-C-",
@@ -385,6 +388,26 @@ def get_or_create_confirmation_policy(
     return policy
 
 
+def _default_confirmation_contact(
+    membership: ClanMembership,
+    *,
+    now: datetime,
+) -> CommunityConfirmationContact:
+    role = str(getattr(membership, "role", "") or "member").lower()
+    return CommunityConfirmationContact(
+        community_id=int(membership.clan_id),
+        user_id=int(membership.user_id),
+        role_type="admin" if role == "admin" else "member",
+        active=True,
+        can_receive_relay_requests=True,
+        can_receive_instant_pulse=True,
+        priority_order=0 if role == "admin" else 10,
+        standing_status="active",
+        opted_in_at=now,
+        last_active_at=now,
+    )
+
+
 def ensure_default_confirmation_contacts(
     db: Session,
     *,
@@ -410,21 +433,7 @@ def ensure_default_confirmation_contacts(
         if existing:
             continue
 
-        role = str(getattr(membership, "role", "") or "member").lower()
-        db.add(
-            CommunityConfirmationContact(
-                community_id=int(community_id),
-                user_id=user_id,
-                role_type="admin" if role == "admin" else "member",
-                active=True,
-                can_receive_relay_requests=True,
-                can_receive_instant_pulse=True,
-                priority_order=0 if role == "admin" else 10,
-                standing_status="active",
-                opted_in_at=now,
-                last_active_at=now,
-            )
-        )
+        db.add(_default_confirmation_contact(membership, now=now))
         created += 1
 
     if created:
@@ -435,6 +444,85 @@ def ensure_default_confirmation_contacts(
     return created
 
 
+def provision_confirmation_contacts_for_membership(
+    db: Session,
+    membership: ClanMembership,
+) -> Optional[CommunityConfirmationContact]:
+    """
+    Give a membership that was just created or reactivated its default
+    confirmation contact, unless the member already has one in that
+    community. Membership write sites call this before they commit, so
+    reads such as the confirmation inbox never write. Does not commit.
+    """
+    if membership.left_at is not None or membership.clan_id is None or membership.user_id is None:
+        return None
+
+    existing = (
+        db.query(CommunityConfirmationContact.id)
+        .filter(CommunityConfirmationContact.community_id == int(membership.clan_id))
+        .filter(CommunityConfirmationContact.user_id == int(membership.user_id))
+        .first()
+    )
+    if existing is not None:
+        return None
+
+    contact = _default_confirmation_contact(membership, now=_now_utc())
+    db.add(contact)
+    return contact
+
+
+def backfill_default_confirmation_contacts(
+    db: Session,
+    *,
+    community_id: Optional[int] = None,
+    chunk_size: int = 500,
+    commit: bool = True,
+) -> Dict[str, int]:
+    """
+    Create the default confirmation contact for every active membership that
+    has none. Contacts are otherwise provisioned where memberships are
+    written; this covers rows written before that, or in bulk. Safe to re-run.
+    """
+    chunk_size = max(1, int(chunk_size))
+    has_contact = exists().where(
+        CommunityConfirmationContact.community_id == ClanMembership.clan_id,
+        CommunityConfirmationContact.user_id == ClanMembership.user_id,
+    )
+    contacts_created = 0
+    chunks = 0
+    last_membership_id = 0
+
+    while True:
+        q = (
+            db.query(ClanMembership)
+            .filter(ClanMembership.id > last_membership_id)
+            .filter(ClanMembership.left_at.is_(None))
+            .filter(~has_contact)
+        )
+        if community_id is not None:
+            q = q.filter(ClanMembership.clan_id == int(community_id))
+        memberships = q.order_by(ClanMembership.id.asc()).limit(chunk_size).all()
+        if not memberships:
+            break
+
+        now = _now_utc()
+        for membership in memberships:
+            db.add(_default_confirmation_contact(membership, now=now))
+        db.flush()
+        if commit:
+            db.commit()
+
+        contacts_created += len(memberships)
+        chunks += 1
+        last_membership_id = int(memberships[-1].id)
+
+    return {
+        "contacts_created": contacts_created,
+        "chunks": chunks,
+        "last_membership_id": last_membership_id or None,
+    }
+
+
 def _eligible_contact_count(
     db: Session,
     *,
@@ -500,8 +588,8 @@ def _notify_confirmation_contacts(
     *,
     request: CommunityConfirmationRequest,
     contacts: list[CommunityConfirmationContact],
-) -> int:
-    created = 0
+) -> list[Notification]:
+    created: list[Notification] = []
     action_url = _confirmation_request_action_url(int(request.id))
     reason_label = str(request.reason_type or "community confirmation").replace("_", " ")
     risk_label = str(request.risk_level or "low").replace("_", " ")
@@ -523,7 +611,7 @@ def _notify_confirmation_contacts(
         )
         if existing:
             continue
-        create_notification(
+        row = create_notification(
             db,
             user_id=recipient_id,
             kind="community_confirmation.request_to_respond",
@@ -537,7 +625,7 @@ def _notify_confirmation_contacts(
             commit=False,
             refresh=False,
         )
-        created += 1
+        created.append(row)
     return created
 
 
@@ -549,10 +637,10 @@ def _notify_confirmation_requester(
     title: str,
     message: str,
     action_label: str = "Open result",
-) -> bool:
+) -> Optional[Notification]:
     requester_user_id = int(getattr(request, "requester_user_id", None) or 0)
     if requester_user_id <= 0:
-        return False
+        return None
 
     action_url = _confirmation_public_outcome_action_url(request)
     existing_unread = (
@@ -564,9 +652,9 @@ def _notify_confirmation_requester(
         .first()
     )
     if existing_unread:
-        return False
+        return None
 
-    create_notification(
+    return create_notification(
         db,
         user_id=requester_user_id,
         kind=kind,
@@ -577,7 +665,6 @@ def _notify_confirmation_requester(
         commit=False,
         refresh=False,
     )
-    return True
 
 
 def _mark_confirmation_request_notification_read(
@@ -585,7 +672,7 @@ def _mark_confirmation_request_notification_read(
     *,
     request_id: int,
     responder_user_id: int,
-) -> bool:
+) -> Optional[Notification]:
     action_url = _confirmation_request_action_url(int(request_id))
     row = (
         db.query(Notification)
@@ -595,11 +682,11 @@ def _mark_confirmation_request_notification_read(
         .first()
     )
     if not row or row.is_read:
-        return False
+        return None
     row.is_read = True
     row.read_at = _now_utc()
     db.add(row)
-    return True
+    return row
 
 
 def _notified_non_response_user_ids(
@@ -900,11 +987,12 @@ def create_confirmation_request(
     request.outcome_summary = summary
 
     actor_user_id = int(requester_user_id or subject_user_id)
-    responder_notifications_created = _notify_confirmation_contacts(
+    responder_notifications = _notify_confirmation_contacts(
         db,
         request=request,
         contacts=delivery_contacts,
     )
+    responder_notifications_created = len(responder_notifications)
     log_trust_event(
         db,
         event_type="community_confirmation.requested",
@@ -964,6 +1052,7 @@ def create_confirmation_request(
 
     db.commit()
     db.refresh(request)
+    publish_notifications(db, created=responder_notifications)
 
     return public_confirmation_outcome(db, public_token=str(request.public_token))
 
@@ -1012,14 +1101,37 @@ def _request_eligible_for_responder(
     return True
 
 
-def list_confirmation_inbox(db: Session, *, responder_user_id: int) -> Dict[str, Any]:
+def list_confirmation_inbox(
+    db: Session,
+    *,
+    responder_user_id: int,
+    limit: int = 50,
+    before_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Open requests the responder can still answer, newest first. Read-only:
+    contacts are provisioned where memberships are written, and the backfill
+    command covers older memberships. Answered requests are excluded in the
+    same query. Pages continue below next_before_id.
+    """
+    lim = max(1, min(int(limit), 200))
+    empty = {
+        "items": [],
+        "total": 0,
+        "limit": lim,
+        "has_more": False,
+        "next_before_id": None,
+    }
     responder = db.query(User).filter(User.id == int(responder_user_id)).first()
     if is_user_activation_pending(responder):
-        return {"items": [], "total": 0}
+        return empty
 
-    ensure_contacts_for_user_communities(db, user_id=int(responder_user_id))
     now = _now_utc()
-    rows = (
+    answered = exists().where(
+        CommunityConfirmationResponse.request_id == CommunityConfirmationRequest.id,
+        CommunityConfirmationResponse.responder_user_id == int(responder_user_id),
+    )
+    query = (
         db.query(CommunityConfirmationRequest)
         .join(
             CommunityConfirmationContact,
@@ -1032,42 +1144,25 @@ def list_confirmation_inbox(db: Session, *, responder_user_id: int) -> Dict[str,
         .filter(CommunityConfirmationRequest.subject_user_id != int(responder_user_id))
         .filter(CommunityConfirmationRequest.status.in_(["pending", "responded"]))
         .filter(CommunityConfirmationRequest.expires_at > now)
-        .order_by(CommunityConfirmationRequest.created_at.desc())
-        .all()
+        .filter(~answered)
     )
+    if before_id is not None:
+        query = query.filter(CommunityConfirmationRequest.id < int(before_id))
 
-    items = []
-    for request in rows:
-        existing = (
-            db.query(CommunityConfirmationResponse.id)
-            .filter(CommunityConfirmationResponse.request_id == int(request.id))
-            .filter(CommunityConfirmationResponse.responder_user_id == int(responder_user_id))
-            .first()
-        )
-        if existing:
-            continue
-        items.append(_private_request_item(db, request))
-
-    return {"items": items, "total": len(items)}
-
+    # Ids follow creation order, so the id is both sort key and cursor.
+    rows = query.order_by(CommunityConfirmationRequest.id.desc()).limit(lim + 1).all()
+    has_more = len(rows) > lim
+    rows = rows[:lim]
+    if not rows:
+        return empty
 
-def ensure_contacts_for_user_communities(db: Session, *, user_id: int) -> None:
-    user = db.query(User).filter(User.id == int(user_id)).first()
-    if is_user_activation_pending(user):
-        return
-
-    memberships = (
-        db.query(ClanMembership)
-        .filter(ClanMembership.user_id == int(user_id))
-        .filter(ClanMembership.left_at.is_(None))
-        .all()
-    )
-    for membership in memberships:
-        ensure_default_confirmation_contacts(
-            db,
-            community_id=int(membership.clan_id),
-            subject_user_id=None,
-        )
+    return {
+        "items": _private_request_items(db, rows),
+        "total": len(rows),
+        "limit": lim,
+        "has_more": has_more,
+        "next_before_id": int(rows[-1].id) if has_more else None,
+    }
 
 
 def _contact_setting_item(
@@ -1109,7 +1204,6 @@ def list_my_confirmation_contact_settings(
     user_id: int,
     community_id: Optional[int] = None,
 ) -> Dict[str, Any]:
-    ensure_contacts_for_user_communities(db, user_id=int(user_id))
     query = (
         db.query(CommunityConfirmationContact)
         .filter(CommunityConfirmationContact.user_id == int(user_id))
@@ -1660,40 +1754,62 @@ def update_admin_confirmation_contact(
     )
 
 
-def _private_request_item(db: Session, request: CommunityConfirmationRequest) -> Dict[str, Any]:
-    community = db.query(Clan).filter(Clan.id == int(request.community_id)).first()
-    subject = db.query(User).filter(User.id == int(request.subject_user_id)).first()
-    membership = (
-        db.query(ClanMembership)
-        .filter(ClanMembership.clan_id == int(request.community_id))
-        .filter(ClanMembership.user_id == int(request.subject_user_id))
+def _private_request_items(
+    db: Session,
+    requests: list[CommunityConfirmationRequest],
+) -> list[Dict[str, Any]]:
+    """Responder-facing items for a page of requests, in one query per table."""
+    community_ids = {int(r.community_id) for r in requests}
+    subject_ids = {int(r.subject_user_id) for r in requests}
+    communities = {
+        int(row.id): row
+        for row in db.query(Clan).filter(Clan.id.in_(community_ids)).all()
+    }
+    subjects = {
+        int(row.id): row
+        for row in db.query(User).filter(User.id.in_(subject_ids)).all()
+    }
+    memberships = {
+        (int(row.clan_id), int(row.user_id)): row
+        for row in db.query(ClanMembership)
+        .filter(ClanMembership.clan_id.in_(community_ids))
+        .filter(ClanMembership.user_id.in_(subject_ids))
         .filter(ClanMembership.left_at.is_(None))
-        .first()
-    )
-    responses = _response_counts(db, request_id=int(request.id))
-    return {
-        "id": int(request.id),
-        "mode": request.mode,
-        "reason_type": request.reason_type,
-        "risk_level": request.risk_level,
-        "community_id": int(request.community_id),
-        "community_name": getattr(community, "name", None),
-        "community_code": getattr(community, "community_code", None),
-        "subject_user_id": int(request.subject_user_id),
-        "subject_profile": {
-            "user_id": int(request.subject_user_id),
-            "display_name": getattr(subject, "display_name", None),
-            "gmfn_id": getattr(subject, "gmfn_id", None),
-            "profile_image_url": getattr(subject, "profile_image_url", None),
-            "phone_verified": bool(getattr(subject, "phone_verified_at", None)),
-            "membership_status": "active" if membership else "not_active",
-            "membership_role": getattr(membership, "role", None) if membership else None,
-        },
-        "created_at": _to_aware(request.created_at).isoformat() if request.created_at else None,
-        "expires_at": _to_aware(request.expires_at).isoformat() if request.expires_at else None,
-        "current_response_counts": responses,
-        "reader_note": "Respond only if you genuinely know the member in this community.",
+        .all()
     }
+    counts = _response_counts_by_request(db, request_ids=[int(r.id) for r in requests])
+
+    items = []
+    for request in requests:
+        community = communities.get(int(request.community_id))
+        subject = subjects.get(int(request.subject_user_id))
+        membership = memberships.get((int(request.community_id), int(request.subject_user_id)))
+        items.append(
+            {
+                "id": int(request.id),
+                "mode": request.mode,
+                "reason_type": request.reason_type,
+                "risk_level": request.risk_level,
+                "community_id": int(request.community_id),
+                "community_name": getattr(community, "name", None),
+                "community_code": getattr(community, "community_code", None),
+                "subject_user_id": int(request.subject_user_id),
+                "subject_profile": {
+                    "user_id": int(request.subject_user_id),
+                    "display_name": getattr(subject, "display_name", None),
+                    "gmfn_id": getattr(subject, "gmfn_id", None),
+                    "profile_image_url": getattr(subject, "profile_image_url", None),
+                    "phone_verified": bool(getattr(subject, "phone_verified_at", None)),
+                    "membership_status": "active" if membership else "not_active",
+                    "membership_role": getattr(membership, "role", None) if membership else None,
+                },
+                "created_at": _to_aware(request.created_at).isoformat() if request.created_at else None,
+                "expires_at": _to_aware(request.expires_at).isoformat() if request.expires_at else None,
+                "current_response_counts": counts[int(request.id)],
+                "reader_note": "Respond only if you genuinely know the member in this community.",
+            }
+        )
+    return items
 
 
 def submit_confirmation_response(
@@ -1747,11 +1863,12 @@ def submit_confirmation_response(
     )
     db.add(response)
     db.flush()
-    responder_notification_marked_read = _mark_confirmation_request_notification_read(
+    responder_notification = _mark_confirmation_request_notification_read(
         db,
         request_id=int(request_id),
         responder_user_id=int(responder_user_id),
     )
+    responder_notification_marked_read = responder_notification is not None
 
     log_trust_event(
         db,
@@ -1786,37 +1903,59 @@ def submit_confirmation_response(
         refresh=False,
     )
 
-    outcome = recompute_confirmation_outcome(db, request_id=int(request_id))
+    outcome_notifications: list[Notification] = []
+    outcome = recompute_confirmation_outcome(
+        db,
+        request_id=int(request_id),
+        created_notifications=outcome_notifications,
+    )
     db.commit()
+    publish_notifications(db, created=outcome_notifications, read=[responder_notification])
 
     return outcome
 
 
 def _response_counts(db: Session, *, request_id: int) -> Dict[str, int]:
+    return _response_counts_by_request(db, request_ids=[int(request_id)])[int(request_id)]
+
+
+def _response_counts_by_request(
+    db: Session,
+    *,
+    request_ids: Iterable[int],
+) -> Dict[int, Dict[str, int]]:
+    counts = {
+        int(request_id): {"positive_count": 0, "caution_count": 0, "objection_count": 0}
+        for request_id in request_ids
+    }
+    if not counts:
+        return counts
     rows = (
-        db.query(CommunityConfirmationResponse.response_type, func.count(CommunityConfirmationResponse.id))
-        .filter(CommunityConfirmationResponse.request_id == int(request_id))
+        db.query(
+            CommunityConfirmationResponse.request_id,
+            CommunityConfirmationResponse.response_type,
+            func.count(CommunityConfirmationResponse.id),
+        )
+        .filter(CommunityConfirmationResponse.request_id.in_(list(counts)))
         .filter(CommunityConfirmationResponse.counted_in_outcome.is_(True))
-        .group_by(CommunityConfirmationResponse.response_type)
+        .group_by(
+            CommunityConfirmationResponse.request_id,
+            CommunityConfirmationResponse.response_type,
+        )
         .all()
     )
-    positive = 0
-    caution = 0
-    objection = 0
-    for response_type, count in rows:
+    for request_id, response_type, count in rows:
         response_type = str(response_type or "")
-        value = int(count or 0)
         if response_type in POSITIVE_RESPONSES:
-            positive += value
+            key = "positive_count"
         elif response_type in CAUTION_RESPONSES:
-            caution += value
+            key = "caution_count"
         elif response_type in OBJECTION_RESPONSES:
-            objection += value
-    return {
-        "positive_count": positive,
-        "caution_count": caution,
-        "objection_count": objection,
-    }
+            key = "objection_count"
+        else:
+            continue
+        counts[int(request_id)][key] += int(count or 0)
+    return counts
 
 
 def _confidence_level(
@@ -1954,7 +2093,7 @@ def _notify_confirmation_requester_outcome(
     request: CommunityConfirmationRequest,
     summary: Dict[str, Any],
     visible_summary: str,
-) -> bool:
+) -> Optional[Notification]:
     responses_received = (
         int(summary.get("positive_count") or 0)
         + int(summary.get("caution_count") or 0)
@@ -1980,7 +2119,7 @@ def _notify_confirmation_requester_expired(
     *,
     request: CommunityConfirmationRequest,
     non_response_count: int,
-) -> bool:
+) -> Optional[Notification]:
     return _notify_confirmation_requester(
         db,
         request=request,
@@ -2090,12 +2229,12 @@ def _mark_confirmation_request_expired(
         request=request,
         user_ids=non_response_user_ids,
     )
-    requester_expiry_notification_created = _notify_confirmation_requester_expired(
+    requester_expiry_notification = _notify_confirmation_requester_expired(
         db,
         request=request,
         non_response_count=len(non_response_user_ids),
     )
-    if requester_expiry_notification_created:
+    if requester_expiry_notification is not None:
         log_trust_event(
             db,
             event_type="community_confirmation.requester_notified",
@@ -2120,9 +2259,20 @@ def _mark_confirmation_request_expired(
     db.flush()
     if commit:
         db.commit()
+        publish_notifications(db, created=[requester_expiry_notification])
 
 
-def recompute_confirmation_outcome(db: Session, *, request_id: int) -> Dict[str, Any]:
+def recompute_confirmation_outcome(
+    db: Session,
+    *,
+    request_id: int,
+    created_notifications: Optional[list[Notification]] = None,
+) -> Dict[str, Any]:
+    """
+    Recount the request's responses into its outcome, without committing.
+    A requester notification written here is appended to
+    created_notifications so the caller can publish it after its commit.
+    """
     request = (
         db.query(CommunityConfirmationRequest)
         .filter(CommunityConfirmationRequest.id == int(request_id))
@@ -2212,13 +2362,15 @@ def recompute_confirmation_outcome(db: Session, *, request_id: int) -> Dict[str,
         visible_summary=visible,
         required_positive_responses=int(policy.minimum_positive_responses or 2),
     )
-    requester_outcome_notification_created = _notify_confirmation_requester_outcome(
+    requester_outcome_notification = _notify_confirmation_requester_outcome(
         db,
         request=request,
         summary=summary,
         visible_summary=visible,
     )
-    if requester_outcome_notification_created:
+    if requester_outcome_notification is not None:
+        if created_notifications is not None:
+            created_notifications.append(requester_outcome_notification)
         log_trust_event(
             db,
             event_type="community_confirmation.requester_notified",
@@ -2688,28 +2840,11 @@ def _record_review_case_sla_event(
         clan_id=int(review_case.community_id),
         actor_user_id=int(fallback_actor_id),
         subject_user_id=int(review_case.subject_user_id),
-        meta=build_trust_meta(
-            reason=f"community_confirmation_review_case_{status}",
-            trust_delta="0.00",
+        meta=_review_case_sla_event_meta(
+            review_case,
+            sla=sla,
+            status=status,
             system=actor_user_id is None,
-            extra={
-                "review_case_id": int(review_case.id),
-                "request_id": int(review_case.request_id),
-                "decision_id": int(review_case.decision_id) if review_case.decision_id else None,
-                "status": status,
-                "label": sla.get("label"),
-                "meaning": sla.get("meaning"),
-                "age_hours": sla.get("age_hours"),
-                "attention_after_hours": sla.get("attention_after_hours"),
-                "overdue_after_hours": sla.get("overdue_after_hours"),
-                "review_case_status": review_case.status,
-                "affects_trust_reading": False,
-                "policy_note": (
-                    "Review SLA markers are audit evidence only. They do not change trust "
-                    "readings until a review outcome is resolved with explicit impact."
-                ),
-                "private_contacts_exposed": False,
-            },
         ),
         dedupe_key=dedupe_key,
         commit=True,
@@ -2718,28 +2853,49 @@ def _record_review_case_sla_event(
     return status
 
 
-def _review_case_sla_notification_recipients(
-    db: Session,
+def _review_case_sla_event_meta(
+    review_case: CommunityConfirmationReviewCase,
     *,
+    sla: Dict[str, Any],
+    status: str,
+    system: bool,
+) -> Dict[str, Any]:
+    return build_trust_meta(
+        reason=f"community_confirmation_review_case_{status}",
+        trust_delta="0.00",
+        system=system,
+        extra={
+            "review_case_id": int(review_case.id),
+            "request_id": int(review_case.request_id),
+            "decision_id": int(review_case.decision_id) if review_case.decision_id else None,
+            "status": status,
+            "label": sla.get("label"),
+            "meaning": sla.get("meaning"),
+            "age_hours": sla.get("age_hours"),
+            "attention_after_hours": sla.get("attention_after_hours"),
+            "overdue_after_hours": sla.get("overdue_after_hours"),
+            "review_case_status": review_case.status,
+            "affects_trust_reading": False,
+            "policy_note": (
+                "Review SLA markers are audit evidence only. They do not change trust "
+                "readings until a review outcome is resolved with explicit impact."
+            ),
+            "private_contacts_exposed": False,
+        },
+    )
+
+
+def _review_case_sla_notification_recipients(
     review_case: CommunityConfirmationReviewCase,
+    *,
+    admin_user_ids: Iterable[int],
 ) -> list[int]:
     recipients: list[int] = []
     if review_case.assigned_to_user_id:
         recipients.append(int(review_case.assigned_to_user_id))
     elif review_case.opened_by_user_id:
         recipients.append(int(review_case.opened_by_user_id))
-
-    admin_ids = [
-        int(row.user_id)
-        for row in (
-            db.query(ClanMembership.user_id)
-            .filter(ClanMembership.clan_id == int(review_case.community_id))
-            .filter(ClanMembership.role == "admin")
-            .filter(ClanMembership.left_at.is_(None))
-            .all()
-        )
-    ]
-    recipients.extend(admin_ids)
+    recipients.extend(int(user_id) for user_id in admin_user_ids)
 
     seen: set[int] = set()
     clean_recipients: list[int] = []
@@ -2751,16 +2907,12 @@ def _review_case_sla_notification_recipients(
     return clean_recipients
 
 
-def _notify_review_case_sla_event(
-    db: Session,
-    *,
+def _review_case_sla_notification_content(
     review_case: CommunityConfirmationReviewCase,
+    *,
     sla: Dict[str, Any],
     status: str,
-) -> int:
-    if status not in {"needs_attention", "overdue"}:
-        return 0
-
+) -> tuple[str, str, str, str]:
     threshold_key = (
         "overdue_after_hours" if status == "overdue" else "attention_after_hours"
     )
@@ -2780,34 +2932,7 @@ def _notify_review_case_sla_event(
         f"{int(review_case.community_id)} has been waiting for more than "
         f"{threshold_hours} hours. Check the case and record evidence before resolving it."
     )
-
-    created = 0
-    for recipient_id in _review_case_sla_notification_recipients(
-        db,
-        review_case=review_case,
-    ):
-        existing = (
-            db.query(Notification.id)
-            .filter(Notification.user_id == int(recipient_id))
-            .filter(Notification.kind == kind)
-            .filter(Notification.action_url == action_url)
-            .first()
-        )
-        if existing:
-            continue
-        create_notification(
-            db,
-            user_id=int(recipient_id),
-            kind=kind,
-            title=title,
-            message=message,
-            action_url=action_url,
-            action_label="Review case",
-            commit=False,
-            refresh=False,
-        )
-        created += 1
-    return created
+    return kind, title, message, action_url
 
 
 def _review_case_public_item(
@@ -3266,110 +3391,400 @@ def list_confirmation_review_cases(
     }
 
 
-def scan_confirmation_review_sla_events(
-    db: Session,
-    *,
-    actor_user_id: int,
-    actor_role: Optional[str] = None,
-    community_id: Optional[int] = None,
-    limit: int = 200,
-) -> Dict[str, Any]:
-    if not _is_platform_admin(actor_role):
-        if community_id is None:
-            raise PermissionError("Community admins must scan one community at a time")
-        if not _is_community_admin_for_confirmation(
-            db,
-            community_id=int(community_id),
-            actor_user_id=int(actor_user_id),
-            actor_role=actor_role,
-        ):
-            raise PermissionError("Only a platform or community admin can scan review SLA events")
+_REVIEW_SLA_POLICY_NOTE = (
+    "This scanner records missing review SLA audit markers only. It does not change trust scores, "
+    "case status, or private contact visibility."
+)
 
-    limit_value = max(1, min(int(limit or 200), 500))
-    query = db.query(CommunityConfirmationReviewCase).filter(
-        CommunityConfirmationReviewCase.status.in_(("open", "in_review"))
-    )
-    if community_id is not None:
-        query = query.filter(CommunityConfirmationReviewCase.community_id == int(community_id))
 
-    cases = (
-        query.order_by(
-            CommunityConfirmationReviewCase.created_at.asc(),
-            CommunityConfirmationReviewCase.id.asc(),
+def _review_sla_thresholds(
+    db: Session,
+    community_ids: Iterable[int],
+) -> Dict[int, Dict[str, int]]:
+    """
+    Review SLA thresholds for many communities in one query. A community
+    without a policy reads the defaults; nothing is created here.
+    """
+    thresholds = {
+        int(community_id): {
+            "review_attention_after_hours": DEFAULT_REVIEW_ATTENTION_AFTER_HOURS,
+            "review_overdue_after_hours": DEFAULT_REVIEW_OVERDUE_AFTER_HOURS,
+        }
+        for community_id in community_ids
+    }
+    if not thresholds:
+        return thresholds
+    rows = (
+        db.query(
+            CommunityConfirmationPolicy.community_id,
+            CommunityConfirmationPolicy.review_attention_after_hours,
+            CommunityConfirmationPolicy.review_overdue_after_hours,
         )
-        .limit(limit_value)
+        .filter(CommunityConfirmationPolicy.community_id.in_(list(thresholds)))
         .all()
     )
-    scanned = 0
-    needs_attention = 0
-    overdue = 0
-    events_recorded = 0
-    notifications_created = 0
-    recorded_by_status = {"needs_attention": 0, "overdue": 0}
-    sample_items = []
+    for community_id, attention_hours, overdue_hours in rows:
+        thresholds[int(community_id)] = {
+            "review_attention_after_hours": int(
+                attention_hours or DEFAULT_REVIEW_ATTENTION_AFTER_HOURS
+            ),
+            "review_overdue_after_hours": int(overdue_hours or DEFAULT_REVIEW_OVERDUE_AFTER_HOURS),
+        }
+    return thresholds
 
-    for review_case in cases:
-        scanned += 1
-        policy_kwargs = _review_case_policy_kwargs(db, int(review_case.community_id))
-        sla = _review_case_sla(
-            review_case.created_at,
-            review_case.status,
-            attention_after_hours=policy_kwargs["review_attention_after_hours"],
-            overdue_after_hours=policy_kwargs["review_overdue_after_hours"],
-        )
-        status = str(sla.get("status") or "")
-        if status == "needs_attention":
-            needs_attention += 1
-        elif status == "overdue":
-            overdue += 1
-        recorded_status = _record_review_case_sla_event(
-            db,
-            review_case=review_case,
-            sla=sla,
-            actor_user_id=int(actor_user_id),
-        )
-        if recorded_status:
-            events_recorded += 1
-            recorded_by_status[recorded_status] = recorded_by_status.get(recorded_status, 0) + 1
-            notifications_created += _notify_review_case_sla_event(
-                db,
-                review_case=review_case,
+
+def _community_admin_user_ids(
+    db: Session,
+    community_ids: Iterable[int],
+) -> Dict[int, list[int]]:
+    admins: Dict[int, list[int]] = {int(community_id): [] for community_id in community_ids}
+    if not admins:
+        return admins
+    rows = (
+        db.query(ClanMembership.clan_id, ClanMembership.user_id)
+        .filter(ClanMembership.clan_id.in_(list(admins)))
+        .filter(ClanMembership.role == "admin")
+        .filter(ClanMembership.left_at.is_(None))
+        .order_by(ClanMembership.id.asc())
+        .all()
+    )
+    for community_id, user_id in rows:
+        admins[int(community_id)].append(int(user_id))
+    return admins
+
+
+_SlaDue = tuple[CommunityConfirmationReviewCase, Dict[str, Any], str]
+
+
+class _ReviewSlaScan:
+    """
+    Records SLA markers for pages of open review cases. Policies and admin
+    lists are loaded once per community; each page checks existing markers
+    and notifications with one query apiece. Missing markers go through
+    log_trust_event, each in its own savepoint. Nothing is committed here.
+    """
+
+    def __init__(self, db: Session, *, actor_user_id: int) -> None:
+        self.db = db
+        self.actor_user_id = int(actor_user_id)
+        self.thresholds: Dict[int, Dict[str, int]] = {}
+        self.admin_ids: Dict[int, list[int]] = {}
+        self.scanned = 0
+        self.needs_attention = 0
+        self.overdue = 0
+        self.events_recorded = 0
+        self.notifications_created = 0
+        self.unpublished_notifications: list[Notification] = []
+        self.recorded_by_status = {"needs_attention": 0, "overdue": 0}
+        self.sample_items: list[Dict[str, Any]] = []
+
+    def _load_communities(self, community_ids: set[int]) -> None:
+        missing = community_ids - set(self.thresholds)
+        if missing:
+            self.thresholds.update(_review_sla_thresholds(self.db, missing))
+            self.admin_ids.update(_community_admin_user_ids(self.db, missing))
+
+    def _insert_events(self, due: list[_SlaDue]) -> list[_SlaDue]:
+        keys = [f"cc-review-sla:{int(rc.id)}:{status}" for rc, _sla, status in due]
+        existing = {
+            str(row[0])
+            for row in self.db.query(TrustEvent.dedupe_key)
+            .filter(TrustEvent.dedupe_key.in_(keys))
+            .all()
+        }
+        due = [item for item, key in zip(due, keys) if key not in existing]
+        if not due:
+            return []
+
+        recorded: list[_SlaDue] = []
+        for review_case, sla, status in due:
+            # One savepoint per marker: a marker that raced in from a case
+            # read rolls back alone, and the page stays uncommitted.
+            try:
+                with self.db.begin_nested():
+                    log_trust_event(
+                        self.db,
+                        event_type=f"community_confirmation.review_case_{status}",
+                        clan_id=int(review_case.community_id),
+                        actor_user_id=self.actor_user_id,
+                        subject_user_id=int(review_case.subject_user_id),
+                        meta=_review_case_sla_event_meta(
+                            review_case, sla=sla, status=status, system=False
+                        ),
+                        dedupe_key=f"cc-review-sla:{int(review_case.id)}:{status}",
+                        commit=False,
+                        refresh=False,
+                    )
+            except IntegrityError:
+                continue
+            recorded.append((review_case, sla, status))
+        return recorded
+
+    def _notify(self, recorded: list[_SlaDue]) -> None:
+        planned = []
+        for review_case, sla, status in recorded:
+            kind, title, message, action_url = _review_case_sla_notification_content(
+                review_case,
                 sla=sla,
-                status=recorded_status,
+                status=status,
+            )
+            for recipient_id in _review_case_sla_notification_recipients(
+                review_case,
+                admin_user_ids=self.admin_ids.get(int(review_case.community_id), []),
+            ):
+                planned.append((recipient_id, kind, title, message, action_url))
+        if not planned:
+            return
+
+        existing = {
+            (int(user_id), str(kind), str(action_url))
+            for user_id, kind, action_url in self.db.query(
+                Notification.user_id,
+                Notification.kind,
+                Notification.action_url,
+            )
+            .filter(Notification.action_url.in_({p[4] for p in planned}))
+            .filter(Notification.kind.in_({p[1] for p in planned}))
+            .all()
+        }
+        for recipient_id, kind, title, message, action_url in planned:
+            if (recipient_id, kind, action_url) in existing:
+                continue
+            existing.add((recipient_id, kind, action_url))
+            row = create_notification(
+                self.db,
+                user_id=recipient_id,
+                kind=kind,
+                title=title,
+                message=message,
+                action_url=action_url,
+                action_label="Review case",
+                commit=False,
+                refresh=False,
+            )
+            self.notifications_created += 1
+            self.unpublished_notifications.append(row)
+
+    def publish_notifications(self) -> None:
+        """Push the notifications written since the last call; run after each commit."""
+        publish_notifications(self.db, created=self.unpublished_notifications)
+        self.unpublished_notifications = []
+
+    def run_page(self, cases: list[CommunityConfirmationReviewCase]) -> None:
+        self._load_communities({int(rc.community_id) for rc in cases})
+        due = []
+        for review_case in cases:
+            self.scanned += 1
+            thresholds = self.thresholds[int(review_case.community_id)]
+            sla = _review_case_sla(
+                review_case.created_at,
+                review_case.status,
+                attention_after_hours=thresholds["review_attention_after_hours"],
+                overdue_after_hours=thresholds["review_overdue_after_hours"],
             )
-            if len(sample_items) < 10:
-                sample_items.append(
+            status = str(sla.get("status") or "")
+            if status == "needs_attention":
+                self.needs_attention += 1
+            elif status == "overdue":
+                self.overdue += 1
+            else:
+                continue
+            due.append((review_case, sla, status))
+        if not due:
+            return
+
+        recorded = self._insert_events(due)
+        self._notify(recorded)
+        for review_case, sla, status in recorded:
+            self.events_recorded += 1
+            self.recorded_by_status[status] = self.recorded_by_status.get(status, 0) + 1
+            if len(self.sample_items) < 10:
+                self.sample_items.append(
                     {
                         "review_case_id": int(review_case.id),
                         "request_id": int(review_case.request_id),
                         "community_id": int(review_case.community_id),
                         "subject_user_id": int(review_case.subject_user_id),
-                        "sla_status": recorded_status,
+                        "sla_status": status,
                         "age_hours": sla.get("age_hours"),
                         "attention_after_hours": sla.get("attention_after_hours"),
                         "overdue_after_hours": sla.get("overdue_after_hours"),
                     }
                 )
 
-    if notifications_created:
-        db.commit()
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "scanned": self.scanned,
+            "needs_attention_cases": self.needs_attention,
+            "overdue_cases": self.overdue,
+            "events_recorded": self.events_recorded,
+            "notifications_created": self.notifications_created,
+            "recorded_by_status": dict(self.recorded_by_status),
+            "sample_recorded_items": list(self.sample_items),
+            "private_contacts_exposed": False,
+            "policy_note": _REVIEW_SLA_POLICY_NOTE,
+        }
+
+
+def _require_review_sla_scan_access(
+    db: Session,
+    *,
+    actor_user_id: int,
+    actor_role: Optional[str],
+    community_id: Optional[int],
+) -> None:
+    if _is_platform_admin(actor_role):
+        return
+    if community_id is None:
+        raise PermissionError("Community admins must scan one community at a time")
+    if not _is_community_admin_for_confirmation(
+        db,
+        community_id=int(community_id),
+        actor_user_id=int(actor_user_id),
+        actor_role=actor_role,
+    ):
+        raise PermissionError("Only a platform or community admin can scan review SLA events")
+
+
+def _open_review_cases(
+    db: Session,
+    *,
+    community_id: Optional[int],
+    after_id: int,
+    limit: int,
+    oldest_first: bool = False,
+) -> list[CommunityConfirmationReviewCase]:
+    """
+    Open review cases after after_id in id order, the checkpoint cursor.
+    oldest_first orders by created_at instead, for the single-page admin
+    scan, which never resumes.
+    """
+    query = (
+        db.query(CommunityConfirmationReviewCase)
+        .filter(CommunityConfirmationReviewCase.status.in_(("open", "in_review")))
+        .filter(CommunityConfirmationReviewCase.id > int(after_id))
+    )
+    if community_id is not None:
+        query = query.filter(CommunityConfirmationReviewCase.community_id == int(community_id))
+    if oldest_first:
+        query = query.order_by(
+            CommunityConfirmationReviewCase.created_at.asc(),
+            CommunityConfirmationReviewCase.id.asc(),
+        )
+    else:
+        query = query.order_by(CommunityConfirmationReviewCase.id.asc())
+    return query.limit(int(limit)).all()
+
+
+def scan_confirmation_review_sla_events(
+    db: Session,
+    *,
+    actor_user_id: int,
+    actor_role: Optional[str] = None,
+    community_id: Optional[int] = None,
+    limit: int = 200,
+) -> Dict[str, Any]:
+    _require_review_sla_scan_access(
+        db,
+        actor_user_id=int(actor_user_id),
+        actor_role=actor_role,
+        community_id=community_id,
+    )
+
+    limit_value = max(1, min(int(limit or 200), 500))
+    scan = _ReviewSlaScan(db, actor_user_id=int(actor_user_id))
+    scan.run_page(
+        _open_review_cases(
+            db,
+            community_id=community_id,
+            after_id=0,
+            limit=limit_value,
+            oldest_first=True,
+        )
+    )
+    db.commit()
+    scan.publish_notifications()
 
     return {
         "scan_completed": True,
-        "scanned": scanned,
         "limit": limit_value,
         "community_id": int(community_id) if community_id is not None else None,
-        "needs_attention_cases": needs_attention,
-        "overdue_cases": overdue,
-        "events_recorded": events_recorded,
-        "notifications_created": notifications_created,
-        "recorded_by_status": recorded_by_status,
-        "sample_recorded_items": sample_items,
-        "private_contacts_exposed": False,
-        "policy_note": (
-            "This scanner records missing review SLA audit markers only. It does not change trust scores, "
-            "case status, or private contact visibility."
-        ),
+        **scan.summary(),
+    }
+
+
+def scan_all_confirmation_review_sla_events(
+    db: Session,
+    *,
+    actor_user_id: int,
+    actor_role: Optional[str] = None,
+    community_id: Optional[int] = None,
+    chunk_size: int = 500,
+    max_cases: int = 20000,
+    job_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Cron pass over every open review case, bounded and resumable.
+
+    Cases are walked in id order from the saved checkpoint. Each page's
+    markers, notifications and the advanced checkpoint are committed
+    together, so an interrupted run resumes after the last committed page.
+    A run stops after max_cases cases; the pass is complete (and the
+    checkpoint cleared) once a page comes back short.
+    """
+    _require_review_sla_scan_access(
+        db,
+        actor_user_id=int(actor_user_id),
+        actor_role=actor_role,
+        community_id=community_id,
+    )
+
+    chunk = max(1, min(int(chunk_size), 2000))
+    budget = max(1, int(max_cases))
+    key = job_key or (
+        f"{REVIEW_SLA_SCAN_JOB_KEY}:community:{int(community_id)}"
+        if community_id is not None
+        else REVIEW_SLA_SCAN_JOB_KEY
+    )
+
+    saved = load_checkpoint(db, key)
+    after_id = int(saved.get("after_id") or 0)
+    resumed = after_id > 0
+
+    scan = _ReviewSlaScan(db, actor_user_id=int(actor_user_id))
+    chunks = 0
+    completed = False
+
+    while scan.scanned < budget:
+        page_limit = min(chunk, budget - scan.scanned)
+        cases = _open_review_cases(db, community_id=community_id, after_id=after_id, limit=page_limit)
+        if not cases:
+            completed = True
+            break
+
+        chunks += 1
+        scan.run_page(cases)
+        after_id = int(cases[-1].id)
+        save_checkpoint(db, key, {"after_id": after_id})
+        db.commit()
+        scan.publish_notifications()
+
+        if len(cases) < page_limit:
+            completed = True
+            break
+
+    if completed:
+        save_checkpoint(db, key, None)
+        db.commit()
+
+    return {
+        "scan_completed": completed,
+        "job_key": key,
+        "community_id": int(community_id) if community_id is not None else None,
+        "resumed": resumed,
+        "chunks": chunks,
+        "next_after_id": None if completed else after_id,
+        **scan.summary(),
     }
 
 
@@ -4999,13 +5414,13 @@ def request_public_community_verification_confirmation(
             "Respond from the community confirmation inbox. Private member contacts stay protected."
         )
 
-    notification_count = 0
+    notifications: list[Notification] = []
     action_url = (
         f"/app/community-confirmations?community_id={int(community.id)}"
         "&verification_request=1"
     )
     for recipient_id in recipient_ids:
-        create_notification(
+        row = create_notification(
             db,
             user_id=int(recipient_id),
             kind="community_verification.request_confirmation",
@@ -5016,7 +5431,8 @@ def request_public_community_verification_confirmation(
             commit=False,
             refresh=False,
         )
-        notification_count += 1
+        notifications.append(row)
+    notification_count = len(notifications)
 
     audit_actor_id = int(requester_user_id or recipient_ids[0])
     log_trust_event(
@@ -5043,6 +5459,7 @@ def request_public_community_verification_confirmation(
         refresh=False,
     )
     db.commit()
+    publish_notifications(db, created=notifications)
 
     return {
         "ok": True,
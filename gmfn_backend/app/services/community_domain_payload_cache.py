@@ -0,0 +1,147 @@
+# app/services/community_domain_payload_cache.py
+from __future__ import annotations
+
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.db.models import CommunityDomain
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = str(os.getenv(name, "") or "").strip()
+    try:
+        return int(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def bump_community_domain_change_version(db: Session, community_domain_id: Any) -> None:
+    """
+    Retire every cached payload of the domain by bumping its change_version
+    in the caller's transaction; a rollback undoes the bump with the write.
+
+    Domain write paths call this explicitly, just before they commit, so the
+    domain row is locked only for the tail of the transaction. Paths that
+    write without calling it are covered by the cache TTL instead.
+    """
+    try:
+        domain_id = int(community_domain_id)
+    except (TypeError, ValueError):
+        return
+    db.execute(
+        update(CommunityDomain.__table__)
+        .where(CommunityDomain.__table__.c.id == domain_id)
+        .values(change_version=CommunityDomain.__table__.c.change_version + 1)
+    )
+
+
+def community_domain_change_version(db: Session, community_domain_id: int) -> int:
+    # Read from the table, not the identity map: a bump in this session
+    # updates the row behind an already-loaded CommunityDomain.
+    version = db.execute(
+        select(CommunityDomain.change_version).where(
+            CommunityDomain.id == int(community_domain_id)
+        )
+    ).scalar()
+    return int(version or 0)
+
+
+class CommunityDomainPayloadCache:
+    """
+    Per-process LRU of read-only domain payloads.
+
+    Keys are (domain, endpoint, viewer, change_version), so a bump makes every
+    older entry unreachable at once; those entries age out through the LRU
+    bound. The domain write routes and trust events naming the domain in
+    their meta bump the version. Inputs that are not tied to one domain
+    (clans, clan memberships, user profiles, other trust events) do not:
+    those parts of a payload can be up to the TTL stale. Entries are
+    deep-copied in and out, so callers never share one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    @staticmethod
+    def ttl_seconds() -> int:
+        return max(0, _env_int("GMFN_COMMUNITY_DOMAIN_CACHE_TTL_SECONDS", 30))
+
+    @staticmethod
+    def max_entries() -> int:
+        return max(1, _env_int("GMFN_COMMUNITY_DOMAIN_CACHE_MAX", 1024))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= now:
+                self._entries.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(payload)
+
+    def put(self, key: Hashable, payload: Any) -> None:
+        ttl = self.ttl_seconds()
+        if ttl <= 0:
+            return
+        stored = copy.deepcopy(payload)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + ttl, stored)
+            limit = self.max_entries()
+            while len(self._entries) > limit:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_payload_cache = CommunityDomainPayloadCache()
+
+
+def clear_community_domain_payload_cache() -> None:
+    _payload_cache.clear()
+
+
+def cached_community_domain_payload(
+    db: Session,
+    *,
+    community_domain_id: int,
+    endpoint: str,
+    viewer: Hashable,
+    build: Callable[[], Any],
+) -> Any:
+    """
+    Return the cached payload for this domain/endpoint/viewer at the domain's
+    current change_version, building and storing it on a miss. Each call
+    returns its own copy, so callers may modify it.
+    """
+    if _payload_cache.ttl_seconds() <= 0:
+        return build()
+    # Pending changes have not bumped change_version yet.
+    if db.new or db.dirty or db.deleted:
+        return build()
+
+    version = community_domain_change_version(db, community_domain_id)
+    key = (int(community_domain_id), str(endpoint), viewer, version)
+    payload = _payload_cache.get(key)
+    if payload is None:
+        payload = build()
+        _payload_cache.put(key, payload)
+    return payload
@@ -9,6 +9,7 @@ from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
 from app.db.models import Clan, ClanInvite, ClanMembership, User, UserSettings
+from app.services.community_confirmation_service import provision_confirmation_contacts_for_membership
 from app.services.global_identity_service import ensure_user_gmfn_id
 
 
@@ -344,6 +345,7 @@ def join_clan_via_invite(
             role="user",
         )
         db.add(membership)
+        provision_confirmation_contacts_for_membership(db, membership)
         db.flush()
         result_status = "joined_successfully"
     else:
@@ -15,6 +15,7 @@ from app.services.feature_entitlements_service import (
     get_active_feature_quantity,
 )
 from app.services.notification_service import create_notification
+from app.services.notification_stream_service import publish_notifications
 from app.services.payment_instruction_service import FEATURE_COMMUNITY_MEETING_PACK
 from app.services.trust_events_services import log_trust_event
 
@@ -173,7 +174,7 @@ def _notify_once(
     message: str,
     action_url: Optional[str],
     action_label: str,
-) -> bool:
+) -> Optional[Notification]:
     existing = (
         db.query(Notification)
         .filter(Notification.user_id == int(user_id))
@@ -182,8 +183,8 @@ def _notify_once(
         .first()
     )
     if existing:
-        return False
-    create_notification(
+        return None
+    return create_notification(
         db,
         user_id=int(user_id),
         kind=str(kind),
@@ -194,7 +195,6 @@ def _notify_once(
         commit=False,
         refresh=False,
     )
-    return True
 
 
 def _event_to_record(event: TrustEvent) -> Dict[str, Any]:
@@ -335,9 +335,9 @@ def create_meeting_reminder(
         refresh=False,
     )
 
-    notified = 0
+    notified: List[Notification] = []
     for user_id in attendee_ids:
-        if _notify_once(
+        row = _notify_once(
             db,
             user_id=int(user_id),
             kind="community.meeting_reminder",
@@ -345,16 +345,18 @@ def create_meeting_reminder(
             message=f"{cleaned_title} has been recorded in GSN. Use WhatsApp for the conversation and GSN for the evidence.",
             action_url=action_url,
             action_label="Open meeting record",
-        ):
-            notified += 1
+        )
+        if row is not None:
+            notified.append(row)
 
     db.commit()
     db.refresh(event)
+    publish_notifications(db, created=notified)
 
     return {
         "meeting": _event_to_record(event),
         "remaining_after": int(remaining_after),
-        "notifications_created": int(notified),
+        "notifications_created": len(notified),
         "message": "Meeting reminder recorded. WhatsApp share is ready, and GSN kept the TrustEvent evidence.",
     }
 
@@ -428,9 +430,9 @@ def record_meeting_summary(
     )
 
     recipient_ids = list(dict.fromkeys(_admin_member_ids(db, clan_id=int(clan_id)) + attendee_ids))
-    notified = 0
+    notified: List[Notification] = []
     for user_id in recipient_ids:
-        if _notify_once(
+        row = _notify_once(
             db,
             user_id=int(user_id),
             kind="community.meeting_summary_recorded",
@@ -438,11 +440,13 @@ def record_meeting_summary(
             message=f"{reminder_record['title']} now has a GSN summary record.",
             action_url=action_url,
             action_label="Open meeting record",
-        ):
-            notified += 1
+        )
+        if row is not None:
+            notified.append(row)
 
     db.commit()
     db.refresh(event)
+    publish_notifications(db, created=notified)
     summary_record = _event_to_record(event)
     summary_record["status"] = "summary_recorded"
 
@@ -453,7 +457,7 @@ def record_meeting_summary(
             "reminder_event_id": int(reminder.id),
             "summary_event_id": int(event.id),
         },
-        "notifications_created": int(notified),
+        "notifications_created": len(notified),
         "message": "Meeting summary recorded as TrustEvent evidence. No extra meeting pack credit was consumed.",
     }
 
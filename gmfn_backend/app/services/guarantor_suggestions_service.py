@@ -1,12 +1,43 @@
 from __future__ import annotations
 
+import heapq
 from typing import Any
 
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
 from app.db.models import Loan, ClanMembership, LoanGuarantor, User
-from app.services.trust_score_service import trust_band_for_score, compute_trust_score_explained
+from app.services.trust_score_service import trust_band_for_score, compute_trust_scores_for_users
+
+
+def _guarantor_history_stats(
+    db: Session,
+    *,
+    clan_id: int,
+    user_ids: list[int],
+) -> dict[int, tuple[int, int, int, int]]:
+    """(total, approved, declined, expired) guarantor requests per member, one grouped query."""
+
+    def status_count(status: str):
+        return func.coalesce(func.sum(case((LoanGuarantor.status == status, 1), else_=0)), 0)
+
+    rows = (
+        db.query(
+            LoanGuarantor.guarantor_user_id,
+            func.count(LoanGuarantor.id),
+            status_count("approved"),
+            status_count("declined"),
+            status_count("expired"),
+        )
+        .filter(LoanGuarantor.clan_id == clan_id, LoanGuarantor.guarantor_user_id.in_(user_ids))
+        .group_by(LoanGuarantor.guarantor_user_id)
+        .all()
+    )
+    return {
+        int(uid): (int(total or 0), int(approved or 0), int(declined or 0), int(expired or 0))
+        for uid, total, approved, declined, expired in rows
+    }
 
 
 def suggest_guarantors_for_loan(
@@ -54,53 +85,26 @@ def suggest_guarantors_for_loan(
 
     # simple reliability from loan_guarantors history in this clan
     # reliability_score = approved*2 - declined - expired
+    stats = _guarantor_history_stats(db, clan_id=clan_id, user_ids=candidate_user_ids)
+
+    # trust score: stored value first; members never scored are computed in
+    # one batch read instead of one ledger walk each
+    unscored_ids = [int(u.id) for u in users if getattr(u, "trust_score", None) is None]
+    computed_scores = compute_trust_scores_for_users(db, unscored_ids) if unscored_ids else {}
+
     items = []
     for u in users:
         uid = int(u.id)
-
-        total = (
-            db.query(LoanGuarantor)
-            .filter(LoanGuarantor.clan_id == clan_id, LoanGuarantor.guarantor_user_id == uid)
-            .count()
-        )
-        approved = (
-            db.query(LoanGuarantor)
-            .filter(
-                LoanGuarantor.clan_id == clan_id,
-                LoanGuarantor.guarantor_user_id == uid,
-                LoanGuarantor.status == "approved",
-            )
-            .count()
-        )
-        declined = (
-            db.query(LoanGuarantor)
-            .filter(
-                LoanGuarantor.clan_id == clan_id,
-                LoanGuarantor.guarantor_user_id == uid,
-                LoanGuarantor.status == "declined",
-            )
-            .count()
-        )
-        expired = (
-            db.query(LoanGuarantor)
-            .filter(
-                LoanGuarantor.clan_id == clan_id,
-                LoanGuarantor.guarantor_user_id == uid,
-                LoanGuarantor.status == "expired",
-            )
-            .count()
-        )
-
+        total, approved, declined, expired = stats.get(uid, (0, 0, 0, 0))
         reliability_score = int(approved * 2 - declined - expired)
 
-        # trust score (stored + fallback compute)
         trust_score = getattr(u, "trust_score", None)
         trust_band = getattr(u, "trust_band", None)
 
         if trust_score is None:
-            computed = compute_trust_score_explained(db, user_id=uid)
-            trust_score = computed.get("score")
-            trust_band = trust_band or trust_band_for_score(int(trust_score) if trust_score is not None else 50)[0]
+            computed = computed_scores.get(uid) or {}
+            trust_score = computed.get("score_int")
+            trust_band = trust_band or computed.get("trust_band")
 
         if trust_band is None and trust_score is not None:
             trust_band = trust_band_for_score(int(trust_score))[0]
@@ -109,8 +113,6 @@ def suggest_guarantors_for_loan(
         trust_score_num = int(trust_score) if trust_score is not None else 50
         rank = trust_score_num * 1.0 + reliability_score * 0.5
 
-        reason = f"Trust {trust_score_num} (Band {trust_band or '—'}), reliability {reliability_score}, history {total} requests"
-
         items.append(
             {
                 "user_id": uid,
@@ -123,9 +125,14 @@ def suggest_guarantors_for_loan(
                 "declined": declined,
                 "expired": expired,
                 "rank": rank,
-                "reason": reason,
             }
         )
 
-    items.sort(key=lambda x: x["rank"], reverse=True)
-    return {"loan_id": loan_id, "clan_id": clan_id, "items": items[:limit]}
+    # nlargest keeps the order sorted(..., reverse=True)[:limit] would give
+    top = heapq.nlargest(max(0, int(limit)), items, key=lambda x: x["rank"])
+    for item in top:
+        item["reason"] = (
+            f"Trust {item['trust_score']} (Band {item['trust_band'] or '—'}), "
+            f"reliability {item['reliability_score']}, history {item['total_requests']} requests"
+        )
+    return {"loan_id": loan_id, "clan_id": clan_id, "items": top}
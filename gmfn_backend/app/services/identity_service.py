@@ -5,8 +5,10 @@ import hashlib
 import json
 from datetime import timedelta
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.db.identity_models import (
@@ -17,6 +19,10 @@ from app.db.identity_models import (
 )
 
 
+DEVICE_OVERLAP_SIGNAL_TYPE = "device_fingerprint_overlap"
+DEVICE_OVERLAP_SEVERITY = 6
+
+
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -209,37 +215,123 @@ def _continuity_from_counts(
     }
 
 
-def _ensure_identity_cluster(
+class _DisjointSet:
+    """
+    Union-find over user ids with union by size and path compression; the
+    smallest id names each component.
+    """
+
+    def __init__(self) -> None:
+        self.parent: Dict[int, int] = {}
+        self.size: Dict[int, int] = {}
+
+    def find(self, item: int) -> int:
+        root = self.parent.setdefault(item, item)
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        size_a, size_b = self.size.get(root_a, 1), self.size.get(root_b, 1)
+        if size_a < size_b:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] = size_a + size_b
+
+    def components(self) -> Dict[int, List[int]]:
+        groups: Dict[int, List[int]] = {}
+        for item in sorted(self.parent):
+            groups.setdefault(self.find(item), []).append(item)
+        return {members[0]: members for members in groups.values()}
+
+
+def _overlap_signal_key(user_id: int, matched_user_id: int, fingerprint_hash: str) -> str:
+    return f"{DEVICE_OVERLAP_SIGNAL_TYPE}:{int(user_id)}:{int(matched_user_id)}:{fingerprint_hash}"
+
+
+def _existing_cluster_pairs(db: Session, pairs: Iterable[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+    pairs = set(pairs)
+    if not pairs:
+        return set()
+    rows = (
+        db.query(IdentityCluster.root_user_id, IdentityCluster.linked_user_id)
+        .filter(IdentityCluster.root_user_id.in_({root for root, _ in pairs}))
+        .filter(IdentityCluster.linked_user_id.in_({linked for _, linked in pairs}))
+        .all()
+    )
+    return {(int(root), int(linked)) for root, linked in rows} & pairs
+
+
+def _bulk_link_clusters(
     db: Session,
+    pairs: Iterable[Tuple[int, int]],
     *,
-    root_user_id: int,
-    linked_user_id: int,
     reason: str,
     confidence: int,
-) -> Optional[IdentityCluster]:
-    if int(root_user_id) == int(linked_user_id):
-        return None
-
-    existing = (
-        db.query(IdentityCluster)
-        .filter(IdentityCluster.root_user_id == int(root_user_id))
-        .filter(IdentityCluster.linked_user_id == int(linked_user_id))
-        .first()
+) -> int:
+    """Stage the (root, linked) cluster links that do not exist yet; returns how many."""
+    wanted = {(min(a, b), max(a, b)) for a, b in pairs if int(a) != int(b)}
+    missing = sorted(wanted - _existing_cluster_pairs(db, wanted))
+    now = _now_utc()
+    db.add_all(
+        [
+            IdentityCluster(
+                root_user_id=int(root),
+                linked_user_id=int(linked),
+                reason=str(reason),
+                confidence=int(confidence),
+                created_at=now,
+            )
+            for root, linked in missing
+        ]
     )
-    if existing:
-        return existing
+    return len(missing)
 
-    row = IdentityCluster(
-        root_user_id=int(root_user_id),
-        linked_user_id=int(linked_user_id),
-        reason=str(reason),
-        confidence=int(confidence),
-        created_at=_now_utc(),
-    )
-    db.add(row)
-    db.commit()
-    db.refresh(row)
-    return row
+
+def _bulk_overlap_signals(
+    db: Session,
+    *,
+    user_id: int,
+    matched_user_ids: List[int],
+    fingerprint_hash: str,
+) -> int:
+    """Stage one overlap signal per matched user and device, skipping those already recorded."""
+    keys = {
+        other: _overlap_signal_key(int(user_id), other, fingerprint_hash)
+        for other in matched_user_ids
+    }
+    existing = {
+        str(row[0])
+        for row in db.query(IdentityRiskSignal.dedupe_key)
+        .filter(IdentityRiskSignal.dedupe_key.in_(list(keys.values())))
+        .all()
+    }
+    now = _now_utc()
+    rows = [
+        IdentityRiskSignal(
+            user_id=int(user_id),
+            signal_type=DEVICE_OVERLAP_SIGNAL_TYPE,
+            severity=DEVICE_OVERLAP_SEVERITY,
+            description="Device fingerprint overlaps with another GSN account.",
+            meta_json=_meta_json(
+                {
+                    "matched_user_id": int(other),
+                    "fingerprint_hash": str(fingerprint_hash),
+                }
+            ),
+            dedupe_key=key,
+            created_at=now,
+        )
+        for other, key in keys.items()
+        if key not in existing
+    ]
+    db.add_all(rows)
+    return len(rows)
 
 
 def detect_identity_overlap(
@@ -248,15 +340,21 @@ def detect_identity_overlap(
     user_id: int,
     fingerprint_hash: str,
 ) -> Dict[str, Any]:
-    others = (
-        db.query(DeviceFingerprint)
+    """
+    Link user_id to every other account seen on this device. Signals and
+    cluster links are checked and written in bulk, one commit per
+    observation; repeat observations of a known overlap write nothing.
+    """
+    matched_user_ids = sorted(
+        int(row[0])
+        for row in db.query(DeviceFingerprint.user_id)
         .filter(DeviceFingerprint.fingerprint_hash == str(fingerprint_hash))
         .filter(DeviceFingerprint.user_id != int(user_id))
-        .order_by(DeviceFingerprint.user_id.asc())
+        .distinct()
         .all()
     )
 
-    if not others:
+    if not matched_user_ids:
         return {
             "matched": False,
             "matched_user_ids": [],
@@ -264,33 +362,29 @@ def detect_identity_overlap(
             "clusters_created": 0,
         }
 
-    matched_user_ids = sorted({int(x.user_id) for x in others})
-    signals_created = 0
-    clusters_created = 0
-
-    for other_user_id in matched_user_ids:
-        _create_risk_signal(
+    def _stage() -> Tuple[int, int]:
+        signals = _bulk_overlap_signals(
             db,
             user_id=int(user_id),
-            signal_type="device_fingerprint_overlap",
-            severity=6,
-            description="Device fingerprint overlaps with another GSN account.",
-            meta={
-                "matched_user_id": int(other_user_id),
-                "fingerprint_hash": str(fingerprint_hash),
-            },
+            matched_user_ids=matched_user_ids,
+            fingerprint_hash=str(fingerprint_hash),
         )
-        signals_created += 1
-
-        created = _ensure_identity_cluster(
+        clusters = _bulk_link_clusters(
             db,
-            root_user_id=min(int(user_id), int(other_user_id)),
-            linked_user_id=max(int(user_id), int(other_user_id)),
-            reason="device_fingerprint_overlap",
-            confidence=6,
+            [(int(user_id), other) for other in matched_user_ids],
+            reason=DEVICE_OVERLAP_SIGNAL_TYPE,
+            confidence=DEVICE_OVERLAP_SEVERITY,
         )
-        if created:
-            clusters_created += 1
+        db.commit()
+        return signals, clusters
+
+    try:
+        signals_created, clusters_created = _stage()
+    except IntegrityError:
+        # A concurrent observation of the same device won the insert; the
+        # retry sees its rows and stages only what is still missing.
+        db.rollback()
+        signals_created, clusters_created = _stage()
 
     return {
         "matched": True,
@@ -300,6 +394,109 @@ def detect_identity_overlap(
     }
 
 
+def recluster_device_fingerprints(
+    db: Session,
+    *,
+    chunk_size: int = 5000,
+    dry_run: bool = False,
+    top_components: int = 20,
+) -> Dict[str, Any]:
+    """
+    Rebuild identity cluster links from the whole DeviceFingerprint table.
+
+    (fingerprint_hash, user_id) pairs are streamed in index order, so every
+    account sharing a device is seen together. Each device links its other
+    accounts to its smallest user id, which is enough to connect the
+    cluster without a link per pair. Missing links are checked and inserted
+    in bulk, one lookup and one commit per chunk; risk signals are left to
+    live observations. A union-find over the shared devices reports the
+    resulting account clusters.
+    """
+    chunk = max(1, int(chunk_size))
+    disjoint = _DisjointSet()
+    pairs_scanned = 0
+    shared_devices = 0
+    links_created = 0
+    after: Optional[Tuple[str, int]] = None
+    current_hash: Optional[str] = None
+    current_users: List[int] = []
+    pending_links: Set[Tuple[int, int]] = set()
+
+    def flush_device(users: List[int]) -> None:
+        nonlocal shared_devices
+        if len(users) < 2:
+            return
+        shared_devices += 1
+        for other in users[1:]:
+            disjoint.union(users[0], other)
+            pending_links.add((users[0], other))
+
+    def flush_links() -> int:
+        if dry_run or not pending_links:
+            pending_links.clear()
+            return 0
+        created = _bulk_link_clusters(
+            db,
+            pending_links,
+            reason=DEVICE_OVERLAP_SIGNAL_TYPE,
+            confidence=DEVICE_OVERLAP_SEVERITY,
+        )
+        pending_links.clear()
+        db.commit()
+        return created
+
+    while True:
+        q = db.query(DeviceFingerprint.fingerprint_hash, DeviceFingerprint.user_id).distinct()
+        if after is not None:
+            q = q.filter(
+                or_(
+                    DeviceFingerprint.fingerprint_hash > after[0],
+                    and_(
+                        DeviceFingerprint.fingerprint_hash == after[0],
+                        DeviceFingerprint.user_id > after[1],
+                    ),
+                )
+            )
+        rows = (
+            q.order_by(DeviceFingerprint.fingerprint_hash.asc(), DeviceFingerprint.user_id.asc())
+            .limit(chunk)
+            .all()
+        )
+        if not rows:
+            break
+
+        for fingerprint_hash, user_id in rows:
+            if fingerprint_hash != current_hash:
+                flush_device(current_users)
+                current_hash, current_users = fingerprint_hash, []
+            current_users.append(int(user_id))
+
+        pairs_scanned += len(rows)
+        after = (str(rows[-1][0]), int(rows[-1][1]))
+        if len(rows) < chunk:
+            # Last page: the open device is complete, so it joins this batch.
+            flush_device(current_users)
+            current_users = []
+        links_created += flush_links()
+
+    flush_device(current_users)
+    links_created += flush_links()
+
+    components = sorted(disjoint.components().values(), key=lambda members: (-len(members), members[0]))
+    return {
+        "fingerprint_pairs_scanned": pairs_scanned,
+        "shared_devices": shared_devices,
+        "links_created": links_created,
+        "dry_run": bool(dry_run),
+        "clusters": len(components),
+        "clustered_users": sum(len(members) for members in components),
+        "largest_clusters": [
+            {"root_user_id": members[0], "size": len(members), "user_ids": members[:50]}
+            for members in components[: max(0, int(top_components))]
+        ],
+    }
+
+
 def register_identity_observation(
     db: Session,
     *,
@@ -3,12 +3,28 @@ from __future__ import annotations
 import csv
 import io
 import json
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
 from typing import Optional, Any
 
+from sqlalchemy import and_, case, func, insert, or_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.db.models import TrustEvent, User
+from app.db.models import InviteAnalyticsRollup, TrustEvent, User
+from app.services.maintenance_checkpoint_service import load_checkpoint, save_checkpoint
+
+
+INVITE_ROLLUP_EVENT_TYPES = ("invite_created", "invite_revoked", "clan_join_via_invite")
+
+ROLLUP_BUCKET_CLAN = "clan"
+ROLLUP_BUCKET_INVITER = "inviter"
+ROLLUP_BUCKET_CODE = "code"
+
+_ROLLUP_COUNTERS = ("invites_created", "invites_revoked", "joins")
+
+# Clans whose rollups missed an event; cleared by a rebuild covering them.
+INVITE_ROLLUP_REBUILD_JOB_KEY = "invite_analytics_rollups.rebuild_requested"
+_BUCKET_KEY_MAX = 128
 
 
 def _loads_meta(meta_json: Optional[str]) -> dict[str, Any]:
@@ -27,6 +43,275 @@ def _user_email_map(db: Session, user_ids: list[int]) -> dict[int, str]:
     return {int(uid): str(email) for uid, email in rows if uid is not None and email is not None}
 
 
+def _aware_utc(dt: Optional[datetime]) -> Optional[datetime]:
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _day_start(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+
+def _invite_event_deltas(
+    event_type: Optional[str],
+    meta_json: Optional[str],
+) -> list[tuple[str, str, dict[str, int]]]:
+    """(bucket, bucket_key, counter increments) contributed by one invite event."""
+    if event_type == "invite_created":
+        return [(ROLLUP_BUCKET_CLAN, "", {"invites_created": 1})]
+
+    if event_type == "invite_revoked":
+        return [(ROLLUP_BUCKET_CLAN, "", {"invites_revoked": 1})]
+
+    if event_type != "clan_join_via_invite":
+        return []
+
+    deltas = [(ROLLUP_BUCKET_CLAN, "", {"joins": 1})]
+    meta = _loads_meta(meta_json)
+
+    code = meta.get("invite_code")
+    if isinstance(code, str) and code:
+        deltas.append((ROLLUP_BUCKET_CODE, code[:_BUCKET_KEY_MAX], {"joins": 1}))
+
+    inviter_id = meta.get("invited_by_user_id")
+    if isinstance(inviter_id, int):
+        deltas.append((ROLLUP_BUCKET_INVITER, str(inviter_id), {"joins": 1}))
+
+    return deltas
+
+
+# =========================
+# ROLLUP MAINTENANCE
+# =========================
+
+def _bump_rollup(
+    db: Session,
+    *,
+    clan_id: int,
+    day: date,
+    bucket: str,
+    bucket_key: str,
+    delta: dict[str, int],
+    event_at: datetime,
+) -> None:
+    table = InviteAnalyticsRollup.__table__
+    key = and_(
+        table.c.clan_id == clan_id,
+        table.c.bucket == bucket,
+        table.c.bucket_key == bucket_key,
+        table.c.day == day,
+    )
+    # Increment in SQL so concurrent writers cannot lose counts.
+    values: dict[str, Any] = {name: table.c[name] + int(n) for name, n in delta.items()}
+    values["last_event_at"] = case(
+        (
+            or_(table.c.last_event_at.is_(None), table.c.last_event_at < event_at),
+            event_at,
+        ),
+        else_=table.c.last_event_at,
+    )
+
+    if db.execute(update(table).where(key).values(**values)).rowcount:
+        return
+
+    try:
+        with db.begin_nested():
+            db.execute(
+                insert(table).values(
+                    clan_id=clan_id,
+                    day=day,
+                    bucket=bucket,
+                    bucket_key=bucket_key,
+                    last_event_at=event_at,
+                    **{name: int(delta.get(name, 0)) for name in _ROLLUP_COUNTERS},
+                )
+            )
+    except IntegrityError:
+        # Another writer created the row first.
+        db.execute(update(table).where(key).values(**values))
+
+
+def fold_trust_event_into_invite_rollups(db: Session, event: TrustEvent) -> int:
+    """
+    Add one persisted invite TrustEvent to the daily rollups.
+
+    Not idempotent: call once per new event (log_trust_event does). Does not
+    commit; the caller's transaction owns the write. Returns the number of
+    rollup rows touched.
+    """
+    clan_id = getattr(event, "clan_id", None)
+    if clan_id is None or event.event_type not in INVITE_ROLLUP_EVENT_TYPES:
+        return 0
+
+    event_at = _aware_utc(getattr(event, "created_at", None)) or datetime.now(timezone.utc)
+    deltas = _invite_event_deltas(event.event_type, getattr(event, "meta_json", None))
+
+    for bucket, bucket_key, delta in deltas:
+        _bump_rollup(
+            db,
+            clan_id=int(clan_id),
+            day=event_at.date(),
+            bucket=bucket,
+            bucket_key=bucket_key,
+            delta=delta,
+            event_at=event_at,
+        )
+    return len(deltas)
+
+
+def requested_invite_rollup_rebuilds(db: Session) -> list[int]:
+    """Clan ids whose rollups a failed fold has flagged for rebuild."""
+    cursor = load_checkpoint(db, INVITE_ROLLUP_REBUILD_JOB_KEY)
+    return sorted({int(x) for x in cursor.get("clan_ids") or [] if str(x).isdigit()})
+
+
+def request_invite_rollup_rebuild(db: Session, *, clan_id: int) -> None:
+    clan_ids = set(requested_invite_rollup_rebuilds(db)) | {int(clan_id)}
+    save_checkpoint(db, INVITE_ROLLUP_REBUILD_JOB_KEY, {"clan_ids": sorted(clan_ids)})
+
+
+def rebuild_invite_analytics_rollups(
+    db: Session,
+    *,
+    clan_id: Optional[int] = None,
+    chunk_size: int = 1000,
+    commit: bool = True,
+) -> dict[str, int]:
+    """
+    Rebuild the daily invite rollups from TrustEvent history, for one clan or
+    all of them. Invite events are streamed in id order one chunk at a time.
+    Used for the initial backfill and to repair rollups after a failed fold;
+    clears the rebuild request for the clans it covered.
+    """
+    chunk_size = max(1, int(chunk_size))
+    grouped: dict[tuple[int, str, str, date], dict[str, Any]] = {}
+    events_scanned = 0
+    last_event_id = 0
+
+    while True:
+        q = db.query(
+            TrustEvent.id,
+            TrustEvent.clan_id,
+            TrustEvent.event_type,
+            TrustEvent.meta_json,
+            TrustEvent.created_at,
+        ).filter(
+            TrustEvent.id > last_event_id,
+            TrustEvent.clan_id.isnot(None),
+            TrustEvent.event_type.in_(INVITE_ROLLUP_EVENT_TYPES),
+        )
+        if clan_id is not None:
+            q = q.filter(TrustEvent.clan_id == int(clan_id))
+        events = q.order_by(TrustEvent.id.asc()).limit(chunk_size).all()
+        if not events:
+            break
+
+        for ev in events:
+            event_at = _aware_utc(ev.created_at) or datetime.now(timezone.utc)
+            for bucket, bucket_key, delta in _invite_event_deltas(ev.event_type, ev.meta_json):
+                key = (int(ev.clan_id), bucket, bucket_key, event_at.date())
+                row = grouped.get(key)
+                if row is None:
+                    row = grouped[key] = {name: 0 for name in _ROLLUP_COUNTERS}
+                    row["last_event_at"] = event_at
+                for name, n in delta.items():
+                    row[name] += int(n)
+                row["last_event_at"] = max(row["last_event_at"], event_at)
+
+        events_scanned += len(events)
+        last_event_id = int(events[-1].id)
+
+    stale = db.query(InviteAnalyticsRollup)
+    if clan_id is not None:
+        stale = stale.filter(InviteAnalyticsRollup.clan_id == int(clan_id))
+    stale.delete(synchronize_session=False)
+
+    mappings = [
+        {
+            "clan_id": row_clan_id,
+            "bucket": bucket,
+            "bucket_key": bucket_key,
+            "day": day,
+            **row,
+        }
+        for (row_clan_id, bucket, bucket_key, day), row in grouped.items()
+    ]
+    for start in range(0, len(mappings), chunk_size):
+        db.execute(insert(InviteAnalyticsRollup), mappings[start:start + chunk_size])
+
+    pending = [] if clan_id is None else [x for x in requested_invite_rollup_rebuilds(db) if x != int(clan_id)]
+    save_checkpoint(db, INVITE_ROLLUP_REBUILD_JOB_KEY, {"clan_ids": pending} if pending else None)
+
+    if commit:
+        db.commit()
+    else:
+        db.flush()
+
+    return {
+        "events_scanned": events_scanned,
+        "rollups_written": len(mappings),
+        "last_event_id": last_event_id,
+    }
+
+
+# =========================
+# READS
+# =========================
+
+def _split_range(
+    from_dt: Optional[datetime],
+    to_dt: Optional[datetime],
+) -> tuple[bool, Optional[date], Optional[date], list[tuple[Optional[datetime], Optional[datetime]]]]:
+    """
+    Split the inclusive [from_dt, to_dt] range into whole UTC days, answered
+    from rollups, and at most two partial-day edges [start, end), answered
+    from raw events. Returns (use_rollups, first_day, last_day, edges).
+    """
+    start = _aware_utc(from_dt)
+    # Half-open from here on: created_at <= to_dt is created_at < end.
+    end = _aware_utc(to_dt) + timedelta(microseconds=1) if to_dt is not None else None
+
+    first_day: Optional[date] = None
+    if start is not None:
+        first_day = start.date()
+        if start != _day_start(first_day):
+            first_day += timedelta(days=1)
+
+    last_day: Optional[date] = None
+    if end is not None:
+        last_day = end.date() - timedelta(days=1)
+
+    if first_day is not None and last_day is not None and first_day > last_day:
+        return False, None, None, [(start, end)]
+
+    edges: list[tuple[Optional[datetime], Optional[datetime]]] = []
+    if start is not None and first_day is not None and start < _day_start(first_day):
+        edges.append((start, _day_start(first_day)))
+    if end is not None and last_day is not None:
+        tail_start = _day_start(last_day + timedelta(days=1))
+        if tail_start < end:
+            edges.append((tail_start, end))
+    return True, first_day, last_day, edges
+
+
+def _rollup_query(
+    db: Session,
+    *,
+    clan_id: int,
+    first_day: Optional[date],
+    last_day: Optional[date],
+):
+    q = db.query(InviteAnalyticsRollup).filter(InviteAnalyticsRollup.clan_id == int(clan_id))
+    if first_day is not None:
+        q = q.filter(InviteAnalyticsRollup.day >= first_day)
+    if last_day is not None:
+        q = q.filter(InviteAnalyticsRollup.day <= last_day)
+    return q
+
+
 def get_invite_analytics(
     db: Session,
     *,
@@ -35,15 +320,12 @@ def get_invite_analytics(
     to_dt: Optional[datetime] = None,
     top_n: int = 10,
 ) -> dict:
-    q = db.query(TrustEvent).filter(TrustEvent.clan_id == clan_id)
-
-    if from_dt is not None:
-        q = q.filter(TrustEvent.created_at >= from_dt)
-    if to_dt is not None:
-        q = q.filter(TrustEvent.created_at <= to_dt)
-
-    events = q.order_by(TrustEvent.created_at.desc()).all()
+    """
+    Invite funnel for a clan over [from_dt, to_dt].
 
+    Whole UTC days come from one grouped range query over the daily rollups;
+    only the partial days at either edge of the range read raw invite events.
+    """
     invites_created = 0
     invites_revoked = 0
     joins_via_invite = 0
@@ -51,32 +333,64 @@ def get_invite_analytics(
     inviter_to_joins: dict[int, int] = {}
     invite_code_to_joins: dict[str, dict[str, Any]] = {}
 
-    for ev in events:
-        et = ev.event_type
-
-        if et == "invite_created":
-            invites_created += 1
-            continue
-
-        if et == "invite_revoked":
-            invites_revoked += 1
-            continue
-
-        if et == "clan_join_via_invite":
-            joins_via_invite += 1
-            meta = _loads_meta(getattr(ev, "meta_json", None))
-
-            code = meta.get("invite_code")
-            inviter_id = meta.get("invited_by_user_id")
-
-            if isinstance(code, str) and code:
-                row = invite_code_to_joins.setdefault(code, {"joins": 0, "last_used_at": None})
-                row["joins"] += 1
-                if row["last_used_at"] is None:
-                    row["last_used_at"] = ev.created_at  # newest-first
-
-            if isinstance(inviter_id, int):
-                inviter_to_joins[inviter_id] = inviter_to_joins.get(inviter_id, 0) + 1
+    def _add(bucket: str, key: str, counts: dict[str, int], last_at: Optional[datetime]) -> None:
+        nonlocal invites_created, invites_revoked, joins_via_invite
+        joins = int(counts.get("joins") or 0)
+
+        if bucket == ROLLUP_BUCKET_CLAN:
+            invites_created += int(counts.get("invites_created") or 0)
+            invites_revoked += int(counts.get("invites_revoked") or 0)
+            joins_via_invite += joins
+        elif bucket == ROLLUP_BUCKET_CODE and joins:
+            row = invite_code_to_joins.setdefault(key, {"joins": 0, "last_used_at": None})
+            row["joins"] += joins
+            last_at = _aware_utc(last_at)
+            if last_at is not None and (row["last_used_at"] is None or last_at > row["last_used_at"]):
+                row["last_used_at"] = last_at
+        elif bucket == ROLLUP_BUCKET_INVITER and joins:
+            try:
+                inviter_id = int(key)
+            except ValueError:
+                return
+            inviter_to_joins[inviter_id] = inviter_to_joins.get(inviter_id, 0) + joins
+
+    use_rollups, first_day, last_day, edges = _split_range(from_dt, to_dt)
+
+    if use_rollups:
+        R = InviteAnalyticsRollup
+        rows = (
+            _rollup_query(db, clan_id=clan_id, first_day=first_day, last_day=last_day)
+            .with_entities(
+                R.bucket,
+                R.bucket_key,
+                func.sum(R.invites_created),
+                func.sum(R.invites_revoked),
+                func.sum(R.joins),
+                func.max(R.last_event_at),
+            )
+            .group_by(R.bucket, R.bucket_key)
+            .all()
+        )
+        for bucket, key, created, revoked, joins, last_at in rows:
+            _add(
+                str(bucket),
+                str(key or ""),
+                {"invites_created": created, "invites_revoked": revoked, "joins": joins},
+                last_at,
+            )
+
+    for edge_start, edge_end in edges:
+        q = db.query(TrustEvent.event_type, TrustEvent.meta_json, TrustEvent.created_at).filter(
+            TrustEvent.clan_id == clan_id,
+            TrustEvent.event_type.in_(INVITE_ROLLUP_EVENT_TYPES),
+        )
+        if edge_start is not None:
+            q = q.filter(TrustEvent.created_at >= edge_start)
+        if edge_end is not None:
+            q = q.filter(TrustEvent.created_at < edge_end)
+        for event_type, meta_json, created_at in q.all():
+            for bucket, key, delta in _invite_event_deltas(event_type, meta_json):
+                _add(bucket, key, delta, created_at)
 
     unique_invites_used = len(invite_code_to_joins)
 
@@ -84,10 +398,9 @@ def get_invite_analytics(
     if invites_created > 0:
         conversion_rate = joins_via_invite / float(invites_created)
 
-    inviter_ids = list(inviter_to_joins.keys())
-    inviter_email_map = _user_email_map(db, inviter_ids)
+    top_inviters_pairs = sorted(inviter_to_joins.items(), key=lambda x: (-x[1], x[0]))[:top_n]
+    inviter_email_map = _user_email_map(db, [inviter_id for inviter_id, _ in top_inviters_pairs])
 
-    top_inviters_pairs = sorted(inviter_to_joins.items(), key=lambda x: x[1], reverse=True)[:top_n]
     top_inviters = [
         {
             "invited_by_user_id": inviter_id,
@@ -99,8 +412,7 @@ def get_invite_analytics(
 
     top_invite_codes_pairs = sorted(
         invite_code_to_joins.items(),
-        key=lambda x: x[1]["joins"],
-        reverse=True,
+        key=lambda x: (-x[1]["joins"], x[0]),
     )[:top_n]
 
     top_invite_codes = [
@@ -124,6 +436,31 @@ def get_invite_analytics(
     }
 
 
+def get_invite_analytics_daily(
+    db: Session,
+    *,
+    clan_id: int,
+    from_day: Optional[date] = None,
+    to_day: Optional[date] = None,
+) -> list[dict]:
+    """Clan-wide invite counters per UTC day, oldest first, from the rollups."""
+    rows = (
+        _rollup_query(db, clan_id=clan_id, first_day=from_day, last_day=to_day)
+        .filter(InviteAnalyticsRollup.bucket == ROLLUP_BUCKET_CLAN)
+        .order_by(InviteAnalyticsRollup.day.asc())
+        .all()
+    )
+    return [
+        {
+            "day": row.day,
+            "invites_created": int(row.invites_created or 0),
+            "invites_revoked": int(row.invites_revoked or 0),
+            "joins_via_invite": int(row.joins or 0),
+        }
+        for row in rows
+    ]
+
+
 def get_recent_invite_joins(
     db: Session,
     *,
@@ -250,3 +587,17 @@ def csv_for_trust_events(rows: list[dict]) -> str:
             json.dumps(r.get("meta") or {}, ensure_ascii=False),
         ])
     return buf.getvalue()
+
+
+def csv_for_invite_analytics_daily(rows: list[dict]) -> str:
+    buf = io.StringIO()
+    w = csv.writer(buf)
+    w.writerow(["day", "invites_created", "invites_revoked", "joins_via_invite"])
+    for r in rows:
+        w.writerow([
+            r.get("day"),
+            r.get("invites_created"),
+            r.get("invites_revoked"),
+            r.get("joins_via_invite"),
+        ])
+    return buf.getvalue()
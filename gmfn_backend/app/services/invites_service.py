@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import os
 import secrets
-import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 from urllib.parse import quote, urlparse
@@ -11,42 +10,37 @@ from fastapi import HTTPException, Request
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.rate_limit import rate_limiter
 from app.core.trust_event_types import TrustEventType
 from app.db.models import Clan, ClanInvite, ClanMembership, User
+from app.services.community_confirmation_service import provision_confirmation_contacts_for_membership
 from app.services.global_identity_service import ensure_user_gmfn_id
 from app.services.trust_events_services import log_trust_event
 from app.services.trust_score_service import recompute_trust_for_user_id
 from app.services.trust_service import log_invite_accepted_event
 
-_INVITE_CREATE_BUCKET: dict[tuple[int, int], list[float]] = {}
-_JOIN_BUCKET: dict[int, list[float]] = {}
 PUBLIC_FRONTEND_ORIGIN = "https://gmfn-frontend.onrender.com"
 SUSPENDED_PUBLIC_FRONTEND_HOSTS = {"frontend.onrender.com"}
 
 
-def _bucket_prune(ts_list: list[float], window_seconds: int) -> list[float]:
-    now = time.time()
-    cutoff = now - window_seconds
-    return [t for t in ts_list if t >= cutoff]
-
-
 def _rate_limit_create_invite(user_id: int, clan_id: int, *, limit: int = 20, window_seconds: int = 3600) -> None:
-    key = (user_id, clan_id)
-    ts_list = _INVITE_CREATE_BUCKET.get(key, [])
-    ts_list = _bucket_prune(ts_list, window_seconds)
-    if len(ts_list) >= limit:
+    result = rate_limiter.check(
+        key=f"invite_create:{user_id}:{clan_id}",
+        max_requests=limit,
+        window_seconds=window_seconds,
+    )
+    if not result.ok:
         raise HTTPException(status_code=429, detail="Too many invites created. Please wait and try again.")
-    ts_list.append(time.time())
-    _INVITE_CREATE_BUCKET[key] = ts_list
 
 
 def _rate_limit_join(user_id: int, *, limit: int = 10, window_seconds: int = 600) -> None:
-    ts_list = _JOIN_BUCKET.get(user_id, [])
-    ts_list = _bucket_prune(ts_list, window_seconds)
-    if len(ts_list) >= limit:
+    result = rate_limiter.check(
+        key=f"invite_join:{user_id}",
+        max_requests=limit,
+        window_seconds=window_seconds,
+    )
+    if not result.ok:
         raise HTTPException(status_code=429, detail="Too many join attempts. Please wait and try again.")
-    ts_list.append(time.time())
-    _JOIN_BUCKET[user_id] = ts_list
 
 
 def _utcnow() -> datetime:
@@ -370,6 +364,7 @@ def join_clan_by_invite_code(db: Session, *, code: str, user: User):
         invite_id=int(invite.id),
     )
     db.add(membership)
+    provision_confirmation_contacts_for_membership(db, membership)
 
     invite.uses = (invite.uses or 0) + 1
 
@@ -3,10 +3,11 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
+from sqlalchemy import func, select, union
 from sqlalchemy.orm import Session
 
 import app.db.models as db_models
-from app.services.trust_graph_service import build_trust_graph
+from app.services.trust_graph_service import build_trust_graph, build_trust_graph_summaries
 
 User = db_models.User
 ClanMembership = db_models.ClanMembership
@@ -27,6 +28,7 @@ LEGACY_REPAYMENT_EVENTS = {
 }
 ACTIVE_EXPOSURE_STATUSES = {"approved", "locked"}
 PENDING_EXPOSURE_STATUSES = {"pending"}
+REPAYMENT_VELOCITY_EVENT_WINDOW = 200
 
 
 def _safe_decimal(value: Any, default: str = "0") -> Decimal:
@@ -92,6 +94,20 @@ def _get_active_guarantee_rows_for_user(db: Session, user_id: int) -> List[Any]:
     return q.all()
 
 
+def _get_active_guarantee_rows_for_users(db: Session, user_ids: List[int]) -> Dict[int, List[Any]]:
+    rows_by_user: Dict[int, List[Any]] = {int(uid): [] for uid in user_ids}
+    if LoanGuarantor is None or not hasattr(LoanGuarantor, "guarantor_user_id") or not user_ids:
+        return rows_by_user
+
+    q = db.query(LoanGuarantor).filter(LoanGuarantor.guarantor_user_id.in_(sorted(rows_by_user)))
+
+    if hasattr(LoanGuarantor, "status"):
+        q = q.filter(LoanGuarantor.status.in_(sorted(ACTIVE_EXPOSURE_STATUSES | PENDING_EXPOSURE_STATUSES)))
+    for row in q.order_by(LoanGuarantor.id.asc()).all():
+        rows_by_user.setdefault(int(row.guarantor_user_id), []).append(row)
+    return rows_by_user
+
+
 def _guarantee_exposure_amount(row: Any) -> Decimal:
     status = str(getattr(row, "status", "") or "").lower()
 
@@ -124,10 +140,76 @@ def _estimate_repayment_velocity(db: Session, user_id: int) -> Decimal:
             (TrustEvent.actor_user_id == int(user_id)) | (TrustEvent.subject_user_id == int(user_id))
         )
         .order_by(TrustEvent.created_at.desc(), TrustEvent.id.desc())
-        .limit(200)
+        .limit(REPAYMENT_VELOCITY_EVENT_WINDOW)
         .all()
     )
+    return _repayment_velocity_from_rows(rows)
+
+
+def _estimate_repayment_velocities(db: Session, user_ids: List[int]) -> Dict[int, Decimal]:
+    """
+    Batch form of _estimate_repayment_velocity: each member's latest
+    REPAYMENT_VELOCITY_EVENT_WINDOW events (as actor or subject) are ranked
+    with a window function, and only the repayment-type rows inside that
+    window are fetched.
+    """
+    velocities = {int(uid): Decimal("0.00") for uid in user_ids}
+    if TrustEvent is None or not velocities:
+        return velocities
+
+    wanted = sorted(velocities)
+    # UNION (not UNION ALL) so an event where the member is both actor and
+    # subject fills one slot of their window, as in the single-member query.
+    pairs = union(
+        select(
+            TrustEvent.actor_user_id.label("member_user_id"),
+            TrustEvent.id.label("event_id"),
+            TrustEvent.created_at.label("created_at"),
+        ).where(TrustEvent.actor_user_id.in_(wanted)),
+        select(
+            TrustEvent.subject_user_id.label("member_user_id"),
+            TrustEvent.id.label("event_id"),
+            TrustEvent.created_at.label("created_at"),
+        ).where(TrustEvent.subject_user_id.in_(wanted)),
+    ).subquery()
+    ranked = select(
+        pairs.c.member_user_id,
+        pairs.c.event_id,
+        func.row_number()
+        .over(
+            partition_by=pairs.c.member_user_id,
+            order_by=(pairs.c.created_at.desc(), pairs.c.event_id.desc()),
+        )
+        .label("position"),
+    ).subquery()
+
+    repayment_types = sorted(CANONICAL_REPAYMENT_EVENTS | LEGACY_REPAYMENT_EVENTS)
+    rows = db.execute(
+        select(
+            ranked.c.member_user_id,
+            TrustEvent.id,
+            TrustEvent.event_type,
+            TrustEvent.loan_id,
+            TrustEvent.created_at,
+        )
+        .join(TrustEvent, TrustEvent.id == ranked.c.event_id)
+        .where(
+            ranked.c.position <= REPAYMENT_VELOCITY_EVENT_WINDOW,
+            func.lower(TrustEvent.event_type).in_(repayment_types),
+        )
+        .order_by(ranked.c.member_user_id.asc(), ranked.c.position.asc())
+    ).all()
+
+    rows_by_user: Dict[int, List[Any]] = {}
+    for row in rows:
+        rows_by_user.setdefault(int(row.member_user_id), []).append(row)
+    for uid, member_rows in rows_by_user.items():
+        velocities[uid] = _repayment_velocity_from_rows(member_rows)
+    return velocities
+
 
+def _repayment_velocity_from_rows(rows: List[Any]) -> Decimal:
+    """Score repayment evidence from events ordered newest first."""
     seen_loans = set()
     canonical_count = 0
     legacy_count = 0
@@ -231,16 +313,28 @@ def _build_user_profile_internal(
             limit_events=500,
         )
 
-    tg = graph_cache[int(user_id)]
-    summary = tg.get("summary", {})
-    cci = tg.get("cci", {})
+    return _profile_from_inputs(
+        user,
+        trust_graph=graph_cache[int(user_id)],
+        active_guarantees=_get_active_guarantee_rows_for_user(db, int(user_id)),
+        repayment_velocity=_estimate_repayment_velocity(db, int(user_id)),
+    )
+
+
+def _profile_from_inputs(
+    user: Any,
+    *,
+    trust_graph: Dict[str, Any],
+    active_guarantees: List[Any],
+    repayment_velocity: Decimal,
+) -> Dict[str, Any]:
+    summary = trust_graph.get("summary", {})
+    cci = trust_graph.get("cci", {})
 
     personal_pool_balance = _q2(getattr(user, "personal_pool_balance", Decimal("0.00")) or Decimal("0.00"))
-    active_guarantees = _get_active_guarantee_rows_for_user(db, int(user_id))
     current_locked_guarantees = _q2(sum((_guarantee_exposure_amount(r) for r in active_guarantees), Decimal("0.00")))
     active_guarantee_count = len(active_guarantees)
 
-    repayment_velocity = _estimate_repayment_velocity(db, int(user_id))
     cross_clan_diversity = _estimate_cross_clan_diversity(summary)
     cci_score = _safe_decimal(cci.get("cci_score"), "0")
     cci_band = str(cci.get("cci_band", "E") or "E")
@@ -314,28 +408,53 @@ def build_user_liquidity_profile(db: Session, user_id: int) -> Dict[str, Any]:
     return _build_user_profile_internal(db, int(user_id), graph_cache={})
 
 
-def build_clan_liquidity_snapshot(db: Session, clan_id: int) -> Dict[str, Any]:
-    memberships = (
-        db.query(ClanMembership)
-        .filter(
-            ClanMembership.clan_id == int(clan_id),
-            ClanMembership.left_at.is_(None),
+def build_user_liquidity_profiles(db: Session, user_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Liquidity profiles for many members with set-based reads.
+
+    Users, active guarantees, repayment-event windows and trust-graph
+    summaries are each loaded for the whole set at once; every profile is
+    identical to build_user_liquidity_profile for the same member. Unknown
+    user ids are omitted.
+    """
+    wanted = sorted({int(uid) for uid in user_ids if _safe_int(uid, 0) > 0})
+    if not wanted:
+        return {}
+
+    users = {int(u.id): u for u in db.query(User).filter(User.id.in_(wanted)).all()}
+    found = sorted(users)
+    graphs = build_trust_graph_summaries(db, found, include_clans=True, limit_events=500)
+    guarantees = _get_active_guarantee_rows_for_users(db, found)
+    velocities = _estimate_repayment_velocities(db, found)
+
+    return {
+        uid: _profile_from_inputs(
+            users[uid],
+            trust_graph=graphs.get(uid, {}),
+            active_guarantees=guarantees.get(uid, []),
+            repayment_velocity=velocities.get(uid, Decimal("0.00")),
         )
-        .order_by(ClanMembership.created_at.asc(), ClanMembership.id.asc())
-        .all()
-    )
+        for uid in found
+    }
 
-    graph_cache: Dict[int, Dict[str, Any]] = {}
-    members: List[Dict[str, Any]] = []
 
-    for membership in memberships:
-        uid = _safe_int(getattr(membership, "user_id", None), 0)
-        if uid <= 0:
-            continue
-        try:
-            members.append(_build_user_profile_internal(db, uid, graph_cache=graph_cache))
-        except ValueError:
-            continue
+def build_clan_liquidity_snapshot(db: Session, clan_id: int) -> Dict[str, Any]:
+    member_user_ids = [
+        _safe_int(row[0], 0)
+        for row in (
+            db.query(ClanMembership.user_id)
+            .filter(
+                ClanMembership.clan_id == int(clan_id),
+                ClanMembership.left_at.is_(None),
+            )
+            .order_by(ClanMembership.created_at.asc(), ClanMembership.id.asc())
+            .all()
+        )
+    ]
+    profiles = build_user_liquidity_profiles(db, member_user_ids)
+    members: List[Dict[str, Any]] = [
+        profiles[uid] for uid in member_user_ids if uid in profiles
+    ]
 
     total_personal_pool = _q2(sum((_safe_decimal(m.get("personal_pool_balance")) for m in members), Decimal("0.00")))
     total_locked = _q2(sum((_safe_decimal(m.get("current_locked_guarantees")) for m in members), Decimal("0.00")))
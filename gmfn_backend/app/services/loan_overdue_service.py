@@ -1,23 +1,33 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
+from fastapi import HTTPException
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
 from app.db.models import Loan
 from app.services.loans_service import mark_loan_defaulted
+from app.services.maintenance_checkpoint_service import load_checkpoint, save_checkpoint
 
 
 FINAL_LOAN_STATUSES = {"repaid", "cancelled", "defaulted", "rejected"}
 DEFAULT_GRACE_DAYS = 3
+OVERDUE_SCAN_JOB_KEY = "loan_overdue_default_scan"
 
 
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _aware_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
 def _days_past_due(now: datetime, due_at: datetime) -> int:
     delta = now - due_at
     return max(0, delta.days)
@@ -35,112 +45,176 @@ class OverdueDecision:
     reason: str
 
 
-def inspect_overdue_loans(
+def _default_cutoff(now: datetime, grace: int) -> datetime:
+    # days_past_due counts whole days, so "more than grace days late" means
+    # due at least grace + 1 full days ago.
+    return now - timedelta(days=grace + 1)
+
+
+def _overdue_candidates(
     db: Session,
     *,
-    clan_id: Optional[int] = None,
-    grace_days: int = DEFAULT_GRACE_DAYS,
-    limit: int = 200,
-    now: Optional[datetime] = None,
-) -> Dict[str, Any]:
+    clan_id: Optional[int],
+    cutoff: datetime,
+    after: Optional[Tuple[datetime, int]],
+    limit: int,
+) -> List[Loan]:
     """
-    Dry-run style inspection.
-    Does not mutate loans.
+    Non-final loans with an outstanding balance and due_at at or before
+    cutoff, in (due_at, id) order through ix_loans_due_at_id. after is the
+    keyset cursor of the last loan already handled.
     """
-    current_time = now or _now_utc()
-    lim = max(1, min(int(limit or 200), 2000))
-    grace = max(0, int(grace_days or 0))
-
-    q = db.query(Loan).order_by(Loan.id.desc())
+    q = db.query(Loan).filter(
+        Loan.due_at.isnot(None),
+        Loan.due_at <= cutoff,
+        # A NULL status is not final; NOT IN alone would drop those loans.
+        or_(
+            Loan.status.is_(None),
+            func.lower(Loan.status).notin_(sorted(FINAL_LOAN_STATUSES)),
+        ),
+        # mark_loan_defaulted falls back to amount - paid_total when
+        # remaining_amount was never synced, so count either as outstanding.
+        or_(Loan.remaining_amount > 0, Loan.amount > Loan.paid_total),
+    )
 
     if clan_id is not None:
         q = q.filter(Loan.clan_id == int(clan_id))
 
-    rows = q.limit(lim).all()
-
-    decisions: List[OverdueDecision] = []
-
-    for loan in rows:
-        status_before = (getattr(loan, "status", "") or "").lower()
-        due_at = getattr(loan, "due_at", None)
-        remaining_amount = getattr(loan, "remaining_amount", None)
-
-        if status_before in FINAL_LOAN_STATUSES:
-            decisions.append(
-                OverdueDecision(
-                    loan_id=int(loan.id),
-                    clan_id=int(loan.clan_id),
-                    borrower_user_id=int(loan.borrower_user_id),
-                    due_at=due_at.isoformat() if due_at else None,
-                    status_before=status_before,
-                    days_past_due=0,
-                    should_default=False,
-                    reason="final_status",
-                )
+    if after is not None:
+        after_due_at, after_id = after
+        q = q.filter(
+            or_(
+                Loan.due_at > after_due_at,
+                and_(Loan.due_at == after_due_at, Loan.id > int(after_id)),
             )
-            continue
+        )
 
-        if due_at is None:
-            decisions.append(
-                OverdueDecision(
-                    loan_id=int(loan.id),
-                    clan_id=int(loan.clan_id),
-                    borrower_user_id=int(loan.borrower_user_id),
-                    due_at=None,
-                    status_before=status_before,
-                    days_past_due=0,
-                    should_default=False,
-                    reason="missing_due_at",
-                )
-            )
+    return q.order_by(Loan.due_at.asc(), Loan.id.asc()).limit(int(limit)).all()
+
+
+def _decide(loan: Loan, *, current_time: datetime, grace: int) -> OverdueDecision:
+    due_at = _aware_utc(loan.due_at)
+    dpd = _days_past_due(current_time, due_at)
+    should_default = dpd > grace
+    return OverdueDecision(
+        loan_id=int(loan.id),
+        clan_id=int(loan.clan_id),
+        borrower_user_id=int(loan.borrower_user_id),
+        due_at=due_at.isoformat(),
+        status_before=(getattr(loan, "status", "") or "").lower(),
+        days_past_due=dpd,
+        should_default=should_default,
+        reason="beyond_grace" if should_default else "within_grace",
+    )
+
+
+def _loan_cursor(loan: Loan) -> Dict[str, Any]:
+    return {"due_at": _aware_utc(loan.due_at).isoformat(), "loan_id": int(loan.id)}
+
+
+def _parse_cursor(cursor: Dict[str, Any]) -> Optional[Tuple[datetime, int]]:
+    try:
+        return (
+            _aware_utc(datetime.fromisoformat(str(cursor["due_at"]))),
+            int(cursor["loan_id"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _apply_defaults(
+    db: Session,
+    decisions: List[OverdueDecision],
+    *,
+    actor_user_id: int,
+    grace: int,
+    dry_run: bool,
+) -> List[Dict[str, Any]]:
+    """
+    Default every candidate in decisions without committing; the caller
+    commits once per chunk. A loan that changed state since it was read is
+    reported as skipped rather than failing the chunk.
+    """
+    results: List[Dict[str, Any]] = []
+
+    for item in decisions:
+        if not item.should_default:
             continue
 
-        if remaining_amount is None or str(remaining_amount) == "0":
-            decisions.append(
-                OverdueDecision(
-                    loan_id=int(loan.id),
-                    clan_id=int(loan.clan_id),
-                    borrower_user_id=int(loan.borrower_user_id),
-                    due_at=due_at.isoformat(),
-                    status_before=status_before,
-                    days_past_due=0,
-                    should_default=False,
-                    reason="no_remaining_amount",
-                )
+        if dry_run:
+            results.append(
+                {
+                    "loan_id": int(item.loan_id),
+                    "status": "would_default",
+                    "days_past_due": int(item.days_past_due),
+                }
             )
             continue
 
-        if current_time <= due_at:
-            decisions.append(
-                OverdueDecision(
-                    loan_id=int(loan.id),
-                    clan_id=int(loan.clan_id),
-                    borrower_user_id=int(loan.borrower_user_id),
-                    due_at=due_at.isoformat(),
-                    status_before=status_before,
-                    days_past_due=0,
-                    should_default=False,
-                    reason="not_due_yet",
-                )
+        try:
+            loan = mark_loan_defaulted(
+                db,
+                loan_id=int(item.loan_id),
+                clan_id=int(item.clan_id),
+                actor_user_id=int(actor_user_id),
+                reason="overdue_grace_exceeded",
+                note=f"Loan defaulted automatically after exceeding {int(grace)}-day grace window.",
+                days_past_due=int(item.days_past_due),
+                trigger_mode="overdue_detector",
+                commit=False,
+            )
+        except HTTPException as exc:
+            results.append(
+                {
+                    "loan_id": int(item.loan_id),
+                    "status": "skipped",
+                    "days_past_due": int(item.days_past_due),
+                    "detail": str(exc.detail),
+                }
             )
             continue
 
-        dpd = _days_past_due(current_time, due_at)
-        should_default = dpd > grace
-
-        decisions.append(
-            OverdueDecision(
-                loan_id=int(loan.id),
-                clan_id=int(loan.clan_id),
-                borrower_user_id=int(loan.borrower_user_id),
-                due_at=due_at.isoformat(),
-                status_before=status_before,
-                days_past_due=dpd,
-                should_default=should_default,
-                reason="beyond_grace" if should_default else "within_grace",
-            )
+        results.append(
+            {
+                "loan_id": int(loan.id),
+                "status": loan.status,
+                "days_past_due": int(item.days_past_due),
+            }
         )
 
+    return results
+
+
+def inspect_overdue_loans(
+    db: Session,
+    *,
+    clan_id: Optional[int] = None,
+    grace_days: int = DEFAULT_GRACE_DAYS,
+    limit: int = 200,
+    now: Optional[datetime] = None,
+    after: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Dry-run style inspection.
+    Does not mutate loans.
+
+    Only default candidates are read: settled, final and not-yet-overdue
+    loans are excluded in SQL, so limit bounds work rather than hiding older
+    overdue loans behind newer ones. next_cursor resumes after the last item.
+    """
+    current_time = _aware_utc(now or _now_utc())
+    lim = max(1, min(int(limit or 200), 2000))
+    grace = max(0, int(grace_days or 0))
+
+    rows = _overdue_candidates(
+        db,
+        clan_id=clan_id,
+        cutoff=_default_cutoff(current_time, grace),
+        after=_parse_cursor(after) if after else None,
+        limit=lim,
+    )
+    decisions = [_decide(loan, current_time=current_time, grace=grace) for loan in rows]
+
     return {
         "clan_id": int(clan_id) if clan_id is not None else None,
         "grace_days": grace,
@@ -148,6 +222,7 @@ def inspect_overdue_loans(
         "scanned": len(decisions),
         "default_candidates": sum(1 for d in decisions if d.should_default),
         "items": [d.__dict__ for d in decisions],
+        "next_cursor": _loan_cursor(rows[-1]) if len(rows) >= lim else None,
     }
 
 
@@ -163,6 +238,7 @@ def run_overdue_default_scan(
 ) -> Dict[str, Any]:
     """
     Deterministically scan loans and default overdue ones via the canonical path.
+    Up to limit candidates are defaulted and committed together.
     """
     inspection = inspect_overdue_loans(
         db,
@@ -171,51 +247,119 @@ def run_overdue_default_scan(
         limit=limit,
         now=now,
     )
+    decisions = [OverdueDecision(**item) for item in inspection["items"]]
 
-    results: List[Dict[str, Any]] = []
-    defaulted_count = 0
+    results = _apply_defaults(
+        db,
+        decisions,
+        actor_user_id=int(actor_user_id),
+        grace=int(inspection["grace_days"]),
+        dry_run=bool(dry_run),
+    )
+    if not dry_run:
+        db.commit()
 
-    for item in inspection["items"]:
-        if not item["should_default"]:
-            continue
+    return {
+        "clan_id": inspection["clan_id"],
+        "grace_days": inspection["grace_days"],
+        "limit": inspection["limit"],
+        "scanned": inspection["scanned"],
+        "default_candidates": inspection["default_candidates"],
+        "defaulted": sum(1 for r in results if r["status"] == "defaulted"),
+        "dry_run": bool(dry_run),
+        "items": results,
+    }
 
-        if dry_run:
-            results.append(
-                {
-                    "loan_id": int(item["loan_id"]),
-                    "status": "would_default",
-                    "days_past_due": int(item["days_past_due"]),
-                }
-            )
-            continue
 
-        loan = mark_loan_defaulted(
+def scan_overdue_loan_book(
+    db: Session,
+    *,
+    actor_user_id: int,
+    grace_days: int = DEFAULT_GRACE_DAYS,
+    chunk_size: int = 200,
+    max_loans: int = 5000,
+    now: Optional[datetime] = None,
+    dry_run: bool = False,
+    job_key: str = OVERDUE_SCAN_JOB_KEY,
+) -> Dict[str, Any]:
+    """
+    Nightly pass over the whole loan book, bounded and resumable.
+
+    Candidates are walked in (due_at, id) order from the saved checkpoint.
+    Each chunk's defaults and the advanced checkpoint are committed together,
+    so an interrupted run resumes after the last committed chunk. A run stops
+    after max_loans candidates; the pass is complete (and the checkpoint
+    cleared) once a chunk comes back short. dry_run reads from the saved
+    checkpoint but writes nothing.
+    """
+    current_time = _aware_utc(now or _now_utc())
+    grace = max(0, int(grace_days or 0))
+    chunk = max(1, min(int(chunk_size), 2000))
+    budget = max(1, int(max_loans))
+    cutoff = _default_cutoff(current_time, grace)
+
+    saved = load_checkpoint(db, job_key)
+    after = _parse_cursor(saved) if saved else None
+    resumed = after is not None
+
+    scanned = 0
+    chunks = 0
+    defaulted = 0
+    completed = False
+    items: List[Dict[str, Any]] = []
+
+    while scanned < budget:
+        rows = _overdue_candidates(
             db,
-            loan_id=int(item["loan_id"]),
-            clan_id=int(item["clan_id"]),
-            actor_user_id=int(actor_user_id),
-            reason="overdue_grace_exceeded",
-            note=f"Loan defaulted automatically after exceeding {int(grace_days)}-day grace window.",
-            days_past_due=int(item["days_past_due"]),
-            trigger_mode="overdue_detector",
+            clan_id=None,
+            cutoff=cutoff,
+            after=after,
+            limit=min(chunk, budget - scanned),
         )
+        if not rows:
+            completed = True
+            break
 
-        defaulted_count += 1
-        results.append(
-            {
-                "loan_id": int(loan.id),
-                "status": loan.status,
-                "days_past_due": int(item["days_past_due"]),
-            }
+        chunks += 1
+        scanned += len(rows)
+        decisions = [_decide(loan, current_time=current_time, grace=grace) for loan in rows]
+        next_cursor = _loan_cursor(rows[-1])
+
+        results = _apply_defaults(
+            db,
+            decisions,
+            actor_user_id=int(actor_user_id),
+            grace=grace,
+            dry_run=bool(dry_run),
         )
+        defaulted += sum(1 for r in results if r["status"] == "defaulted")
+        items.extend(results)
+
+        after = _parse_cursor(next_cursor)
+        if not dry_run:
+            save_checkpoint(db, job_key, next_cursor)
+            db.commit()
+
+        if len(rows) < chunk and scanned < budget:
+            completed = True
+            break
+
+    if completed and not dry_run:
+        save_checkpoint(db, job_key, None)
+        db.commit()
 
     return {
-        "clan_id": inspection["clan_id"],
-        "grace_days": inspection["grace_days"],
-        "limit": inspection["limit"],
-        "scanned": inspection["scanned"],
-        "default_candidates": inspection["default_candidates"],
-        "defaulted": defaulted_count,
+        "job_key": str(job_key),
+        "grace_days": grace,
+        "cutoff": cutoff.isoformat(),
+        "resumed": resumed,
+        "completed": completed,
+        "chunks": chunks,
+        "scanned": scanned,
+        "defaulted": defaulted,
         "dry_run": bool(dry_run),
-        "items": results,
-    }
\ No newline at end of file
+        "next_cursor": None if completed else (
+            {"due_at": after[0].isoformat(), "loan_id": after[1]} if after else None
+        ),
+        "items": items,
+    }
@@ -467,11 +467,14 @@ def mark_loan_defaulted(
     note: Optional[str] = None,
     days_past_due: Optional[int] = None,
     trigger_mode: Optional[str] = None,
+    commit: bool = True,
 ) -> Loan:
     """
     Deterministically mark a loan as defaulted.
 
     Locked supporter responsibility is intentionally not auto-released here.
+    With commit=False the change is only flushed, so batch callers can commit
+    many defaults together.
     """
     loan = db.get(Loan, int(loan_id))
     if not loan:
@@ -514,6 +517,10 @@ def mark_loan_defaulted(
         refresh=False,
     )
 
+    if not commit:
+        db.flush()
+        return loan
+
     db.commit()
     db.refresh(loan)
     return loan
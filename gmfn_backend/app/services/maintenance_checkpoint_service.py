@@ -0,0 +1,56 @@
+# app/services/maintenance_checkpoint_service.py
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.db.models import MaintenanceCheckpoint
+
+
+def _now_utc() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def load_checkpoint(db: Session, job_key: str) -> Dict[str, Any]:
+    """Saved cursor for job_key, or {} when the job should start from the beginning."""
+    row = (
+        db.query(MaintenanceCheckpoint)
+        .filter(MaintenanceCheckpoint.job_key == str(job_key))
+        .one_or_none()
+    )
+    if row is None or not row.cursor_json:
+        return {}
+    try:
+        data = json.loads(row.cursor_json)
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_checkpoint(db: Session, job_key: str, cursor: Optional[Dict[str, Any]]) -> None:
+    """
+    Stage the cursor for job_key in the current transaction; the caller's
+    commit makes it durable together with the work it describes. A None or
+    empty cursor marks the pass as finished.
+    """
+    row = (
+        db.query(MaintenanceCheckpoint)
+        .filter(MaintenanceCheckpoint.job_key == str(job_key))
+        .one_or_none()
+    )
+    if row is None:
+        row = MaintenanceCheckpoint(job_key=str(job_key))
+        db.add(row)
+
+    if cursor:
+        if not row.cursor_json:
+            row.pass_started_at = _now_utc()
+        row.cursor_json = json.dumps(cursor, sort_keys=True, default=str)
+    else:
+        row.cursor_json = None
+        row.pass_started_at = None
+    row.updated_at = _now_utc()
+    db.flush()
@@ -0,0 +1,311 @@
+# app/services/marketplace_image_variants.py
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Type, Union
+
+from sqlalchemy import update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.db.models import MarketplaceBroadcast, MarketplaceProduct
+
+
+# Longest side in pixels, smallest first. Feed cards use "thumb"; product
+# and spotlight detail views use "medium".
+IMAGE_VARIANT_SIZES: Tuple[Tuple[str, int], ...] = (("thumb", 320), ("medium", 960))
+
+IMAGE_VARIANT_SOURCE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+IMAGE_VARIANT_MODELS: Tuple[Type[Any], ...] = (MarketplaceProduct, MarketplaceBroadcast)
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_GUARD = threading.Lock()
+_JOBS: set[Future] = set()
+_JOBS_GUARD = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = str(os.getenv(name, "") or "").strip()
+    try:
+        return int(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def image_variant_workers() -> int:
+    return max(1, min(_env_int("GMFN_IMAGE_VARIANT_WORKERS", 2), 8))
+
+
+def _webp_quality() -> int:
+    return max(30, min(_env_int("GMFN_IMAGE_VARIANT_WEBP_QUALITY", 78), 95))
+
+
+def _uploads_root() -> Path:
+    raw = str(os.getenv("GMFN_UPLOADS_DIR", "uploads") or "").strip()
+    return Path(raw or "uploads").expanduser()
+
+
+def _local_source_path(media_url: Any) -> Optional[Path]:
+    """The file behind a /uploads/... image URL, or None for anything else."""
+    value = str(media_url or "").strip()
+    if not value.startswith("/uploads/"):
+        return None
+
+    cleaned = value.split("?", 1)[0].split("#", 1)[0].replace("\\", "/")
+    relative = cleaned[len("/uploads/"):].lstrip("/")
+    if not relative or "/variants/" in f"/{relative}":
+        return None
+    if Path(relative).suffix.lower() not in IMAGE_VARIANT_SOURCE_EXTENSIONS:
+        return None
+
+    try:
+        root = _uploads_root().resolve()
+        candidate = (root / relative).resolve()
+        candidate.relative_to(root)
+    except Exception:
+        return None
+    return candidate
+
+
+def image_variant_urls(media_url: Any) -> Dict[str, str]:
+    """
+    Where each variant of a local upload lives, whether or not it has been
+    generated: /uploads/<dir>/<name>.jpg -> /uploads/<dir>/variants/<name>-thumb.webp.
+    """
+    if _local_source_path(media_url) is None:
+        return {}
+    cleaned = str(media_url).strip().split("?", 1)[0].split("#", 1)[0].replace("\\", "/")
+    directory, _, filename = cleaned.rpartition("/")
+    stem = Path(filename).stem
+    return {name: f"{directory}/variants/{stem}-{name}.webp" for name, _ in IMAGE_VARIANT_SIZES}
+
+
+def _variant_path(variant_url: str) -> Path:
+    return _uploads_root() / variant_url[len("/uploads/"):]
+
+
+def existing_image_variants(media_url: Any) -> Dict[str, str]:
+    return {
+        name: url
+        for name, url in image_variant_urls(media_url).items()
+        if _variant_path(url).is_file()
+    }
+
+
+def _save_webp(image: Any, target: Path) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    handle = tempfile.NamedTemporaryFile(
+        mode="wb",
+        dir=str(target.parent),
+        prefix=".variant-",
+        suffix=".part",
+        delete=False,
+    )
+    try:
+        with handle:
+            image.save(handle, format="WEBP", quality=_webp_quality(), method=4)
+        os.replace(handle.name, target)
+    except BaseException:
+        try:
+            os.unlink(handle.name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def generate_image_variants(media_url: Any) -> Dict[str, str]:
+    """
+    Write the missing WebP variants of a local upload and return every
+    variant that exists afterwards. Idempotent; an unreadable or non-local
+    image yields {}.
+    """
+    source = _local_source_path(media_url)
+    if source is None or not source.is_file():
+        return {}
+
+    urls = image_variant_urls(media_url)
+    missing = [(name, size) for name, size in IMAGE_VARIANT_SIZES if not _variant_path(urls[name]).is_file()]
+    if missing:
+        from PIL import Image, ImageOps
+
+        try:
+            with Image.open(source) as opened:
+                image = ImageOps.exif_transpose(opened)
+                has_alpha = image.mode in {"RGBA", "LA", "PA"} or "transparency" in image.info
+                image = image.convert("RGBA" if has_alpha else "RGB")
+                for name, size in missing:
+                    variant = image.copy()
+                    variant.thumbnail((size, size), Image.Resampling.LANCZOS)
+                    _save_webp(variant, _variant_path(urls[name]))
+        except Exception:
+            return existing_image_variants(media_url)
+
+    return existing_image_variants(media_url)
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_GUARD:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=image_variant_workers(),
+                thread_name_prefix="gmfn-image-variants",
+            )
+        return _EXECUTOR
+
+
+def _submit(fn, *args) -> Future:
+    future = _executor().submit(fn, *args)
+    with _JOBS_GUARD:
+        _JOBS.add(future)
+    future.add_done_callback(lambda done: _discard_job(done))
+    return future
+
+
+def _discard_job(future: Future) -> None:
+    with _JOBS_GUARD:
+        _JOBS.discard(future)
+
+
+def wait_for_image_variant_jobs(timeout: Optional[float] = None) -> None:
+    """Block until queued variant jobs finish (maintenance runs and tests)."""
+    with _JOBS_GUARD:
+        jobs = list(_JOBS)
+    for job in jobs:
+        try:
+            job.result(timeout=timeout)
+        except Exception:
+            pass
+
+
+def schedule_image_variants(media_url: Any) -> Optional[Future]:
+    """Generate a fresh upload's variants on the worker pool, off the request."""
+    urls = image_variant_urls(media_url)
+    if not urls or all(_variant_path(url).is_file() for url in urls.values()):
+        return None
+    return _submit(generate_image_variants, str(media_url))
+
+
+def image_variants_payload(media_url: Any, variants_json: Any = None) -> Dict[str, Any]:
+    """
+    Feed fields for an image: its recorded variants (JSON or a dict), the
+    smallest one for list cards and a bounded one for detail views. Both
+    fall back to the original until the variants exist.
+    """
+    loaded: Any = variants_json or {}
+    if isinstance(loaded, str):
+        try:
+            loaded = json.loads(loaded)
+        except ValueError:
+            loaded = {}
+    variants: Dict[str, str] = (
+        {str(k): str(v) for k, v in loaded.items() if v} if isinstance(loaded, dict) else {}
+    )
+
+    original = str(media_url or "").strip() or None
+    return {
+        "image_variants": variants,
+        "image_thumb_url": variants.get("thumb") or variants.get("medium") or original,
+        "image_display_url": variants.get("medium") or original,
+    }
+
+
+def _record_variants(
+    bind: Union[Engine, Connection],
+    model: Type[Any],
+    row_id: int,
+    media_url: str,
+) -> Dict[str, str]:
+    variants = generate_image_variants(media_url)
+    if not variants:
+        return {}
+
+    engine = bind.engine if isinstance(bind, Connection) else bind
+    table = model.__table__
+    with engine.begin() as conn:
+        # The row may have moved on to another image while this ran.
+        conn.execute(
+            update(table)
+            .where(table.c.id == int(row_id), table.c.image_url == media_url)
+            .values(image_variants_json=json.dumps(variants, sort_keys=True))
+        )
+    return variants
+
+
+def record_known_image_variants(row: Any) -> None:
+    """
+    Record on a product or broadcast the variants already on disk for its
+    current image (usually generated when the image was uploaded). An image
+    without variants, or no image, clears them. Call whenever image_url is
+    set, before the commit.
+    """
+    variants = existing_image_variants(row.image_url)
+    row.image_variants_json = json.dumps(variants, sort_keys=True) if variants else None
+
+
+def enqueue_image_variant_job(db: Session, row: Any) -> Optional[Future]:
+    """
+    After the row is committed, render the variants its image still lacks
+    on the worker pool and record them on the row.
+    """
+    if row.id is None or row.image_variants_json:
+        return None
+    media_url = row.image_url
+    if not image_variant_urls(media_url):
+        return None
+    return _submit(_record_variants, db.get_bind(), type(row), int(row.id), str(media_url))
+
+
+def backfill_image_variants(
+    db: Session,
+    *,
+    chunk_size: int = 200,
+    max_rows: int = 5000,
+) -> Dict[str, Any]:
+    """
+    Generate and record variants for products and broadcasts that have a
+    local image but none recorded, oldest first, one commit per chunk.
+    """
+    chunk = max(1, int(chunk_size))
+    budget = max(1, int(max_rows))
+    stats: Dict[str, Any] = {"seen": 0, "recorded": 0, "skipped": 0, "chunks": 0}
+
+    for model in IMAGE_VARIANT_MODELS:
+        after_id = 0
+        while stats["seen"] < budget:
+            rows = (
+                db.query(model)
+                .filter(
+                    model.image_url.like("/uploads/%"),
+                    model.image_variants_json.is_(None),
+                    model.id > after_id,
+                )
+                .order_by(model.id.asc())
+                .limit(min(chunk, budget - stats["seen"]))
+                .all()
+            )
+            if not rows:
+                break
+
+            for row in rows:
+                variants = generate_image_variants(row.image_url)
+                if variants:
+                    row.image_variants_json = json.dumps(variants, sort_keys=True)
+                    stats["recorded"] += 1
+                else:
+                    stats["skipped"] += 1
+            db.commit()
+
+            after_id = int(rows[-1].id)
+            stats["seen"] += len(rows)
+            stats["chunks"] += 1
+            if len(rows) < chunk:
+                break
+
+    return stats
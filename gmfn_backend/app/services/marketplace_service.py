@@ -11,6 +11,10 @@ from app.db.models import (
     MarketplaceProduct,
     MarketplaceShop,
 )
+from app.services.marketplace_image_variants import (
+    enqueue_image_variant_job,
+    record_known_image_variants,
+)
 
 
 def utcnow() -> datetime:
@@ -131,10 +135,12 @@ def create_product(
         currency=normalized_currency,
         image_url=image_url.strip() if image_url else None,
     )
+    record_known_image_variants(product)
 
     db.add(product)
     db.commit()
     db.refresh(product)
+    enqueue_image_variant_job(db, product)
     return product
 
 
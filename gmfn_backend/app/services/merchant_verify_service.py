@@ -14,6 +14,7 @@ from typing import Any, Dict, Optional, Tuple
 from sqlalchemy.orm import Session
 
 from app.db.models import TrustEvent
+from app.services.trust_events_services import fold_event_into_trust_graph, log_trust_event
 
 
 # Event types (append-only evidence)
@@ -148,18 +149,15 @@ def build_merchant_verify_link(
         "level": str(level),
         "expires_at": exp.isoformat(),
     }
-    db.add(
-        TrustEvent(
-            event_type=EV_MERCHANT_LINK_CREATED,
-            clan_id=None,
-            loan_id=0,
-            guarantor_id=None,
-            actor_user_id=int(user_id),
-            subject_user_id=int(user_id),
-            meta_json=json.dumps(meta),
-        )
+    log_trust_event(
+        db,
+        event_type=EV_MERCHANT_LINK_CREATED,
+        clan_id=None,
+        actor_user_id=int(user_id),
+        subject_user_id=int(user_id),
+        meta=meta,
+        refresh=False,
     )
-    db.commit()
 
     return token, path, link_id, pack_id, ttl_hours
 
@@ -215,16 +213,20 @@ def mark_token_used(db: Session, *, actor_user_id: int, subject_user_id: int, jt
         "jti": jti,
         "link_id": link_id,
         "pack_id": pack_id,
+        "system": int(actor_user_id) <= 0,
     }
-    db.add(
-        TrustEvent(
-            event_type=EV_MERCHANT_TOKEN_USED,
-            clan_id=None,
-            loan_id=0,
-            guarantor_id=None,
-            actor_user_id=int(actor_user_id),
-            subject_user_id=int(subject_user_id),
-            meta_json=json.dumps(meta),
-        )
+    # Written directly rather than through log_trust_event: a public verify
+    # has no signed-in actor (actor 0) and the token may carry no uid.
+    event = TrustEvent(
+        event_type=EV_MERCHANT_TOKEN_USED,
+        clan_id=None,
+        loan_id=0,
+        guarantor_id=None,
+        actor_user_id=int(actor_user_id),
+        subject_user_id=int(subject_user_id),
+        meta_json=json.dumps(meta),
     )
+    db.add(event)
+    db.flush()
+    fold_event_into_trust_graph(db, event)
     db.commit()
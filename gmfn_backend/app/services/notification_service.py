@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 from urllib.parse import parse_qs, urlparse
 
 from sqlalchemy.orm import Session
@@ -52,6 +52,7 @@ def create_notification(
         db.commit()
         if refresh:
             db.refresh(row)
+        _publish_to_streams(db, created=[row])
         try:
             dispatch_web_push_for_notification(db, row)
         except Exception:
@@ -61,6 +62,18 @@ def create_notification(
     return row
 
 
+def _publish_to_streams(
+    db: Session,
+    *,
+    created: Iterable[Notification] = (),
+    read: Iterable[Notification] = (),
+) -> None:
+    # Local import: the stream service builds its items from this module.
+    from app.services.notification_stream_service import publish_notifications
+
+    publish_notifications(db, created=created, read=read)
+
+
 def _community_code(clan_id: int) -> str:
     return f"GMFN-C-{int(clan_id):06d}"
 
@@ -86,15 +99,7 @@ def _join_request_id_from_action_url(action_url: Any) -> int:
     return 0
 
 
-def _join_request_status_for_notification(
-    db: Session,
-    notification: Notification,
-) -> Dict[str, Any]:
-    request_id = _join_request_id_from_action_url(notification.action_url)
-    if request_id <= 0:
-        return {}
-
-    join_request = db.get(ClanJoinRequest, int(request_id))
+def _join_request_status_payload(request_id: int, join_request: ClanJoinRequest | None) -> Dict[str, Any]:
     if not join_request:
         return {
             "join_request_id": int(request_id),
@@ -110,6 +115,62 @@ def _join_request_status_for_notification(
     }
 
 
+def _join_request_statuses_for_notifications(
+    db: Session,
+    notifications: List[Notification],
+) -> Dict[int, Dict[str, Any]]:
+    """Join-request status per approval notification id, read in one query."""
+    request_ids = {
+        int(row.id): _join_request_id_from_action_url(row.action_url)
+        for row in notifications
+        if str(row.kind) == "approval_request"
+    }
+    request_ids = {nid: rid for nid, rid in request_ids.items() if rid > 0}
+    if not request_ids:
+        return {}
+
+    join_requests = {
+        int(join_request.id): join_request
+        for join_request in db.query(ClanJoinRequest)
+        .filter(ClanJoinRequest.id.in_(sorted(set(request_ids.values()))))
+        .all()
+    }
+    return {
+        nid: _join_request_status_payload(rid, join_requests.get(rid))
+        for nid, rid in request_ids.items()
+    }
+
+
+def notification_item(row: Notification) -> Dict[str, Any]:
+    normalized_action_url, normalized_action_label = normalize_notification_action(
+        kind=row.kind,
+        title=row.title,
+        message=row.message,
+        action_url=row.action_url,
+        action_label=row.action_label,
+    )
+    return {
+        "id": int(row.id),
+        "kind": str(row.kind),
+        "title": str(row.title),
+        "message": str(row.message),
+        "action_url": normalized_action_url,
+        "action_label": normalized_action_label,
+        "is_read": bool(row.is_read),
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "read_at": row.read_at.isoformat() if row.read_at else None,
+    }
+
+
+def notification_items(db: Session, rows: List[Notification]) -> List[Dict[str, Any]]:
+    """Items as /notifications/me serves them: approval requests carry their join-request status."""
+    join_statuses = _join_request_statuses_for_notifications(db, rows)
+    return [
+        {**notification_item(row), **join_statuses.get(int(row.id), {})}
+        for row in rows
+    ]
+
+
 def _notification_text(
     *,
     kind: Any,
@@ -228,15 +289,17 @@ def ensure_join_review_notifications(
     active_clan_ids = [int(membership.clan_id) for membership, _clan in memberships]
     clan_by_id = {int(clan.id): clan for membership, clan in memberships}
 
-    retired = _retire_stale_join_review_notifications(
+    retired_rows = _retire_stale_join_review_notifications(
         db,
         reviewer_user_id=int(reviewer_user.id),
         active_clan_ids=active_clan_ids,
     )
+    retired = len(retired_rows)
 
     if not memberships:
         if retired:
             db.commit()
+            _publish_to_streams(db, read=retired_rows)
         return {"ok": True, "created": 0, "retired": int(retired)}
 
     pending_requests = (
@@ -249,7 +312,7 @@ def ensure_join_review_notifications(
         .all()
     )
 
-    created = 0
+    created_rows: List[Notification] = []
 
     for join_request in pending_requests:
         if int(join_request.applicant_user_id or 0) == int(reviewer_user.id):
@@ -291,7 +354,7 @@ def ensure_join_review_notifications(
             or "A pending applicant"
         )
 
-        create_notification(
+        row = create_notification(
             db,
             user_id=int(reviewer_user.id),
             kind="approval_request",
@@ -305,10 +368,12 @@ def ensure_join_review_notifications(
             commit=False,
             refresh=False,
         )
-        created += 1
+        created_rows.append(row)
 
+    created = len(created_rows)
     if created or retired:
         db.commit()
+        _publish_to_streams(db, created=created_rows, read=retired_rows)
 
     return {"ok": True, "created": int(created), "retired": int(retired)}
 
@@ -318,7 +383,7 @@ def _retire_stale_join_review_notifications(
     *,
     reviewer_user_id: int,
     active_clan_ids: List[int],
-) -> int:
+) -> List[Notification]:
     active_ids = {int(clan_id) for clan_id in active_clan_ids}
     rows = (
         db.query(Notification)
@@ -330,7 +395,7 @@ def _retire_stale_join_review_notifications(
         .all()
     )
 
-    retired = 0
+    retired: List[Notification] = []
     now = _now_utc()
 
     for row in rows:
@@ -355,9 +420,9 @@ def _retire_stale_join_review_notifications(
         row.is_read = True
         row.read_at = now
         db.add(row)
-        retired += 1
+        retired.append(row)
 
-    return int(retired)
+    return retired
 
 
 def list_my_notifications(
@@ -378,36 +443,8 @@ def list_my_notifications(
 
     rows = q.limit(int(max(1, min(limit, 200)))).all()
 
-    items: List[Dict[str, Any]] = []
-    for r in rows:
-        normalized_action_url, normalized_action_label = normalize_notification_action(
-            kind=r.kind,
-            title=r.title,
-            message=r.message,
-            action_url=r.action_url,
-            action_label=r.action_label,
-        )
-        items.append(
-            {
-                "id": int(r.id),
-                "kind": str(r.kind),
-                "title": str(r.title),
-                "message": str(r.message),
-                "action_url": normalized_action_url,
-                "action_label": normalized_action_label,
-                "is_read": bool(r.is_read),
-                "created_at": r.created_at.isoformat() if r.created_at else None,
-                "read_at": r.read_at.isoformat() if r.read_at else None,
-                **(
-                    _join_request_status_for_notification(db, r)
-                    if str(r.kind) == "approval_request"
-                    else {}
-                ),
-            }
-        )
-
     return {
-        "items": items,
+        "items": notification_items(db, rows),
         "total": len(rows),
     }
 
@@ -450,6 +487,7 @@ def mark_notification_read(
         db.add(row)
         db.commit()
         db.refresh(row)
+        _publish_to_streams(db, read=[row])
 
     return row
 
@@ -0,0 +1,278 @@
+# app/services/notification_stream_service.py
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func, inspect
+from sqlalchemy.orm import Session
+
+from app.db.notification_models import Notification
+from app.services.notification_service import get_unread_count, notification_items
+
+
+NOTIFICATION_STREAM_HEARTBEAT_SECONDS = 15.0
+NOTIFICATION_STREAM_RETRY_MS = 5000
+# A subscriber that falls this far behind is closed; the client reconnects
+# with Last-Event-ID and replays from the table.
+NOTIFICATION_STREAM_QUEUE_SIZE = 100
+NOTIFICATION_STREAM_REPLAY_LIMIT = 100
+
+
+class _Subscriber:
+    def __init__(self, user_id: int, loop: asyncio.AbstractEventLoop) -> None:
+        self.user_id = int(user_id)
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=NOTIFICATION_STREAM_QUEUE_SIZE)
+        self.overflowed = False
+
+    def _put(self, event: Dict[str, Any]) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class NotificationBus:
+    """
+    In-process publish/subscribe for notification events. Publishers may be
+    on any thread (sync route handlers, workers); each subscriber receives
+    events on its own event loop.
+
+    The bus is single-process: a notification committed by another worker
+    process or a cron job reaches no stream here. The notifications table
+    stays the source of truth; clients resync from /notifications/me when
+    they reconnect. Fanning out across processes needs Postgres
+    LISTEN/NOTIFY or Redis pub/sub behind publish_notifications.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: Dict[int, Set[_Subscriber]] = {}
+
+    def subscribe(self, user_id: int) -> _Subscriber:
+        subscriber = _Subscriber(int(user_id), asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(int(user_id), set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: _Subscriber) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscriber.user_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscriber)
+            if not subscribers:
+                self._subscribers.pop(subscriber.user_id, None)
+
+    def has_subscribers(self, user_id: int) -> bool:
+        with self._lock:
+            return bool(self._subscribers.get(int(user_id)))
+
+    def subscribed_user_ids(self) -> Set[int]:
+        with self._lock:
+            return {user_id for user_id, subscribers in self._subscribers.items() if subscribers}
+
+    def publish(self, user_id: int, event: Dict[str, Any]) -> int:
+        with self._lock:
+            subscribers = list(self._subscribers.get(int(user_id), ()))
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber._put, event)
+            except RuntimeError:
+                # The subscriber's loop has closed.
+                self.unsubscribe(subscriber)
+        return len(subscribers)
+
+
+notification_bus = NotificationBus()
+
+
+def _unread_counts(db: Session, user_ids: List[int]) -> Dict[int, int]:
+    rows = (
+        db.query(Notification.user_id, func.count(Notification.id))
+        .filter(
+            Notification.user_id.in_(sorted(user_ids)),
+            Notification.is_read == False,  # noqa: E712
+        )
+        .group_by(Notification.user_id)
+        .all()
+    )
+    counts = {int(user_id): 0 for user_id in user_ids}
+    counts.update({int(user_id): int(count) for user_id, count in rows})
+    return counts
+
+
+def _row_ids(rows: Iterable[Notification]) -> Set[int]:
+    # The identity survives the commit that expired the row, so no reload.
+    ids = set()
+    for row in rows:
+        identity = inspect(row).identity if row is not None else None
+        if identity:
+            ids.add(int(identity[0]))
+    return ids
+
+
+def publish_notifications(
+    db: Session,
+    *,
+    created: Iterable[Notification] = (),
+    read: Iterable[Notification] = (),
+    bus: Optional[NotificationBus] = None,
+) -> None:
+    """
+    Push the notifications a commit created, and the ones it marked read,
+    to the streams open in this process: each new item, then the
+    recipient's unread change. Call it after the commit. Nothing is read
+    unless a recipient has a stream open here.
+    """
+    bus = bus or notification_bus
+    listening = bus.subscribed_user_ids()
+    if not listening:
+        return
+    created_ids = _row_ids(created)
+    read_ids = _row_ids(read)
+    if not created_ids and not read_ids:
+        return
+
+    try:
+        rows = (
+            db.query(Notification)
+            .filter(
+                Notification.id.in_(sorted(created_ids | read_ids)),
+                Notification.user_id.in_(sorted(listening)),
+            )
+            .order_by(Notification.id.asc())
+            .all()
+        )
+        new_rows = [row for row in rows if int(row.id) in created_ids]
+        deltas: Dict[int, int] = {}
+        for row, item in zip(new_rows, notification_items(db, new_rows)):
+            bus.publish(int(row.user_id), {"type": "notification", "item": item})
+            if not row.is_read:
+                deltas[int(row.user_id)] = deltas.get(int(row.user_id), 0) + 1
+        for row in rows:
+            if int(row.id) in read_ids:
+                deltas[int(row.user_id)] = deltas.get(int(row.user_id), 0) - 1
+
+        changed = [user_id for user_id, delta in deltas.items() if delta]
+        counts = _unread_counts(db, changed) if changed else {}
+    except Exception:
+        # Streams are best-effort; the client resyncs from /notifications/me.
+        return
+
+    for user_id in changed:
+        bus.publish(
+            user_id,
+            {"type": "unread", "delta": deltas[user_id], "unread_count": counts.get(user_id)},
+        )
+
+
+def _sse(event: str, data: Any, *, event_id: Optional[int] = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {int(event_id)}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'), default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def parse_last_event_id(value: Any) -> Optional[int]:
+    raw = str(value or "").strip()
+    if not raw.isdigit():
+        return None
+    return int(raw)
+
+
+def _notifications_after(db: Session, *, user_id: int, after_id: int) -> List[Notification]:
+    return (
+        db.query(Notification)
+        .filter(
+            Notification.user_id == int(user_id),
+            Notification.id > int(after_id),
+        )
+        .order_by(Notification.id.asc())
+        .limit(NOTIFICATION_STREAM_REPLAY_LIMIT)
+        .all()
+    )
+
+
+def _stream_snapshot(
+    session_factory: Callable[[], Session],
+    *,
+    user_id: int,
+    last_event_id: Optional[int],
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Backlog after last_event_id and the unread count. Read-only."""
+    with session_factory() as db:
+        items: List[Dict[str, Any]] = []
+        if last_event_id is not None:
+            rows = _notifications_after(db, user_id=int(user_id), after_id=int(last_event_id))
+            items = notification_items(db, rows)
+        unread = int(get_unread_count(db, user_id=int(user_id))["unread_count"])
+    return items, unread
+
+
+async def notification_event_stream(
+    *,
+    user_id: int,
+    last_event_id: Optional[int] = None,
+    session_factory: Optional[Callable[[], Session]] = None,
+    is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    heartbeat_seconds: float = NOTIFICATION_STREAM_HEARTBEAT_SECONDS,
+    bus: Optional[NotificationBus] = None,
+) -> AsyncIterator[str]:
+    """
+    Server-sent events for one user: notifications missed since
+    last_event_id, the current unread count, then the notifications and
+    unread changes published in this process as they are committed.
+    Notification events carry the notification id as the SSE id, so a
+    reconnect resumes where it left off. Heartbeats only keep the
+    connection open; they do not read the table.
+    """
+    if session_factory is None:
+        from app.db.database import SessionLocal as session_factory
+
+    bus = bus or notification_bus
+    # Subscribe before reading the backlog so nothing committed in between
+    # is missed; anything seen twice is dropped by id.
+    subscriber = bus.subscribe(int(user_id))
+    try:
+        yield f"retry: {NOTIFICATION_STREAM_RETRY_MS}\n\n"
+
+        backlog, unread = await asyncio.to_thread(
+            _stream_snapshot,
+            session_factory,
+            user_id=int(user_id),
+            last_event_id=last_event_id,
+        )
+        sent_ids: Set[int] = {int(item["id"]) for item in backlog}
+        for item in backlog:
+            yield _sse("notification", item, event_id=int(item["id"]))
+        yield _sse("unread", {"delta": 0, "unread_count": unread})
+
+        while True:
+            if is_disconnected is not None and await is_disconnected():
+                return
+            if subscriber.overflowed and subscriber.queue.empty():
+                return
+            try:
+                published = await asyncio.wait_for(subscriber.queue.get(), timeout=heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+
+            if published["type"] == "notification":
+                item = published["item"]
+                if int(item["id"]) in sent_ids:
+                    continue
+                yield _sse("notification", item, event_id=int(item["id"]))
+            elif published["type"] == "unread":
+                yield _sse(
+                    "unread",
+                    {"delta": published["delta"], "unread_count": published["unread_count"]},
+                )
+    finally:
+        bus.unsubscribe(subscriber)
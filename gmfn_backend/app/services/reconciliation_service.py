@@ -184,6 +184,42 @@ def _find_expected_candidates(
     )
 
 
+_CandidateIndex = Dict[Tuple[str, str], List[ExpectedPayment]]
+
+
+def _preload_expected_candidates(
+    db: Session,
+    *,
+    clan_id: int,
+    events: List[BankEvent],
+    chunk_size: int = 500,
+) -> _CandidateIndex:
+    """
+    All ExpectedPayments the events could match, keyed by
+    (reference_normalized, currency) in id order: the per-event
+    _find_expected_candidates lookup done once for a whole batch.
+    """
+    refs = sorted({be.reference_normalized for be in events if be.reference_normalized})
+    index: _CandidateIndex = {}
+    for start in range(0, len(refs), chunk_size):
+        rows = (
+            db.query(ExpectedPayment)
+            .filter(ExpectedPayment.clan_id == int(clan_id))
+            .filter(ExpectedPayment.reference_normalized.in_(refs[start:start + chunk_size]))
+            .order_by(ExpectedPayment.id.asc())
+            .all()
+        )
+        for row in rows:
+            index.setdefault((row.reference_normalized, row.currency), []).append(row)
+    return index
+
+
+def _indexed_candidates(index: _CandidateIndex, be: BankEvent) -> List[ExpectedPayment]:
+    if not be.reference_normalized:
+        return []
+    return index.get((be.reference_normalized, (be.currency or "").upper()), [])
+
+
 def _select_expected_deterministically(
     *,
     candidates: List[ExpectedPayment],
@@ -252,6 +288,7 @@ def _create_credit(
     amount: Decimal,
     source_bank_event_id: int,
     dry_run: bool,
+    commit: bool = True,
 ) -> Optional[BankCredit]:
     amt = _q2(amount)
     if amt <= Decimal("0"):
@@ -267,19 +304,27 @@ def _create_credit(
         meta_json=None,
     )
 
-    db.add(row)
-    if not dry_run:
-        try:
+    if dry_run:
+        db.add(row)
+        return row
+
+    try:
+        if commit:
+            db.add(row)
             db.commit()
             db.refresh(row)
-        except IntegrityError:
+        else:
+            with db.begin_nested():
+                db.add(row)
+    except IntegrityError:
+        if commit:
             db.rollback()
-            existing = (
-                db.query(BankCredit)
-                .filter(BankCredit.source_bank_event_id == int(source_bank_event_id))
-                .first()
-            )
-            return existing
+        existing = (
+            db.query(BankCredit)
+            .filter(BankCredit.source_bank_event_id == int(source_bank_event_id))
+            .first()
+        )
+        return existing
     return row
 
 
@@ -394,6 +439,13 @@ def _maybe_apply_match(
         db.refresh(be)
 
 
+def _save_event_status(db: Session, be: BankEvent, *, commit: bool) -> None:
+    db.add(be)
+    if commit:
+        db.commit()
+        db.refresh(be)
+
+
 def reconcile_one_event(
     db: Session,
     *,
@@ -401,6 +453,8 @@ def reconcile_one_event(
     confirm_non_canonical: bool = True,
     canonical_only_match: bool = False,
     dry_run: bool = False,
+    commit: bool = True,
+    candidates: Optional[List[ExpectedPayment]] = None,
 ) -> BankEvent:
     """
     Deterministic reconciliation:
@@ -413,6 +467,10 @@ def reconcile_one_event(
     Apply:
     - partial payment supported via ExpectedPayment.paid_amount/remaining_amount
     - overpay stored as BankCredit
+
+    candidates, when given, replaces the ExpectedPayment lookup (see
+    _preload_expected_candidates). With commit=False every outcome is only
+    staged: the caller commits, then runs _maybe_apply_match for matches.
     """
     if _canonical_already_linked(be):
         return be
@@ -422,9 +480,7 @@ def reconcile_one_event(
         be.status_reason = "non_canonical_skipped"
         be.confidence = 0
         if not dry_run:
-            db.add(be)
-            db.commit()
-            db.refresh(be)
+            _save_event_status(db, be, commit=commit)
         return be
 
     if (be.direction or "").lower() != "credit":
@@ -432,17 +488,16 @@ def reconcile_one_event(
         be.status_reason = "non_credit_event_skipped"
         be.confidence = 0
         if not dry_run:
-            db.add(be)
-            db.commit()
-            db.refresh(be)
+            _save_event_status(db, be, commit=commit)
         return be
 
-    candidates = _find_expected_candidates(
-        db,
-        clan_id=int(be.clan_id),
-        reference_normalized=be.reference_normalized,
-        currency=be.currency,
-    )
+    if candidates is None:
+        candidates = _find_expected_candidates(
+            db,
+            clan_id=int(be.clan_id),
+            reference_normalized=be.reference_normalized,
+            currency=be.currency,
+        )
 
     exp, reason = _select_expected_deterministically(
         candidates=candidates,
@@ -454,9 +509,7 @@ def reconcile_one_event(
         be.status_reason = reason
         be.confidence = 0 if reason != "ambiguous_reference" else 1
         if not dry_run:
-            db.add(be)
-            db.commit()
-            db.refresh(be)
+            _save_event_status(db, be, commit=commit)
         return be
 
     _ensure_expected_remaining_initialized(exp)
@@ -466,9 +519,7 @@ def reconcile_one_event(
         be.status_reason = "expected_already_confirmed_elsewhere"
         be.confidence = 10 if be.canonical else 5
         if not dry_run:
-            db.add(be)
-            db.commit()
-            db.refresh(be)
+            _save_event_status(db, be, commit=commit)
         return be
 
     should_confirm = bool(be.canonical) or bool(confirm_non_canonical)
@@ -507,11 +558,14 @@ def reconcile_one_event(
             amount=excess,
             source_bank_event_id=int(be.id),
             dry_run=dry_run,
+            commit=commit,
         )
 
     if not dry_run:
         db.add(exp)
         db.add(be)
+        if not commit:
+            return be
         db.commit()
         db.refresh(be)
         db.refresh(exp)
@@ -520,6 +574,57 @@ def reconcile_one_event(
     return be
 
 
+def reconcile_events(
+    db: Session,
+    *,
+    clan_id: int,
+    events: List[BankEvent],
+    confirm_non_canonical: bool = True,
+    canonical_only_match: bool = False,
+    dry_run: bool = False,
+) -> List[str]:
+    """
+    Bulk form of reconcile_one_event for one clan's events, in the given
+    order. Candidates for the whole batch are read in one pass and every
+    outcome is committed in a single transaction; downstream application
+    then runs for each match, after the reconciliation truth is committed.
+    Earlier events see the in-memory effect of later ones exactly as in
+    the one-by-one path, since candidates are shared ORM rows.
+
+    Returns the resulting status of each event.
+    """
+    index = _preload_expected_candidates(db, clan_id=int(clan_id), events=events)
+    by_id = {int(exp.id): exp for rows in index.values() for exp in rows}
+
+    statuses: List[str] = []
+    matches: List[Tuple[BankEvent, ExpectedPayment]] = []
+    for be in events:
+        already_linked = _canonical_already_linked(be)
+        out = reconcile_one_event(
+            db,
+            be=be,
+            confirm_non_canonical=confirm_non_canonical,
+            canonical_only_match=canonical_only_match,
+            dry_run=dry_run,
+            commit=False,
+            candidates=_indexed_candidates(index, be),
+        )
+        status = (out.status or "").lower()
+        statuses.append(status)
+        if not already_linked and status in {"confirmed", "partial"} and out.expected_payment_id:
+            exp = by_id.get(int(out.expected_payment_id))
+            if exp is not None:
+                matches.append((out, exp))
+
+    if dry_run:
+        return statuses
+
+    db.commit()
+    for be, exp in matches:
+        _maybe_apply_match(db, be=be, exp=exp, dry_run=False)
+    return statuses
+
+
 def reconcile_batch(
     db: Session,
     *,
@@ -555,26 +660,23 @@ def reconcile_batch(
         "mismatch_flagged": 0,
         "duplicate": 0,
         "other": 0,
-        "last_event_id": None,
+        "last_event_id": int(rows[0].id) if rows else None,
         "dry_run": bool(dry_run),
         "confirm_non_canonical": bool(confirm_non_canonical),
         "canonical_only_match": bool(canonical_only_match),
     }
 
-    for r in rows:
-        stats["seen"] += 1
-        if stats["last_event_id"] is None:
-            stats["last_event_id"] = r.id
-
-        out = reconcile_one_event(
-            db,
-            be=r,
-            confirm_non_canonical=confirm_non_canonical,
-            canonical_only_match=canonical_only_match,
-            dry_run=dry_run,
-        )
+    statuses = reconcile_events(
+        db,
+        clan_id=int(clan_id),
+        events=rows,
+        confirm_non_canonical=confirm_non_canonical,
+        canonical_only_match=canonical_only_match,
+        dry_run=dry_run,
+    )
 
-        s = (out.status or "").lower()
+    for s in statuses:
+        stats["seen"] += 1
         if s == "confirmed":
             stats["confirmed"] += 1
         elif s == "partial":
@@ -590,4 +692,4 @@ def reconcile_batch(
         else:
             stats["other"] += 1
 
-    return stats
\ No newline at end of file
+    return stats
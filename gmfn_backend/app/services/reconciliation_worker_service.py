@@ -0,0 +1,269 @@
+# app/services/reconciliation_worker_service.py
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from sqlalchemy import and_, or_, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.db.bank_models import BankEvent
+from app.services.reconciliation_service import reconcile_events
+
+
+# Statuses that can still change on a later run. Linked (confirmed, partial,
+# matched_unconfirmed) and duplicate events are done.
+RECONCILE_PENDING_STATUSES = ("detected", "pending_match", "mismatch_flagged")
+
+RECONCILE_OUTCOME_STATUSES = (
+    "confirmed",
+    "partial",
+    "matched_unconfirmed",
+    "pending_match",
+    "mismatch_flagged",
+    "duplicate",
+)
+
+# First key of the two-int Postgres advisory lock; the second is the clan id.
+RECONCILE_LOCK_NAMESPACE = 0x474D
+
+_LOCAL_CLAN_LOCKS: Dict[int, threading.Lock] = {}
+_LOCAL_CLAN_LOCKS_GUARD = threading.Lock()
+
+
+def _now_utc() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def reconciliation_max_workers() -> int:
+    raw = str(os.getenv("GMFN_RECONCILE_MAX_WORKERS", "") or "").strip()
+    try:
+        value = int(raw) if raw else 4
+    except ValueError:
+        value = 4
+    return max(1, min(value, 32))
+
+
+def _pending_event_filter():
+    # Non-credit events are flagged deterministically, so only a fresh one
+    # is worth reading.
+    return and_(
+        BankEvent.status.in_(RECONCILE_PENDING_STATUSES),
+        BankEvent.expected_payment_id.is_(None),
+        or_(BankEvent.status == "detected", BankEvent.direction == "credit"),
+    )
+
+
+def list_clans_with_pending_bank_events(db: Session) -> List[int]:
+    rows = (
+        db.query(BankEvent.clan_id)
+        .filter(_pending_event_filter())
+        .distinct()
+        .order_by(BankEvent.clan_id.asc())
+        .all()
+    )
+    return [int(row[0]) for row in rows if row and row[0] is not None]
+
+
+def _empty_stats(clan_id: int) -> Dict[str, Any]:
+    stats: Dict[str, Any] = {
+        "clan_id": int(clan_id),
+        "seen": 0,
+        "chunks": 0,
+        "last_event_id": None,
+    }
+    for status in RECONCILE_OUTCOME_STATUSES:
+        stats[status] = 0
+    stats["other"] = 0
+    return stats
+
+
+def reconcile_pending_bank_events(
+    db: Session,
+    *,
+    clan_id: int,
+    max_events: int = 1000,
+    chunk_size: int = 200,
+    confirm_non_canonical: bool = True,
+    canonical_only_match: bool = False,
+) -> Dict[str, Any]:
+    """
+    Reconcile a clan's unreconciled BankEvents, oldest first.
+
+    Only events still in a pending status are read, through the status
+    indexes; each is handled at most once per call. Each chunk is matched
+    in bulk and committed in one transaction (see reconcile_events).
+    """
+    budget = max(1, int(max_events))
+    chunk = max(1, min(int(chunk_size), 2000))
+    stats = _empty_stats(clan_id)
+    after_id = 0
+
+    while stats["seen"] < budget:
+        rows = (
+            db.query(BankEvent)
+            .filter(
+                BankEvent.clan_id == int(clan_id),
+                _pending_event_filter(),
+                BankEvent.id > after_id,
+            )
+            .order_by(BankEvent.id.asc())
+            .limit(min(chunk, budget - stats["seen"]))
+            .all()
+        )
+        if not rows:
+            break
+
+        after_id = int(rows[-1].id)
+        statuses = reconcile_events(
+            db,
+            clan_id=int(clan_id),
+            events=rows,
+            confirm_non_canonical=confirm_non_canonical,
+            canonical_only_match=canonical_only_match,
+        )
+        for status in statuses:
+            if status in RECONCILE_OUTCOME_STATUSES:
+                stats[status] += 1
+            else:
+                stats["other"] += 1
+
+        stats["seen"] += len(rows)
+        stats["chunks"] += 1
+        stats["last_event_id"] = after_id
+        if len(rows) < chunk:
+            break
+
+    return stats
+
+
+def _local_clan_lock(clan_id: int) -> threading.Lock:
+    with _LOCAL_CLAN_LOCKS_GUARD:
+        lock = _LOCAL_CLAN_LOCKS.get(int(clan_id))
+        if lock is None:
+            lock = _LOCAL_CLAN_LOCKS[int(clan_id)] = threading.Lock()
+        return lock
+
+
+@contextmanager
+def _clan_lock(bind: Engine, clan_id: int) -> Iterator[bool]:
+    """
+    Yields True when this worker owns the clan. The in-process lock covers
+    pool threads; on Postgres a session advisory lock, held on a dedicated
+    connection, covers other worker processes.
+    """
+    local = _local_clan_lock(clan_id)
+    if not local.acquire(blocking=False):
+        yield False
+        return
+
+    try:
+        if bind.dialect.name != "postgresql":
+            yield True
+            return
+
+        params = {"ns": RECONCILE_LOCK_NAMESPACE, "clan_id": int(clan_id)}
+        with bind.connect() as conn:
+            acquired = bool(
+                conn.execute(text("SELECT pg_try_advisory_lock(:ns, :clan_id)"), params).scalar()
+            )
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    conn.execute(text("SELECT pg_advisory_unlock(:ns, :clan_id)"), params)
+    finally:
+        local.release()
+
+
+def run_reconciliation_pass(
+    *,
+    session_factory: Optional[Callable[[], Session]] = None,
+    max_workers: Optional[int] = None,
+    max_events_per_clan: int = 1000,
+    chunk_size: int = 200,
+    confirm_non_canonical: bool = True,
+) -> Dict[str, Any]:
+    """
+    One worker pass: every clan with unreconciled events is reconciled on a
+    thread pool, each clan in its own session and under its own lock, so a
+    clan is never processed twice at once. A failing clan is rolled back
+    and reported without stopping the others. Returns per-run throughput
+    metrics with per-clan detail.
+    """
+    if session_factory is None:
+        from app.db.database import SessionLocal as session_factory
+
+    started_at = _now_utc()
+    started = time.perf_counter()
+
+    with session_factory() as db:
+        clan_ids = list_clans_with_pending_bank_events(db)
+        bind = db.get_bind()
+
+    workers = min(int(max_workers or reconciliation_max_workers()), max(1, len(clan_ids)))
+    if bind.dialect.name == "sqlite":
+        # SQLite serialises writers; parallel clans would only contend.
+        workers = 1
+
+    def run_clan(clan_id: int) -> Dict[str, Any]:
+        clan_started = time.perf_counter()
+        with _clan_lock(bind, clan_id) as acquired:
+            if not acquired:
+                return {"clan_id": int(clan_id), "result": "locked", "seen": 0}
+
+            with session_factory() as db:
+                try:
+                    out = reconcile_pending_bank_events(
+                        db,
+                        clan_id=int(clan_id),
+                        max_events=max_events_per_clan,
+                        chunk_size=chunk_size,
+                        confirm_non_canonical=confirm_non_canonical,
+                    )
+                except Exception as exc:
+                    db.rollback()
+                    out = {
+                        "clan_id": int(clan_id),
+                        "result": "failed",
+                        "seen": 0,
+                        "error": f"{type(exc).__name__}: {str(exc)[:200]}",
+                    }
+                else:
+                    out["result"] = "ok"
+
+        out["duration_ms"] = int((time.perf_counter() - clan_started) * 1000)
+        return out
+
+    if workers <= 1:
+        clans = [run_clan(clan_id) for clan_id in clan_ids]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gmfn-reconcile") as pool:
+            clans = list(pool.map(run_clan, clan_ids))
+
+    elapsed = time.perf_counter() - started
+    events_seen = sum(int(c.get("seen") or 0) for c in clans)
+    outcomes = {
+        status: sum(int(c.get(status) or 0) for c in clans)
+        for status in (*RECONCILE_OUTCOME_STATUSES, "other")
+    }
+
+    return {
+        "started_at": started_at.isoformat(),
+        "duration_ms": int(elapsed * 1000),
+        "workers": workers,
+        "clans_total": len(clan_ids),
+        "clans_ok": sum(1 for c in clans if c["result"] == "ok"),
+        "clans_locked": sum(1 for c in clans if c["result"] == "locked"),
+        "clans_failed": sum(1 for c in clans if c["result"] == "failed"),
+        "events_seen": events_seen,
+        "events_per_second": round(events_seen / elapsed, 2) if elapsed > 0 else 0.0,
+        "outcomes": outcomes,
+        "clans": clans,
+    }
@@ -14,6 +14,7 @@ from app.db.notification_models import Notification
 from app.services.expected_payments_service import create_expected_payment
 from app.services.feature_entitlements_service import get_active_feature_quantity
 from app.services.notification_service import create_notification
+from app.services.notification_stream_service import publish_notifications
 from app.services.payment_instruction_service import FEATURE_ROSCA_CYCLE
 from app.services.trust_events_services import log_trust_event
 
@@ -127,7 +128,7 @@ def _notify_once(
     message: str,
     action_url: Optional[str] = None,
     action_label: Optional[str] = None,
-) -> bool:
+) -> Optional[Notification]:
     existing = (
         db.query(Notification)
         .filter(Notification.user_id == int(user_id))
@@ -136,8 +137,8 @@ def _notify_once(
         .first()
     )
     if existing:
-        return False
-    create_notification(
+        return None
+    return create_notification(
         db,
         user_id=int(user_id),
         kind=str(kind),
@@ -148,7 +149,6 @@ def _notify_once(
         commit=False,
         refresh=False,
     )
-    return True
 
 
 def _dashboard_focus_url(*, cycle_id: str, round_number: Optional[int] = None) -> str:
@@ -548,9 +548,9 @@ def notify_rosca_contribution_confirmed(
     if not cycle_id or round_number <= 0:
         return {"ok": True, "created": 0, "reason": "missing_cycle_or_round"}
 
-    created = 0
+    created: List[Notification] = []
     title = str(meta.get("rosca_cycle_title") or "ROSCA cycle").strip()
-    created += int(
+    created.append(
         _notify_once(
             db,
             user_id=int(exp.user_id),
@@ -594,7 +594,7 @@ def notify_rosca_contribution_confirmed(
         if payout_user_id > 0:
             recipients.append(payout_user_id)
         for recipient_user_id in dict.fromkeys(recipients):
-            created += int(
+            created.append(
                 _notify_once(
                     db,
                     user_id=int(recipient_user_id),
@@ -613,7 +613,9 @@ def notify_rosca_contribution_confirmed(
                 )
             )
 
-    return {"ok": True, "created": created}
+    # The caller commits, then passes "notifications" to publish_notifications.
+    notifications = [row for row in created if row is not None]
+    return {"ok": True, "created": len(notifications), "notifications": notifications}
 
 
 def create_rosca_cycle(
@@ -779,8 +781,9 @@ def create_rosca_cycle(
         refresh=False,
     )
 
+    notified: List[Notification] = []
     for member_user_id in members:
-        _notify_once(
+        row = _notify_once(
             db,
             user_id=int(member_user_id),
             kind="rosca.cycle_started",
@@ -792,8 +795,11 @@ def create_rosca_cycle(
             action_url=_dashboard_focus_url(cycle_id=cycle_id),
             action_label="Open Focus",
         )
+        if row is not None:
+            notified.append(row)
 
     db.commit()
+    publish_notifications(db, created=notified)
     return get_rosca_cycle(db, clan_id=int(clan_id), cycle_id=cycle_id) or {
         "cycle_id": cycle_id,
         "status": "created",
@@ -857,7 +863,7 @@ def record_rosca_payout(
         refresh=False,
     )
 
-    _notify_once(
+    notification = _notify_once(
         db,
         user_id=int(payout_user_id),
         kind="rosca.payout_recorded",
@@ -874,5 +880,6 @@ def record_rosca_payout(
     )
 
     db.commit()
+    publish_notifications(db, created=[notification])
 
     return get_rosca_cycle(db, clan_id=int(clan_id), cycle_id=str(cycle_id)) or cycle
@@ -0,0 +1,152 @@
+# app/services/share_card_cache.py
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CachedShareCard:
+    key: str
+    content: bytes
+    last_modified: datetime
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.key}"'
+
+
+def share_card_cache_key(inputs: dict[str, Any]) -> str:
+    """
+    Content address for a rendered card: a hash of every input that changes
+    the pixels (text fields, labels, template version). Equal inputs always
+    map to the same file and the same ETag.
+    """
+    raw = json.dumps(inputs, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ShareCardCache:
+    """
+    Rendered share cards on local disk, keyed by share_card_cache_key.
+
+    Writes are atomic (temp file + rename) so concurrent workers never serve a
+    partial PNG. A hit refreshes the file's access time; once the directory
+    grows past max_bytes the least recently used cards are deleted. Every disk
+    error degrades to "not cached" so a full or read-only disk never breaks the
+    card endpoints.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.root = Path(root)
+        self.max_bytes = max(1, int(max_bytes))
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.png"
+
+    def get(self, key: str) -> Optional[CachedShareCard]:
+        path = self._path(key)
+        try:
+            stat = path.stat()
+            content = path.read_bytes()
+            os.utime(path, (datetime.now(timezone.utc).timestamp(), stat.st_mtime))
+        except OSError:
+            return None
+        return CachedShareCard(
+            key=key,
+            content=content,
+            last_modified=datetime.fromtimestamp(int(stat.st_mtime), tz=timezone.utc),
+        )
+
+    def put(self, key: str, content: bytes) -> CachedShareCard:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(content)
+                os.replace(tmp_name, path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+                raise
+            modified = path.stat().st_mtime
+            self._evict()
+        except OSError:
+            modified = datetime.now(timezone.utc).timestamp()
+
+        return CachedShareCard(
+            key=key,
+            content=content,
+            last_modified=datetime.fromtimestamp(int(modified), tz=timezone.utc),
+        )
+
+    def get_or_render(self, key: str, render: Callable[[], bytes]) -> CachedShareCard:
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        return self.put(key, render())
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries: list[tuple[float, int, Path]] = []
+            total = 0
+            for path in self.root.glob("*/*.png"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_atime, stat.st_size, path))
+                total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            for _atime, size, path in sorted(entries):
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+
+_CACHES: dict[tuple[str, int], ShareCardCache] = {}
+
+
+def get_share_card_cache() -> ShareCardCache:
+    """
+    GMFN_SHARE_CARD_CACHE_DIR: directory for rendered cards (default: a
+    gmfn_share_cards folder in the system temp dir).
+    GMFN_SHARE_CARD_CACHE_MAX_MB: size bound before eviction (default 64).
+    """
+    raw_dir = str(os.getenv("GMFN_SHARE_CARD_CACHE_DIR", "") or "").strip()
+    root = Path(raw_dir).expanduser() if raw_dir else Path(tempfile.gettempdir()) / "gmfn_share_cards"
+
+    raw_max = str(os.getenv("GMFN_SHARE_CARD_CACHE_MAX_MB", "") or "").strip()
+    try:
+        max_bytes = int(float(raw_max) * 1024 * 1024) if raw_max else DEFAULT_MAX_BYTES
+    except ValueError:
+        max_bytes = DEFAULT_MAX_BYTES
+
+    cache_key = (str(root), max_bytes)
+    cache = _CACHES.get(cache_key)
+    if cache is None:
+        cache = ShareCardCache(root, max_bytes=max_bytes)
+        _CACHES[cache_key] = cache
+    return cache
@@ -3,14 +3,28 @@
 from __future__ import annotations
 
 import json
+import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.db.models import TrustEvent
+from app.services.community_domain_payload_cache import bump_community_domain_change_version
+from app.services.invite_analytics_service import (
+    INVITE_ROLLUP_EVENT_TYPES,
+    fold_trust_event_into_invite_rollups,
+    request_invite_rollup_rebuild,
+)
+from app.services.trust_graph_service import (
+    fold_trust_event_into_graph,
+    request_trust_graph_rebuild,
+)
 
 
+logger = logging.getLogger(__name__)
+
 PROTOCOL_VERSION = "GMFN_PROTOCOL_v1"
 
 
@@ -123,6 +137,12 @@ def log_trust_event(
     )
 
     db.add(event)
+    db.flush()
+    fold_event_into_trust_graph(db, event)
+    fold_event_into_invite_rollups(db, event)
+    if isinstance(meta, dict) and meta.get("community_domain_id") is not None:
+        # Domain notices, activities and outcomes change that domain's payloads.
+        bump_community_domain_change_version(db, meta["community_domain_id"])
 
     if commit:
         db.commit()
@@ -133,6 +153,46 @@ def log_trust_event(
     return event
 
 
+def fold_event_into_trust_graph(db: Session, event: TrustEvent) -> None:
+    """
+    Keep the materialized trust graph current as events are written.
+
+    Runs in a savepoint so a concurrent edge insert cannot fail the event
+    itself. A failed fold is logged and flags the edge store for a rebuild
+    (rebuild_trust_graph_edges --if-requested).
+    """
+    try:
+        with db.begin_nested():
+            fold_trust_event_into_graph(db, event)
+    except SQLAlchemyError:
+        logger.exception("trust graph fold failed for TrustEvent %s", event.id)
+        _request_rebuild(db, request_trust_graph_rebuild, event_id=int(event.id))
+
+
+def fold_event_into_invite_rollups(db: Session, event: TrustEvent) -> None:
+    """
+    Keep the daily invite analytics rollups current as invite events are
+    written. Same savepoint contract as the trust graph fold; a failure flags
+    the event's clan for rebuild_invite_analytics_rollups --if-requested.
+    """
+    if event.event_type not in INVITE_ROLLUP_EVENT_TYPES or event.clan_id is None:
+        return
+    try:
+        with db.begin_nested():
+            fold_trust_event_into_invite_rollups(db, event)
+    except SQLAlchemyError:
+        logger.exception("invite rollup fold failed for TrustEvent %s", event.id)
+        _request_rebuild(db, request_invite_rollup_rebuild, clan_id=int(event.clan_id))
+
+
+def _request_rebuild(db: Session, request, **kwargs: Any) -> None:
+    try:
+        with db.begin_nested():
+            request(db, **kwargs)
+    except SQLAlchemyError:
+        logger.exception("could not record rebuild request %s", kwargs)
+
+
 # =========================
 # SPECIALIZED HELPERS
 # =========================
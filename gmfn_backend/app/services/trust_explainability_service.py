@@ -7,6 +7,7 @@ from typing import Any, Dict, Iterable, List, Optional
 from sqlalchemy.orm import Session
 
 from app.db.models import TrustEvent, User
+from app.services.trust_events_services import log_trust_event
 
 
 def _to_decimal(value: Any) -> Decimal:
@@ -232,7 +233,8 @@ def log_trust_event_with_meta(
     payload["delta"] = str(_to_decimal(delta))
     payload = _normalize_meta(payload)
 
-    event = TrustEvent(
+    return log_trust_event(
+        db,
         event_type=event_type,
         clan_id=clan_id,
         loan_id=loan_id,
@@ -240,8 +242,6 @@ def log_trust_event_with_meta(
         actor_user_id=int(actor_user_id),
         subject_user_id=int(subject_user_id),
         meta=payload,
+        commit=False,
+        refresh=False,
     )
-
-    db.add(event)
-    db.flush()
-    return event
@@ -6,11 +6,27 @@ from decimal import Decimal
 import json
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from sqlalchemy import String, cast, false, or_
+from sqlalchemy import String, cast, false, func, insert, or_, select, text, union
 from sqlalchemy.orm import Session
 
-from app.db.models import ClanMembership, Loan, LoanGuarantor, TrustEvent, User
+from app.db.models import (
+    ClanMembership,
+    Loan,
+    LoanGuarantor,
+    TrustEvent,
+    TrustGraphEdge,
+    User,
+)
 from app.services.cci_service import compute_cci_from_summary
+from app.services.maintenance_checkpoint_service import save_checkpoint
+
+
+# A stored edge keeps only its most recent supporting event ids; event_count
+# carries the full total.
+TRUST_EDGE_SUPPORTING_EVENT_IDS_LIMIT = 50
+
+# Set when an incremental fold fails; cleared by a full rebuild.
+TRUST_GRAPH_REBUILD_JOB_KEY = "trust_graph_edges.rebuild_requested"
 
 
 def _now_utc() -> datetime:
@@ -344,45 +360,69 @@ def _build_edge(
     }
 
 
-def _loan_borrower_user_id(db: Session, loan_id: Optional[int]) -> int:
-    if not loan_id:
-        return 0
-    loan = db.get(Loan, int(loan_id))
-    if not loan:
-        return 0
-    return _safe_int(getattr(loan, "borrower_user_id", None), 0)
+class _LoanParticipants:
+    """
+    Per-call cache of loan borrower / approved guarantor ids.
 
+    Edge extraction needs both for most loan events; preloading a whole chunk
+    of loan ids turns the per-event lookups into two set-based queries.
+    """
 
-def _loan_guarantor_user_ids(db: Session, loan_id: Optional[int]) -> List[int]:
-    if not loan_id:
-        return []
+    def __init__(self, db: Session) -> None:
+        self.db = db
+        self._borrowers: Dict[int, int] = {}
+        self._guarantors: Dict[int, List[int]] = {}
 
-    rows = (
-        db.query(LoanGuarantor)
-        .filter(LoanGuarantor.loan_id == int(loan_id))
-        .filter(LoanGuarantor.status == "approved")
-        .all()
-    )
+    def preload(self, loan_ids: Iterable[int]) -> None:
+        missing = sorted(
+            {int(x) for x in loan_ids if _safe_int(x) > 0} - set(self._borrowers)
+        )
+        if not missing:
+            return
 
-    out: List[int] = []
-    seen: Set[int] = set()
+        for loan_id in missing:
+            self._borrowers[loan_id] = 0
+            self._guarantors[loan_id] = []
 
-    for row in rows:
-        uid = _safe_int(getattr(row, "guarantor_user_id", None), 0)
-        if uid > 0 and uid not in seen:
-            seen.add(uid)
-            out.append(uid)
+        for loan_id, borrower_user_id in (
+            self.db.query(Loan.id, Loan.borrower_user_id)
+            .filter(Loan.id.in_(missing))
+            .all()
+        ):
+            self._borrowers[int(loan_id)] = _safe_int(borrower_user_id, 0)
 
-    return out
+        for loan_id, guarantor_user_id in (
+            self.db.query(LoanGuarantor.loan_id, LoanGuarantor.guarantor_user_id)
+            .filter(LoanGuarantor.loan_id.in_(missing))
+            .filter(LoanGuarantor.status == "approved")
+            .order_by(LoanGuarantor.id.asc())
+            .all()
+        ):
+            uid = _safe_int(guarantor_user_id, 0)
+            bucket = self._guarantors[int(loan_id)]
+            if uid > 0 and uid not in bucket:
+                bucket.append(uid)
+
+    def borrower_user_id(self, loan_id: Optional[int]) -> int:
+        if not loan_id:
+            return 0
+        self.preload([int(loan_id)])
+        return self._borrowers.get(int(loan_id), 0)
+
+    def guarantor_user_ids(self, loan_id: Optional[int]) -> List[int]:
+        if not loan_id:
+            return []
+        self.preload([int(loan_id)])
+        return list(self._guarantors.get(int(loan_id), []))
 
 
 def _resolve_borrower_user_id(
-    db: Session,
+    loans: _LoanParticipants,
     *,
     explicit_borrower_user_id: int,
     loan_id: Optional[int],
 ) -> int:
-    loan_borrower_user_id = _loan_borrower_user_id(db, loan_id)
+    loan_borrower_user_id = loans.borrower_user_id(loan_id)
 
     if loan_borrower_user_id > 0:
         return loan_borrower_user_id
@@ -394,17 +434,21 @@ def _resolve_borrower_user_id(
 
 
 def _resolve_guarantor_user_ids(
-    db: Session,
+    loans: _LoanParticipants,
     *,
     explicit_guarantor_user_id: int,
     loan_id: Optional[int],
 ) -> List[int]:
     if explicit_guarantor_user_id > 0:
         return [explicit_guarantor_user_id]
-    return _loan_guarantor_user_ids(db, loan_id)
+    return loans.guarantor_user_ids(loan_id)
 
 
-def _extract_edges_from_event(db: Session, event: TrustEvent) -> List[Dict[str, Any]]:
+def _extract_edges_from_event(
+    loans: _LoanParticipants,
+    event: TrustEvent,
+    meta: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
     event_type = _event_type_lower(event)
     clan_id = _safe_int(getattr(event, "clan_id", None), 0) or None
 
@@ -413,7 +457,8 @@ def _extract_edges_from_event(db: Session, event: TrustEvent) -> List[Dict[str,
 
     event_id = _safe_int(getattr(event, "id", None), 0) or None
     created_at = _aware_utc(getattr(event, "created_at", None))
-    meta = _parse_meta(event)
+    if meta is None:
+        meta = _parse_meta(event)
     ids = _extract_common_ids(event, meta)
 
     edges: List[Dict[str, Any]] = []
@@ -466,12 +511,12 @@ def _extract_edges_from_event(db: Session, event: TrustEvent) -> List[Dict[str,
 
     if _is_guarantee_event(event_type):
         guarantor_ids = _resolve_guarantor_user_ids(
-            db,
+            loans,
             explicit_guarantor_user_id=ids["guarantor_user_id"],
             loan_id=loan_id,
         )
         borrower_id = _resolve_borrower_user_id(
-            db,
+            loans,
             explicit_borrower_user_id=ids["borrower_user_id"],
             loan_id=loan_id,
         )
@@ -493,12 +538,12 @@ def _extract_edges_from_event(db: Session, event: TrustEvent) -> List[Dict[str,
 
     if _is_repayment_event(event_type):
         borrower_id = _resolve_borrower_user_id(
-            db,
+            loans,
             explicit_borrower_user_id=ids["borrower_user_id"],
             loan_id=loan_id,
         )
         guarantor_ids = _resolve_guarantor_user_ids(
-            db,
+            loans,
             explicit_guarantor_user_id=ids["guarantor_user_id"],
             loan_id=loan_id,
         )
@@ -532,12 +577,12 @@ def _extract_edges_from_event(db: Session, event: TrustEvent) -> List[Dict[str,
 
     if _is_repayment_delay_event(event_type):
         borrower_id = _resolve_borrower_user_id(
-            db,
+            loans,
             explicit_borrower_user_id=ids["borrower_user_id"],
             loan_id=loan_id,
         )
         guarantor_ids = _resolve_guarantor_user_ids(
-            db,
+            loans,
             explicit_guarantor_user_id=(ids["guarantor_user_id"] or ids["affected_user_id"]),
             loan_id=loan_id,
         )
@@ -559,12 +604,12 @@ def _extract_edges_from_event(db: Session, event: TrustEvent) -> List[Dict[str,
 
     if _is_default_pressure_event(event_type):
         borrower_id = _resolve_borrower_user_id(
-            db,
+            loans,
             explicit_borrower_user_id=ids["borrower_user_id"],
             loan_id=loan_id,
         )
         affected_ids = _resolve_guarantor_user_ids(
-            db,
+            loans,
             explicit_guarantor_user_id=(ids["affected_user_id"] or ids["guarantor_user_id"]),
             loan_id=loan_id,
         )
@@ -655,52 +700,81 @@ def _aggregate_edges(raw_edges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         if reason:
             row["meta_reasons"].add(reason)
 
-    finalized: List[Dict[str, Any]] = []
-
-    for row in grouped.values():
-        edge_type = _safe_str(row["edge_type"])
-        source_node_id = _safe_str(row["source_node_id"])
-        target_node_id = _safe_str(row["target_node_id"])
-        clan_id = row["clan_id"]
-        loan_id = row["loan_id"]
-
-        edge_id = (
-            f"{edge_type}:"
-            f"{source_node_id}:"
-            f"{target_node_id}:"
-            f"clan:{clan_id or 0}:"
-            f"loan:{loan_id or 0}"
+    finalized = [
+        _finalize_edge(
+            edge_type=_safe_str(row["edge_type"]),
+            source_node_id=_safe_str(row["source_node_id"]),
+            target_node_id=_safe_str(row["target_node_id"]),
+            clan_id=row["clan_id"],
+            loan_id=row["loan_id"],
+            directional=bool(row["directional"]),
+            weight=row["weight"],
+            confidence=row["confidence"],
+            event_count=int(row["event_count"]),
+            first_seen_at=row["first_seen_at"],
+            last_seen_at=row["last_seen_at"],
+            supporting_event_ids=row["supporting_event_ids"],
+            reasons=row["meta_reasons"],
         )
+        for row in grouped.values()
+    ]
+    _sort_edges(finalized)
+    return finalized
 
-        if edge_type in {EDGE_DEFAULT_AFFECTED, EDGE_REPAYMENT_DELAY}:
-            status = "stressed"
-        else:
-            status = _recency_bucket(row["last_seen_at"])
 
-        finalized.append(
-            {
-                "edge_id": edge_id,
-                "edge_type": edge_type,
-                "edge_label": row["edge_label"],
-                "source_node_id": source_node_id,
-                "target_node_id": target_node_id,
-                "clan_id": clan_id or None,
-                "loan_id": loan_id or None,
-                "weight": str(_q2(row["weight"])),
-                "confidence": str(_q2(row["confidence"])),
-                "directional": bool(row["directional"]),
-                "status": status,
-                "event_count": int(row["event_count"]),
-                "first_seen_at": _iso(row["first_seen_at"]),
-                "last_seen_at": _iso(row["last_seen_at"]),
-                "supporting_event_ids": sorted(row["supporting_event_ids"]),
-                "meta": {
-                    "reasons": sorted(row["meta_reasons"]),
-                },
-            }
-        )
+def _finalize_edge(
+    *,
+    edge_type: str,
+    source_node_id: str,
+    target_node_id: str,
+    clan_id: int,
+    loan_id: int,
+    directional: bool,
+    weight: Any,
+    confidence: Any,
+    event_count: int,
+    first_seen_at: Optional[datetime],
+    last_seen_at: Optional[datetime],
+    supporting_event_ids: Iterable[int],
+    reasons: Iterable[str],
+) -> Dict[str, Any]:
+    edge_id = (
+        f"{edge_type}:"
+        f"{source_node_id}:"
+        f"{target_node_id}:"
+        f"clan:{clan_id or 0}:"
+        f"loan:{loan_id or 0}"
+    )
+
+    if edge_type in {EDGE_DEFAULT_AFFECTED, EDGE_REPAYMENT_DELAY}:
+        status = "stressed"
+    else:
+        status = _recency_bucket(last_seen_at)
+
+    return {
+        "edge_id": edge_id,
+        "edge_type": edge_type,
+        "edge_label": EDGE_LABELS.get(edge_type, edge_type),
+        "source_node_id": source_node_id,
+        "target_node_id": target_node_id,
+        "clan_id": clan_id or None,
+        "loan_id": loan_id or None,
+        "weight": str(_q2(weight)),
+        "confidence": str(_q2(confidence)),
+        "directional": bool(directional),
+        "status": status,
+        "event_count": int(event_count),
+        "first_seen_at": _iso(first_seen_at),
+        "last_seen_at": _iso(last_seen_at),
+        "supporting_event_ids": sorted(supporting_event_ids),
+        "meta": {
+            "reasons": sorted(reasons),
+        },
+    }
+
 
-    finalized.sort(
+def _sort_edges(edges: List[Dict[str, Any]]) -> None:
+    edges.sort(
         key=lambda x: (
             _safe_str(x.get("edge_type")),
             _safe_str(x.get("source_node_id")),
@@ -709,7 +783,6 @@ def _aggregate_edges(raw_edges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             _safe_int(x.get("loan_id")),
         )
     )
-    return finalized
 
 
 def _build_summary(
@@ -908,6 +981,306 @@ def _build_summary(
     }
 
 
+# =========================
+# MATERIALIZED EDGE STORE
+# =========================
+
+_EdgeKey = Tuple[str, str, str, int, int]
+
+
+def _edge_key(edge: Dict[str, Any]) -> _EdgeKey:
+    return (
+        _safe_str(edge.get("edge_type")),
+        _safe_str(edge.get("source_node_id")),
+        _safe_str(edge.get("target_node_id")),
+        _safe_int(edge.get("clan_id"), 0),
+        _safe_int(edge.get("loan_id"), 0),
+    )
+
+
+def _node_user_id(node_id: str) -> Optional[int]:
+    if not node_id.startswith("user:"):
+        return None
+    return _safe_int(node_id.split(":", 1)[1], 0) or None
+
+
+def _json_list(raw: Optional[str]) -> List[Any]:
+    if not raw:
+        return []
+    try:
+        data = json.loads(raw)
+        return data if isinstance(data, list) else []
+    except Exception:
+        return []
+
+
+def _min_dt(a: Optional[datetime], b: Optional[datetime]) -> Optional[datetime]:
+    a, b = _aware_utc(a), _aware_utc(b)
+    if a is None or b is None:
+        return a or b
+    return min(a, b)
+
+
+def _max_dt(a: Optional[datetime], b: Optional[datetime]) -> Optional[datetime]:
+    a, b = _aware_utc(a), _aware_utc(b)
+    if a is None or b is None:
+        return a or b
+    return max(a, b)
+
+
+def _edge_reason(edge: Dict[str, Any]) -> str:
+    return _safe_str(dict(edge.get("meta") or {}).get("reason"))
+
+
+def _recent_event_ids(event_ids: Iterable[int]) -> List[int]:
+    return sorted(set(event_ids))[-TRUST_EDGE_SUPPORTING_EVENT_IDS_LIMIT:]
+
+
+def _event_already_folded(event_ids: List[int], event_id: int) -> bool:
+    # Once the id list is full, an event older than everything it keeps was
+    # folded before its id aged out.
+    if event_id in event_ids:
+        return True
+    return len(event_ids) >= TRUST_EDGE_SUPPORTING_EVENT_IDS_LIMIT and event_id < event_ids[0]
+
+
+def request_trust_graph_rebuild(db: Session, *, event_id: Optional[int] = None) -> None:
+    """Record that the edge store missed an event and needs a full rebuild."""
+    save_checkpoint(
+        db,
+        TRUST_GRAPH_REBUILD_JOB_KEY,
+        {"requested_at": _now_utc().isoformat(), "event_id": _safe_int(event_id, 0) or None},
+    )
+
+
+def fold_trust_event_into_graph(
+    db: Session,
+    event: TrustEvent,
+    *,
+    loans: Optional[_LoanParticipants] = None,
+) -> int:
+    """
+    Fold one persisted TrustEvent into the materialized edge store.
+
+    Idempotent per event: an edge that already lists the event id (or has
+    aged it out of its capped id list) is left alone. Does not commit; the
+    caller's transaction owns the write.
+    Returns the number of edge rows touched.
+    """
+    event_id = _safe_int(getattr(event, "id", None), 0)
+    if event_id <= 0:
+        return 0
+
+    raw_edges = _extract_edges_from_event(loans or _LoanParticipants(db), event)
+    rows: Dict[_EdgeKey, TrustGraphEdge] = {}
+    touched = 0
+
+    for edge in raw_edges:
+        key = _edge_key(edge)
+        edge_type, source_node_id, target_node_id, clan_id, loan_id = key
+
+        row = rows.get(key)
+        if row is None:
+            row = (
+                db.query(TrustGraphEdge)
+                .filter(
+                    TrustGraphEdge.edge_type == edge_type,
+                    TrustGraphEdge.source_node_id == source_node_id,
+                    TrustGraphEdge.target_node_id == target_node_id,
+                    TrustGraphEdge.clan_id == clan_id,
+                    TrustGraphEdge.loan_id == loan_id,
+                )
+                .first()
+            )
+        if row is None:
+            row = TrustGraphEdge(
+                edge_type=edge_type,
+                source_node_id=source_node_id,
+                target_node_id=target_node_id,
+                source_user_id=_node_user_id(source_node_id),
+                target_user_id=_node_user_id(target_node_id),
+                clan_id=clan_id,
+                loan_id=loan_id,
+                directional=bool(edge.get("directional", True)),
+                event_count=0,
+            )
+            db.add(row)
+        rows[key] = row
+
+        event_ids = sorted(_safe_int(x) for x in _json_list(row.supporting_event_ids_json))
+        if _event_already_folded(event_ids, event_id):
+            continue
+
+        reasons = set(_json_list(row.reasons_json))
+        reason = _edge_reason(edge)
+        if reason:
+            reasons.add(reason)
+
+        if row.id is None:
+            row.event_count = int(row.event_count or 0) + 1
+        else:
+            # Incremented in SQL so concurrent folds into one edge all count.
+            row.event_count = TrustGraphEdge.event_count + 1
+        row.supporting_event_ids_json = json.dumps(_recent_event_ids(event_ids + [event_id]))
+        row.reasons_json = json.dumps(sorted(reasons))
+        row.first_seen_at = _min_dt(row.first_seen_at, edge.get("created_at"))
+        row.last_seen_at = _max_dt(row.last_seen_at, edge.get("created_at"))
+        touched += 1
+
+    return touched
+
+
+def rebuild_trust_graph_edges(
+    db: Session,
+    *,
+    chunk_size: int = 1000,
+    commit: bool = True,
+) -> Dict[str, int]:
+    """
+    Rebuild the materialized edge store from the full TrustEvent history.
+
+    Events are streamed in id order, one chunk at a time, with loan
+    participants preloaded per chunk. Used for the initial backfill, after
+    edge-extraction rule changes, and to repair a failed incremental fold;
+    clears any pending rebuild request.
+
+    The scan, delete and reinsert run in one transaction that first locks the
+    edge store against writers (LOCK TABLE on Postgres; the up-front delete
+    takes the database write lock on SQLite). A live fold waits for the
+    rebuild to commit instead of landing between the scan and the delete,
+    and its event is then either in the rebuilt rows or folded on top of
+    them. Graph reads keep seeing the old edges until the commit.
+    """
+    chunk_size = max(1, int(chunk_size))
+    grouped: Dict[_EdgeKey, Dict[str, Any]] = {}
+
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text(f"LOCK TABLE {TrustGraphEdge.__tablename__} IN EXCLUSIVE MODE"))
+    db.query(TrustGraphEdge).delete(synchronize_session=False)
+    events_scanned = 0
+    last_event_id = 0
+
+    while True:
+        events = (
+            db.query(
+                TrustEvent.id,
+                TrustEvent.event_type,
+                TrustEvent.clan_id,
+                TrustEvent.loan_id,
+                TrustEvent.actor_user_id,
+                TrustEvent.subject_user_id,
+                TrustEvent.meta_json,
+                TrustEvent.created_at,
+            )
+            .filter(TrustEvent.id > last_event_id)
+            .order_by(TrustEvent.id.asc())
+            .limit(chunk_size)
+            .all()
+        )
+        if not events:
+            break
+
+        loans = _LoanParticipants(db)
+        loans.preload(_safe_int(e.loan_id, 0) for e in events)
+
+        for event in events:
+            event_id = int(event.id)
+            for edge in _extract_edges_from_event(loans, event):
+                key = _edge_key(edge)
+                row = grouped.get(key)
+                if row is None:
+                    row = grouped[key] = {
+                        "directional": bool(edge.get("directional", True)),
+                        "event_ids": set(),
+                        "event_count": 0,
+                        "reasons": set(),
+                        "first_seen_at": None,
+                        "last_seen_at": None,
+                    }
+                if event_id in row["event_ids"]:
+                    continue
+                row["event_ids"].add(event_id)
+                row["event_count"] += 1
+                reason = _edge_reason(edge)
+                if reason:
+                    row["reasons"].add(reason)
+                row["first_seen_at"] = _min_dt(row["first_seen_at"], edge.get("created_at"))
+                row["last_seen_at"] = _max_dt(row["last_seen_at"], edge.get("created_at"))
+
+        events_scanned += len(events)
+        last_event_id = int(events[-1].id)
+
+    mappings = [
+        {
+            "edge_type": edge_type,
+            "source_node_id": source_node_id,
+            "target_node_id": target_node_id,
+            "source_user_id": _node_user_id(source_node_id),
+            "target_user_id": _node_user_id(target_node_id),
+            "clan_id": clan_id,
+            "loan_id": loan_id,
+            "directional": row["directional"],
+            "event_count": row["event_count"],
+            "supporting_event_ids_json": json.dumps(_recent_event_ids(row["event_ids"])),
+            "reasons_json": json.dumps(sorted(row["reasons"])),
+            "first_seen_at": row["first_seen_at"],
+            "last_seen_at": row["last_seen_at"],
+        }
+        for (edge_type, source_node_id, target_node_id, clan_id, loan_id), row in grouped.items()
+    ]
+    for start in range(0, len(mappings), chunk_size):
+        db.execute(insert(TrustGraphEdge), mappings[start:start + chunk_size])
+    save_checkpoint(db, TRUST_GRAPH_REBUILD_JOB_KEY, None)
+
+    if commit:
+        db.commit()
+    else:
+        db.flush()
+
+    return {
+        "events_scanned": events_scanned,
+        "edges_written": len(mappings),
+        "last_event_id": last_event_id,
+    }
+
+
+def _stored_edge_out(row: TrustGraphEdge) -> Dict[str, Any]:
+    edge_type = _safe_str(row.edge_type)
+    return _finalize_edge(
+        edge_type=edge_type,
+        source_node_id=_safe_str(row.source_node_id),
+        target_node_id=_safe_str(row.target_node_id),
+        clan_id=_safe_int(row.clan_id, 0),
+        loan_id=_safe_int(row.loan_id, 0),
+        directional=bool(row.directional),
+        weight=EDGE_WEIGHTS.get(edge_type, Decimal("0")),
+        confidence=EDGE_CONFIDENCE.get(edge_type, Decimal("1")),
+        event_count=_safe_int(row.event_count, 0),
+        first_seen_at=row.first_seen_at,
+        last_seen_at=row.last_seen_at,
+        supporting_event_ids=[_safe_int(x) for x in _json_list(row.supporting_event_ids_json)],
+        reasons=[_safe_str(x) for x in _json_list(row.reasons_json) if _safe_str(x)],
+    )
+
+
+def _co_membership_edges(root_user_id: int, active_clan_ids: List[int]) -> List[Dict[str, Any]]:
+    raw_edges = [
+        _build_edge(
+            edge_type=EDGE_CO_MEMBERSHIP,
+            source_node_id=_user_node_id(root_user_id),
+            target_node_id=_clan_node_id(clan_id),
+            clan_id=clan_id,
+            loan_id=None,
+            event_id=None,
+            created_at=None,
+            directional=False,
+            meta={"reason": "active_membership"},
+        )
+        for clan_id in sorted(set(active_clan_ids))
+    ]
+    return _aggregate_edges(raw_edges)
+
+
 def build_trust_graph(
     db: Session,
     user_id: int,
@@ -915,117 +1288,72 @@ def build_trust_graph(
     include_clans: bool = True,
     limit_events: int = 500,
 ) -> Dict[str, Any]:
+    """
+    Read a member's trust graph from the materialized edge store.
+
+    Edges touching the member, or any loan they borrowed on or guaranteed,
+    are read in one indexed query. limit_events caps the number of stored
+    edges returned (most recently seen first).
+    """
     root_user_id = int(user_id)
     root_user = db.get(User, root_user_id)
     if not root_user:
         raise ValueError("User not found")
 
-    memberships = (
-        db.query(ClanMembership)
-        .filter(
-            _user_id_text_match(ClanMembership.user_id, root_user_id),
-            ClanMembership.left_at.is_(None),
-        )
-        .order_by(ClanMembership.created_at.asc(), ClanMembership.id.asc())
-        .all()
+    related_loan_ids = sorted(
+        {
+            int(x[0])
+            for x in (
+                db.query(Loan.id)
+                .filter(_user_id_text_match(Loan.borrower_user_id, root_user_id))
+                .union(
+                    db.query(LoanGuarantor.loan_id).filter(
+                        _user_id_text_match(LoanGuarantor.guarantor_user_id, root_user_id)
+                    )
+                )
+                .all()
+            )
+            if x and x[0] is not None
+        }
     )
-    active_clan_ids = [
-        int(m.clan_id) for m in memberships if getattr(m, "clan_id", None) is not None
-    ]
-
-    borrower_loan_ids = [
-        int(x[0])
-        for x in (
-            db.query(Loan.id)
-            .filter(_user_id_text_match(Loan.borrower_user_id, root_user_id))
-            .all()
-        )
-        if x and x[0] is not None
-    ]
 
-    guarantor_loan_ids = [
-        int(x[0])
-        for x in (
-            db.query(LoanGuarantor.loan_id)
-            .filter(
-                _user_id_text_match(LoanGuarantor.guarantor_user_id, root_user_id)
-            )
-            .all()
-        )
-        if x and x[0] is not None
+    edge_clauses = [
+        TrustGraphEdge.source_user_id == root_user_id,
+        TrustGraphEdge.target_user_id == root_user_id,
     ]
+    if related_loan_ids:
+        edge_clauses.append(TrustGraphEdge.loan_id.in_(related_loan_ids))
 
-    related_loan_ids = sorted(set(borrower_loan_ids + guarantor_loan_ids))
-
-    loan_clause = (
-        TrustEvent.loan_id.in_(related_loan_ids)
-        if related_loan_ids
-        else false()
-    )
-
-    trust_events = (
-        db.query(TrustEvent)
-        .filter(
-            or_(
-                _user_id_text_match(TrustEvent.actor_user_id, root_user_id),
-                _user_id_text_match(TrustEvent.subject_user_id, root_user_id),
-                loan_clause,
-            )
-        )
-        .order_by(TrustEvent.created_at.desc(), TrustEvent.id.desc())
+    stored_edges = (
+        db.query(TrustGraphEdge)
+        .filter(or_(*edge_clauses))
+        .order_by(TrustGraphEdge.last_seen_at.desc(), TrustGraphEdge.id.desc())
         .limit(max(1, min(int(limit_events), 2000)))
         .all()
     )
 
     user_ids: Set[int] = {root_user_id}
-    for event in trust_events:
-        meta = _parse_meta(event)
-        ids = _extract_common_ids(event, meta)
-
-        for key in [
-            "actor_user_id",
-            "subject_user_id",
-            "borrower_user_id",
-            "guarantor_user_id",
-            "affected_user_id",
-            "inviter_user_id",
-            "joiner_user_id",
-        ]:
-            maybe_id = _safe_int(ids.get(key))
-            if maybe_id > 0:
-                user_ids.add(maybe_id)
-
-        raw_loan_id = _safe_int(getattr(event, "loan_id", None), 0)
-        loan_id = raw_loan_id if raw_loan_id > 0 else None
-        if loan_id:
-            borrower_id = _loan_borrower_user_id(db, loan_id)
-            if borrower_id > 0:
-                user_ids.add(borrower_id)
-
-            for guarantor_id in _loan_guarantor_user_ids(db, loan_id):
-                if guarantor_id > 0:
-                    user_ids.add(guarantor_id)
-
-    users = (
-        db.query(User)
-        .filter(User.id.in_(sorted(user_ids)))
-        .all()
-        if user_ids
-        else []
-    )
+    for row in stored_edges:
+        for maybe_id in (row.source_user_id, row.target_user_id):
+            if _safe_int(maybe_id) > 0:
+                user_ids.add(int(maybe_id))
+
+    users = db.query(User).filter(User.id.in_(sorted(user_ids))).all()
 
     memberships_by_user: Dict[int, List[int]] = defaultdict(list)
-    if user_ids:
-        related_memberships = (
-            db.query(ClanMembership)
-            .filter(
-                _user_id_text_in(ClanMembership.user_id, sorted(user_ids)),
-                ClanMembership.left_at.is_(None),
-            )
-            .all()
+    related_memberships = (
+        db.query(ClanMembership.user_id, ClanMembership.clan_id)
+        .filter(
+            _user_id_text_in(ClanMembership.user_id, sorted(user_ids)),
+            ClanMembership.left_at.is_(None),
         )
-        for membership in related_memberships:
-            memberships_by_user[int(membership.user_id)].append(int(membership.clan_id))
+        .order_by(ClanMembership.created_at.asc(), ClanMembership.id.asc())
+        .all()
+    )
+    for membership_user_id, membership_clan_id in related_memberships:
+        if membership_clan_id is not None:
+            memberships_by_user[int(membership_user_id)].append(int(membership_clan_id))
+    active_clan_ids = list(memberships_by_user.get(root_user_id, []))
 
     nodes: List[Dict[str, Any]] = []
     seen_node_ids: Set[str] = set()
@@ -1047,27 +1375,11 @@ def build_trust_graph(
                 nodes.append(node)
                 seen_node_ids.add(node["node_id"])
 
-    raw_edges: List[Dict[str, Any]] = []
-    for event in trust_events:
-        raw_edges.extend(_extract_edges_from_event(db, event))
-
-    if include_clans:
-        for clan_id in sorted(set(active_clan_ids)):
-            raw_edges.append(
-                _build_edge(
-                    edge_type=EDGE_CO_MEMBERSHIP,
-                    source_node_id=_user_node_id(root_user_id),
-                    target_node_id=_clan_node_id(clan_id),
-                    clan_id=clan_id,
-                    loan_id=None,
-                    event_id=None,
-                    created_at=None,
-                    directional=False,
-                    meta={"reason": "active_membership"},
-                )
-            )
-
-    edges = _aggregate_edges(raw_edges)
+    membership_edges = (
+        _co_membership_edges(root_user_id, active_clan_ids) if include_clans else []
+    )
+    edges = membership_edges + [_stored_edge_out(row) for row in stored_edges]
+    _sort_edges(edges)
     summary = _build_summary(
         root_user_id=root_user_id,
         active_clan_ids=active_clan_ids,
@@ -1112,3 +1424,117 @@ def build_trust_graph(
         "cci": cci,
         "command_centre": command_centre,
     }
+
+
+def build_trust_graph_summaries(
+    db: Session,
+    user_ids: Iterable[int],
+    *,
+    include_clans: bool = True,
+    limit_events: int = 500,
+    chunk_size: int = 500,
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Summary and CCI for many members, as build_trust_graph would return them.
+
+    Each chunk of members costs three queries (members, active memberships,
+    ranked edges) instead of several per member. Edges are assigned to every
+    member they touch and capped in SQL at limit_events per member, most
+    recently seen first, exactly like the single-member read. Node
+    lists and the command centre are not built; callers that need the full
+    graph use build_trust_graph. Unknown user ids are omitted.
+    """
+    wanted = sorted({int(x) for x in user_ids if _safe_int(x) > 0})
+    per_user_limit = max(1, min(int(limit_events), 2000))
+    chunk_size = max(1, int(chunk_size))
+    out: Dict[int, Dict[str, Any]] = {}
+
+    for start in range(0, len(wanted), chunk_size):
+        chunk = [
+            int(row[0])
+            for row in db.query(User.id)
+            .filter(User.id.in_(wanted[start:start + chunk_size]))
+            .all()
+        ]
+        if not chunk:
+            continue
+
+        clans_by_user: Dict[int, List[int]] = defaultdict(list)
+        for membership_user_id, membership_clan_id in (
+            db.query(ClanMembership.user_id, ClanMembership.clan_id)
+            .filter(
+                _user_id_text_in(ClanMembership.user_id, chunk),
+                ClanMembership.left_at.is_(None),
+            )
+            .order_by(ClanMembership.created_at.asc(), ClanMembership.id.asc())
+            .all()
+        ):
+            if membership_clan_id is not None:
+                clans_by_user[int(membership_user_id)].append(int(membership_clan_id))
+
+        # One (edge, owner) row per member an edge counts towards: either
+        # endpoint, or the borrower/guarantor of the loan it belongs to.
+        # Ranking per owner in SQL keeps the per-member cap out of Python, so
+        # a busy member no longer pulls every edge they ever touched.
+        edge_owners = union(
+            select(
+                TrustGraphEdge.id.label("edge_id"),
+                cast(TrustGraphEdge.source_user_id, String).label("owner"),
+            ).where(TrustGraphEdge.source_user_id.in_(chunk)),
+            select(
+                TrustGraphEdge.id,
+                cast(TrustGraphEdge.target_user_id, String),
+            ).where(TrustGraphEdge.target_user_id.in_(chunk)),
+            select(TrustGraphEdge.id, cast(Loan.borrower_user_id, String))
+            .join(Loan, Loan.id == TrustGraphEdge.loan_id)
+            .where(_user_id_text_in(Loan.borrower_user_id, chunk)),
+            select(TrustGraphEdge.id, cast(LoanGuarantor.guarantor_user_id, String))
+            .join(LoanGuarantor, LoanGuarantor.loan_id == TrustGraphEdge.loan_id)
+            .where(_user_id_text_in(LoanGuarantor.guarantor_user_id, chunk)),
+        ).subquery()
+        ranked = (
+            select(
+                edge_owners.c.edge_id,
+                edge_owners.c.owner,
+                func.row_number()
+                .over(
+                    partition_by=edge_owners.c.owner,
+                    order_by=(TrustGraphEdge.last_seen_at.desc(), TrustGraphEdge.id.desc()),
+                )
+                .label("rank"),
+            )
+            .join(TrustGraphEdge, TrustGraphEdge.id == edge_owners.c.edge_id)
+            .subquery()
+        )
+
+        edges_by_id: Dict[int, Dict[str, Any]] = {}
+        edges_by_user: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        for row, owner in (
+            db.query(TrustGraphEdge, ranked.c.owner)
+            .join(ranked, ranked.c.edge_id == TrustGraphEdge.id)
+            .filter(ranked.c.rank <= per_user_limit)
+            .all()
+        ):
+            edge = edges_by_id.get(int(row.id))
+            if edge is None:
+                edge = edges_by_id[int(row.id)] = _stored_edge_out(row)
+            edges_by_user[_safe_int(owner)].append(edge)
+
+        for uid in chunk:
+            active_clan_ids = list(clans_by_user.get(uid, []))
+            membership_edges = (
+                _co_membership_edges(uid, active_clan_ids) if include_clans else []
+            )
+            # _build_summary is order-independent, so no _sort_edges here.
+            summary = _build_summary(
+                root_user_id=uid,
+                active_clan_ids=active_clan_ids,
+                edges=membership_edges + edges_by_user.get(uid, []),
+            )
+            out[uid] = {
+                "root_user_id": uid,
+                "summary": summary,
+                "cci": compute_cci_from_summary(summary),
+            }
+
+    return out
@@ -3,8 +3,10 @@ from __future__ import annotations
 import json
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Any, Dict, Optional, Union
+from itertools import groupby
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
 
 from app.core.constants import (
@@ -25,7 +27,7 @@ from app.core.constants import (
     RECENCY_MAX_FACTOR,
     RECENCY_MIN_FACTOR,
 )
-from app.db.models import TrustEvent, User
+from app.db.models import ClanMembership, TrustEvent, User
 
 # Canonical event types
 EV_BORROWER_FULL_REPAID = "loan_fully_repaid"
@@ -130,6 +132,15 @@ _EVENT_ALIASES = {
 }
 
 
+# Every raw event_type the scorer counts; lets the batch recompute skip
+# unrelated events in SQL instead of streaming them through Python.
+_SCORED_EVENT_TYPES = frozenset(
+    {EV_COMMUNITY_CONFIRMATION_REVIEW_RESOLVED}
+    | set(_EVENT_ALIASES)
+    | {alias for aliases in _EVENT_ALIASES.values() for alias in aliases}
+)
+
+
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -256,8 +267,6 @@ def recompute_trust_for_user(
     if as_of.tzinfo is None:
         as_of = as_of.replace(tzinfo=timezone.utc)
 
-    window_start = as_of - timedelta(days=int(window_days))
-
     rows = (
         db.query(TrustEvent)
         .filter(TrustEvent.subject_user_id == int(user_id))
@@ -265,6 +274,29 @@ def recompute_trust_for_user(
         .all()
     )
 
+    return _compute_trust_breakdown(
+        rows,
+        user_id=int(user_id),
+        window_days=window_days,
+        as_of=as_of,
+    )
+
+
+def _compute_trust_breakdown(
+    rows: Iterable[Any],
+    *,
+    user_id: int,
+    window_days: int,
+    as_of: datetime,
+) -> Dict[str, Any]:
+    """
+    Walk one subject's events (created_at/id order) into a trust breakdown.
+
+    Rows only need event_type, created_at and meta/meta_json, so both ORM
+    TrustEvents and column rows from the batch recompute are accepted.
+    """
+    window_start = as_of - timedelta(days=int(window_days))
+
     counts = {
         EV_BORROWER_FULL_REPAID: 0,
         EV_GUARANTOR_SUCCESS: 0,
@@ -623,6 +655,15 @@ def compute_trust_score_explained(db: Session, user_id: int) -> Dict[str, Any]:
     return out
 
 
+def _trust_user_row_values(out: Dict[str, Any], updated_at: datetime) -> Dict[str, Any]:
+    return {
+        "trust_score": int(out["score_int"]),
+        "trust_band": str(out["trust_band"]),
+        "trust_breakdown_json": json.dumps(out),
+        "trust_score_updated_at": updated_at,
+    }
+
+
 def apply_trust_score(
     db: Session,
     user_id: int,
@@ -635,10 +676,8 @@ def apply_trust_score(
     if user is None:
         return out
 
-    user.trust_score = int(out["score_int"])
-    user.trust_band = str(out["trust_band"])
-    user.trust_breakdown_json = json.dumps(out)
-    user.trust_score_updated_at = _now_utc()
+    for field, value in _trust_user_row_values(out, _now_utc()).items():
+        setattr(user, field, value)
 
     db.add(user)
     db.commit()
@@ -677,3 +716,174 @@ def compute_trust_score(db: Session, user_id: int) -> Dict[str, Any]:
 
 def calculate_trust_score(db: Session, user_id: int) -> Dict[str, Any]:
     return recompute_trust_for_user(db, user_id=int(user_id))
+
+
+def _batch_subject_ids(
+    db: Session,
+    *,
+    user_ids: Optional[Sequence[int]],
+    clan_id: Optional[int],
+) -> List[int]:
+    if user_ids is not None:
+        wanted = sorted({int(x) for x in user_ids if int(x) > 0})
+        if not wanted:
+            return []
+        rows = db.query(User.id).filter(User.id.in_(wanted)).all()
+        return sorted(int(r[0]) for r in rows)
+
+    if clan_id is not None:
+        rows = (
+            db.query(ClanMembership.user_id)
+            .filter(
+                ClanMembership.clan_id == int(clan_id),
+                ClanMembership.left_at.is_(None),
+            )
+            .distinct()
+            .all()
+        )
+        return sorted({int(r[0]) for r in rows if r and r[0] is not None})
+
+    return [int(r[0]) for r in db.query(User.id).order_by(User.id.asc()).all()]
+
+
+def _trust_breakdowns_for_subjects(
+    db: Session,
+    subject_ids: Sequence[int],
+    *,
+    window_days: int,
+    as_of: datetime,
+) -> Tuple[Dict[int, Dict[str, Any]], int]:
+    rows = (
+        db.query(
+            TrustEvent.subject_user_id,
+            TrustEvent.event_type,
+            TrustEvent.created_at,
+            TrustEvent.meta_json,
+        )
+        .filter(
+            TrustEvent.subject_user_id.in_(list(subject_ids)),
+            func.lower(func.trim(TrustEvent.event_type)).in_(_SCORED_EVENT_TYPES),
+        )
+        .order_by(
+            TrustEvent.subject_user_id.asc(),
+            TrustEvent.created_at.asc(),
+            TrustEvent.id.asc(),
+        )
+        .all()
+    )
+
+    rows_by_subject = {
+        int(subject_id): list(group)
+        for subject_id, group in groupby(rows, key=lambda r: int(r.subject_user_id))
+    }
+    breakdowns = {
+        int(subject_id): _compute_trust_breakdown(
+            rows_by_subject.get(int(subject_id), []),
+            user_id=int(subject_id),
+            window_days=window_days,
+            as_of=as_of,
+        )
+        for subject_id in subject_ids
+    }
+    return breakdowns, len(rows)
+
+
+def compute_trust_scores_for_users(
+    db: Session,
+    user_ids: Sequence[int],
+    *,
+    window_days: int = DEFAULT_WINDOW_DAYS,
+    as_of: Optional[datetime] = None,
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Read-only batch form of recompute_trust_for_user: one event query for
+    the whole set, nothing written back.
+    """
+    if as_of is None:
+        as_of = _now_utc()
+    if as_of.tzinfo is None:
+        as_of = as_of.replace(tzinfo=timezone.utc)
+
+    wanted = sorted({int(x) for x in user_ids if int(x) > 0})
+    if not wanted:
+        return {}
+    breakdowns, _scanned = _trust_breakdowns_for_subjects(
+        db,
+        wanted,
+        window_days=window_days,
+        as_of=as_of,
+    )
+    return breakdowns
+
+
+def recompute_trust_for_users(
+    db: Session,
+    *,
+    user_ids: Optional[Sequence[int]] = None,
+    clan_id: Optional[int] = None,
+    chunk_size: int = 500,
+    window_days: int = DEFAULT_WINDOW_DAYS,
+    as_of: Optional[datetime] = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    Recompute and store trust for many members in chunked passes.
+
+    Scope is user_ids, else the active members of clan_id, else every user.
+    Each chunk streams the scored TrustEvents for its subjects in one ordered
+    query, walks them grouped by subject with the same rules as
+    recompute_trust_for_user, and writes the user rows back in one bulk
+    update and commit, so no transaction stays open across the whole run.
+    """
+    if as_of is None:
+        as_of = _now_utc()
+    if as_of.tzinfo is None:
+        as_of = as_of.replace(tzinfo=timezone.utc)
+
+    subject_ids = _batch_subject_ids(db, user_ids=user_ids, clan_id=clan_id)
+    chunk_size = max(1, int(chunk_size))
+
+    users_updated = 0
+    events_scanned = 0
+    chunks = 0
+    band_counts: Dict[str, int] = {}
+
+    for start in range(0, len(subject_ids), chunk_size):
+        chunk = subject_ids[start:start + chunk_size]
+        chunks += 1
+
+        breakdowns, scanned = _trust_breakdowns_for_subjects(
+            db,
+            chunk,
+            window_days=window_days,
+            as_of=as_of,
+        )
+        events_scanned += scanned
+
+        updated_at = _now_utc()
+        values: List[Dict[str, Any]] = []
+        for subject_id in chunk:
+            out = breakdowns[subject_id]
+            band_counts[out["trust_band"]] = band_counts.get(out["trust_band"], 0) + 1
+            values.append({"id": subject_id, **_trust_user_row_values(out, updated_at)})
+
+        if dry_run:
+            continue
+
+        db.execute(update(User), values)
+        db.commit()
+        users_updated += len(values)
+
+    return {
+        "scope": (
+            "users" if user_ids is not None else "clan" if clan_id is not None else "all"
+        ),
+        "clan_id": int(clan_id) if clan_id is not None and user_ids is None else None,
+        "users_scanned": len(subject_ids),
+        "users_updated": users_updated,
+        "events_scanned": events_scanned,
+        "chunks": chunks,
+        "band_counts": dict(sorted(band_counts.items())),
+        "dry_run": bool(dry_run),
+        "as_of": as_of.isoformat(),
+    }
@@ -19,6 +19,7 @@ from app.services.institutional_pdf import (
     utc_generated_label,
 )
 from app.services.trust_slips_services import get_trust_slip_payload
+from app.services.trust_timeline_service import iter_trust_timeline_events
 
 PAGE_WIDTH, PAGE_HEIGHT = A4
 
@@ -75,12 +76,14 @@ def _fmt_dt(value: Any) -> str:
 
 
 def _load_events(db: Session, *, user_id: int, limit: int) -> list[TrustEvent]:
-    return (
-        db.query(TrustEvent)
-        .filter(TrustEvent.subject_user_id == int(user_id))
-        .order_by(TrustEvent.created_at.desc(), TrustEvent.id.desc())
-        .limit(int(limit))
-        .all()
+    # The PDF keeps the full event trail; only the paging is shared.
+    return list(
+        iter_trust_timeline_events(
+            db,
+            user_id=int(user_id),
+            audience="admin",
+            max_events=int(limit),
+        )
     )
 
 
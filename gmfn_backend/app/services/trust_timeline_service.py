@@ -3,9 +3,10 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Literal
+from typing import Any, Dict, Iterator, List, Optional, Literal, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Query, Session
 
 from app.db.models import TrustEvent
 
@@ -60,6 +61,30 @@ ALIASES = {
 }
 
 
+# What a member sees of their own history. Every aliased type carries a
+# delta or is a milestone worth showing; other zero-delta activity is kept
+# only when it matches one of the case-insensitive types or prefixes below.
+USER_TIMELINE_EVENT_TYPES = frozenset(
+    {"loan.created"}
+    | set(ALIASES)
+    | {alias for bucket in ALIASES.values() for alias in bucket}
+)
+USER_TIMELINE_EVENT_TYPES_ANY_CASE = frozenset(
+    {
+        "loan_cancelled",
+        "loan_incomplete",
+        "repayment.claimed",
+        "repayment_claimed",
+        "repayment.claim",
+    }
+    | FOLLOW_ATTENTION_EVENT_TYPES
+)
+USER_TIMELINE_EVENT_PREFIXES = ("merchant.", "courier.")
+HIDDEN_USER_EVENT_TYPE = "trust.score_updated"
+
+TIMELINE_PAGE_SIZE = 200
+
+
 def _to_aware(dt: Optional[datetime]) -> Optional[datetime]:
     if dt is None:
         return None
@@ -184,100 +209,198 @@ def _admin_label(event_type_raw: str, canonical: str) -> str:
     return canonical if canonical != (event_type_raw or "").strip() else (event_type_raw or canonical or "activity")
 
 
-def _should_hide_for_user(event_type_raw: str) -> bool:
-    return (event_type_raw or "").strip() == "trust.score_updated"
+def _visibility_filter(audience: Audience, hide_zero_deltas_for_user: bool):
+    if audience != "user":
+        return None
+    event_type = func.trim(TrustEvent.event_type)
+    if not hide_zero_deltas_for_user:
+        return event_type != HIDDEN_USER_EVENT_TYPE
+    lowered = func.lower(event_type)
+    return or_(
+        event_type.in_(sorted(USER_TIMELINE_EVENT_TYPES)),
+        lowered.in_(sorted(USER_TIMELINE_EVENT_TYPES_ANY_CASE)),
+        *(lowered.like(f"{prefix}%") for prefix in USER_TIMELINE_EVENT_PREFIXES),
+    )
+
+
+def encode_timeline_cursor(event: TrustEvent) -> str:
+    created_at = _to_aware(getattr(event, "created_at", None))
+    return f"{created_at.isoformat() if created_at else ''}|{int(event.id)}"
+
+
+def decode_timeline_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw_created_at, raw_id = str(cursor).rsplit("|", 1)
+        created_at = _to_aware(datetime.fromisoformat(raw_created_at))
+        event_id = int(raw_id)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid timeline cursor")
+    if created_at is None or event_id <= 0:
+        raise ValueError("Invalid timeline cursor")
+    return created_at, event_id
+
+
+def _timeline_query(
+    db: Session,
+    *,
+    user_id: int,
+    audience: Audience,
+    hide_zero_deltas_for_user: bool,
+    before: Optional[Tuple[datetime, int]],
+) -> Query:
+    """
+    A member's events newest first, filtered for the audience in SQL and
+    walked by (created_at, id) on ix_trust_events_subject_created_id.
+    """
+    q = db.query(TrustEvent).filter(TrustEvent.subject_user_id == int(user_id))
+    visibility = _visibility_filter(audience, hide_zero_deltas_for_user)
+    if visibility is not None:
+        q = q.filter(visibility)
+    if before is not None:
+        before_created_at, before_id = before
+        q = q.filter(
+            or_(
+                TrustEvent.created_at < before_created_at,
+                and_(TrustEvent.created_at == before_created_at, TrustEvent.id < int(before_id)),
+            )
+        )
+    return q.order_by(TrustEvent.created_at.desc(), TrustEvent.id.desc())
+
+
+def iter_trust_timeline_events(
+    db: Session,
+    *,
+    user_id: int,
+    audience: Audience = "user",
+    hide_zero_deltas_for_user: bool = True,
+    page_size: int = TIMELINE_PAGE_SIZE,
+    max_events: Optional[int] = None,
+) -> Iterator[TrustEvent]:
+    """Stream a member's visible events newest first, one keyset page at a time."""
+    page = max(1, min(int(page_size), 1000))
+    remaining = None if max_events is None else max(0, int(max_events))
+    before: Optional[Tuple[datetime, int]] = None
+
+    while remaining is None or remaining > 0:
+        lim = page if remaining is None else min(page, remaining)
+        rows = (
+            _timeline_query(
+                db,
+                user_id=user_id,
+                audience=audience,
+                hide_zero_deltas_for_user=hide_zero_deltas_for_user,
+                before=before,
+            )
+            .limit(lim)
+            .all()
+        )
+        yield from rows
+        if remaining is not None:
+            remaining -= len(rows)
+        if len(rows) < lim:
+            return
+        last = rows[-1]
+        before = (_to_aware(last.created_at), int(last.id))
 
 
 def _is_follow_attention_event(event_type_raw: str) -> bool:
     return (event_type_raw or "").strip().lower() in FOLLOW_ATTENTION_EVENT_TYPES
 
 
-def list_trust_timeline(
+def _timeline_item(r: TrustEvent, *, audience: Audience) -> Dict[str, Any]:
+    raw_type = getattr(r, "event_type", "") or ""
+    canonical = _normalize_event_type(raw_type)
+    delta = _delta_for_event(canonical)
+
+    meta = _parse_meta(getattr(r, "meta_json", None))
+    reason = meta.get("reason") or (meta.get("meta", {}) or {}).get("reason")
+    note = meta.get("note") or (meta.get("meta", {}) or {}).get("note")
+    payment_reference = meta.get("payment_reference")
+
+    if audience == "user" and _is_follow_attention_event(raw_type):
+        reason = "Attention event"
+        note = FOLLOW_ATTENTION_NOTE
+
+    created_at = _to_aware(getattr(r, "created_at", None))
+    label = _humane_label(raw_type, canonical, meta) if audience == "user" else _admin_label(raw_type, canonical)
+
+    loan_id = getattr(r, "loan_id", None)
+    guarantor_id = getattr(r, "guarantor_id", None)
+    item = {
+        "event_type": canonical if audience == "user" else (raw_type or canonical),
+        "label": label,
+        "delta": str(delta),
+        "reason": reason,
+        "note": note,
+        "created_at": created_at.isoformat() if created_at else None,
+    }
+
+    if audience == "admin":
+        item.update(
+            {
+                "payment_reference": payment_reference,
+                "loan_id": loan_id,
+                "clan_id": getattr(r, "clan_id", None),
+                "guarantor_id": guarantor_id,
+                "actor_user_id": getattr(r, "actor_user_id", None),
+                "subject_user_id": getattr(r, "subject_user_id", None),
+            }
+        )
+    elif loan_id or guarantor_id or payment_reference:
+        item["reference_label"] = "Private support record"
+
+    return item
+
+
+def get_trust_timeline_page(
     db: Session,
     *,
     user_id: int,
     limit: int = 50,
     audience: Audience = "user",
     hide_zero_deltas_for_user: bool = True,
-) -> List[Dict[str, Any]]:
+    before: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    One page of a member's timeline. Pages are always full when history
+    remains; next_before continues below the last item.
+    """
     limit = max(1, min(int(limit), 200))
-
     rows: List[TrustEvent] = (
-        db.query(TrustEvent)
-        .filter(TrustEvent.subject_user_id == int(user_id))
-        .order_by(TrustEvent.created_at.desc())
-        .limit(limit)
+        _timeline_query(
+            db,
+            user_id=user_id,
+            audience=audience,
+            hide_zero_deltas_for_user=hide_zero_deltas_for_user,
+            before=decode_timeline_cursor(before) if before else None,
+        )
+        .limit(limit + 1)
         .all()
     )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
 
-    out: List[Dict[str, Any]] = []
-    for r in rows:
-        raw_type = getattr(r, "event_type", "") or ""
-        canonical = _normalize_event_type(raw_type)
-        delta = _delta_for_event(canonical)
-
-        meta = _parse_meta(getattr(r, "meta_json", None))
-        reason = meta.get("reason") or (meta.get("meta", {}) or {}).get("reason")
-        note = meta.get("note") or (meta.get("meta", {}) or {}).get("note")
-        payment_reference = meta.get("payment_reference")
-        is_follow_attention = _is_follow_attention_event(raw_type)
-
-        if audience == "user" and is_follow_attention:
-            reason = "Attention event"
-            note = FOLLOW_ATTENTION_NOTE
-
-        if audience == "user":
-            if _should_hide_for_user(raw_type):
-                continue
-
-            if hide_zero_deltas_for_user and delta == Decimal("0.00"):
-                keep = False
-                rt = (raw_type or "").strip().lower()
-
-                if canonical in {EV_GUARANTEE_GIVEN, EV_GUARANTEE_RELEASED, EV_DEFAULT, EV_FULL_REPAID}:
-                    keep = True
-                if raw_type == "loan.created":
-                    keep = True
-                if (raw_type or "").upper() in {"LOAN_CANCELLED", "LOAN_INCOMPLETE"}:
-                    keep = True
-                if rt in {"repayment.claimed", "repayment_claimed", "repayment.claim"}:
-                    keep = True
-                if rt in FOLLOW_ATTENTION_EVENT_TYPES:
-                    keep = True
-                if rt.startswith("merchant.") or rt.startswith("courier."):
-                    keep = True
-
-                if not keep:
-                    continue
-
-        created_at = _to_aware(getattr(r, "created_at", None))
-        label = _humane_label(raw_type, canonical, meta) if audience == "user" else _admin_label(raw_type, canonical)
-
-        loan_id = getattr(r, "loan_id", None)
-        guarantor_id = getattr(r, "guarantor_id", None)
-        item = {
-            "event_type": canonical if audience == "user" else (raw_type or canonical),
-            "label": label,
-            "delta": str(delta),
-            "reason": reason,
-            "note": note,
-            "created_at": created_at.isoformat() if created_at else None,
-        }
-
-        if audience == "admin":
-            item.update(
-                {
-                    "payment_reference": payment_reference,
-                    "loan_id": loan_id,
-                    "clan_id": getattr(r, "clan_id", None),
-                    "guarantor_id": guarantor_id,
-                    "actor_user_id": getattr(r, "actor_user_id", None),
-                    "subject_user_id": getattr(r, "subject_user_id", None),
-                }
-            )
-        elif loan_id or guarantor_id or payment_reference:
-            item["reference_label"] = "Private support record"
+    return {
+        "items": [_timeline_item(r, audience=audience) for r in rows],
+        "has_more": has_more,
+        "next_before": encode_timeline_cursor(rows[-1]) if has_more else None,
+    }
 
-        out.append(item)
 
-    return out
+def list_trust_timeline(
+    db: Session,
+    *,
+    user_id: int,
+    limit: int = 50,
+    audience: Audience = "user",
+    hide_zero_deltas_for_user: bool = True,
+    before: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    return get_trust_timeline_page(
+        db,
+        user_id=user_id,
+        limit=limit,
+        audience=audience,
+        hide_zero_deltas_for_user=hide_zero_deltas_for_user,
+        before=before,
+    )["items"]
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import contextvars
 import hashlib
 import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Optional
+from urllib.parse import urlparse
 
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
 
 from app.db.notification_models import Notification, WebPushSubscription
@@ -16,12 +23,24 @@ except Exception:  # pragma: no cover - pywebpush is optional until env is confi
     WebPushException = Exception  # type: ignore[assignment]
     webpush = None  # type: ignore[assignment]
 
+try:  # pragma: no cover - installed alongside pywebpush
+    import requests
+    from py_vapid import Vapid
+except Exception:  # pragma: no cover
+    requests = None  # type: ignore[assignment]
+    Vapid = None  # type: ignore[assignment]
+
 
 WEB_PUSH_NOTIFICATION_KINDS = {
     "community.notice.posted",
     "community_domain.notice.posted",
 }
 
+WEB_PUSH_SEND_TIMEOUT_SECONDS = 10
+WEB_PUSH_MAX_FAILURES = 5
+# Signed VAPID JWTs are valid for up to 24h; re-sign well before that.
+WEB_PUSH_VAPID_TTL_SECONDS = 12 * 60 * 60
+
 
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
@@ -74,16 +93,6 @@ def _endpoint_hash(endpoint: str) -> str:
     return hashlib.sha256(endpoint.encode("utf-8")).hexdigest()
 
 
-def _subscription_payload(row: WebPushSubscription) -> dict[str, Any]:
-    return {
-        "endpoint": row.endpoint,
-        "keys": {
-            "p256dh": row.p256dh,
-            "auth": row.auth,
-        },
-    }
-
-
 def upsert_web_push_subscription(
     db: Session,
     *,
@@ -183,6 +192,80 @@ def notification_web_push_payload(notification: Notification) -> dict[str, Any]:
     }
 
 
+class _WebPushBatch:
+    """
+    Shared state for one fan-out: the VAPID key is parsed once, one signed
+    header set is reused per push-service origin, and each worker thread keeps
+    one HTTP session per origin so TLS connections are reused.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._vapid_headers: dict[str, dict[str, str]] = {}
+        self._local = threading.local()
+        self._sessions: list[Any] = []
+        self._vapid: Any = None
+        if Vapid is not None:
+            try:
+                self._vapid = Vapid.from_string(private_key=web_push_private_key())
+            except Exception:
+                self._vapid = None
+
+    def vapid_headers_for(self, endpoint: str) -> Optional[dict[str, str]]:
+        if self._vapid is None:
+            return None
+        url = urlparse(endpoint)
+        audience = f"{url.scheme}://{url.netloc}"
+        with self._lock:
+            headers = self._vapid_headers.get(audience)
+            if headers is None:
+                try:
+                    headers = dict(
+                        self._vapid.sign(
+                            {
+                                "sub": web_push_subject(),
+                                "aud": audience,
+                                "exp": int(time.time()) + WEB_PUSH_VAPID_TTL_SECONDS,
+                            }
+                        )
+                    )
+                except Exception:
+                    return None
+                self._vapid_headers[audience] = headers
+            return headers
+
+    def session_for(self, endpoint: str) -> Any:
+        if requests is None:
+            return None
+        sessions = getattr(self._local, "sessions", None)
+        if sessions is None:
+            sessions = {}
+            self._local.sessions = sessions
+        host = urlparse(endpoint).netloc
+        session = sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            sessions[host] = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+
+_ACTIVE_BATCH: contextvars.ContextVar[Optional[_WebPushBatch]] = contextvars.ContextVar(
+    "gmfn_web_push_batch",
+    default=None,
+)
+
+
 def _send_web_push_payload(
     *,
     subscription_info: dict[str, Any],
@@ -190,11 +273,27 @@ def _send_web_push_payload(
 ) -> None:
     if webpush is None:
         raise RuntimeError("pywebpush is not installed.")
+
+    data = json.dumps(payload, separators=(",", ":"))
+    batch = _ACTIVE_BATCH.get()
+    endpoint = _safe_str(subscription_info.get("endpoint"))
+    headers = batch.vapid_headers_for(endpoint) if batch is not None else None
+    if headers is not None:
+        webpush(
+            subscription_info=subscription_info,
+            data=data,
+            headers=headers,
+            requests_session=batch.session_for(endpoint),
+            timeout=WEB_PUSH_SEND_TIMEOUT_SECONDS,
+        )
+        return
+
     webpush(
         subscription_info=subscription_info,
-        data=json.dumps(payload, separators=(",", ":")),
+        data=data,
         vapid_private_key=web_push_private_key(),
         vapid_claims={"sub": web_push_subject()},
+        timeout=WEB_PUSH_SEND_TIMEOUT_SECONDS,
     )
 
 
@@ -207,83 +306,215 @@ def _web_push_exception_status(exc: BaseException) -> int:
         return 0
 
 
-def dispatch_web_push_for_notification(
-    db: Session,
-    notification: Notification,
-) -> dict[str, Any]:
-    kind = _safe_str(getattr(notification, "kind", ""))
-    if kind not in WEB_PUSH_NOTIFICATION_KINDS:
-        return {"attempted": 0, "sent": 0, "skipped": "kind_not_allowed"}
+def web_push_max_workers() -> int:
+    raw = _safe_str(os.getenv("GMFN_WEB_PUSH_MAX_WORKERS"))
+    try:
+        value = int(raw) if raw else 16
+    except ValueError:
+        value = 16
+    return max(1, min(value, 64))
+
+
+@dataclass(frozen=True)
+class _WebPushTarget:
+    subscription_id: int
+    failure_count: int
+    subscription_info: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class _WebPushOutcome:
+    subscription_id: int
+    ok: bool
+    status_code: int = 0
 
-    status = web_push_runtime_status()
-    if not status["configured"]:
-        return {"attempted": 0, "sent": 0, "skipped": "web_push_not_configured"}
 
+def _active_web_push_targets(db: Session, user_ids: list[int]) -> dict[int, list[_WebPushTarget]]:
+    if not user_ids:
+        return {}
     rows = (
-        db.query(WebPushSubscription)
-        .filter(WebPushSubscription.user_id == int(notification.user_id))
+        db.query(
+            WebPushSubscription.id,
+            WebPushSubscription.user_id,
+            WebPushSubscription.endpoint,
+            WebPushSubscription.p256dh,
+            WebPushSubscription.auth,
+            WebPushSubscription.failure_count,
+        )
+        .filter(WebPushSubscription.user_id.in_(sorted(set(user_ids))))
         .filter(WebPushSubscription.is_active.is_(True))
         .order_by(WebPushSubscription.id.asc())
         .all()
     )
-    if not rows:
-        return {"attempted": 0, "sent": 0, "skipped": "no_active_subscription"}
-
-    payload = notification_web_push_payload(notification)
-    attempted = 0
-    sent = 0
-    deactivated = 0
+    out: dict[int, list[_WebPushTarget]] = {}
     for row in rows:
-        attempted += 1
+        out.setdefault(int(row.user_id), []).append(
+            _WebPushTarget(
+                subscription_id=int(row.id),
+                failure_count=int(row.failure_count or 0),
+                subscription_info={
+                    "endpoint": row.endpoint,
+                    "keys": {"p256dh": row.p256dh, "auth": row.auth},
+                },
+            )
+        )
+    return out
+
+
+def _fan_out_web_push(
+    jobs: list[tuple[_WebPushTarget, dict[str, Any]]],
+) -> list[_WebPushOutcome]:
+    """
+    Sends every (target, payload) pair with bounded parallelism. Only network
+    I/O happens on the worker threads; the DB session stays on the caller.
+    """
+    if not jobs:
+        return []
+
+    batch = _WebPushBatch()
+    token = _ACTIVE_BATCH.set(batch)
+
+    def send_one(job: tuple[_WebPushTarget, dict[str, Any]]) -> _WebPushOutcome:
+        target, payload = job
         try:
             _send_web_push_payload(
-                subscription_info=_subscription_payload(row),
+                subscription_info=target.subscription_info,
                 payload=payload,
             )
-            row.last_success_at = _now_utc()
-            row.updated_at = _now_utc()
-            row.failure_count = 0
-            sent += 1
+            return _WebPushOutcome(subscription_id=target.subscription_id, ok=True)
         except Exception as exc:
-            row.last_failure_at = _now_utc()
-            row.updated_at = _now_utc()
-            row.failure_count = int(row.failure_count or 0) + 1
-            status_code = _web_push_exception_status(exc)
-            if status_code in {404, 410} or row.failure_count >= 5:
-                row.is_active = False
-                deactivated += 1
+            return _WebPushOutcome(
+                subscription_id=target.subscription_id,
+                ok=False,
+                status_code=_web_push_exception_status(exc),
+            )
+
+    try:
+        workers = min(web_push_max_workers(), len(jobs))
+        if workers <= 1:
+            return [send_one(job) for job in jobs]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gmfn-web-push") as pool:
+            futures = [
+                pool.submit(contextvars.copy_context().run, send_one, job)
+                for job in jobs
+            ]
+            return [future.result() for future in futures]
+    finally:
+        _ACTIVE_BATCH.reset(token)
+        batch.close()
+
+
+def _record_web_push_outcomes(
+    db: Session,
+    targets: dict[int, _WebPushTarget],
+    outcomes: list[_WebPushOutcome],
+) -> dict[str, int]:
+    """
+    Applies a whole fan-out's results with at most three UPDATE statements:
+    successes, failures, and deactivations (404/410 or too many failures).
+    """
+    succeeded: set[int] = set()
+    failures: dict[int, int] = {}
+    gone: set[int] = set()
+    for outcome in outcomes:
+        if outcome.ok:
+            succeeded.add(outcome.subscription_id)
+            continue
+        failures[outcome.subscription_id] = failures.get(outcome.subscription_id, 0) + 1
+        if outcome.status_code in {404, 410}:
+            gone.add(outcome.subscription_id)
+
+    failed_only = {sid: count for sid, count in failures.items() if sid not in succeeded}
+    deactivate = set(gone)
+    for sid, count in failed_only.items():
+        if targets[sid].failure_count + count >= WEB_PUSH_MAX_FAILURES:
+            deactivate.add(sid)
+
+    now = _now_utc()
+    if succeeded:
+        db.execute(
+            update(WebPushSubscription)
+            .where(WebPushSubscription.id.in_(sorted(succeeded)))
+            .values(last_success_at=now, updated_at=now, failure_count=0),
+            execution_options={"synchronize_session": False},
+        )
+    by_increment: dict[int, list[int]] = {}
+    for sid, count in failed_only.items():
+        by_increment.setdefault(count, []).append(sid)
+    for count, sids in sorted(by_increment.items()):
+        db.execute(
+            update(WebPushSubscription)
+            .where(WebPushSubscription.id.in_(sorted(sids)))
+            .values(
+                last_failure_at=now,
+                updated_at=now,
+                failure_count=func.coalesce(WebPushSubscription.failure_count, 0) + count,
+            ),
+            execution_options={"synchronize_session": False},
+        )
+    if deactivate:
+        db.execute(
+            update(WebPushSubscription)
+            .where(WebPushSubscription.id.in_(sorted(deactivate)))
+            .values(is_active=False, updated_at=now),
+            execution_options={"synchronize_session": False},
+        )
 
     db.commit()
     return {
-        "attempted": attempted,
-        "sent": sent,
-        "deactivated": deactivated,
+        "attempted": len(outcomes),
+        "sent": sum(1 for outcome in outcomes if outcome.ok),
+        "deactivated": len(deactivate),
     }
 
 
-def dispatch_web_push_test_to_user(db: Session, *, user_id: int) -> dict[str, Any]:
+def _dispatch_payloads_to_users(
+    db: Session,
+    payloads: list[tuple[int, dict[str, Any]]],
+) -> dict[str, Any]:
+    targets_by_user = _active_web_push_targets(db, [user_id for user_id, _ in payloads])
+    jobs = [
+        (target, payload)
+        for user_id, payload in payloads
+        for target in targets_by_user.get(int(user_id), [])
+    ]
+    if not jobs:
+        return {"attempted": 0, "sent": 0, "deactivated": 0, "skipped": "no_active_subscription"}
+
+    targets = {target.subscription_id: target for target, _ in jobs}
+    return _record_web_push_outcomes(db, targets, _fan_out_web_push(jobs))
+
+
+def dispatch_web_push_for_notification(
+    db: Session,
+    notification: Notification,
+) -> dict[str, Any]:
+    kind = _safe_str(getattr(notification, "kind", ""))
+    if kind not in WEB_PUSH_NOTIFICATION_KINDS:
+        return {"attempted": 0, "sent": 0, "skipped": "kind_not_allowed"}
+
     status = web_push_runtime_status()
     if not status["configured"]:
-        return {
-            "attempted": 0,
-            "sent": 0,
-            "deactivated": 0,
-            "skipped": "web_push_not_configured",
-        }
+        return {"attempted": 0, "sent": 0, "skipped": "web_push_not_configured"}
 
-    rows = (
-        db.query(WebPushSubscription)
-        .filter(WebPushSubscription.user_id == int(user_id))
-        .filter(WebPushSubscription.is_active.is_(True))
-        .order_by(WebPushSubscription.id.asc())
-        .all()
+    result = _dispatch_payloads_to_users(
+        db,
+        [(int(notification.user_id), notification_web_push_payload(notification))],
     )
-    if not rows:
+    if result.get("skipped"):
+        return {"attempted": 0, "sent": 0, "skipped": result["skipped"]}
+    return result
+
+
+def dispatch_web_push_test_to_user(db: Session, *, user_id: int) -> dict[str, Any]:
+    status = web_push_runtime_status()
+    if not status["configured"]:
         return {
             "attempted": 0,
             "sent": 0,
             "deactivated": 0,
-            "skipped": "no_active_subscription",
+            "skipped": "web_push_not_configured",
         }
 
     payload = {
@@ -295,45 +526,90 @@ def dispatch_web_push_test_to_user(db: Session, *, user_id: int) -> dict[str, An
         "action_url": "/app/notifications",
         "action_label": "Open GSN",
     }
-
-    attempted = 0
-    sent = 0
-    deactivated = 0
-    for row in rows:
-        attempted += 1
-        try:
-            _send_web_push_payload(
-                subscription_info=_subscription_payload(row),
-                payload=payload,
-            )
-            row.last_success_at = _now_utc()
-            row.updated_at = _now_utc()
-            row.failure_count = 0
-            sent += 1
-        except Exception as exc:
-            row.last_failure_at = _now_utc()
-            row.updated_at = _now_utc()
-            row.failure_count = int(row.failure_count or 0) + 1
-            status_code = _web_push_exception_status(exc)
-            if status_code in {404, 410} or row.failure_count >= 5:
-                row.is_active = False
-                deactivated += 1
-
-    db.commit()
-    return {
-        "attempted": attempted,
-        "sent": sent,
-        "deactivated": deactivated,
-    }
+    return _dispatch_payloads_to_users(db, [(int(user_id), payload)])
 
 
 def dispatch_web_push_for_notifications(
     db: Session,
     notifications: list[Notification],
 ) -> dict[str, Any]:
+    """
+    Fans a batch of notifications (e.g. one clan-wide notice) out in a single
+    concurrent send with one subscription query and one bulk outcome update.
+    """
     totals = {"attempted": 0, "sent": 0, "deactivated": 0}
-    for notification in notifications:
-        result = dispatch_web_push_for_notification(db, notification)
-        for key in totals:
-            totals[key] += int(result.get(key) or 0)
+    allowed = [
+        notification
+        for notification in notifications
+        if _safe_str(getattr(notification, "kind", "")) in WEB_PUSH_NOTIFICATION_KINDS
+    ]
+    if not allowed or not web_push_runtime_status()["configured"]:
+        return totals
+
+    result = _dispatch_payloads_to_users(
+        db,
+        [
+            (int(notification.user_id), notification_web_push_payload(notification))
+            for notification in allowed
+        ],
+    )
+    for key in totals:
+        totals[key] += int(result.get(key) or 0)
     return totals
+
+
+def web_push_dispatch_mode() -> str:
+    mode = _safe_str(os.getenv("GMFN_WEB_PUSH_DISPATCH_MODE")).lower()
+    return "background" if mode == "background" else "inline"
+
+
+_BACKGROUND_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_BACKGROUND_LOCK = threading.Lock()
+
+
+def _background_executor() -> ThreadPoolExecutor:
+    global _BACKGROUND_EXECUTOR
+    with _BACKGROUND_LOCK:
+        if _BACKGROUND_EXECUTOR is None:
+            _BACKGROUND_EXECUTOR = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="gmfn-web-push-dispatch",
+            )
+        return _BACKGROUND_EXECUTOR
+
+
+def _dispatch_web_push_for_notification_ids(notification_ids: list[int]) -> dict[str, Any]:
+    from app.db.database import SessionLocal
+
+    with SessionLocal() as db:
+        notifications = (
+            db.query(Notification)
+            .filter(Notification.id.in_(sorted(set(notification_ids))))
+            .order_by(Notification.id.asc())
+            .all()
+        )
+        return dispatch_web_push_for_notifications(db, notifications)
+
+
+def schedule_web_push_for_notifications(
+    db: Session,
+    notifications: list[Notification],
+) -> Optional[dict[str, Any]]:
+    """
+    Sends push for already-committed notifications. With
+    GMFN_WEB_PUSH_DISPATCH_MODE=background the batch is handed to a
+    single-thread worker with its own DB session and the request returns
+    immediately; otherwise it is sent inline as before.
+    """
+    if web_push_dispatch_mode() != "background":
+        return dispatch_web_push_for_notifications(db, notifications)
+
+    notification_ids = [
+        int(notification.id)
+        for notification in notifications
+        if getattr(notification, "id", None)
+        and _safe_str(getattr(notification, "kind", "")) in WEB_PUSH_NOTIFICATION_KINDS
+    ]
+    if notification_ids:
+        _background_executor().submit(_dispatch_web_push_for_notification_ids, notification_ids)
+    return None
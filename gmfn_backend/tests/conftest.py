@@ -35,7 +35,11 @@ if db_path.exists():
 
 from app.main import app  # noqa: E402
 from app.core import clan_auth  # noqa: E402
+from app.core.auth import clear_auth_user_cache  # noqa: E402
 from app.db.database import engine  # noqa: E402
+from app.services.community_domain_payload_cache import (  # noqa: E402
+    clear_community_domain_payload_cache,
+)
 
 
 class Obj:
@@ -98,6 +102,8 @@ def _clean_db_between_tests(_apply_migrations):
     with engine.begin() as conn:
         tables = _list_user_tables(conn)
         _wipe_all_tables(conn, tables)
+    clear_auth_user_cache()
+    clear_community_domain_payload_cache()
     yield
 
 
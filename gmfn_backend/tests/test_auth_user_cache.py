@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event, update
+
+from app.core.auth import get_current_user
+from app.core.security import create_access_token
+from app.db.database import SessionLocal, engine
+from app.db.models import User
+
+
+@pytest.fixture(autouse=True)
+def _jwt_secret(monkeypatch):
+    monkeypatch.setenv("GMFN_SECRET_KEY", "test-secret")
+
+
+def _user_selects(fn):
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        if "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+    return result, statements
+
+
+def _seed_user(**overrides) -> int:
+    with SessionLocal() as db:
+        user = User(
+            email=overrides.get("email", "cached@example.com"),
+            gmfn_id=overrides.get("gmfn_id", "GMFN-U-CACHED"),
+            hashed_password="hashed",
+            role=overrides.get("role", "user"),
+        )
+        db.add(user)
+        db.commit()
+        return int(user.id)
+
+
+def test_hot_subject_is_loaded_by_primary_key():
+    user_id = _seed_user()
+    token = create_access_token({"sub": "cached@example.com"})
+
+    with SessionLocal() as db:
+        first, first_selects = _user_selects(lambda: get_current_user(db=db, token=token))
+    with SessionLocal() as db:
+        second, second_selects = _user_selects(lambda: get_current_user(db=db, token=token))
+        assert second in db
+        assert second.email == "cached@example.com"
+
+    assert first.id == user_id
+    assert second.id == user_id
+    assert len(first_selects) == 1
+    assert len(second_selects) == 1
+    assert "users.email" not in second_selects[0].split("WHERE", 1)[1]
+
+
+def test_gmfn_id_subject_resolves_in_one_query():
+    user_id = _seed_user()
+    token = create_access_token({"sub": "GMFN-U-CACHED"})
+
+    with SessionLocal() as db:
+        user, selects = _user_selects(lambda: get_current_user(db=db, token=token))
+
+    assert user.id == user_id
+    assert len(selects) == 1
+
+
+def test_bulk_update_is_seen_on_the_next_request():
+    user_id = _seed_user()
+    token = create_access_token({"sub": "cached@example.com"})
+
+    with SessionLocal() as db:
+        assert get_current_user(db=db, token=token).role == "user"
+
+    # A Core UPDATE fires no mapper events; the cached id still loads fresh columns.
+    with SessionLocal() as db:
+        db.execute(update(User).where(User.id == user_id).values(role="admin", hashed_password="reset"))
+        db.commit()
+
+    with SessionLocal() as db:
+        refreshed = get_current_user(db=db, token=token)
+        assert (refreshed.role, refreshed.hashed_password) == ("admin", "reset")
+
+
+def test_changed_email_no_longer_resolves_the_old_subject(monkeypatch):
+    monkeypatch.delenv("GMFN_DEV_MODE", raising=False)
+    user_id = _seed_user()
+    token = create_access_token({"sub": "cached@example.com"})
+
+    with SessionLocal() as db:
+        assert get_current_user(db=db, token=token).id == user_id
+
+    with SessionLocal() as db:
+        db.execute(update(User).where(User.id == user_id).values(email="moved@example.com"))
+        db.commit()
+
+    with SessionLocal() as db:
+        with pytest.raises(HTTPException):
+            get_current_user(db=db, token=token)
@@ -3,7 +3,7 @@
 from app.routers import clans as legacy_clans_router
 from app.db.database import engine
 from app.schemas.clan_memberships import ClanMemberCreate
-from sqlalchemy import text
+from sqlalchemy import event, text
 
 def _extract_items(payload):
     if isinstance(payload, list):
@@ -73,6 +73,90 @@ def test_list_clan_members_separates_admitted_members_from_reviewers(
     assert len(data["reviewer_items"]) == 1
 
 
+def test_list_clan_members_pages_by_cursor_with_constant_queries(
+    client,
+    override_current_user,
+    seed_clan_admin_membership,
+):
+    with engine.begin() as conn:
+        for user_id in range(2, 8):
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO users (id, email, hashed_password, role, gmfn_id)
+                    VALUES (:id, :email, :hashed, 'user', :gmfn_id)
+                    """
+                ),
+                {
+                    "id": user_id,
+                    "email": f"member{user_id}@example.com",
+                    "hashed": "PENDING_APPROVAL" if user_id == 7 else "hashed",
+                    "gmfn_id": f"GMFN-U-{user_id}",
+                },
+            )
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO clan_memberships (clan_id, user_id, role, personal_pool_balance)
+                    VALUES (1, :user_id, 'user', 0)
+                    """
+                ),
+                {"user_id": user_id},
+            )
+        # A membership whose user row is gone is neither listed nor counted.
+        conn.execute(
+            text(
+                """
+                INSERT INTO clan_memberships (clan_id, user_id, role, personal_pool_balance)
+                VALUES (1, 99, 'user', 0)
+                """
+            )
+        )
+
+    client.get("/clans/1/members", params={"limit": 1})
+    statements = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        small = client.get("/clans/1/members", params={"limit": 2})
+        small_statements = len(statements)
+        statements.clear()
+        large = client.get("/clans/1/members", params={"limit": 7})
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert small.status_code == 200, small.text
+    assert large.status_code == 200, large.text
+    # Rows come from one joined read, so the page size does not add queries.
+    assert len(statements) == small_statements
+
+    first = small.json()
+    assert first["total"] == 7
+    assert first["has_more"] is True
+    assert len(first["items"]) == 2
+
+    # Reviewers are the whole community's, not the page's.
+    reviewers = sorted(item["user_id"] for item in first["reviewer_items"])
+    assert reviewers == list(range(1, 7))
+    assert first["reviewer_total"] == 6
+
+    seen = [item["user_id"] for item in first["items"]]
+    after_id = first["next_after_id"]
+    while after_id is not None:
+        page = client.get("/clans/1/members", params={"limit": 2, "after_id": after_id}).json()
+        seen.extend(item["user_id"] for item in page["items"])
+        assert sorted(item["user_id"] for item in page["reviewer_items"]) == reviewers
+        after_id = page["next_after_id"]
+
+    assert seen == [item["user_id"] for item in large.json()["items"]]
+    assert sorted(seen) == list(range(1, 8))
+    assert large.json()["has_more"] is False
+    assert large.json()["next_after_id"] is None
+
+
 def test_add_member_admin_ok(client, override_current_user, seed_clan_admin_membership, seed_user2_non_member):
     payload = {"user_id": 2, "role": "member"}
     r = client.post("/clans/1/members", json=payload)
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models import (
+    Base,
+    Clan,
+    ClanMembership,
+    CommunityConfirmationContact,
+    CommunityConfirmationRequest,
+    CommunityConfirmationResponse,
+    User,
+)
+from app.core.clan_auth import ensure_membership
+from app.services.clans_service import create_clan, join_clan
+from app.services.community_confirmation_service import (
+    backfill_default_confirmation_contacts,
+    list_confirmation_inbox,
+    provision_confirmation_contacts_for_membership,
+)
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    Base.metadata.create_all(bind=engine)
+
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _seed(db, *, members: int = 3):
+    clan = Clan(name="Confirmation Inbox", status="active")
+    users = [
+        User(email=f"inbox-{index}@example.com", hashed_password="x", role="user")
+        for index in range(members)
+    ]
+    db.add(clan)
+    db.add_all(users)
+    db.commit()
+    return clan, users
+
+
+def _contacts(db, clan_id: int) -> dict[int, str]:
+    return {
+        int(row.user_id): row.role_type
+        for row in db.query(CommunityConfirmationContact)
+        .filter(CommunityConfirmationContact.community_id == clan_id)
+        .all()
+    }
+
+
+def _request(db, *, clan, subject, token: str) -> CommunityConfirmationRequest:
+    request = CommunityConfirmationRequest(
+        public_token=token,
+        subject_user_id=subject.id,
+        community_id=clan.id,
+        reason_type="merchant_trust_check",
+        expires_at=datetime.now(timezone.utc) + timedelta(days=3),
+    )
+    db.add(request)
+    db.commit()
+    return request
+
+
+def test_joining_and_rejoining_provisions_contacts_once(db):
+    _clan, (admin, member, _other) = _seed(db)
+    clan = create_clan(db, creator=admin, name="Confirmation Joiners")
+    membership = join_clan(db, user=member, clan_id=clan.id)
+
+    assert _contacts(db, clan.id) == {admin.id: "admin", member.id: "member"}
+
+    membership.left_at = datetime.now(timezone.utc)
+    db.commit()
+    ensure_membership(db=db, clan=clan, user=member)
+
+    assert db.query(CommunityConfirmationContact).count() == 2
+
+
+def test_plain_session_writes_provision_no_contacts(db):
+    clan, (_admin, member, _other) = _seed(db)
+    db.add(ClanMembership(clan_id=clan.id, user_id=member.id, role="user"))
+    db.commit()
+
+    assert _contacts(db, clan.id) == {}
+
+
+def test_backfill_covers_memberships_written_outside_the_orm(db):
+    clan, users = _seed(db)
+    db.execute(
+        insert(ClanMembership),
+        [{"clan_id": clan.id, "user_id": user.id, "role": "user"} for user in users],
+    )
+    db.commit()
+    assert _contacts(db, clan.id) == {}
+
+    result = backfill_default_confirmation_contacts(db, chunk_size=2)
+
+    assert result["contacts_created"] == 3
+    assert result["chunks"] == 2
+    assert set(_contacts(db, clan.id)) == {user.id for user in users}
+    assert backfill_default_confirmation_contacts(db)["contacts_created"] == 0
+
+
+def test_inbox_is_read_only_and_pages_unanswered_requests(db):
+    clan, (subject, responder, other) = _seed(db)
+    for user in (subject, responder, other):
+        membership = ClanMembership(clan_id=clan.id, user_id=user.id, role="user")
+        db.add(membership)
+        provision_confirmation_contacts_for_membership(db, membership)
+    db.commit()
+
+    requests = [_request(db, clan=clan, subject=subject, token=f"inbox-{index}") for index in range(5)]
+    db.add(
+        CommunityConfirmationResponse(
+            request_id=requests[4].id,
+            responder_user_id=responder.id,
+            response_type="active_here",
+        )
+    )
+    db.commit()
+
+    # Read before counting: the attribute refresh after commit is a SELECT.
+    responder_id = int(responder.id)
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        first = list_confirmation_inbox(db, responder_user_id=responder_id, limit=3)
+        first_page_statements = len(statements)
+        second = list_confirmation_inbox(
+            db,
+            responder_user_id=responder_id,
+            limit=3,
+            before_id=first["next_before_id"],
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert [item["id"] for item in first["items"]] == [requests[3].id, requests[2].id, requests[1].id]
+    assert first["has_more"] is True
+    assert [item["id"] for item in second["items"]] == [requests[0].id]
+    assert second["has_more"] is False
+    assert second["next_before_id"] is None
+    assert first["items"][0]["subject_profile"]["membership_status"] == "active"
+
+    assert not [s for s in statements if s.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE"))]
+    # Responder, page, then one query each for clans, subjects, memberships
+    # and response counts.
+    assert first_page_statements == 6
+
+
+def test_inbox_does_not_provision_contacts_for_bulk_memberships(db):
+    clan, (subject, responder, _other) = _seed(db)
+    db.execute(
+        insert(ClanMembership),
+        [
+            {"clan_id": clan.id, "user_id": user.id, "role": "user"}
+            for user in (subject, responder)
+        ],
+    )
+    db.commit()
+    request = _request(db, clan=clan, subject=subject, token="inbox-bulk")
+
+    assert list_confirmation_inbox(db, responder_user_id=responder.id)["items"] == []
+    assert _contacts(db, clan.id) == {}
+
+    backfill_default_confirmation_contacts(db)
+    inbox = list_confirmation_inbox(db, responder_user_id=responder.id)
+    assert [item["id"] for item in inbox["items"]] == [request.id]
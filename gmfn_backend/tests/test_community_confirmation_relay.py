@@ -26,7 +26,10 @@ from app.db.notification_models import Notification
 from app.main import app
 import app.api.routes.community_confirmations as community_confirmation_routes
 import app.services.community_confirmation_service as community_confirmation_service
-from app.services.community_confirmation_service import build_community_confirmation_summary
+from app.services.community_confirmation_service import (
+    backfill_default_confirmation_contacts,
+    build_community_confirmation_summary,
+)
 from app.services.trust_score_service import compute_trust_breakdown
 
 
@@ -2626,6 +2629,10 @@ def test_confirmation_request_status_update_records_trust_event(client: TestClie
 
 def test_responder_can_opt_out_of_confirmation_relay(client: TestClient):
     _seed_relay_fixture()
+    # The fixture inserts memberships in raw SQL; the backfill gives them
+    # contacts, as it does for existing members on deploy.
+    with SessionLocal() as db:
+        backfill_default_confirmation_contacts(db)
 
     app.dependency_overrides[get_current_user] = lambda: Obj(
         id=2,
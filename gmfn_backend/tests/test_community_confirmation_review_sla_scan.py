@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models import (
+    Base,
+    Clan,
+    ClanMembership,
+    CommunityConfirmationPolicy,
+    CommunityConfirmationRequest,
+    CommunityConfirmationReviewCase,
+    MaintenanceCheckpoint,
+    TrustEvent,
+    User,
+)
+from app.db.notification_models import Notification
+from app.services.community_confirmation_service import (
+    REVIEW_SLA_SCAN_JOB_KEY,
+    scan_all_confirmation_review_sla_events,
+    scan_confirmation_review_sla_events,
+)
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    Base.metadata.create_all(bind=engine)
+
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _seed(db):
+    now = datetime.now(timezone.utc)
+    strict = Clan(name="Strict Review", status="active")
+    relaxed = Clan(name="Relaxed Review", status="active")
+    admin = User(email="sla-admin@example.com", hashed_password="x", role="admin")
+    subject = User(email="sla-subject@example.com", hashed_password="x", role="user")
+    db.add_all([strict, relaxed, admin, subject])
+    db.commit()
+
+    db.add_all(
+        [
+            ClanMembership(clan_id=strict.id, user_id=admin.id, role="admin"),
+            ClanMembership(clan_id=relaxed.id, user_id=admin.id, role="admin"),
+            # Relaxed keeps the default 24h / 72h thresholds.
+            CommunityConfirmationPolicy(
+                community_id=strict.id,
+                review_attention_after_hours=2,
+                review_overdue_after_hours=4,
+            ),
+        ]
+    )
+    db.commit()
+
+    ages = [
+        (strict, 1),  # fresh
+        (strict, 3),  # needs attention
+        (strict, 10),  # overdue
+        (relaxed, 10),  # fresh under the default policy
+        (relaxed, 30),  # needs attention
+        (relaxed, 100),  # overdue
+    ]
+    for index, (clan, age_hours) in enumerate(ages):
+        request = CommunityConfirmationRequest(
+            public_token=f"sla-scan-{index}",
+            subject_user_id=subject.id,
+            community_id=clan.id,
+            reason_type="merchant_trust_check",
+            status="under_review",
+            expires_at=now + timedelta(days=3),
+        )
+        db.add(request)
+        db.flush()
+        db.add(
+            CommunityConfirmationReviewCase(
+                request_id=request.id,
+                community_id=clan.id,
+                subject_user_id=subject.id,
+                opened_by_user_id=subject.id,
+                status="open",
+                trust_impact="none",
+                created_at=now - timedelta(hours=age_hours),
+            )
+        )
+    db.commit()
+    return admin
+
+
+def test_scan_pages_through_every_open_case_with_a_checkpoint(db):
+    admin = _seed(db)
+
+    first = scan_all_confirmation_review_sla_events(
+        db,
+        actor_user_id=admin.id,
+        actor_role="admin",
+        chunk_size=2,
+        max_cases=4,
+    )
+    assert first["scan_completed"] is False
+    assert first["scanned"] == 4
+    assert first["chunks"] == 2
+    checkpoint = db.query(MaintenanceCheckpoint).filter_by(job_key=REVIEW_SLA_SCAN_JOB_KEY).one()
+    assert checkpoint.cursor_json is not None
+
+    second = scan_all_confirmation_review_sla_events(
+        db,
+        actor_user_id=admin.id,
+        actor_role="admin",
+        chunk_size=2,
+        max_cases=4,
+    )
+    assert second["resumed"] is True
+    assert second["scan_completed"] is True
+    assert second["scanned"] == 2
+    db.refresh(checkpoint)
+    assert checkpoint.cursor_json is None
+
+    assert first["needs_attention_cases"] + second["needs_attention_cases"] == 2
+    assert first["overdue_cases"] + second["overdue_cases"] == 2
+    assert first["events_recorded"] + second["events_recorded"] == 4
+
+    markers = sorted(row.dedupe_key.rsplit(":", 1)[1] for row in db.query(TrustEvent).all())
+    assert markers == ["needs_attention", "needs_attention", "overdue", "overdue"]
+    # The opener (the subject here) and the community admin hear about each marker.
+    assert db.query(Notification).count() == 8
+
+
+def test_rescan_records_nothing_new(db):
+    admin = _seed(db)
+    scan_all_confirmation_review_sla_events(db, actor_user_id=admin.id, actor_role="admin")
+
+    again = scan_all_confirmation_review_sla_events(db, actor_user_id=admin.id, actor_role="admin")
+
+    assert again["scanned"] == 6
+    assert again["events_recorded"] == 0
+    assert again["notifications_created"] == 0
+    assert db.query(TrustEvent).count() == 4
+    assert db.query(Notification).count() == 8
+
+
+def test_community_admin_scan_is_scoped_to_one_community(db):
+    admin = _seed(db)
+    with pytest.raises(PermissionError):
+        scan_all_confirmation_review_sla_events(db, actor_user_id=admin.id, actor_role="user")
+
+    strict_id = db.query(Clan.id).filter(Clan.name == "Strict Review").scalar()
+    result = scan_all_confirmation_review_sla_events(
+        db,
+        actor_user_id=admin.id,
+        actor_role="user",
+        community_id=strict_id,
+    )
+    assert result["scanned"] == 3
+    assert result["job_key"] == f"{REVIEW_SLA_SCAN_JOB_KEY}:community:{strict_id}"
+    assert result["recorded_by_status"] == {"needs_attention": 1, "overdue": 1}
+
+
+def test_admin_single_page_scan_reads_oldest_cases_first(db):
+    admin = _seed(db)
+
+    result = scan_confirmation_review_sla_events(
+        db, actor_user_id=admin.id, actor_role="admin", limit=1
+    )
+
+    assert result["scanned"] == 1
+    assert result["recorded_by_status"] == {"needs_attention": 0, "overdue": 1}
+    (item,) = result["sample_recorded_items"]
+    assert item["age_hours"] >= 100
+    marker = db.query(TrustEvent).one()
+    assert marker.dedupe_key == f"cc-review-sla:{item['review_case_id']}:overdue"
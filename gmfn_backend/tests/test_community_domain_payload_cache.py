@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routes import community_domains as community_domains_route
+from app.core.auth import get_current_user
+from app.db.database import SessionLocal
+from app.db.models import CommunityDomain, User
+from app.main import app
+from app.services.community_domain_payload_cache import (
+    bump_community_domain_change_version,
+    cached_community_domain_payload,
+    community_domain_change_version,
+)
+from app.services.trust_events_services import log_trust_event
+
+
+@pytest.fixture(autouse=True)
+def _enable_payload_cache(monkeypatch):
+    monkeypatch.setenv("GMFN_COMMUNITY_DOMAIN_CACHE_TTL_SECONDS", "60")
+
+
+def _seed_user(user_id: int, email: str) -> User:
+    with SessionLocal() as db:
+        db.add(User(id=user_id, email=email, hashed_password="hashed", role="user"))
+        db.commit()
+    return User(id=user_id, email=email, hashed_password="hashed", role="user")
+
+
+def _count_builds(monkeypatch) -> list[int]:
+    builds: list[int] = []
+    original = community_domains_route._community_domain_operating_map_payload
+
+    def _counting(*args, **kwargs):
+        builds.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(
+        community_domains_route,
+        "_community_domain_operating_map_payload",
+        _counting,
+    )
+    return builds
+
+
+def _create_domain(client: TestClient) -> tuple[int, int]:
+    created = client.post(
+        "/community-domains/drafts",
+        json={
+            "domain_name": "Cached Map Schools",
+            "display_name": "Cached Map Schools",
+            "domain_type": "school",
+            "template_key": "school_multi_branch",
+        },
+    )
+    assert created.status_code == 201, created.text
+    domain = created.json()["community_domain"]
+    return int(domain["id"]), int(domain["root_node"]["id"])
+
+
+def test_operating_map_is_served_from_cache_until_domain_changes(
+    client: TestClient, monkeypatch
+):
+    owner = _seed_user(1, "cached-map-owner@example.com")
+    builds = _count_builds(monkeypatch)
+    try:
+        app.dependency_overrides[get_current_user] = lambda: owner
+        domain_id, root_node_id = _create_domain(client)
+
+        first = client.get(f"/community-domains/{domain_id}/operating-map")
+        second = client.get(f"/community-domains/{domain_id}/operating-map")
+        assert first.status_code == 200, first.text
+        assert second.json() == first.json()
+        assert len(builds) == 1
+
+        branch = client.post(
+            f"/community-domains/{domain_id}/nodes",
+            json={
+                "name": "Cached Branch",
+                "parent_node_id": root_node_id,
+                "node_type": "campus",
+                "node_kind": "school_branch",
+            },
+        )
+        assert branch.status_code in {200, 201}, branch.text
+
+        third = client.get(f"/community-domains/{domain_id}/operating-map")
+        assert third.status_code == 200, third.text
+        assert len(builds) == 2
+        assert third.json() != first.json()
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+
+
+def test_operating_map_cache_is_keyed_by_viewer(client: TestClient, monkeypatch):
+    owner = _seed_user(1, "cached-map-owner@example.com")
+    builds = _count_builds(monkeypatch)
+    try:
+        app.dependency_overrides[get_current_user] = lambda: owner
+        domain_id, _root_node_id = _create_domain(client)
+        assert client.get(f"/community-domains/{domain_id}/operating-map").status_code == 200
+
+        admin = User(
+            id=1,
+            email="cached-map-owner@example.com",
+            hashed_password="hashed",
+            role="admin",
+        )
+        app.dependency_overrides[get_current_user] = lambda: admin
+        assert client.get(f"/community-domains/{domain_id}/operating-map").status_code == 200
+        assert len(builds) == 2
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+
+
+def test_only_explicit_bumps_move_the_domain_change_version():
+    _seed_user(1, "cached-map-owner@example.com")
+    with SessionLocal() as db:
+        domain = CommunityDomain(
+            domain_name="version-bump",
+            display_name="Version Bump",
+            owner_user_id=1,
+        )
+        db.add(domain)
+        db.commit()
+        domain_id = int(domain.id)
+        start = community_domain_change_version(db, domain_id)
+
+        # Plain session writes carry no hook; the write path bumps.
+        domain.public_profile = "Updated profile"
+        db.commit()
+        assert community_domain_change_version(db, domain_id) == start
+
+        bump_community_domain_change_version(db, domain_id)
+        db.commit()
+        assert community_domain_change_version(db, domain_id) == start + 1
+
+        bump_community_domain_change_version(db, domain_id)
+        db.rollback()
+        assert community_domain_change_version(db, domain_id) == start + 1
+
+
+def test_trust_events_naming_the_domain_bump_the_version():
+    _seed_user(1, "cached-map-owner@example.com")
+    with SessionLocal() as db:
+        domain = CommunityDomain(
+            domain_name="version-events",
+            display_name="Version Events",
+            owner_user_id=1,
+        )
+        db.add(domain)
+        db.commit()
+        domain_id = int(domain.id)
+        start = community_domain_change_version(db, domain_id)
+
+        log_trust_event(
+            db,
+            event_type="clan.unrelated_event",
+            clan_id=None,
+            actor_user_id=1,
+            subject_user_id=1,
+            meta={"reason": "unrelated"},
+        )
+        assert community_domain_change_version(db, domain_id) == start
+
+        log_trust_event(
+            db,
+            event_type="community_domain.notice_published",
+            clan_id=None,
+            actor_user_id=1,
+            subject_user_id=1,
+            meta={"community_domain_id": domain_id},
+        )
+        assert community_domain_change_version(db, domain_id) == start + 1
+
+
+def test_cached_payloads_are_returned_as_copies():
+    _seed_user(1, "cached-map-owner@example.com")
+    with SessionLocal() as db:
+        domain = CommunityDomain(
+            domain_name="version-copies",
+            display_name="Version Copies",
+            owner_user_id=1,
+        )
+        db.add(domain)
+        db.commit()
+
+        def _fetch():
+            return cached_community_domain_payload(
+                db,
+                community_domain_id=int(domain.id),
+                endpoint="copies",
+                viewer=(1, "user"),
+                build=lambda: {"nodes": [{"id": 1}]},
+            )
+
+        first = _fetch()
+        first["nodes"].append({"id": 2})
+        second = _fetch()
+        second["nodes"][0]["id"] = 99
+
+        assert _fetch() == {"nodes": [{"id": 1}]}
@@ -4,6 +4,7 @@ import json
 from datetime import datetime, timedelta, timezone
 
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
 from app.core.auth import get_current_user
 from app.db.database import SessionLocal
@@ -615,6 +616,279 @@ def test_community_domain_period_summary_reports_recorded_facts_only(
         app.dependency_overrides.pop(get_current_user, None)
 
 
+def test_community_domain_period_summary_aggregates_counts_in_sql(
+    client: TestClient,
+):
+    owner = _seed_owner()
+    now = datetime.now(timezone.utc)
+    start = now - timedelta(days=2)
+    end = now + timedelta(days=2)
+    for index in range(2, 14):
+        _seed_user(index, f"period-aggregate-{index}@example.com")
+
+    with SessionLocal() as db:
+        db.add(
+            CommunityDomain(
+                id=1,
+                domain_name="period-aggregate",
+                display_name="Period Aggregate",
+                domain_type="ngo_project",
+                template_key="ngo_project",
+                owner_user_id=1,
+                status="active",
+            )
+        )
+        db.flush()
+        db.add(
+            CommunityDomainMembership(
+                community_domain_id=1,
+                user_id=1,
+                role="owner",
+                status="active",
+                created_at=now - timedelta(days=10),
+                updated_at=now - timedelta(days=10),
+            )
+        )
+        for index in range(2, 14):
+            created_at = now - timedelta(hours=index)
+            db.add(
+                CommunityDomainMembership(
+                    community_domain_id=1,
+                    user_id=index,
+                    role="Field Officer" if index % 3 == 0 else "member",
+                    status="active" if index % 2 == 0 else "suspended",
+                    created_at=created_at if index < 8 else now - timedelta(days=9),
+                    updated_at=created_at,
+                )
+            )
+        for index in range(1, 13):
+            db.add(
+                CommunityDomainActionReview(
+                    id=index,
+                    community_domain_id=1,
+                    action_key="domain_member.upsert",
+                    requested_by_user_id=1,
+                    subject_user_id=2,
+                    target_type="domain_member",
+                    target_id="2",
+                    status="pending" if index % 2 else "applied",
+                    created_at=now - timedelta(hours=index),
+                    updated_at=now - timedelta(hours=index),
+                    applied_at=None if index % 2 else now - timedelta(minutes=index),
+                    payload_json=json.dumps({"user_id": 2, "status": "active"}),
+                )
+            )
+        db.flush()
+        db.add_all(
+            [
+                CommunityDomainActionReviewEvidence(
+                    action_review_id=1,
+                    community_domain_id=1,
+                    submitted_by_user_id=1,
+                    evidence_type="photo",
+                    title="Site visit",
+                    description="Attendee list from the EVENT",
+                    status="active",
+                    created_at=now - timedelta(hours=3),
+                ),
+                CommunityDomainActionReviewEvidence(
+                    action_review_id=2,
+                    community_domain_id=1,
+                    submitted_by_user_id=1,
+                    evidence_type="receipt",
+                    title="Stipend receipt",
+                    status="active",
+                    created_at=now - timedelta(hours=2),
+                ),
+            ]
+        )
+        db.commit()
+
+    try:
+        app.dependency_overrides[get_current_user] = lambda: owner
+        params = {"period_start": start.isoformat(), "period_end": end.isoformat()}
+        response = client.get("/community-domains/1/period-summary", params=params)
+        assert response.status_code == 200, response.text
+        data = response.json()
+        assert data["membership_snapshot"]["total"] == 13
+        assert data["membership_snapshot"]["by_status"] == {"active": 7, "suspended": 6}
+        assert data["membership_snapshot"]["by_role"]["field_officer"] == 4
+        assert data["member_movement"]["added"] == 6
+        assert data["member_movement"]["updated"] == 6
+        assert data["governance_summary"]["total"] == 12
+        assert data["governance_summary"]["requested_total"] == 12
+        assert data["governance_summary"]["applied_total"] == 6
+        assert data["governance_summary"]["by_status"] == {"pending": 6, "applied": 6}
+        assert data["evidence_summary"]["total"] == 2
+        assert data["evidence_summary"]["meeting_signal_count"] == 1
+        assert data["evidence_summary"]["attendance_signal_count"] == 1
+        assert data["source_records"]["membership_rows"] == {"total": 13}
+        assert data["source_records"]["action_reviews"] == {
+            "total": 12,
+            "ids": list(range(1, 11)),
+            "truncated": True,
+        }
+        assert data["source_records"]["action_review_evidence"]["ids"] == [2, 1]
+
+        public = client.get(
+            "/community-domains/1/period-summary",
+            params={**params, "visibility_mode": "public_safe"},
+        )
+        assert public.status_code == 200, public.text
+        assert public.json()["source_records"]["action_reviews"] == {"total": 12}
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+
+
+def test_community_domain_period_summary_scopes_nodes_by_path_prefix(
+    client: TestClient,
+):
+    owner = _seed_owner()
+    now = datetime.now(timezone.utc)
+
+    with SessionLocal() as db:
+        db.add(
+            CommunityDomain(
+                id=1,
+                domain_name="period-scope",
+                display_name="Period Scope",
+                domain_type="ngo_project",
+                template_key="ngo_project",
+                owner_user_id=1,
+                status="active",
+            )
+        )
+        db.flush()
+        db.add_all(
+            [
+                CommunityNode(id=10, community_domain_id=1, name="North", path="/1/10", depth=1),
+                CommunityNode(
+                    id=11,
+                    community_domain_id=1,
+                    parent_node_id=10,
+                    name="North Ward",
+                    path="/1/10/11",
+                    depth=2,
+                ),
+                CommunityNode(id=100, community_domain_id=1, name="South", path="/1/100", depth=1),
+            ]
+        )
+        db.flush()
+        for review_id, node_id in ((1, 10), (2, 11), (3, 100), (4, None)):
+            db.add(
+                CommunityDomainActionReview(
+                    id=review_id,
+                    community_domain_id=1,
+                    community_node_id=node_id,
+                    action_key="domain_member.upsert",
+                    requested_by_user_id=1,
+                    subject_user_id=1,
+                    target_type="domain_member",
+                    target_id="1",
+                    status="pending",
+                    created_at=now - timedelta(hours=1),
+                    updated_at=now - timedelta(hours=1),
+                    payload_json=json.dumps({"user_id": 1}),
+                )
+            )
+        db.commit()
+
+    try:
+        app.dependency_overrides[get_current_user] = lambda: owner
+        params = {
+            "period_start": (now - timedelta(days=1)).isoformat(),
+            "period_end": (now + timedelta(days=1)).isoformat(),
+            "community_node_id": 10,
+        }
+        scoped = client.get("/community-domains/1/period-summary", params=params)
+        assert scoped.status_code == 200, scoped.text
+        # /1/100 shares the "/1/10" text prefix but is not under node 10.
+        assert scoped.json()["governance_summary"]["total"] == 2
+        assert scoped.json()["source_records"]["action_reviews"]["ids"] == [1, 2]
+
+        single = client.get(
+            "/community-domains/1/period-summary",
+            params={**params, "include_descendants": False},
+        )
+        assert single.status_code == 200, single.text
+        assert single.json()["governance_summary"]["total"] == 1
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+
+
+def test_community_domain_counters_read_flushed_rows_in_one_select():
+    from app.api.routes.community_domains import _community_domain_counters
+
+    _seed_owner()
+    _seed_user(2, "domain-counters-member@example.com")
+    with SessionLocal() as db:
+        db.add(
+            CommunityDomain(
+                id=1,
+                domain_name="domain-counters",
+                display_name="Domain Counters",
+                domain_type="ngo_project",
+                template_key="ngo_project",
+                owner_user_id=1,
+                status="active",
+            )
+        )
+        db.flush()
+        db.add_all(
+            [
+                CommunityDomainMembership(
+                    community_domain_id=1, user_id=1, role="owner", status="active"
+                ),
+                CommunityDomainMembership(
+                    community_domain_id=1, user_id=2, role="member", status="suspended"
+                ),
+                CommunityDomainPolicy(
+                    community_domain_id=1,
+                    policy_key="privacy.visibility",
+                    action_key="domain_member.upsert",
+                    created_by_user_id=1,
+                    status="active",
+                ),
+            ]
+        )
+        db.commit()
+
+        statements: list[str] = []
+
+        def _capture(_conn, _cursor, statement, *_args):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            counters = _community_domain_counters(db, community_domain_id=1)
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+        assert len(statements) == 1
+        assert counters == {
+            "node_count": 0,
+            "active_member_count": 1,
+            "active_node_member_count": 0,
+            "active_policy_count": 1,
+            "open_review_count": 0,
+        }
+
+        member = (
+            db.query(CommunityDomainMembership)
+            .filter(CommunityDomainMembership.user_id == 2)
+            .one()
+        )
+        member.status = "active"
+        db.flush()
+        assert _community_domain_counters(db, community_domain_id=1)[
+            "active_member_count"
+        ] == 2
+        db.rollback()
+        assert _community_domain_counters(db, community_domain_id=1)[
+            "active_member_count"
+        ] == 1
+
+
 def test_community_domain_period_summary_is_admin_only_and_validates_period(
     client: TestClient,
 ):
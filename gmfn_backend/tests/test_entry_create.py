@@ -1793,6 +1793,59 @@ def test_admin_pilot_intake_reports_completed_create_entry(client, override_curr
     assert "Creation appears complete" in item["next_action"]
 
 
+def test_admin_pilot_intake_counts_whole_funnel_beyond_listed_page(client, override_current_user):
+    now = datetime.now(timezone.utc)
+    with SessionLocal() as db:
+        db.add(
+            User(
+                email="Funnel.Existing@Example.com",
+                hashed_password=get_password_hash("secret123"),
+                role="user",
+            )
+        )
+        db.add_all(
+            [
+                EntryPhoneVerification(
+                    display_name="Funnel Existing",
+                    phone_e164="+2348012345710",
+                    email="  funnel.existing@example.com ",
+                    code="111111",
+                    expires_at=now + timedelta(hours=1),
+                    created_at=now - timedelta(minutes=3),
+                ),
+                EntryPhoneVerification(
+                    display_name="Funnel Expired",
+                    phone_e164="+2348012345711",
+                    code="222222",
+                    expires_at=now - timedelta(minutes=1),
+                    created_at=now - timedelta(minutes=2),
+                ),
+                EntryPhoneVerification(
+                    display_name="Funnel Bank",
+                    phone_e164="+2348012345712",
+                    code="333333",
+                    expires_at=now + timedelta(hours=1),
+                    verified_at=now,
+                    bank_details_recorded_at=now,
+                    created_at=now - timedelta(minutes=1),
+                ),
+            ]
+        )
+        db.commit()
+
+    intake_res = client.get("/admin/pilot-intake?limit=1")
+    assert intake_res.status_code == 200, intake_res.text
+    summary = intake_res.json()["summary"]
+
+    # Only one entry is listed, but the stage counts cover every entry.
+    assert summary["create_total"] == 1
+    assert summary["create_funnel_total"] >= 3
+    assert summary["create_by_stage"]["account_exists"] >= 1
+    assert summary["create_by_stage"]["expired"] >= 1
+    assert summary["create_by_stage"]["ready_for_community"] >= 1
+    assert summary["needs_attention"] >= 2
+
+
 def test_entry_phone_start_resumes_unfinished_verified_session(client):
     os.environ["GMFN_DEV_MODE"] = "1"
 
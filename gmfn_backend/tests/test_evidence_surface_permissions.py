@@ -48,6 +48,7 @@ def test_member_cannot_download_admin_analytics_evidence_surfaces(
         "/analytics/clans/1/invites/recent-joins",
         "/analytics/clans/1/trust-events",
         "/analytics/clans/1/invites/recent-joins.csv",
+        "/analytics/clans/1/invites/daily.csv",
         "/analytics/clans/1/trust-events.csv",
         "/analytics/clans/1/evidence-pack.pdf",
     ]
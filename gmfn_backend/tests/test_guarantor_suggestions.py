@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models import Base, Clan, ClanMembership, Loan, LoanGuarantor, User
+from app.services.guarantor_suggestions_service import suggest_guarantors_for_loan
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    Base.metadata.create_all(bind=engine)
+
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _seed(db, member_count: int):
+    clan = Clan(name=f"Suggestions {member_count}")
+    borrower = User(
+        email=f"suggest-borrower-{member_count}@example.com",
+        hashed_password="x",
+        role="user",
+    )
+    members = [
+        User(
+            email=f"suggest-{member_count}-{index}@example.com",
+            hashed_password="x",
+            role="user",
+            trust_score=40 + index,
+            trust_band="B",
+        )
+        for index in range(member_count)
+    ]
+    db.add(clan)
+    db.add(borrower)
+    db.add_all(members)
+    db.commit()
+    db.add_all(
+        [
+            ClanMembership(clan_id=clan.id, user_id=user.id, role="user")
+            for user in [borrower, *members]
+        ]
+    )
+    # uq_loan_guarantor allows one row per (loan, guarantor), so each past
+    # request sits on its own history loan.
+    history = [
+        (members[0], "approved"),
+        (members[0], "approved"),
+        (members[0], "approved"),
+        (members[0], "approved"),
+        (members[0], "declined"),
+        (members[-1], "expired"),
+    ]
+    history_loans = [
+        Loan(
+            clan_id=clan.id,
+            borrower_user_id=borrower.id,
+            amount=Decimal("100.00"),
+            currency="NGN",
+            status="repaid",
+            guarantors_required=1,
+        )
+        for _ in history
+    ]
+    loan = Loan(
+        clan_id=clan.id,
+        borrower_user_id=borrower.id,
+        amount=Decimal("100.00"),
+        currency="NGN",
+        status="pending",
+        guarantors_required=1,
+    )
+    db.add_all([*history_loans, loan])
+    db.commit()
+
+    # The lowest-trust member has a strong approval record.
+    db.add_all(
+        [
+            LoanGuarantor(
+                loan_id=history_loan.id,
+                clan_id=clan.id,
+                guarantor_user_id=guarantor.id,
+                pledge_amount=Decimal("10.00"),
+                status=status,
+            )
+            for history_loan, (guarantor, status) in zip(history_loans, history)
+        ]
+    )
+    db.commit()
+    return clan, borrower, members, loan
+
+
+def test_suggestions_rank_by_trust_and_grouped_history(db):
+    clan, borrower, members, loan = _seed(db, member_count=4)
+
+    data = suggest_guarantors_for_loan(
+        db,
+        loan_id=int(loan.id),
+        clan_id=int(clan.id),
+        borrower_user_id=int(borrower.id),
+        limit=2,
+    )
+
+    items = data["items"]
+    assert [item["user_id"] for item in items] == [members[0].id, members[-1].id]
+    top = items[0]
+    assert (top["total_requests"], top["approved"], top["declined"], top["expired"]) == (
+        5,
+        4,
+        1,
+        0,
+    )
+    assert top["reliability_score"] == 7
+    assert top["rank"] == 43.5
+    assert top["reason"] == "Trust 40 (Band B), reliability 7, history 5 requests"
+
+
+def test_suggestion_query_count_does_not_grow_with_clan_size(db):
+    def _statements_for(member_count: int) -> int:
+        clan, borrower, _members, loan = _seed(db, member_count=member_count)
+        statements: list[str] = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            db.expire_all()
+            data = suggest_guarantors_for_loan(
+                db,
+                loan_id=int(loan.id),
+                clan_id=int(clan.id),
+                borrower_user_id=int(borrower.id),
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+        assert data["items"]
+        return len(statements)
+
+    assert _statements_for(3) == _statements_for(15)
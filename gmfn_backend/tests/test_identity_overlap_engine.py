@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base as CoreBase
+from app.db.database import Base as IdentityBase
+from app.db.identity_models import DeviceFingerprint, IdentityCluster, IdentityRiskSignal
+from app.services.identity_service import (
+    detect_identity_overlap,
+    recluster_device_fingerprints,
+)
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        future=True,
+    )
+
+    CoreBase.metadata.create_all(bind=engine)
+    IdentityBase.metadata.create_all(bind=engine)
+
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _seen(db, devices: dict[str, list[int]]) -> None:
+    db.add_all(
+        [
+            DeviceFingerprint(user_id=user_id, fingerprint_hash=fingerprint_hash)
+            for fingerprint_hash, user_ids in devices.items()
+            for user_id in user_ids
+        ]
+    )
+    db.commit()
+
+
+def test_shared_kiosk_observation_is_linked_in_bulk_and_once(db):
+    _seen(db, {"kiosk": list(range(1, 31))})
+
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        first = detect_identity_overlap(db, user_id=30, fingerprint_hash="kiosk")
+        first_statements = list(statements)
+        again = detect_identity_overlap(db, user_id=30, fingerprint_hash="kiosk")
+        again_statements = statements[len(first_statements):]
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert first["matched_user_ids"] == list(range(1, 30))
+    assert (first["signals_created"], first["clusters_created"]) == (29, 29)
+    # Matches, existing signals and existing links are each read once, not per account.
+    reads = [s for s in first_statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(reads) == 3
+
+    assert (again["signals_created"], again["clusters_created"]) == (0, 0)
+    assert not [s for s in again_statements if s.lstrip().upper().startswith("INSERT")]
+    assert db.query(IdentityRiskSignal).count() == 29
+    assert db.query(IdentityCluster).count() == 29
+    assert {(c.root_user_id, c.linked_user_id) for c in db.query(IdentityCluster).all()} == {
+        (other, 30) for other in range(1, 30)
+    }
+
+
+def test_recluster_links_every_shared_device_and_reports_components(db):
+    _seen(
+        db,
+        {
+            "a-device": [1, 2, 3],
+            "b-device": [3, 4],
+            "c-device": [5],
+            "d-device": [6, 7],
+        },
+    )
+    db.add(IdentityCluster(root_user_id=1, linked_user_id=2, reason="device_fingerprint_overlap", confidence=6))
+    db.commit()
+
+    result = recluster_device_fingerprints(db, chunk_size=2)
+
+    assert result["fingerprint_pairs_scanned"] == 8
+    assert result["shared_devices"] == 3
+    assert result["links_created"] == 3
+    assert result["clusters"] == 2
+    assert result["largest_clusters"][0] == {"root_user_id": 1, "size": 4, "user_ids": [1, 2, 3, 4]}
+    assert result["largest_clusters"][1]["user_ids"] == [6, 7]
+    assert {(c.root_user_id, c.linked_user_id) for c in db.query(IdentityCluster).all()} == {
+        (1, 2),
+        (1, 3),
+        (3, 4),
+        (6, 7),
+    }
+    assert db.query(IdentityRiskSignal).count() == 0
+
+    assert recluster_device_fingerprints(db)["links_created"] == 0
+
+
+def test_recluster_dry_run_writes_nothing(db):
+    _seen(db, {"shared": [1, 2]})
+
+    result = recluster_device_fingerprints(db, dry_run=True)
+
+    assert result["clusters"] == 1
+    assert result["links_created"] == 0
+    assert db.query(IdentityCluster).count() == 0
+
+
+def test_recluster_checks_existing_links_once_per_chunk(db):
+    _seen(db, {f"device-{index:02d}": [index, index + 1] for index in range(1, 21)})
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        result = recluster_device_fingerprints(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert result["links_created"] == 20
+    assert result["largest_clusters"][0] == {
+        "root_user_id": 1,
+        "size": 21,
+        "user_ids": list(range(1, 22)),
+    }
+    cluster_reads = [
+        s for s in statements if s.lstrip().upper().startswith("SELECT") and "identity_clusters" in s
+    ]
+    assert len(cluster_reads) == 1
@@ -1007,8 +1007,9 @@ def test_analytics_evidence_downloads_use_gsn_filenames():
     assert "_ensure_can_view_complete_loan_evidence(db, current_user=user, loan=loan)" in text
     assert "build_clan_evidence_pack_pdf(db, clan_id=clan_id, redact=True)" in text
     assert "build_loan_evidence_pack_pdf(db, loan_id=loan_id, redact=True)" in text
-    assert text.count("_ensure_clan_admin_or_platform_admin(db, current_user=user, clan_id=int(clan_id))") == 6
+    assert text.count("_ensure_clan_admin_or_platform_admin(db, current_user=user, clan_id=int(clan_id))") == 7
     assert "gsn-community-{clan_id}-recent-invite-joins.csv" in text
+    assert "gsn-community-{clan_id}-invites-daily.csv" in text
     assert "gsn-community-{clan_id}-trust-events.csv" in text
     assert "gsn-community-{clan_id}-evidence-pack.pdf" in text
     assert "gsn-loan-{loan_id}-evidence-pack.pdf" in text
@@ -1016,6 +1017,7 @@ def test_analytics_evidence_downloads_use_gsn_filenames():
     assert "GMFN_loan_{loan_id}_evidence_pack.pdf" not in text
     assert "clan_{clan_id}_recent_invite_joins.csv" not in text
     assert "clan_{clan_id}_trust_events.csv" not in text
+    assert "clan_{clan_id}_invites_daily.csv" not in text
 
 
 def test_dormant_loan_audit_share_links_are_redacted_if_reenabled():
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models import Base, Clan, InviteAnalyticsRollup, TrustEvent, User
+from app.services.invite_analytics_service import (
+    get_invite_analytics,
+    get_invite_analytics_daily,
+    rebuild_invite_analytics_rollups,
+)
+from app.services.trust_events_services import log_trust_event
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    Base.metadata.create_all(bind=engine)
+
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _seed(db):
+    clan = Clan(name="Invite Rollups")
+    users = [
+        User(email=f"invite-rollup-{index}@example.com", hashed_password="x", role="user")
+        for index in range(4)
+    ]
+    db.add(clan)
+    db.add_all(users)
+    db.commit()
+    return clan, users
+
+
+def _join_meta(code: str, inviter_id: int) -> dict:
+    return {"invite_code": code, "invited_by_user_id": inviter_id}
+
+
+def _event(db, clan, user, event_type: str, at: datetime, meta: dict | None = None) -> None:
+    db.add(
+        TrustEvent(
+            event_type=event_type,
+            clan_id=clan.id,
+            actor_user_id=user.id,
+            subject_user_id=user.id,
+            meta_json=json.dumps(meta) if meta is not None else None,
+            created_at=at,
+        )
+    )
+
+
+def test_logged_invite_events_are_folded_into_rollups(db):
+    clan, (inviter, other, joiner, late) = _seed(db)
+
+    for _ in range(3):
+        log_trust_event(
+            db,
+            event_type="invite_created",
+            clan_id=clan.id,
+            actor_user_id=inviter.id,
+            subject_user_id=inviter.id,
+        )
+    log_trust_event(
+        db,
+        event_type="invite_revoked",
+        clan_id=clan.id,
+        actor_user_id=inviter.id,
+        subject_user_id=inviter.id,
+    )
+    for user, code, by in ((joiner, "ALPHA", inviter), (late, "ALPHA", inviter), (other, "BETA", other)):
+        log_trust_event(
+            db,
+            event_type="clan_join_via_invite",
+            clan_id=clan.id,
+            actor_user_id=user.id,
+            subject_user_id=user.id,
+            meta=_join_meta(code, by.id),
+        )
+    log_trust_event(
+        db,
+        event_type="loan_repaid",
+        clan_id=clan.id,
+        actor_user_id=joiner.id,
+        subject_user_id=joiner.id,
+    )
+
+    data = get_invite_analytics(db, clan_id=clan.id)
+
+    summary = data["summary"]
+    assert (
+        summary["invites_created"],
+        summary["invites_revoked"],
+        summary["joins_via_invite"],
+        summary["unique_invites_used"],
+    ) == (3, 1, 3, 2)
+    assert summary["conversion_rate"] == 1.0
+    assert [(r["invited_by_user_id"], r["joins"]) for r in data["top_inviters"]] == [
+        (inviter.id, 2),
+        (other.id, 1),
+    ]
+    assert data["top_inviters"][0]["invited_by_email"] == inviter.email
+    assert [(r["invite_code"], r["joins"]) for r in data["top_invite_codes"]] == [
+        ("ALPHA", 2),
+        ("BETA", 1),
+    ]
+
+    folded = sorted(
+        (r.bucket, r.bucket_key, r.invites_created, r.invites_revoked, r.joins)
+        for r in db.query(InviteAnalyticsRollup).all()
+    )
+    result = rebuild_invite_analytics_rollups(db, chunk_size=2)
+    rebuilt = sorted(
+        (r.bucket, r.bucket_key, r.invites_created, r.invites_revoked, r.joins)
+        for r in db.query(InviteAnalyticsRollup).all()
+    )
+    assert result["events_scanned"] == 7
+    assert rebuilt == folded
+
+
+def test_range_reads_combine_whole_days_and_partial_edges(db):
+    clan, (inviter, other, joiner, late) = _seed(db)
+
+    def at(day: int, hour: int) -> datetime:
+        return datetime(2026, 8, day, hour, tzinfo=timezone.utc)
+
+    _event(db, clan, inviter, "invite_created", at(1, 8))
+    _event(db, clan, inviter, "invite_created", at(2, 9))
+    _event(db, clan, joiner, "clan_join_via_invite", at(2, 20), _join_meta("ALPHA", inviter.id))
+    _event(db, clan, inviter, "invite_created", at(3, 12))
+    _event(db, clan, late, "clan_join_via_invite", at(4, 6), _join_meta("ALPHA", inviter.id))
+    _event(db, clan, other, "clan_join_via_invite", at(4, 18), _join_meta("BETA", other.id))
+    db.commit()
+    rebuild_invite_analytics_rollups(db)
+
+    # 2 Aug 12:00 .. 4 Aug 12:00: one partial day at each edge plus 3 Aug whole.
+    data = get_invite_analytics(db, clan_id=clan.id, from_dt=at(2, 12), to_dt=at(4, 12))
+    summary = data["summary"]
+    assert (summary["invites_created"], summary["joins_via_invite"]) == (1, 2)
+    assert [(r["invite_code"], r["joins"]) for r in data["top_invite_codes"]] == [("ALPHA", 2)]
+    assert data["top_invite_codes"][0]["last_used_at"] == at(4, 6)
+
+    # Both ends inside one day.
+    data = get_invite_analytics(db, clan_id=clan.id, from_dt=at(4, 0), to_dt=at(4, 6))
+    assert data["summary"]["joins_via_invite"] == 1
+
+    daily = get_invite_analytics_daily(
+        db, clan_id=clan.id, from_day=date(2026, 8, 2), to_day=date(2026, 8, 4)
+    )
+    assert [(r["day"], r["invites_created"], r["joins_via_invite"]) for r in daily] == [
+        (date(2026, 8, 2), 1, 1),
+        (date(2026, 8, 3), 1, 0),
+        (date(2026, 8, 4), 0, 2),
+    ]
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models import Base, Clan, ClanMembership, Loan, LoanGuarantor, User
+from app.services.liquidity_engine_service import (
+    build_clan_liquidity_snapshot,
+    build_user_liquidity_profile,
+    build_user_liquidity_profiles,
+)
+from app.services.trust_events_services import log_trust_event
+from app.services.trust_graph_service import build_trust_graph, build_trust_graph_summaries
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    Base.metadata.create_all(bind=engine)
+
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _seed_clan(db, member_count: int = 6, label: str = "batch"):
+    clan = Clan(name=f"Liquidity {label}")
+    users = [
+        User(
+            email=f"liquidity-{label}-{index}@example.com",
+            hashed_password="x",
+            role="user",
+            personal_pool_balance=Decimal(100 * (index + 1)),
+        )
+        for index in range(member_count)
+    ]
+    db.add(clan)
+    db.add_all(users)
+    db.commit()
+
+    db.add_all(
+        [ClanMembership(clan_id=clan.id, user_id=user.id, role="user") for user in users]
+    )
+    db.commit()
+
+    for index, borrower in enumerate(users[:-1]):
+        guarantor = users[index + 1]
+        loan = Loan(
+            clan_id=clan.id,
+            borrower_user_id=borrower.id,
+            amount=Decimal("100.00"),
+            currency="NGN",
+            status="approved",
+            guarantors_required=1,
+        )
+        db.add(loan)
+        db.commit()
+        db.add(
+            LoanGuarantor(
+                loan_id=loan.id,
+                clan_id=clan.id,
+                guarantor_user_id=guarantor.id,
+                pledge_amount=Decimal("50.00"),
+                status="approved" if index % 2 == 0 else "pending",
+            )
+        )
+        db.commit()
+        log_trust_event(
+            db,
+            event_type="guarantee_given",
+            clan_id=clan.id,
+            actor_user_id=guarantor.id,
+            subject_user_id=borrower.id,
+            loan_id=loan.id,
+            meta={"guarantor_user_id": guarantor.id},
+        )
+        if index % 2 == 0:
+            log_trust_event(
+                db,
+                event_type="loan_repaid",
+                clan_id=clan.id,
+                actor_user_id=borrower.id,
+                subject_user_id=borrower.id,
+                loan_id=loan.id,
+                meta={"guarantor_user_id": guarantor.id},
+            )
+    return clan, users
+
+
+def test_batch_graph_summaries_match_single_member_reads(db):
+    _clan, users = _seed_clan(db)
+    user_ids = [int(u.id) for u in users]
+
+    batch = build_trust_graph_summaries(db, user_ids + [999999], chunk_size=2)
+
+    assert sorted(batch) == sorted(user_ids)
+    for uid in user_ids:
+        single = build_trust_graph(db, user_id=uid)
+        assert batch[uid]["summary"] == single["summary"]
+        assert batch[uid]["cci"] == single["cci"]
+
+
+def test_batch_graph_summaries_cap_edges_per_member_like_single_reads(db):
+    _clan, users = _seed_clan(db)
+    user_ids = [int(u.id) for u in users]
+
+    batch = build_trust_graph_summaries(db, user_ids, limit_events=2)
+
+    for uid in user_ids:
+        single = build_trust_graph(db, user_id=uid, limit_events=2)
+        assert batch[uid]["summary"] == single["summary"]
+
+
+def test_batch_profiles_match_single_member_profiles(db):
+    _clan, users = _seed_clan(db)
+    user_ids = [int(u.id) for u in users]
+
+    batch = build_user_liquidity_profiles(db, user_ids)
+
+    for uid in user_ids:
+        assert batch[uid] == build_user_liquidity_profile(db, uid)
+
+
+def test_clan_snapshot_query_count_does_not_grow_with_members(db):
+    def _statements_for(clan_id: int) -> int:
+        statements: list[str] = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            db.expire_all()
+            snapshot = build_clan_liquidity_snapshot(db, clan_id)
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+        assert snapshot["member_count"] > 0
+        return len(statements)
+
+    small_clan, _ = _seed_clan(db, member_count=3, label="small")
+    small = _statements_for(int(small_clan.id))
+    large_clan, _ = _seed_clan(db, member_count=12, label="large")
+    large = _statements_for(int(large_clan.id))
+
+    assert large == small
+    assert large <= 10
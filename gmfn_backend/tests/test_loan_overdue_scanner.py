@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models import Base, Clan, Loan, MaintenanceCheckpoint, User
+from app.services.loan_overdue_service import (
+    OVERDUE_SCAN_JOB_KEY,
+    inspect_overdue_loans,
+    scan_overdue_loan_book,
+)
+
+
+NOW = datetime(2026, 8, 20, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    Base.metadata.create_all(bind=engine)
+
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _seed(db):
+    clan = Clan(name="Overdue Book")
+    admin = User(email="overdue-admin@example.com", hashed_password="x", role="admin")
+    borrower = User(email="overdue-borrower@example.com", hashed_password="x", role="user")
+    db.add_all([clan, admin, borrower])
+    db.commit()
+
+    def loan(days_ago: int, *, status: str = "approved", remaining: str = "100.00") -> Loan:
+        row = Loan(
+            clan_id=clan.id,
+            borrower_user_id=borrower.id,
+            amount=Decimal("100.00"),
+            paid_total=Decimal("100.00") - Decimal(remaining),
+            remaining_amount=Decimal(remaining),
+            currency="NGN",
+            status=status,
+            due_at=NOW - timedelta(days=days_ago),
+        )
+        db.add(row)
+        return row
+
+    # Oldest overdue loans first, so a newest-by-id scan would miss them.
+    overdue = [loan(30 - index) for index in range(5)]
+    within_grace = loan(2)
+    settled = loan(40, remaining="0.00")
+    final = loan(50, status="repaid")
+    not_due = loan(-5)
+    db.commit()
+    return admin, overdue, [within_grace, settled, final, not_due]
+
+
+def test_inspection_reads_only_default_candidates(db):
+    _admin, overdue, skipped = _seed(db)
+
+    result = inspect_overdue_loans(db, grace_days=3, limit=3, now=NOW)
+
+    assert [item["loan_id"] for item in result["items"]] == [l.id for l in overdue[:3]]
+    assert all(item["should_default"] for item in result["items"])
+    assert result["next_cursor"] == {
+        "due_at": overdue[2].due_at.replace(tzinfo=timezone.utc).isoformat(),
+        "loan_id": overdue[2].id,
+    }
+
+    rest = inspect_overdue_loans(
+        db, grace_days=3, limit=3, now=NOW, after=result["next_cursor"]
+    )
+    assert [item["loan_id"] for item in rest["items"]] == [l.id for l in overdue[3:]]
+    assert rest["next_cursor"] is None
+    assert not {l.id for l in skipped} & {item["loan_id"] for item in rest["items"]}
+
+
+def test_book_scan_is_bounded_and_resumes_from_checkpoint(db):
+    admin, overdue, skipped = _seed(db)
+
+    first = scan_overdue_loan_book(
+        db, actor_user_id=admin.id, chunk_size=2, max_loans=3, now=NOW
+    )
+    assert first["scanned"] == 3
+    assert first["defaulted"] == 3
+    assert first["completed"] is False
+    assert first["next_cursor"]["loan_id"] == overdue[2].id
+    checkpoint = db.query(MaintenanceCheckpoint).filter_by(job_key=OVERDUE_SCAN_JOB_KEY).one()
+    assert checkpoint.cursor_json
+
+    second = scan_overdue_loan_book(
+        db, actor_user_id=admin.id, chunk_size=2, max_loans=10, now=NOW
+    )
+    assert second["resumed"] is True
+    assert second["completed"] is True
+    assert [item["loan_id"] for item in second["items"]] == [l.id for l in overdue[3:]]
+    db.refresh(checkpoint)
+    assert checkpoint.cursor_json is None
+
+    statuses = {row.id: row.status for row in db.query(Loan).all()}
+    assert all(statuses[l.id] == "defaulted" for l in overdue)
+    assert all(statuses[l.id] != "defaulted" for l in skipped)
+
+
+def test_book_scan_dry_run_writes_nothing(db):
+    admin, overdue, _skipped = _seed(db)
+
+    result = scan_overdue_loan_book(db, actor_user_id=admin.id, dry_run=True, now=NOW)
+
+    assert result["completed"] is True
+    assert {item["status"] for item in result["items"]} == {"would_default"}
+    assert len(result["items"]) == len(overdue)
+    assert db.query(MaintenanceCheckpoint).count() == 0
+    assert db.query(Loan).filter(Loan.status == "defaulted").count() == 0
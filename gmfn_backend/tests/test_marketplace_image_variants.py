@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from PIL import Image
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+from app.db.models import MarketplaceBroadcast, MarketplaceProduct
+from app.services.marketplace_image_variants import (
+    backfill_image_variants,
+    enqueue_image_variant_job,
+    generate_image_variants,
+    image_variants_payload,
+    record_known_image_variants,
+    wait_for_image_variant_jobs,
+)
+
+
+@pytest.fixture()
+def uploads(tmp_path, monkeypatch) -> Path:
+    monkeypatch.setenv("GMFN_UPLOADS_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        future=True,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _photo(root: Path, name: str, size=(2000, 1500)) -> str:
+    target = root / "marketplace" / "images" / name
+    target.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", size, (200, 120, 40)).save(target, format="JPEG")
+    return f"/uploads/marketplace/images/{name}"
+
+
+def _product(image_url: str) -> MarketplaceProduct:
+    return MarketplaceProduct(clan_id=1, shop_id=1, seller_user_id=1, name="Shoes", image_url=image_url)
+
+
+def test_variants_are_bounded_webp_files_and_generated_once(uploads):
+    url = _photo(uploads, "shoes.jpg")
+
+    variants = generate_image_variants(url)
+
+    assert variants == {
+        "thumb": "/uploads/marketplace/images/variants/shoes-thumb.webp",
+        "medium": "/uploads/marketplace/images/variants/shoes-medium.webp",
+    }
+    with Image.open(uploads / "marketplace/images/variants/shoes-thumb.webp") as thumb:
+        assert thumb.format == "WEBP"
+        assert thumb.size == (320, 240)
+    with Image.open(uploads / "marketplace/images/variants/shoes-medium.webp") as medium:
+        assert medium.size == (960, 720)
+
+    thumb_path = uploads / "marketplace/images/variants/shoes-thumb.webp"
+    stamp = thumb_path.stat().st_mtime_ns
+    assert generate_image_variants(url) == variants
+    assert thumb_path.stat().st_mtime_ns == stamp
+
+    payload = image_variants_payload(url, json.dumps(variants))
+    assert payload["image_thumb_url"] == variants["thumb"]
+    assert payload["image_display_url"] == variants["medium"]
+
+
+def test_unusable_sources_have_no_variants_and_fall_back_to_the_original(uploads):
+    broken = uploads / "marketplace" / "images" / "broken.jpg"
+    broken.parent.mkdir(parents=True, exist_ok=True)
+    broken.write_bytes(b"not an image")
+
+    assert generate_image_variants("/uploads/marketplace/images/broken.jpg") == {}
+    assert generate_image_variants("https://cdn.example.com/a.jpg") == {}
+    assert generate_image_variants("/uploads/../outside.jpg") == {}
+    assert image_variants_payload("/uploads/marketplace/images/broken.jpg", None) == {
+        "image_variants": {},
+        "image_thumb_url": "/uploads/marketplace/images/broken.jpg",
+        "image_display_url": "/uploads/marketplace/images/broken.jpg",
+    }
+
+
+def test_rows_record_variants_on_write_and_after_commit(uploads, db):
+    ready_url = _photo(uploads, "ready.jpg")
+    generate_image_variants(ready_url)
+    fresh_url = _photo(uploads, "fresh.png")
+
+    ready = _product(ready_url)
+    fresh = MarketplaceBroadcast(clan_id=1, author_user_id=1, message="New stock", image_url=fresh_url)
+    for row in (ready, fresh):
+        record_known_image_variants(row)
+
+    # Variants already on disk are recorded with the write itself.
+    assert json.loads(ready.image_variants_json)["thumb"].endswith("/ready-thumb.webp")
+    assert fresh.image_variants_json is None
+
+    db.add_all([ready, fresh])
+    db.commit()
+    assert enqueue_image_variant_job(db, ready) is None
+    assert enqueue_image_variant_job(db, fresh) is not None
+    wait_for_image_variant_jobs(timeout=30)
+
+    db.expire_all()
+    assert json.loads(fresh.image_variants_json) == {
+        "medium": "/uploads/marketplace/images/variants/fresh-medium.webp",
+        "thumb": "/uploads/marketplace/images/variants/fresh-thumb.webp",
+    }
+
+    ready.image_url = None
+    record_known_image_variants(ready)
+    db.commit()
+    assert ready.image_variants_json is None
+
+
+def test_plain_session_writes_queue_no_variant_jobs(uploads, db):
+    url = _photo(uploads, "untracked.jpg")
+    db.add(_product(url))
+    db.commit()
+    wait_for_image_variant_jobs(timeout=30)
+
+    row = db.query(MarketplaceProduct).one()
+    assert row.image_variants_json is None
+    assert not (uploads / "marketplace/images/variants/untracked-thumb.webp").exists()
+
+
+def test_backfill_records_variants_for_older_rows(uploads, db):
+    url = _photo(uploads, "legacy.jpg")
+    db.add_all([_product(url), _product("https://cdn.example.com/remote.jpg")])
+    db.commit()
+
+    stats = backfill_image_variants(db, chunk_size=1)
+
+    assert (stats["seen"], stats["recorded"], stats["skipped"]) == (1, 1, 0)
+    legacy = db.query(MarketplaceProduct).filter(MarketplaceProduct.image_url == url).one()
+    assert json.loads(legacy.image_variants_json)["thumb"].endswith("/legacy-thumb.webp")
+    assert backfill_image_variants(db)["seen"] == 0
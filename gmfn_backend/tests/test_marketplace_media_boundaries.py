@@ -73,3 +73,112 @@ def test_marketplace_upload_url_valid_image_still_returns_direct_upload_contract
     assert (upload_root / "marketplace" / "videos").is_dir()
 
     shutil.rmtree(upload_root, ignore_errors=True)
+
+
+def test_marketplace_direct_upload_streams_and_stops_at_the_size_limit(
+    client,
+    monkeypatch,
+):
+    from app.api.routes import marketplace_media
+
+    upload_root = _upload_root()
+    monkeypatch.setenv("GMFN_UPLOADS_DIR", str(upload_root))
+    monkeypatch.setattr(marketplace_media, "MAX_IMAGE_BYTES", 1024)
+    monkeypatch.setattr(marketplace_media, "UPLOAD_CHUNK_BYTES", 256)
+    images = upload_root / "marketplace" / "images"
+
+    def _chunks(total: int):
+        for _ in range(total // 256):
+            yield b"x" * 256
+
+    # A chunked body carries no Content-Length; the limit applies while reading.
+    response = client.put(
+        "/marketplace/media/upload-direct/images/too-big.png",
+        content=_chunks(2048),
+        headers={"content-type": "image/png"},
+    )
+
+    assert response.status_code == 400, response.text
+    assert "too large" in response.text
+    assert list(images.iterdir()) == []
+
+    response = client.put(
+        "/marketplace/media/upload-direct/images/cover.png",
+        content=_chunks(1024),
+        headers={"content-type": "image/png"},
+    )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["size_bytes"] == 1024
+    assert len(body["sha256"]) == 64
+    assert [p.name for p in images.iterdir()] == ["cover.png"]
+    assert (images / "cover.png").read_bytes() == b"x" * 1024
+
+    shutil.rmtree(upload_root, ignore_errors=True)
+
+
+def test_marketplace_image_upload_stores_identical_media_once(
+    client,
+    monkeypatch,
+):
+    upload_root = _upload_root()
+    monkeypatch.setenv("GMFN_UPLOADS_DIR", str(upload_root))
+    images = upload_root / "marketplace" / "images"
+
+    def _upload(data: bytes):
+        return client.post(
+            "/marketplace/media/image",
+            files={"file": ("photo.jpg", data, "image/jpeg")},
+        )
+
+    first = _upload(b"same-bytes" * 100)
+    second = _upload(b"same-bytes" * 100)
+    other = _upload(b"other-bytes" * 100)
+
+    assert first.status_code == 200, first.text
+    assert first.json()["deduplicated"] is False
+    assert second.json()["deduplicated"] is True
+    assert second.json()["url"] == first.json()["url"]
+    assert other.json()["url"] != first.json()["url"]
+    assert sorted(p.name for p in images.iterdir()) == sorted(
+        [first.json()["filename"], other.json()["filename"]]
+    )
+
+    empty = _upload(b"")
+    assert empty.status_code == 400, empty.text
+    assert len(list(images.iterdir())) == 2
+
+    shutil.rmtree(upload_root, ignore_errors=True)
+
+
+def test_marketplace_multipart_upload_rejects_oversized_content_length_before_parsing(
+    client,
+    monkeypatch,
+):
+    from app.api.routes import marketplace_media
+
+    upload_root = _upload_root()
+    monkeypatch.setenv("GMFN_UPLOADS_DIR", str(upload_root))
+    monkeypatch.setattr(marketplace_media, "MAX_IMAGE_BYTES", 1024)
+
+    async def _not_reached(*args, **kwargs):
+        raise AssertionError("the multipart body should not be read")
+
+    monkeypatch.setattr(marketplace_media, "_store_upload_file", _not_reached)
+
+    response = client.post(
+        "/marketplace/media/image",
+        files={
+            "file": (
+                "photo.jpg",
+                b"x" * (1024 + marketplace_media.MULTIPART_OVERHEAD_BYTES + 1),
+                "image/jpeg",
+            )
+        },
+    )
+
+    assert response.status_code == 400, response.text
+    assert "too large" in response.text
+
+    shutil.rmtree(upload_root, ignore_errors=True)
@@ -3378,3 +3378,112 @@ def test_shop_product_create_notifies_visible_followers_only(client, monkeypatch
     assert notices[0].message == "Visible Follow Shop added a new product."
     assert notices[0].action_label == "Open shop"
     assert "product_id=" in notices[0].action_url
+
+
+def test_marketplace_feeds_filter_visibility_in_sql_and_page_by_keyset(
+    client,
+    override_current_user_user,
+):
+    _ensure_marketplace_tables()
+
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                INSERT INTO users (id, email, hashed_password, display_name, role)
+                VALUES
+                    (1, 'pytest@example.com', 'hashed', 'Viewer Owner', 'user'),
+                    (2, 'member@example.com', 'hashed', 'Member Seller', 'user'),
+                    (3, 'former@example.com', 'hashed', 'Former Seller', 'user')
+                """
+            )
+        )
+        conn.execute(
+            text(
+                """
+                INSERT INTO clans (id, name, marketplace_name, invite_code)
+                VALUES (1, 'Keyset community', 'Keyset Marketplace', 'KEYSET1')
+                """
+            )
+        )
+        conn.execute(
+            text(
+                """
+                INSERT INTO clan_memberships (id, clan_id, user_id, role, personal_pool_balance, left_at)
+                VALUES
+                    (1, 1, 1, 'member', 0, NULL),
+                    (2, 1, 2, 'member', 0, NULL),
+                    (3, 1, 3, 'member', 0, '2026-07-01 00:00:00.000000')
+                """
+            )
+        )
+        conn.execute(
+            text(
+                """
+                INSERT INTO marketplace_shops (
+                    id, clan_id, owner_user_id, shop_name, description, is_active, created_at
+                ) VALUES
+                    (1, 1, 1, 'Viewer Shop', 'Visible', 1, '2026-08-01 10:00:01.000000'),
+                    (2, 1, 2, 'Member Shop', 'Visible', 1, '2026-08-01 10:00:02.000000'),
+                    (3, 1, 3, 'Former Shop', 'Owner left', 1, '2026-08-01 10:00:03.000000')
+                """
+            )
+        )
+        for product_id, shop_id, title, description in [
+            (1, 1, "Old lamp", "[BLOCK:1] Replaced lamp"),
+            (2, 2, "Chair", "Member chair"),
+            (3, 3, "Hidden stool", "Owner no longer a member"),
+            (4, 1, "Table", "Viewer table"),
+            (5, 1, "New lamp", "[BLOCK:1] Current lamp"),
+            (6, 2, "Stool", "Member stool"),
+        ]:
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO marketplace_products (
+                        id, clan_id, shop_id, seller_user_id, title, description,
+                        price, currency, visibility_mode, is_active, created_at
+                    ) VALUES (
+                        :id, 1, :shop_id, :shop_id, :title, :description,
+                        '1000', 'NGN', 'community_visible', 1, :created_at
+                    )
+                    """
+                ),
+                {
+                    "id": product_id,
+                    "shop_id": shop_id,
+                    "title": title,
+                    "description": description,
+                    "created_at": f"2026-08-02 10:00:0{product_id}.000000",
+                },
+            )
+
+    seen: list[int] = []
+    params = "clan_id=1&limit=2"
+    for _ in range(4):
+        res = client.get(f"/marketplace/products?{params}")
+        assert res.status_code == 200, res.text
+        body = res.json()
+        seen.extend(int(item["id"]) for item in body["items"])
+        if body["next_before_id"] is None:
+            break
+        params = (
+            "clan_id=1&limit=2"
+            f"&before_created_at={body['next_before_created_at']}"
+            f"&before_id={body['next_before_id']}"
+        )
+
+    assert seen == [6, 5, 4, 2]
+
+    first_shop_page = client.get("/marketplace/shops?clan_id=1&limit=1")
+    assert first_shop_page.status_code == 200, first_shop_page.text
+    first_body = first_shop_page.json()
+    assert [item["id"] for item in first_body["items"]] == [2]
+
+    second_shop_page = client.get(
+        "/marketplace/shops?clan_id=1&limit=1"
+        f"&before_created_at={first_body['next_before_created_at']}"
+        f"&before_id={first_body['next_before_id']}"
+    )
+    assert second_shop_page.status_code == 200, second_shop_page.text
+    assert [item["id"] for item in second_shop_page.json()["items"]] == [1]
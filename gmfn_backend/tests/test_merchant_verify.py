@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 from app.core.security import create_access_token
 from app.db.database import SessionLocal
 from app.db.models import TrustEvent, User
+from app.services.merchant_verify_service import is_token_used, mark_token_used
 
 
 def _b64url_decode(text: str) -> bytes:
@@ -102,9 +103,12 @@ def test_merchant_verify_link_public_use_and_append_only_events(client, monkeypa
             .all()
         )
     assert len(used_events) == 1
+    assert used_events[0].actor_user_id == 0
+    assert used_events[0].subject_user_id == 1
     used_meta = json.loads(used_events[0].meta_json)
     assert used_meta["link_id"] == issued_payload["verification_link_id"]
     assert used_meta["pack_id"] == issued_payload["pack_id"]
+    assert used_meta["system"] is True
 
 
 def test_merchant_verify_rejects_tampered_token_body(client, monkeypatch):
@@ -139,6 +143,20 @@ def test_merchant_verify_rejects_tampered_token_body(client, monkeypatch):
         ) == 0
 
 
+def test_merchant_token_without_uid_is_still_recorded_as_used(client):
+    with SessionLocal() as db:
+        assert is_token_used(db, jti="jti-without-uid") is False
+        mark_token_used(
+            db,
+            actor_user_id=0,
+            subject_user_id=0,
+            jti="jti-without-uid",
+            link_id="MV-NOUID",
+            pack_id=None,
+        )
+        assert is_token_used(db, jti="jti-without-uid") is True
+
+
 def test_merchant_release_records_evidence_after_public_verify(client, monkeypatch):
     monkeypatch.setenv("SECRET_KEY", "pytest-merchant-verify-secret")
     _seed_merchant_verify_user()
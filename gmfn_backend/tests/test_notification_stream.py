@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+from app.db.models import ClanJoinRequest
+from app.db.notification_models import Notification
+from app.services.notification_service import create_notification, mark_notification_read
+from app.services.notification_stream_service import notification_bus, notification_event_stream
+
+
+@pytest.fixture()
+def session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        future=True,
+    )
+    Base.metadata.create_all(bind=engine)
+    try:
+        yield sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    finally:
+        engine.dispose()
+
+
+def _notify(session_factory, *, user_id: int, title: str) -> int:
+    with session_factory() as db:
+        return int(create_notification(db, user_id=user_id, kind="assistant.nudge", title=title, message=title).id)
+
+
+def _parse(chunk: str) -> dict:
+    fields = dict(line.split(": ", 1) for line in chunk.strip().splitlines() if not line.startswith(":"))
+    return {"id": fields.get("id"), "event": fields.get("event"), "data": json.loads(fields.get("data", "null"))}
+
+
+async def _next_event(stream) -> dict:
+    while True:
+        chunk = await asyncio.wait_for(stream.__anext__(), timeout=5)
+        if chunk.startswith("event:") or chunk.startswith("id:"):
+            return _parse(chunk)
+
+
+def test_stream_replays_after_last_event_id_then_pushes_live_changes(session_factory):
+    seen_id = _notify(session_factory, user_id=1, title="Seen before")
+    missed_id = _notify(session_factory, user_id=1, title="Missed while offline")
+    _notify(session_factory, user_id=2, title="Someone else's")
+
+    async def scenario():
+        stream = notification_event_stream(
+            user_id=1,
+            last_event_id=seen_id,
+            session_factory=session_factory,
+            heartbeat_seconds=30,
+        )
+        assert (await stream.__anext__()).startswith("retry:")
+
+        replayed = await _next_event(stream)
+        snapshot = await _next_event(stream)
+
+        live_id = await asyncio.to_thread(_notify, session_factory, user_id=1, title="Live")
+        await asyncio.to_thread(_notify, session_factory, user_id=2, title="Not for this stream")
+        live = await _next_event(stream)
+        live_unread = await _next_event(stream)
+
+        def _read():
+            with session_factory() as db:
+                mark_notification_read(db, user_id=1, notification_id=missed_id)
+
+        await asyncio.to_thread(_read)
+        read_unread = await _next_event(stream)
+        await stream.aclose()
+        return replayed, snapshot, live_id, live, live_unread, read_unread
+
+    replayed, snapshot, live_id, live, live_unread, read_unread = asyncio.run(scenario())
+
+    assert (replayed["event"], replayed["id"]) == ("notification", str(missed_id))
+    assert replayed["data"]["title"] == "Missed while offline"
+    assert snapshot == {"id": None, "event": "unread", "data": {"delta": 0, "unread_count": 2}}
+    assert (live["event"], live["id"], live["data"]["title"]) == ("notification", str(live_id), "Live")
+    assert live_unread["data"] == {"delta": 1, "unread_count": 3}
+    assert read_unread["data"] == {"delta": -1, "unread_count": 2}
+    assert not notification_bus.has_subscribers(1)
+
+
+def test_rolled_back_notifications_are_never_published(session_factory):
+    async def scenario():
+        stream = notification_event_stream(user_id=1, session_factory=session_factory, heartbeat_seconds=30)
+        await stream.__anext__()
+        snapshot = await _next_event(stream)
+
+        def _rolled_back():
+            with session_factory() as db:
+                create_notification(
+                    db, user_id=1, kind="assistant.nudge", title="Draft", message="Draft", commit=False
+                )
+                db.flush()
+                db.rollback()
+
+        await asyncio.to_thread(_rolled_back)
+        kept_id = await asyncio.to_thread(_notify, session_factory, user_id=1, title="Kept")
+        received = await _next_event(stream)
+        await stream.aclose()
+        return snapshot, kept_id, received
+
+    snapshot, kept_id, received = asyncio.run(scenario())
+
+    assert snapshot["data"]["unread_count"] == 0
+    assert (received["id"], received["data"]["title"]) == (str(kept_id), "Kept")
+    with session_factory() as db:
+        assert db.query(Notification).count() == 1
+
+
+def _insert_elsewhere(session_factory, *, notification_id: int, user_id: int, title: str) -> None:
+    """A write the bus never sees, like one from another worker process."""
+    with session_factory() as db:
+        db.execute(
+            insert(Notification).values(
+                id=notification_id,
+                user_id=user_id,
+                kind="assistant.nudge",
+                title=title,
+                message=title,
+                is_read=False,
+            )
+        )
+        db.commit()
+
+
+def test_heartbeats_keep_the_stream_open_without_reading_the_table(session_factory):
+    engine = session_factory.kw["bind"]
+    statements = []
+
+    async def scenario():
+        stream = notification_event_stream(user_id=1, session_factory=session_factory, heartbeat_seconds=0.01)
+        await stream.__anext__()
+        await _next_event(stream)
+
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        await asyncio.to_thread(_insert_elsewhere, session_factory, notification_id=1, user_id=1, title="Elsewhere")
+        statements.clear()
+        chunks = [await asyncio.wait_for(stream.__anext__(), timeout=5) for _ in range(3)]
+        await stream.aclose()
+        return chunks
+
+    chunks = asyncio.run(scenario())
+
+    # Writes from other processes are not pushed; the client picks them up
+    # from /notifications/me when it reconnects.
+    assert chunks == [": keepalive\n\n"] * 3
+    assert statements == []
+
+
+def test_streamed_approval_requests_carry_the_join_request_status(session_factory):
+    with session_factory() as db:
+        db.add(ClanJoinRequest(id=7, clan_id=1, applicant_user_id=2, status="approved"))
+        db.commit()
+
+    async def scenario():
+        stream = notification_event_stream(user_id=1, session_factory=session_factory, heartbeat_seconds=30)
+        await stream.__anext__()
+        await _next_event(stream)
+
+        def _approval_request():
+            with session_factory() as db:
+                return int(
+                    create_notification(
+                        db,
+                        user_id=1,
+                        kind="approval_request",
+                        title="Pending join request",
+                        message="Review the applicant.",
+                        action_url="/app/community/1/join-requests?request_id=7",
+                        action_label="Review",
+                    ).id
+                )
+
+        notification_id = await asyncio.to_thread(_approval_request)
+        live = await _next_event(stream)
+        await stream.aclose()
+
+        replay = notification_event_stream(
+            user_id=1,
+            last_event_id=notification_id - 1,
+            session_factory=session_factory,
+            heartbeat_seconds=30,
+        )
+        await replay.__anext__()
+        replayed = await _next_event(replay)
+        await replay.aclose()
+        return live, replayed
+
+    live, replayed = asyncio.run(scenario())
+
+    for received in (live, replayed):
+        assert received["data"]["join_request_id"] == 7
+        assert received["data"]["join_request_status"] == "approved"
+        assert received["data"]["join_request_resolved"] is True
+
+
+def test_notification_payloads_are_only_built_for_open_streams(session_factory, monkeypatch):
+    from app.services import notification_stream_service
+
+    built = []
+    real_items = notification_stream_service.notification_items
+
+    def _counting_items(db, rows):
+        built.extend(int(row.user_id) for row in rows)
+        return real_items(db, rows)
+
+    monkeypatch.setattr(notification_stream_service, "notification_items", _counting_items)
+
+    _notify(session_factory, user_id=5, title="Nobody listening")
+
+    assert built == []
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import app.core.rate_limit as rate_limit
+from app.core.rate_limit import MemoryCounterStore, RateLimiter, SQLiteCounterStore
+
+
+class _Clock:
+    def __init__(self, start: float) -> None:
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_sliding_window_blocks_after_limit_and_recovers(monkeypatch):
+    clock = _Clock(1_000_000.0)
+    monkeypatch.setattr(rate_limit, "_now", clock)
+    limiter = RateLimiter(MemoryCounterStore())
+
+    results = [limiter.check(key="ip:1", max_requests=3, window_seconds=60) for _ in range(4)]
+    assert [r.ok for r in results] == [True, True, True, False]
+    assert results[0].remaining == 2
+
+    assert limiter.check(key="ip:2", max_requests=3, window_seconds=60).ok is True
+
+    clock.now += 180
+    assert limiter.check(key="ip:1", max_requests=3, window_seconds=60).ok is True
+
+
+def test_rejected_requests_do_not_extend_the_block(monkeypatch):
+    clock = _Clock(1_000_000.0)
+    monkeypatch.setattr(rate_limit, "_now", clock)
+    limiter = RateLimiter(MemoryCounterStore())
+
+    for _ in range(3):
+        assert limiter.check(key="ip:1", max_requests=3, window_seconds=60).ok is True
+    for _ in range(20):
+        assert limiter.check(key="ip:1", max_requests=3, window_seconds=60).ok is False
+
+    # One window later only the three admitted hits carry over (weighted to
+    # one), so the retries did not keep the client locked out.
+    clock.now += 60
+    results = [limiter.check(key="ip:1", max_requests=3, window_seconds=60) for _ in range(3)]
+    assert [r.ok for r in results] == [True, True, False]
+
+
+def test_memory_store_expires_idle_keys_and_caps_size(monkeypatch):
+    clock = _Clock(1_000_000.0)
+    monkeypatch.setattr(rate_limit, "_now", clock)
+    store = MemoryCounterStore(max_keys=10, sweep_interval=1)
+    limiter = RateLimiter(store)
+
+    for i in range(50):
+        limiter.check(key=f"ip:{i}", max_requests=5, window_seconds=60)
+    assert len(store) <= 10
+
+    clock.now += 600
+    limiter.check(key="ip:fresh", max_requests=5, window_seconds=60)
+    assert len(store) == 1
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "rate_limit.db")
+    first = RateLimiter(SQLiteCounterStore(path))
+    second = RateLimiter(SQLiteCounterStore(path))
+
+    assert first.check(key="join:7", max_requests=2, window_seconds=600).ok is True
+    assert second.check(key="join:7", max_requests=2, window_seconds=600).ok is True
+    assert first.check(key="join:7", max_requests=2, window_seconds=600).ok is False
+    assert second.check(key="join:8", max_requests=2, window_seconds=600).ok is True
+
+
+def test_limiter_accepts_redis_style_client():
+    class _RedisLike:
+        def __init__(self) -> None:
+            self.values: dict[str, int] = {}
+            self.ttls: dict[str, int] = {}
+
+        def get(self, name):
+            value = self.values.get(name)
+            return None if value is None else str(value).encode()
+
+        def incr(self, name, amount=1):
+            self.values[name] = self.values.get(name, 0) + amount
+            return self.values[name]
+
+        def expire(self, name, time):
+            self.ttls[name] = time
+            return True
+
+    client = _RedisLike()
+    limiter = RateLimiter(client)
+
+    assert limiter.check(key="merchant:1", max_requests=1, window_seconds=30).ok is True
+    assert limiter.check(key="merchant:1", max_requests=1, window_seconds=30).ok is False
+    assert set(client.ttls.values()) == {60}
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base as CoreBase
+from app.db.database import Base as BankBase
+from app.db.bank_models import BankEvent, ExpectedPayment
+from app.services import reconciliation_worker_service as worker
+from app.services.reconciliation_service import create_bank_event, normalize_reference
+
+
+@pytest.fixture()
+def session_factory():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        future=True,
+    )
+
+    CoreBase.metadata.create_all(bind=engine)
+    BankBase.metadata.create_all(bind=engine)
+
+    try:
+        yield sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    finally:
+        engine.dispose()
+
+
+def _expected(db, *, clan_id: int, reference: str, amount: str) -> ExpectedPayment:
+    ep = ExpectedPayment(
+        clan_id=clan_id,
+        user_id=1,
+        expected_type="manual",
+        amount=Decimal(amount),
+        currency="NGN",
+        reference_display=reference,
+        reference_normalized=normalize_reference(reference),
+        status="expected",
+    )
+    db.add(ep)
+    db.commit()
+    return ep
+
+
+def _event(db, *, clan_id: int, reference: str, amount: str, direction: str = "credit") -> BankEvent:
+    return create_bank_event(
+        db,
+        clan_id=clan_id,
+        source_type="statement_csv",
+        source_id=f"{clan_id}-{reference}-{direction}",
+        direction=direction,
+        amount=Decimal(amount),
+        currency="NGN",
+        reference_raw=reference,
+        description_raw=None,
+    )
+
+
+def _seed(session_factory) -> None:
+    with session_factory() as db:
+        for clan_id in (1, 2):
+            _expected(db, clan_id=clan_id, reference=f"GSN-{clan_id}-A", amount="50.00")
+            _event(db, clan_id=clan_id, reference=f"GSN-{clan_id}-A", amount="50.00")
+            _event(db, clan_id=clan_id, reference=f"GSN-{clan_id}-LATER", amount="20.00")
+            _event(db, clan_id=clan_id, reference=f"GSN-{clan_id}-OUT", amount="5.00", direction="debit")
+
+
+def test_pass_reconciles_every_clan_and_reports_throughput(session_factory):
+    _seed(session_factory)
+
+    metrics = worker.run_reconciliation_pass(session_factory=session_factory)
+
+    assert metrics["clans_total"] == 2
+    assert metrics["clans_ok"] == 2
+    assert metrics["events_seen"] == 6
+    assert metrics["outcomes"]["confirmed"] == 2
+    assert metrics["outcomes"]["pending_match"] == 2
+    assert metrics["outcomes"]["mismatch_flagged"] == 2
+    assert metrics["events_per_second"] > 0
+    assert sorted(c["clan_id"] for c in metrics["clans"]) == [1, 2]
+
+
+def test_later_passes_only_read_unreconciled_credits(session_factory):
+    _seed(session_factory)
+    worker.run_reconciliation_pass(session_factory=session_factory)
+
+    # Confirmed and non-credit events are not read again.
+    again = worker.run_reconciliation_pass(session_factory=session_factory)
+    assert again["events_seen"] == 2
+    assert again["outcomes"]["pending_match"] == 2
+
+    with session_factory() as db:
+        _expected(db, clan_id=1, reference="GSN-1-LATER", amount="20.00")
+
+    matched = worker.run_reconciliation_pass(session_factory=session_factory)
+    assert matched["outcomes"]["confirmed"] == 1
+    with session_factory() as db:
+        statuses = {
+            be.reference_normalized: be.status
+            for be in db.query(BankEvent).filter(BankEvent.clan_id == 1).all()
+        }
+    assert statuses == {
+        "GSN-1-A": "confirmed",
+        "GSN-1-LATER": "confirmed",
+        "GSN-1-OUT": "mismatch_flagged",
+    }
+
+
+def test_clan_held_by_another_worker_is_skipped(session_factory):
+    _seed(session_factory)
+
+    held = worker._local_clan_lock(1)
+    held.acquire()
+    try:
+        metrics = worker.run_reconciliation_pass(session_factory=session_factory)
+    finally:
+        held.release()
+
+    by_clan = {c["clan_id"]: c for c in metrics["clans"]}
+    assert by_clan[1]["result"] == "locked"
+    assert by_clan[2]["result"] == "ok"
+    assert metrics["clans_locked"] == 1
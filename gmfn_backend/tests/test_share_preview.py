@@ -128,3 +128,70 @@ def test_vault_request_card_png_uses_vault_branding(client, monkeypatch):
     assert res.headers["content-type"].startswith("image/png")
     assert res.content.startswith(b"\x89PNG\r\n\x1a\n")
     assert len(res.content) > 10_000
+
+
+def test_share_card_png_is_cached_and_revalidates_with_etag(client, monkeypatch, tmp_path):
+    from app.api.routes import share_preview
+
+    monkeypatch.setenv("PUBLIC_FRONTEND_URL", "https://pilot.gsn.example")
+    monkeypatch.setenv("GMFN_SHARE_CARD_CACHE_DIR", str(tmp_path))
+    _seed_public_shop()
+
+    renders = []
+    real_draw = share_preview._draw_share_card_png
+
+    def counting_draw(*args, **kwargs):
+        renders.append(kwargs.get("block"))
+        return real_draw(*args, **kwargs)
+
+    monkeypatch.setattr(share_preview, "_draw_share_card_png", counting_draw)
+
+    first = client.get("/share/shop/GMFN-U-SHARE/card.png?product_id=3&block=1")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["last-modified"]
+    assert list(tmp_path.glob("*/*.png"))
+
+    second = client.get("/share/shop/GMFN-U-SHARE/card.png?product_id=3&block=1")
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["etag"] == etag
+
+    revalidated = client.get(
+        "/share/shop/GMFN-U-SHARE/card.png?product_id=3&block=1",
+        headers={"If-None-Match": etag},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    by_date = client.get(
+        "/share/shop/GMFN-U-SHARE/card.png?product_id=3&block=1",
+        headers={"If-Modified-Since": first.headers["last-modified"]},
+    )
+    assert by_date.status_code == 304
+
+    other_block = client.get("/share/shop/GMFN-U-SHARE/card.png?product_id=3&block=2")
+    assert other_block.status_code == 200
+    assert other_block.headers["etag"] != etag
+    assert renders == [1, 2]
+
+
+def test_share_card_cache_evicts_least_recently_used_cards(tmp_path):
+    import os
+
+    from app.services.share_card_cache import ShareCardCache
+
+    cache = ShareCardCache(tmp_path, max_bytes=250)
+    cache.put("aa" + "0" * 62, b"a" * 100)
+    cache.put("bb" + "0" * 62, b"b" * 100)
+
+    stale = tmp_path / "aa" / ("aa" + "0" * 62 + ".png")
+    fresh = tmp_path / "bb" / ("bb" + "0" * 62 + ".png")
+    os.utime(stale, (1_000, stale.stat().st_mtime))
+    os.utime(fresh, (2_000, fresh.stat().st_mtime))
+
+    cache.put("cc" + "0" * 62, b"c" * 100)
+
+    assert cache.get("aa" + "0" * 62) is None
+    assert cache.get("bb" + "0" * 62).content == b"b" * 100
+    assert cache.get("cc" + "0" * 62).content == b"c" * 100
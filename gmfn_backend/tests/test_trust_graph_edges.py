@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import json
+import logging
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models import (
+    Base,
+    Clan,
+    ClanMembership,
+    Loan,
+    LoanGuarantor,
+    TrustEvent,
+    TrustGraphEdge,
+    User,
+)
+from app.services.maintenance_checkpoint_service import load_checkpoint
+from app.services.trust_events_services import log_trust_event
+from app.services.trust_graph_service import (
+    TRUST_EDGE_SUPPORTING_EVENT_IDS_LIMIT,
+    TRUST_GRAPH_REBUILD_JOB_KEY,
+    build_trust_graph,
+    rebuild_trust_graph_edges,
+)
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    Base.metadata.create_all(bind=engine)
+
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _seed_guaranteed_loan(db):
+    clan = Clan(name="Aberdeen City")
+    borrower = User(email="borrower@example.com", hashed_password="x", role="user")
+    guarantor = User(email="guarantor@example.com", hashed_password="x", role="user")
+    db.add_all([clan, borrower, guarantor])
+    db.commit()
+
+    db.add_all(
+        [
+            ClanMembership(clan_id=clan.id, user_id=borrower.id, role="user"),
+            ClanMembership(clan_id=clan.id, user_id=guarantor.id, role="user"),
+        ]
+    )
+    loan = Loan(
+        clan_id=clan.id,
+        borrower_user_id=borrower.id,
+        amount=Decimal("100.00"),
+        currency="NGN",
+        status="approved",
+        guarantors_required=1,
+    )
+    db.add(loan)
+    db.commit()
+
+    db.add(
+        LoanGuarantor(
+            loan_id=loan.id,
+            clan_id=clan.id,
+            guarantor_user_id=guarantor.id,
+            pledge_amount=Decimal("100.00"),
+            status="approved",
+        )
+    )
+    db.commit()
+    return clan, borrower, guarantor, loan
+
+
+def _log_guarantee_and_repayment(db, clan, borrower, guarantor, loan):
+    log_trust_event(
+        db,
+        event_type="guarantee_given",
+        clan_id=clan.id,
+        actor_user_id=guarantor.id,
+        subject_user_id=borrower.id,
+        loan_id=loan.id,
+        meta={"guarantor_user_id": guarantor.id},
+    )
+    log_trust_event(
+        db,
+        event_type="loan.repaid",
+        clan_id=clan.id,
+        actor_user_id=borrower.id,
+        subject_user_id=borrower.id,
+        loan_id=loan.id,
+        meta={"reason": "loan_repaid", "guarantor_user_id": guarantor.id},
+    )
+
+
+def test_logged_events_are_folded_into_edge_store(db):
+    clan, borrower, guarantor, loan = _seed_guaranteed_loan(db)
+    _log_guarantee_and_repayment(db, clan, borrower, guarantor, loan)
+
+    rows = db.query(TrustGraphEdge).order_by(TrustGraphEdge.edge_type.asc()).all()
+    keys = {(r.edge_type, r.source_user_id, r.target_user_id) for r in rows}
+
+    assert ("guaranteed", guarantor.id, borrower.id) in keys
+    assert ("repaid_with_support", borrower.id, guarantor.id) in keys
+    assert ("repaid_with_support", guarantor.id, borrower.id) in keys
+    assert all(r.event_count == 1 for r in rows)
+
+
+def test_rebuild_matches_incremental_fold(db):
+    clan, borrower, guarantor, loan = _seed_guaranteed_loan(db)
+    _log_guarantee_and_repayment(db, clan, borrower, guarantor, loan)
+    incremental = build_trust_graph(db, user_id=borrower.id)
+
+    result = rebuild_trust_graph_edges(db, chunk_size=1)
+    rebuilt = build_trust_graph(db, user_id=borrower.id)
+
+    assert result["events_scanned"] == 2
+    assert result["edges_written"] == 3
+    assert rebuilt["edges"] == incremental["edges"]
+    assert rebuilt["summary"] == incremental["summary"]
+
+
+def test_rebuild_backfills_events_written_outside_the_logger(db):
+    clan, borrower, guarantor, loan = _seed_guaranteed_loan(db)
+    db.add(
+        TrustEvent(
+            event_type="guarantee_given",
+            clan_id=clan.id,
+            loan_id=loan.id,
+            actor_user_id=guarantor.id,
+            subject_user_id=borrower.id,
+            meta_json=None,
+        )
+    )
+    db.commit()
+    assert db.query(TrustGraphEdge).count() == 0
+
+    rebuild_trust_graph_edges(db)
+    graph = build_trust_graph(db, user_id=guarantor.id)
+
+    guaranteed = [e for e in graph["edges"] if e["edge_type"] == "guaranteed"]
+    assert len(guaranteed) == 1
+    assert guaranteed[0]["source_node_id"] == f"user:{guarantor.id}"
+    assert graph["summary"]["guarantees_given_count"] == 1
+
+
+def test_graph_read_query_count_does_not_grow_with_history(db):
+    clan, borrower, guarantor, loan = _seed_guaranteed_loan(db)
+    for _ in range(25):
+        _log_guarantee_and_repayment(db, clan, borrower, guarantor, loan)
+
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        db.expire_all()
+        graph = build_trust_graph(db, user_id=borrower.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert len(statements) <= 6
+    repaid = [e for e in graph["edges"] if e["edge_type"] == "repaid_with_support"]
+    assert {e["event_count"] for e in repaid} == {25}
+
+
+def test_fold_counts_every_event_but_keeps_a_bounded_id_list(db):
+    clan, borrower, guarantor, loan = _seed_guaranteed_loan(db)
+    total = TRUST_EDGE_SUPPORTING_EVENT_IDS_LIMIT + 5
+    for _ in range(total):
+        log_trust_event(
+            db,
+            event_type="guarantee_given",
+            clan_id=clan.id,
+            actor_user_id=guarantor.id,
+            subject_user_id=borrower.id,
+            loan_id=loan.id,
+        )
+
+    db.expire_all()
+    row = db.query(TrustGraphEdge).filter(TrustGraphEdge.edge_type == "guaranteed").one()
+    kept = json.loads(row.supporting_event_ids_json)
+    newest = db.query(TrustEvent.id).order_by(TrustEvent.id.desc()).first()[0]
+
+    assert row.event_count == total
+    assert len(kept) == TRUST_EDGE_SUPPORTING_EVENT_IDS_LIMIT
+    assert kept[-1] == newest
+
+    rebuild_trust_graph_edges(db)
+    rebuilt = db.query(TrustGraphEdge).filter(TrustGraphEdge.edge_type == "guaranteed").one()
+    assert rebuilt.event_count == total
+    assert json.loads(rebuilt.supporting_event_ids_json) == kept
+
+
+def test_failed_fold_is_logged_and_requests_a_rebuild(db, monkeypatch, caplog):
+    clan, borrower, guarantor, loan = _seed_guaranteed_loan(db)
+
+    def _fail(*_args, **_kwargs):
+        db.execute(TrustGraphEdge.__table__.insert().values(edge_type=None))
+
+    monkeypatch.setattr(
+        "app.services.trust_events_services.fold_trust_event_into_graph",
+        _fail,
+    )
+    # alembic's fileConfig in other tests disables existing loggers.
+    monkeypatch.setattr(logging.getLogger("app.services.trust_events_services"), "disabled", False)
+    with caplog.at_level(logging.ERROR, logger="app.services.trust_events_services"):
+        logged = log_trust_event(
+            db,
+            event_type="guarantee_given",
+            clan_id=clan.id,
+            actor_user_id=guarantor.id,
+            subject_user_id=borrower.id,
+            loan_id=loan.id,
+        )
+
+    assert db.get(TrustEvent, logged.id) is not None
+    assert "trust graph fold failed" in caplog.text
+    assert load_checkpoint(db, TRUST_GRAPH_REBUILD_JOB_KEY)["event_id"] == logged.id
+
+    monkeypatch.undo()
+    rebuild_trust_graph_edges(db)
+    assert load_checkpoint(db, TRUST_GRAPH_REBUILD_JOB_KEY) == {}
+    assert db.query(TrustGraphEdge).filter(TrustGraphEdge.edge_type == "guaranteed").count() == 1
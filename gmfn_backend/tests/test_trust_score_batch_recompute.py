@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models import Base, Clan, ClanMembership, TrustEvent, User
+from app.services.trust_score_service import (
+    recompute_trust_for_user,
+    recompute_trust_for_users,
+)
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    Base.metadata.create_all(bind=engine)
+
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+AS_OF = datetime(2026, 8, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _seed(db):
+    clan = Clan(name="Aberdeen City")
+    users = [
+        User(email=f"member{i}@example.com", hashed_password="x", role="user")
+        for i in range(5)
+    ]
+    outsider = User(email="outsider@example.com", hashed_password="x", role="user")
+    db.add_all([clan, outsider, *users])
+    db.commit()
+
+    db.add_all(
+        ClanMembership(clan_id=clan.id, user_id=u.id, role="user") for u in users
+    )
+
+    events = []
+    for i, user in enumerate(users):
+        for day in range(i + 1):
+            events.append(
+                TrustEvent(
+                    event_type="loan.repaid",
+                    actor_user_id=user.id,
+                    subject_user_id=user.id,
+                    created_at=AS_OF - timedelta(days=40 * day),
+                )
+            )
+        events.append(
+            TrustEvent(
+                event_type="identity.phone_verified",
+                actor_user_id=user.id,
+                subject_user_id=user.id,
+                created_at=AS_OF - timedelta(days=3),
+            )
+        )
+        events.append(
+            TrustEvent(
+                event_type="marketplace.viewed",
+                actor_user_id=user.id,
+                subject_user_id=user.id,
+                created_at=AS_OF - timedelta(days=1),
+            )
+        )
+    events.append(
+        TrustEvent(
+            event_type="missed_payment",
+            actor_user_id=users[2].id,
+            subject_user_id=users[2].id,
+            created_at=AS_OF - timedelta(days=2),
+        )
+    )
+    db.add_all(events)
+    db.commit()
+    return clan, users, outsider
+
+
+def test_batch_recompute_matches_per_user_recompute(db):
+    clan, users, outsider = _seed(db)
+
+    result = recompute_trust_for_users(db, clan_id=clan.id, chunk_size=2, as_of=AS_OF)
+
+    assert result["scope"] == "clan"
+    assert result["users_scanned"] == 5
+    assert result["users_updated"] == 5
+    assert result["chunks"] == 3
+    # The unscored marketplace events are filtered out in SQL.
+    assert result["events_scanned"] == 15 + 5 + 1
+
+    db.expire_all()
+    for user in users:
+        expected = recompute_trust_for_user(db, user_id=user.id, as_of=AS_OF)
+        row = db.get(User, user.id)
+        assert row.trust_score == expected["score_int"]
+        assert row.trust_band == expected["trust_band"]
+        assert json.loads(row.trust_breakdown_json) == expected
+
+    assert db.get(User, outsider.id).trust_breakdown_json is None
+
+
+def test_batch_recompute_dry_run_and_explicit_users(db):
+    clan, users, outsider = _seed(db)
+
+    dry = recompute_trust_for_users(
+        db,
+        user_ids=[users[0].id, outsider.id, 9999],
+        as_of=AS_OF,
+        dry_run=True,
+    )
+
+    assert dry["scope"] == "users"
+    assert dry["users_scanned"] == 2
+    assert dry["users_updated"] == 0
+    db.expire_all()
+    assert db.get(User, users[0].id).trust_breakdown_json is None
+
+    full = recompute_trust_for_users(db, as_of=AS_OF)
+    assert full["scope"] == "all"
+    assert full["users_updated"] == 6
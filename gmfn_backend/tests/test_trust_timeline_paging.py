@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models import Base, TrustEvent, User
+from app.services.trust_timeline_service import (
+    get_trust_timeline_page,
+    iter_trust_timeline_events,
+)
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    Base.metadata.create_all(bind=engine)
+
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+# Oldest first. Hidden for members: the score update and the zero-delta
+# invite activity; everything else is shown.
+HISTORY = [
+    "loan.created",
+    "trust.score_updated",
+    "GUARANTOR_APPROVED",
+    "LOAN_CANCELLED",
+    "invite_created",
+    "loan_repaid",
+    "Merchant.Dispatched",
+    "community.followed",
+    "trust.score_updated",
+    "missed_payment",
+    "repayment.claimed",
+    "guarantee_released",
+]
+HIDDEN_FOR_MEMBER = {"trust.score_updated", "GUARANTOR_APPROVED", "invite_created"}
+
+
+def _seed(db) -> User:
+    user = User(email="timeline-paging@example.com", hashed_password="x", role="user")
+    db.add(user)
+    db.commit()
+
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for index, event_type in enumerate(HISTORY):
+        # Pairs share a timestamp so the id tiebreak is exercised.
+        db.add(
+            TrustEvent(
+                event_type=event_type,
+                actor_user_id=user.id,
+                subject_user_id=user.id,
+                created_at=start + timedelta(hours=index // 2),
+            )
+        )
+    db.commit()
+    return user
+
+
+def _walk(db, user, *, audience: str, limit: int) -> list[list[dict]]:
+    pages = []
+    before = None
+    while True:
+        page = get_trust_timeline_page(
+            db,
+            user_id=user.id,
+            limit=limit,
+            audience=audience,
+            hide_zero_deltas_for_user=audience == "user",
+            before=before,
+        )
+        pages.append(page["items"])
+        if not page["has_more"]:
+            return pages
+        before = page["next_before"]
+
+
+def test_member_pages_are_full_and_cover_the_whole_history(db):
+    user = _seed(db)
+
+    pages = _walk(db, user, audience="user", limit=3)
+
+    assert [len(page) for page in pages] == [3, 3, 2]
+    labels = [item["label"] for page in pages for item in page]
+    assert labels == [
+        "Support lock released",
+        "You said you paid",
+        "Payment missed",
+        "Followed a community",
+        "Goods dispatched",
+        "Full repayment recorded",
+        "Request cancelled",
+        "You asked for support",
+    ]
+
+
+def test_admin_pages_include_every_event_in_order(db):
+    user = _seed(db)
+
+    pages = _walk(db, user, audience="admin", limit=5)
+
+    types = [item["event_type"] for page in pages for item in page]
+    assert types == list(reversed(HISTORY))
+
+
+def test_iterator_streams_visible_history_page_by_page(db):
+    user = _seed(db)
+
+    streamed = list(iter_trust_timeline_events(db, user_id=user.id, page_size=2))
+
+    assert [e.event_type for e in streamed] == [
+        t for t in reversed(HISTORY) if t not in HIDDEN_FOR_MEMBER
+    ]
+    assert len(list(iter_trust_timeline_events(db, user_id=user.id, max_events=3))) == 3
+
+
+def test_malformed_cursor_is_rejected(db):
+    user = _seed(db)
+
+    with pytest.raises(ValueError):
+        get_trust_timeline_page(db, user_id=user.id, before="not-a-cursor")
@@ -326,3 +326,98 @@ def test_official_notice_dispatches_web_push_to_registered_member(
             assert subscription.last_success_at is not None
     finally:
         app.dependency_overrides.pop(get_current_user, None)
+
+
+def test_notification_batch_fans_out_concurrently_and_records_outcomes_in_bulk(
+    client,
+    monkeypatch,
+):
+    import threading
+    import time
+
+    from py_vapid import Vapid
+    from py_vapid.utils import b64urlencode
+
+    from app.services.web_push_service import dispatch_web_push_for_notifications
+
+    vapid = Vapid()
+    vapid.generate_keys()
+    private_key = b64urlencode(
+        vapid.private_key.private_numbers().private_value.to_bytes(32, "big")
+    )
+    monkeypatch.setenv("GSN_WEB_PUSH_PUBLIC_KEY", "BElocalPublicKey")
+    monkeypatch.setenv("GSN_WEB_PUSH_PRIVATE_KEY", private_key)
+    monkeypatch.setenv("GMFN_WEB_PUSH_MAX_WORKERS", "4")
+
+    class Gone(Exception):
+        def __init__(self) -> None:
+            super().__init__("gone")
+            self.response = type("Response", (), {"status_code": 410})()
+
+    calls: list[dict] = []
+    threads: set[str] = set()
+    lock = threading.Lock()
+
+    def fake_webpush(**kwargs):
+        with lock:
+            calls.append(kwargs)
+            threads.add(threading.current_thread().name)
+        time.sleep(0.02)
+        endpoint = kwargs["subscription_info"]["endpoint"]
+        if endpoint.endswith("/gone"):
+            raise Gone()
+        if endpoint.endswith("/flaky"):
+            raise RuntimeError("temporary failure")
+
+    monkeypatch.setattr("app.services.web_push_service.webpush", fake_webpush)
+
+    with SessionLocal() as db:
+        db.add_all(
+            [
+                User(id=user_id, email=f"fanout-{user_id}@example.com", hashed_password="hashed", role="user")
+                for user_id in range(1, 7)
+            ]
+        )
+        db.flush()
+        for user_id in range(1, 7):
+            suffix = {5: "gone", 6: "flaky"}.get(user_id, str(user_id))
+            db.add(
+                WebPushSubscription(
+                    user_id=user_id,
+                    endpoint_hash=f"fanout-hash-{user_id}",
+                    endpoint=f"https://push.example/subscription/{suffix}",
+                    p256dh="p256dh-key-material",
+                    auth="auth-secret",
+                    is_active=True,
+                    failure_count=4 if user_id == 6 else 1,
+                )
+            )
+        notifications = [
+            Notification(
+                user_id=user_id,
+                kind="community.notice.posted",
+                title="Official community notice",
+                message="Dues meeting moved.",
+                is_read=False,
+            )
+            for user_id in range(1, 7)
+        ]
+        db.add_all(notifications)
+        db.commit()
+
+        result = dispatch_web_push_for_notifications(db, notifications)
+
+    assert result == {"attempted": 6, "sent": 4, "deactivated": 2}
+    assert len(calls) == 6
+    assert len(threads) > 1
+    assert all("vapid_claims" not in call for call in calls)
+    assert len({call["headers"]["Authorization"] for call in calls}) == 1
+    assert len({id(call["requests_session"]) for call in calls}) <= 4
+
+    with SessionLocal() as db:
+        rows = {row.user_id: row for row in db.query(WebPushSubscription).all()}
+        assert all(rows[user_id].failure_count == 0 for user_id in range(1, 5))
+        assert all(rows[user_id].last_success_at is not None for user_id in range(1, 5))
+        assert rows[5].is_active is False
+        assert rows[6].failure_count == 5
+        assert rows[6].is_active is False
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# app.api.routes.clans pulls in the app engine; the benchmark uses its own.
+os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///:memory:")
+
+from app.db.base import Base  # noqa: E402
+from app.db.models import Clan, ClanMembership, User  # noqa: E402
+from app.api.routes.clans import (  # noqa: E402
+    MEMBER_LIST_MAX_LIMIT,
+    _active_reviewer_memberships,
+    _list_member_page,
+    _member_reviewer_items,
+    _member_row,
+)
+
+
+CLAN_ID = 1
+
+
+def _session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        future=True,
+    )
+    Base.metadata.create_all(bind=engine)
+    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    return engine, session_local
+
+
+def _seed(session_local, *, members: int) -> None:
+    with session_local() as db:
+        db.execute(insert(Clan), [{"id": CLAN_ID, "name": "Benchmark Clan", "invite_code": "BENCH-1"}])
+        db.execute(
+            insert(User),
+            [
+                {
+                    "id": index,
+                    "email": f"member{index}@example.com",
+                    "hashed_password": "hashed",
+                    "role": "user",
+                    "gmfn_id": f"GMFN-U-{index:06d}",
+                }
+                for index in range(1, members + 1)
+            ],
+        )
+        db.execute(
+            insert(ClanMembership),
+            [
+                {"clan_id": CLAN_ID, "user_id": index, "role": "member", "personal_pool_balance": 0}
+                for index in range(1, members + 1)
+            ],
+        )
+        db.commit()
+
+
+def _per_row(db) -> int:
+    """The listing as it was: memberships, then db.get per member and reviewer."""
+    rows = (
+        db.query(ClanMembership)
+        .filter(ClanMembership.clan_id == CLAN_ID, ClanMembership.left_at.is_(None))
+        .order_by(ClanMembership.created_at.asc(), ClanMembership.id.asc())
+        .all()
+    )
+    items = [_member_row(db, m) for m in rows]
+    reviewers = [_member_row(db, m) for m, _user in _active_reviewer_memberships(db, clan_id=CLAN_ID)]
+    return len(items) + len(reviewers)
+
+
+def _joined(db) -> int:
+    clan = db.get(Clan, CLAN_ID)
+    rows = len(_member_reviewer_items(db, clan=clan))
+    after_id = None
+    while True:
+        page = _list_member_page(db, clan=clan, limit=MEMBER_LIST_MAX_LIMIT, after_id=after_id)
+        rows += len(page["items"])
+        after_id = page["next_after_id"]
+        if after_id is None:
+            return rows
+
+
+def _run(mode: str, *, members: int) -> dict[str, Any]:
+    engine, session_local = _session()
+    statements = 0
+
+    def _count_statement(*_args) -> None:
+        nonlocal statements
+        statements += 1
+
+    try:
+        _seed(session_local, members=members)
+        with session_local() as db:
+            event.listen(engine, "before_cursor_execute", _count_statement)
+            started = time.perf_counter()
+            rows = _joined(db) if mode == "joined" else _per_row(db)
+            elapsed = time.perf_counter() - started
+    finally:
+        engine.dispose()
+
+    return {
+        "mode": mode,
+        "members": members,
+        "rows": rows,
+        "seconds": round(elapsed, 3),
+        "statements": statements,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark the community member listing on in-memory SQLite: the "
+            "joined, cursor-paged read against the per-row lookups it replaced."
+        )
+    )
+    parser.add_argument(
+        "--members",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000],
+        help="Community sizes to benchmark. Default: 1000 10000.",
+    )
+    args = parser.parse_args(argv)
+
+    results = [
+        _run(mode, members=members)
+        for members in args.members
+        for mode in ("joined", "per_row")
+    ]
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# app.db.bank_models pulls in the app engine; the benchmark uses its own.
+os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///:memory:")
+
+from app.db.base import Base  # noqa: E402
+from app.db.bank_models import BankEvent, ExpectedPayment  # noqa: E402
+from app.services.reconciliation_service import (  # noqa: E402
+    compute_match_key,
+    reconcile_events,
+    reconcile_one_event,
+)
+
+
+CLAN_ID = 1
+
+
+def _session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        future=True,
+    )
+    Base.metadata.create_all(bind=engine)
+    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    return engine, session_local()
+
+
+def _seed_import(db, *, events: int, match_ratio: float) -> None:
+    """A statement import: events credits, match_ratio of them with an expected payment."""
+    matched = int(events * match_ratio)
+    db.execute(
+        insert(ExpectedPayment),
+        [
+            {
+                "clan_id": CLAN_ID,
+                "user_id": 1,
+                "expected_type": "manual",
+                "amount": Decimal("10.00"),
+                "currency": "NGN",
+                "paid_amount": Decimal("0.00"),
+                "remaining_amount": Decimal("10.00"),
+                "reference_display": f"GSN-BENCH-{index}",
+                "reference_normalized": f"GSN-BENCH-{index}",
+                "status": "expected",
+            }
+            for index in range(matched)
+        ],
+    )
+    db.execute(
+        insert(BankEvent),
+        [
+            {
+                "clan_id": CLAN_ID,
+                "source_type": "statement_csv",
+                "source_id": "benchmark",
+                "direction": "credit",
+                "amount": Decimal("10.00"),
+                "currency": "NGN",
+                "reference_raw": f"GSN-BENCH-{index}",
+                "reference_normalized": f"GSN-BENCH-{index}",
+                "match_key": compute_match_key(
+                    clan_id=CLAN_ID,
+                    direction="credit",
+                    amount=Decimal("10.00"),
+                    currency="NGN",
+                    reference_normalized=f"GSN-BENCH-{index}",
+                ),
+                "status": "detected",
+                "confidence": 0,
+                "canonical": True,
+                "hash": f"benchmark-{index:064d}"[-64:],
+            }
+            for index in range(events)
+        ],
+    )
+    db.commit()
+
+
+def _run(mode: str, *, events: int, match_ratio: float, chunk_size: int) -> dict[str, Any]:
+    engine, db = _session()
+    statements = 0
+    commits = 0
+
+    def _count_statement(*_args) -> None:
+        nonlocal statements
+        statements += 1
+
+    def _count_commit(_session) -> None:
+        nonlocal commits
+        commits += 1
+
+    try:
+        _seed_import(db, events=events, match_ratio=match_ratio)
+        event_ids = [row[0] for row in db.query(BankEvent.id).order_by(BankEvent.id.asc()).all()]
+
+        event.listen(engine, "before_cursor_execute", _count_statement)
+        event.listen(db, "after_commit", _count_commit)
+        started = time.perf_counter()
+
+        confirmed = 0
+        for start in range(0, len(event_ids), chunk_size):
+            rows = (
+                db.query(BankEvent)
+                .filter(BankEvent.id.in_(event_ids[start:start + chunk_size]))
+                .order_by(BankEvent.id.asc())
+                .all()
+            )
+            if mode == "bulk":
+                statuses = reconcile_events(db, clan_id=CLAN_ID, events=rows)
+            else:
+                statuses = [(reconcile_one_event(db, be=be).status or "").lower() for be in rows]
+            confirmed += sum(1 for s in statuses if s == "confirmed")
+
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+        engine.dispose()
+
+    return {
+        "mode": mode,
+        "events": events,
+        "confirmed": confirmed,
+        "seconds": round(elapsed, 3),
+        "events_per_second": round(events / elapsed, 1) if elapsed > 0 else None,
+        "statements": statements,
+        "commits": commits,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark reconciliation of a bank statement import on in-memory "
+            "SQLite: bulk matching (reconcile_events) against the per-event path."
+        )
+    )
+    parser.add_argument("--events", type=int, default=10_000, help="Imported credit events. Default: 10000.")
+    parser.add_argument(
+        "--match-ratio",
+        type=float,
+        default=0.5,
+        help="Share of events with an expected payment. Default: 0.5.",
+    )
+    parser.add_argument("--chunk-size", type=int, default=2000, help="Events per batch. Default: 2000.")
+    parser.add_argument(
+        "--skip-per-event",
+        action="store_true",
+        help="Only run the bulk path.",
+    )
+    args = parser.parse_args(argv)
+
+    modes = ["bulk"] if args.skip_per_event else ["bulk", "per_event"]
+    results = [
+        _run(mode, events=args.events, match_ratio=args.match_ratio, chunk_size=args.chunk_size)
+        for mode in modes
+    ]
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))